@@ -0,0 +1,6 @@
+"""
+以本地的 Calendar v3 替身量測 google-calendar-api 的吞吐量、延遲、記憶體配置與請求數
+
+執行 `python -m benchmarks -o bench_output.json`，結果為 JSON；
+加上 `--baseline <前一次結果>` 時，p50 延遲或每次操作的請求數退步超過 `--threshold` 會以非 0 結束
+"""
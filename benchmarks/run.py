@@ -0,0 +1,532 @@
+import json
+import platform
+import statistics
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from tempfile import TemporaryDirectory
+from time import perf_counter_ns
+from typing import Any
+
+from .server import FakeCalendarServer
+
+__all__ = ["Benchmark", "BenchmarkContext", "BENCHMARKS", "run_benchmark", "main"]
+
+SCOPES = ["https://www.googleapis.com/auth/calendar"]
+TIME_MIN = "2024-01-01T00:00:00Z"
+
+
+@dataclass
+class BenchmarkContext:
+    """執行 benchmark 時共用的本地伺服器與設定"""
+
+    server: FakeCalendarServer
+    discovery_cache_dir: str
+    calendar_config_path: str
+    events: int
+    time_max: str
+
+    def token_params(self) -> dict[str, Any]:
+        return {
+            "token": "bench-token",
+            "refresh_token": "bench-refresh-token",
+            "token_uri": f"{self.server.url}/token",
+            "client_id": "bench-client",
+            "client_secret": "bench-secret",
+            "scopes": SCOPES,
+        }
+
+    def api(self, **kwargs: Any) -> Any:
+        """api 建立指向本地伺服器的 `GoogleCalendarAPI`"""
+        from google_calendar_api import GoogleCalendarAPI
+
+        return GoogleCalendarAPI(
+            **self.token_params(),
+            calendar_config_path=self.calendar_config_path,
+            discovery_cache_dir=self.discovery_cache_dir,
+            **kwargs,
+        )
+
+
+@dataclass
+class Benchmark:
+    """
+    Benchmark 一個量測項目
+
+    Args:
+        name (str): 名稱
+        setup (Callable[[BenchmarkContext], Callable[[], Any]]): 準備資料並回傳每次量測執行的函式
+        iterations (int, optional): 量測次數. Defaults to 50.
+    """
+
+    name: str
+    setup: Callable[[BenchmarkContext], Callable[[], Any]]
+    iterations: int = 50
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(
+    name: str, iterations: int = 50
+) -> Callable[
+    [Callable[[BenchmarkContext], Callable[[], Any]]],
+    Callable[[BenchmarkContext], Callable[[], Any]],
+]:
+    def decorator(
+        setup: Callable[[BenchmarkContext], Callable[[], Any]],
+    ) -> Callable[[BenchmarkContext], Callable[[], Any]]:
+        BENCHMARKS.append(Benchmark(name=name, setup=setup, iterations=iterations))
+        return setup
+
+    return decorator
+
+
+@benchmark("credentials.startup.cold", iterations=30)
+def _credentials_startup_cold(context: BenchmarkContext) -> Callable[[], Any]:
+    from google_calendar_api.discovery import clear_resources
+    from google_calendar_api.service.credentials import CredentialsService
+
+    def run() -> Any:
+        clear_resources()
+
+        return CredentialsService.from_token_params(
+            **context.token_params(), discovery_cache_dir=context.discovery_cache_dir
+        ).get_service("calendar", "v3")
+
+    return run
+
+
+@benchmark("credentials.startup.warm", iterations=200)
+def _credentials_startup_warm(context: BenchmarkContext) -> Callable[[], Any]:
+    from google_calendar_api.service.credentials import CredentialsService
+
+    credentials_service = CredentialsService.from_token_params(
+        **context.token_params(), discovery_cache_dir=context.discovery_cache_dir
+    )
+
+    def run() -> Any:
+        return credentials_service.get_service("calendar", "v3")
+
+    return run
+
+
+@benchmark("credentials.refresh", iterations=50)
+def _credentials_refresh(context: BenchmarkContext) -> Callable[[], Any]:
+    from google_calendar_api.credentials import Credentials
+
+    credentials = Credentials(**context.token_params()).create_credentials()
+
+    return credentials.refresh_token
+
+
+@benchmark("api.startup", iterations=30)
+def _api_startup(context: BenchmarkContext) -> Callable[[], Any]:
+    return context.api
+
+
+def _get_calendar_events(
+    context: BenchmarkContext, read_ahead: int = 0, **api_kwargs: Any
+) -> Callable[[], Any]:
+    api = context.api(**api_kwargs)
+
+    def run() -> int:
+        events = api.get_calendar_events(
+            time_min=TIME_MIN,
+            time_max=context.time_max,
+            max_results=250,
+            read_ahead=read_ahead,
+        )
+
+        return sum(1 for event in events if event.start)
+
+    return run
+
+
+@benchmark("api.get_calendar_events", iterations=10)
+def _get_calendar_events_strict(context: BenchmarkContext) -> Callable[[], Any]:
+    return _get_calendar_events(context)
+
+
+@benchmark("api.get_calendar_events.trusted", iterations=10)
+def _get_calendar_events_trusted(context: BenchmarkContext) -> Callable[[], Any]:
+    return _get_calendar_events(context, parse_mode="trusted")
+
+
+@benchmark("api.get_calendar_events.read_ahead", iterations=10)
+def _get_calendar_events_read_ahead(context: BenchmarkContext) -> Callable[[], Any]:
+    return _get_calendar_events(context, read_ahead=2)
+
+
+@benchmark("api.add_calendar_event", iterations=100)
+def _add_calendar_event(context: BenchmarkContext) -> Callable[[], Any]:
+    api = context.api()
+
+    def run() -> Any:
+        return api.add_calendar_event(
+            summary="bench",
+            start_time="2024-02-01T09:00:00+08:00",
+            end_time="2024-02-01T10:00:00+08:00",
+            location="room",
+            description=None,
+        )
+
+    return run
+
+
+def _replace_calendar_event(
+    context: BenchmarkContext, by_id: bool
+) -> Callable[[], Any]:
+    api = context.api()
+    event = api.add_calendar_event(
+        summary="bench",
+        start_time="2024-02-02T09:00:00+08:00",
+        end_time="2024-02-02T10:00:00+08:00",
+        location="room",
+        description=None,
+    )
+    holder = [event]
+
+    def run() -> Any:
+        holder[0] = api.replace_calendar_event(
+            holder[0].id if by_id else holder[0],
+            summary="bench replaced",
+            start_time="2024-02-02T09:30:00+08:00",
+            end_time="2024-02-02T10:30:00+08:00",
+            location="room",
+            description=None,
+        )
+
+        return holder[0]
+
+    return run
+
+
+@benchmark("api.replace_calendar_event", iterations=100)
+def _replace_calendar_event_held(context: BenchmarkContext) -> Callable[[], Any]:
+    return _replace_calendar_event(context, by_id=False)
+
+
+@benchmark("api.replace_calendar_event.by_id", iterations=100)
+def _replace_calendar_event_by_id(context: BenchmarkContext) -> Callable[[], Any]:
+    return _replace_calendar_event(context, by_id=True)
+
+
+@benchmark("service.patch_delete", iterations=100)
+def _patch_delete(context: BenchmarkContext) -> Callable[[], Any]:
+    api = context.api()
+    calendar_service = api.calendar_service
+
+    def run() -> Any:
+        event = calendar_service.add_calendar_event(
+            summary="bench",
+            start_time="2024-02-03T09:00:00Z",
+            end_time="2024-02-03T10:00:00Z",
+        )
+        calendar_service.patch_calendar_event(event.id, summary="bench patched")
+
+        return calendar_service.delete_event(calendar_service.calendar_id, event.id)
+
+    return run
+
+
+@benchmark("api.get_calendar_event.threads_8.pooled", iterations=10)
+def _get_calendar_event_threaded(context: BenchmarkContext) -> Callable[[], Any]:
+    from concurrent.futures import ThreadPoolExecutor
+
+    api = context.api(pool_size=8)
+    event_ids = [
+        event.id
+        for event in api.get_calendar_events(
+            time_min=TIME_MIN, time_max=context.time_max, max_results=64
+        )
+    ][:64]
+    calendar = api.calendar_service.calendar
+
+    def run() -> Any:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(
+                executor.map(
+                    lambda event_id: calendar.get_event("primary", event_id),
+                    event_ids,
+                )
+            )
+
+    return run
+
+
+@benchmark("service.batch_insert_50", iterations=10)
+def _batch_insert(context: BenchmarkContext) -> Callable[[], Any]:
+    api = context.api()
+
+    def run() -> Any:
+        with api.batch() as batch:
+            for index in range(50):
+                batch.add_calendar_event(
+                    summary=f"batch {index}",
+                    start_time="2024-02-04T09:00:00Z",
+                    end_time="2024-02-04T10:00:00Z",
+                )
+
+        return batch.results
+
+    return run
+
+
+@benchmark("freebusy.get_freebusy", iterations=50)
+def _freebusy(context: BenchmarkContext) -> Callable[[], Any]:
+    api = context.api()
+
+    def run() -> Any:
+        return api.freebusy_service.get_freebusy(
+            ["primary", "team"], time_min=TIME_MIN, time_max=context.time_max
+        )
+
+    return run
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    ordered = sorted(values)
+    index = (len(ordered) - 1) * percentile
+
+    lower = int(index)
+    upper = min(lower + 1, len(ordered) - 1)
+
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (index - lower)
+
+
+def run_benchmark(
+    item: Benchmark, context: BenchmarkContext, scale: float = 1.0
+) -> dict[str, Any]:
+    """
+    run_benchmark 執行一個 benchmark，分別量測時間與記憶體配置
+
+    時間量測時不啟用 `tracemalloc`，記憶體配置於之後另外執行 (最多 10 次) 量測
+
+    Args:
+        item (Benchmark): 量測項目
+        context (BenchmarkContext): 共用的伺服器與設定
+        scale (float, optional): 量測次數的倍率. Defaults to 1.0.
+
+    Returns:
+        dict[str, Any]: 量測結果
+    """
+    run = item.setup(context)
+    iterations = max(1, int(item.iterations * scale))
+    run()
+
+    context.server.reset_requests()
+    latencies: list[float] = []
+
+    for _ in range(iterations):
+        start = perf_counter_ns()
+        run()
+        latencies.append((perf_counter_ns() - start) / 1e6)
+
+    requests = dict(context.server.requests)
+
+    alloc_iterations = min(iterations, 10)
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.take_snapshot()
+
+    for _ in range(alloc_iterations):
+        run()
+
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    total = sum(latencies)
+
+    return {
+        "name": item.name,
+        "iterations": iterations,
+        "ops_per_sec": iterations / (total / 1e3) if total else None,
+        "latency_ms": {
+            "mean": statistics.fmean(latencies),
+            "min": min(latencies),
+            "p50": _percentile(latencies, 0.5),
+            "p90": _percentile(latencies, 0.9),
+            "p99": _percentile(latencies, 0.99),
+            "max": max(latencies),
+        },
+        "allocations": {
+            "bytes_per_op": sum(stat.size_diff for stat in stats) / alloc_iterations,
+            "blocks_per_op": sum(stat.count_diff for stat in stats) / alloc_iterations,
+            "peak_bytes": peak,
+        },
+        "requests": {
+            "per_op": sum(
+                value
+                for name, value in requests.items()
+                if not name.startswith("batched.")
+            )
+            / iterations,
+            "by_operation": {
+                name: value / iterations for name, value in sorted(requests.items())
+            },
+        },
+    }
+
+
+@contextmanager
+def benchmark_context(events: int, latency: float) -> Iterator[BenchmarkContext]:
+    """
+    benchmark_context 啟動本地伺服器，並準備 discovery document 快取與日曆設定檔
+
+    所有請求由 discovery document 的 `rootUrl` 導向本地伺服器，不需要修改程式碼
+    """
+    from datetime import timedelta
+
+    from google_calendar_api.discovery import clear_resources, get_discovery_document
+    from google_calendar_api.discovery.discovery import _cache_file_path, _write_file
+    from google_calendar_api.scheduler import RequestScheduler, set_default_scheduler
+
+    with FakeCalendarServer(latency=latency) as server, TemporaryDirectory() as tmp:
+        server.seed("primary", events)
+        server.seed("team", max(1, events // 4), step=timedelta(hours=2))
+
+        _write_file(
+            _cache_file_path(tmp, "calendar", "v3"),
+            server.discovery_document(get_discovery_document("calendar", "v3")),
+        )
+        calendar_config_path = f"{tmp}/calendar.json"
+
+        with open(calendar_config_path, mode="w", encoding="UTF-8") as file:
+            json.dump({"calendar_id": "primary", "time_zone": "UTC"}, file)
+
+        # 不讓預設的速率限制影響量測結果
+        set_default_scheduler(RequestScheduler(user_rate=1e9, project_rate=1e9))
+        clear_resources()
+
+        yield BenchmarkContext(
+            server=server,
+            discovery_cache_dir=tmp,
+            calendar_config_path=calendar_config_path,
+            events=events,
+            time_max=(
+                datetime(2024, 1, 1, tzinfo=timezone.utc)
+                + timedelta(minutes=30 * events)
+            ).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        )
+
+        clear_resources()
+
+
+def _metadata(events: int, latency: float) -> dict[str, Any]:
+    from importlib.metadata import PackageNotFoundError, version
+
+    versions: dict[str, str | None] = {}
+
+    for package in ("google-api-python-client", "google-auth", "httplib2", "pydantic"):
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "packages": versions,
+        "events": events,
+        "latency": latency,
+    }
+
+
+def _compare(
+    results: list[dict[str, Any]], baseline_path: str, threshold: float
+) -> list[str]:
+    with open(baseline_path, encoding="UTF-8") as file:
+        baseline = {item["name"]: item for item in json.load(file)["results"]}
+
+    regressions: list[str] = []
+
+    for result in results:
+        if (previous := baseline.get(result["name"])) is None:
+            continue
+
+        for metric, current, before in (
+            (
+                "latency_ms.p50",
+                result["latency_ms"]["p50"],
+                previous["latency_ms"]["p50"],
+            ),
+            (
+                "requests.per_op",
+                result["requests"]["per_op"],
+                previous["requests"]["per_op"],
+            ),
+        ):
+            if before and current > before * (1 + threshold):
+                regressions.append(
+                    f"{result['name']} {metric}: {before:.3f} -> {current:.3f}"
+                )
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark google-calendar-api against a local fake Calendar v3 server",
+    )
+    parser.add_argument("-k", "--filter", default="", help="只執行名稱包含此字串的項目")
+    parser.add_argument(
+        "-o", "--output", help="結果 JSON 的輸出路徑，預設輸出到 stdout"
+    )
+    parser.add_argument("--events", type=int, default=1000, help="primary 日曆的事件數")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="每個請求模擬的延遲秒數"
+    )
+    parser.add_argument("--scale", type=float, default=1.0, help="量測次數的倍率")
+    parser.add_argument("--baseline", help="比較用的前一次結果 JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="視為退步的比例")
+    parser.add_argument("--list", action="store_true", help="列出所有項目")
+    args = parser.parse_args(argv)
+
+    selected = [item for item in BENCHMARKS if args.filter in item.name]
+
+    if args.list:
+        print("\n".join(item.name for item in selected))
+        return 0
+
+    results: list[dict[str, Any]] = []
+
+    with benchmark_context(args.events, args.latency) as context:
+        for item in selected:
+            result = run_benchmark(item, context, scale=args.scale)
+            results.append(result)
+            print(
+                f"{item.name:<40} {result['ops_per_sec']:>10.1f} ops/s "
+                f"p50 {result['latency_ms']['p50']:>8.3f} ms "
+                f"p99 {result['latency_ms']['p99']:>8.3f} ms "
+                f"{result['requests']['per_op']:>7.2f} req/op",
+                file=sys.stderr,
+            )
+
+    report = json.dumps(
+        {"meta": _metadata(args.events, args.latency), "results": results}, indent=2
+    )
+
+    if args.output:
+        with open(args.output, mode="w", encoding="UTF-8") as file:
+            file.write(report)
+    else:
+        print(report)
+
+    if args.baseline:
+        regressions = _compare(results, args.baseline, args.threshold)
+
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+
+        return 1 if regressions else 0
+
+    return 0
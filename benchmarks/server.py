@@ -0,0 +1,668 @@
+import json
+from collections import Counter
+from datetime import datetime, timedelta, timezone, tzinfo
+from email.parser import BytesParser
+from email.policy import compat32
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from threading import Lock, Thread
+from time import sleep
+from typing import Any
+from urllib.parse import parse_qs, unquote, urlsplit
+from zoneinfo import ZoneInfo
+
+from typing_extensions import Self
+
+__all__ = ["FakeCalendarServer"]
+
+Response = tuple[int, dict[str, str], bytes]
+
+CALENDAR_PREFIX = "/calendar/v3/calendars/"
+FREEBUSY_PATH = "/calendar/v3/freeBusy"
+CHANNELS_STOP_PATH = "/calendar/v3/channels/stop"
+BATCH_PATH = "/batch/calendar/v3"
+TOKEN_PATH = "/token"
+WRITE_OPERATIONS = ("events.insert", "events.patch", "events.update", "events.delete")
+REASONS = {
+    200: "OK",
+    204: "No Content",
+    404: "Not Found",
+    409: "Conflict",
+    412: "Precondition Failed",
+}
+
+
+def _to_datetime(value: str, tz: tzinfo = timezone.utc) -> datetime:
+    if len(value) == 10:
+        return datetime.fromisoformat(value).replace(tzinfo=tz)
+
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _format(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _json(status: int, content: Any) -> Response:
+    return status, {"Content-Type": "application/json"}, json.dumps(content).encode()
+
+
+def _error(status: int, message: str) -> Response:
+    return _json(
+        status,
+        {
+            "error": {
+                "code": status,
+                "message": message,
+                "errors": [{"reason": message}],
+            }
+        },
+    )
+
+
+class FakeCalendarServer:
+    """
+    FakeCalendarServer 本地的 Calendar v3 替身，事件保存在記憶體中
+
+    支援 events get/list/insert/patch/update/delete (含 `If-Match`)、以 `syncToken` 增量讀取、
+    events.watch/channels.stop (事件變更時向 channel 的 address 送出通知)、freeBusy.query、
+    multipart batch 與 OAuth token endpoint，並依操作種類計算請求數
+
+    Args:
+        latency (float, optional): 每個 HTTP 請求額外等待的秒數，用來模擬網路延遲. Defaults to 0.
+    """
+
+    def __init__(self, latency: float = 0) -> None:
+        self.latency = latency
+        self.requests: Counter[str] = Counter()
+        self._events: dict[str, dict[str, dict[str, Any]]] = {}
+        self._lock = Lock()
+        self._ids = count()
+        self._server: ThreadingHTTPServer | None = None
+        self._seq = 0
+        self._changes: dict[
+            str, dict[str, int]
+        ] = {}  # 事件最後變更的序號，刪除的事件保留序號
+        self._channels: dict[str, dict[str, Any]] = {}
+        self.notifications = 0
+        self.time_zones: dict[
+            str, str
+        ] = {}  # 日曆的時區，決定全天事件的範圍，預設為 UTC
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("server is not started")
+
+        host, port = self._server.server_address[:2]
+
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # headers 與 body 分兩次 write，避免 Nagle 與 delayed ACK 造成約 40ms 的等待
+            disable_nagle_algorithm = True
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+
+                if server.latency:
+                    sleep(server.latency)
+
+                status, headers, content = server.dispatch(
+                    self.command,
+                    self.path,
+                    {key.lower(): value for key, value in self.headers.items()},
+                    body,
+                )
+                self.send_response(status)
+
+                for key, value in headers.items():
+                    self.send_header(key, value)
+
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def reset_requests(self) -> None:
+        with self._lock:
+            self.requests.clear()
+
+    def discovery_document(self, document: str) -> str:
+        """
+        discovery_document 將 discovery document 的 endpoint 改為本地伺服器
+
+        Args:
+            document (str): 原本的 discovery document JSON
+
+        Returns:
+            str: 指向本地伺服器的 discovery document JSON
+        """
+        content = json.loads(document)
+        content["rootUrl"] = f"{self.url}/"
+        content["baseUrl"] = f"{self.url}/{content['servicePath']}"
+
+        return json.dumps(content)
+
+    def seed(
+        self,
+        calendar_id: str,
+        size: int,
+        start: datetime = datetime(2024, 1, 1, tzinfo=timezone.utc),
+        step: timedelta = timedelta(minutes=30),
+        duration: timedelta = timedelta(minutes=20),
+    ) -> None:
+        """
+        seed 於 `calendar_id` 建立 `size` 個間隔為 `step` 的事件
+
+        Args:
+            calendar_id (str): 日曆id
+            size (int): 事件數量
+            start (datetime, optional): 第一個事件的開始時間. Defaults to 2024-01-01T00:00:00Z.
+            step (timedelta, optional): 事件開始時間的間隔. Defaults to 30 minutes.
+            duration (timedelta, optional): 事件長度. Defaults to 20 minutes.
+        """
+        for index in range(size):
+            event_start = start + step * index
+            self._insert(
+                calendar_id,
+                {
+                    "summary": f"event {index}",
+                    "description": "seeded",
+                    "start": {"dateTime": _format(event_start), "timeZone": "UTC"},
+                    "end": {
+                        "dateTime": _format(event_start + duration),
+                        "timeZone": "UTC",
+                    },
+                    "attendees": [
+                        {
+                            "email": f"user{index % 7}@example.com",
+                            "responseStatus": "accepted",
+                        }
+                    ],
+                },
+            )
+
+    def _touch(self, calendar_id: str, event_id: str) -> None:
+        """_touch 記錄事件的變更序號，需持有 `_lock`"""
+        self._seq += 1
+        self._changes.setdefault(calendar_id, {})[event_id] = self._seq
+
+    def _insert(self, calendar_id: str, body: dict[str, Any]) -> dict[str, Any] | None:
+        """_insert 新增事件，body 指定的 id 已存在時回傳 None"""
+        event_id = body.get("id") or f"evt{next(self._ids):08d}"
+        now = _format(datetime.now(timezone.utc))
+        event = {
+            "kind": "calendar#event",
+            "etag": f'"{event_id}-0"',
+            "id": event_id,
+            "status": "confirmed",
+            "htmlLink": f"https://www.google.com/calendar/event?eid={event_id}",
+            "created": now,
+            "updated": now,
+            "summary": "",
+            "creator": {"email": "owner@example.com", "self": True},
+            "organizer": {"email": "owner@example.com", "self": True},
+            "iCalUID": f"{event_id}@google.com",
+            "sequence": 0,
+            "reminders": {"useDefault": True},
+            "eventType": "default",
+            **body,
+        }
+
+        with self._lock:
+            events = self._events.setdefault(calendar_id, {})
+
+            if event_id in events:
+                return None
+
+            events[event_id] = event
+            self._touch(calendar_id, event_id)
+
+        return event
+
+    def _write(
+        self,
+        calendar_id: str,
+        event_id: str,
+        body: dict[str, Any],
+        if_match: str | None,
+        replace: bool,
+    ) -> Response:
+        with self._lock:
+            event = self._events.get(calendar_id, {}).get(event_id)
+
+            if event is None:
+                return _error(404, "notFound")
+
+            if if_match is not None and if_match != event["etag"]:
+                return _error(412, "conditionNotMet")
+
+            sequence = event["sequence"] + 1
+            fixed = {
+                key: event[key]
+                for key in (
+                    "kind",
+                    "id",
+                    "htmlLink",
+                    "created",
+                    "creator",
+                    "organizer",
+                    "iCalUID",
+                )
+            }
+            new_event = {**body, **fixed} if replace else {**event, **body}
+            new_event.update(
+                etag=f'"{event_id}-{sequence}"',
+                sequence=sequence,
+                updated=_format(datetime.now(timezone.utc)),
+            )
+            new_event.setdefault("status", "confirmed")
+            new_event.setdefault("reminders", {"useDefault": True})
+            new_event.setdefault("eventType", "default")
+            new_event.setdefault("summary", "")
+            self._events[calendar_id][event_id] = new_event
+            self._touch(calendar_id, event_id)
+
+        return _json(200, new_event)
+
+    def _list(
+        self,
+        calendar_id: str,
+        query: dict[str, str],
+        repeated: dict[str, list[str]] | None = None,
+    ) -> Response:
+        time_min = _to_datetime(query["timeMin"]) if "timeMin" in query else None
+        time_max = _to_datetime(query["timeMax"]) if "timeMax" in query else None
+        max_results = min(int(query.get("maxResults", 250)), 2500)
+        offset = int(query.get("pageToken", 0))
+        q = query.get("q")
+        sync_token = query.get("syncToken")
+        repeated = repeated or {}
+        properties = [
+            (scope, *value.partition("=")[::2])
+            for scope, key in (
+                ("private", "privateExtendedProperty"),
+                ("shared", "sharedExtendedProperty"),
+            )
+            for value in repeated.get(key, [])
+        ]
+        event_types = set(repeated.get("eventTypes", []))
+        updated_min = (
+            _to_datetime(query["updatedMin"]) if "updatedMin" in query else None
+        )
+        ical_uid = query.get("iCalUID")
+
+        with self._lock:
+            events = list(self._events.get(calendar_id, {}).values())
+            changes = dict(self._changes.get(calendar_id, {}))
+            next_sync_token = str(self._seq)
+
+        if sync_token is not None:
+            since = int(sync_token) if sync_token.isdigit() else 0
+            by_id = {event["id"]: event for event in events}
+            events = [
+                by_id.get(event_id)
+                or {"kind": "calendar#event", "id": event_id, "status": "cancelled"}
+                for event_id, seq in changes.items()
+                if seq > since
+            ]
+            time_min = time_max = None
+
+        time_zone = self.time_zones.get(calendar_id, "UTC")
+        tz = ZoneInfo(time_zone)
+        items = [
+            event
+            for event in events
+            if (
+                time_max is None
+                or _to_datetime(
+                    event["start"].get("dateTime") or event["start"]["date"], tz
+                )
+                < time_max
+            )
+            and (
+                time_min is None
+                or _to_datetime(
+                    event["end"].get("dateTime") or event["end"]["date"], tz
+                )
+                > time_min
+            )
+            and (q is None or q in event.get("summary", ""))
+            and all(
+                event.get("extendedProperties", {}).get(scope, {}).get(name) == value
+                for scope, name, value in properties
+            )
+            and (not event_types or event.get("eventType", "default") in event_types)
+            and (updated_min is None or _to_datetime(event["updated"]) >= updated_min)
+            and (ical_uid is None or event.get("iCalUID") == ical_uid)
+        ]
+
+        if query.get("orderBy") == "startTime":
+            items.sort(
+                key=lambda event: _to_datetime(
+                    event["start"].get("dateTime") or event["start"]["date"], tz
+                )
+            )
+
+        page = items[offset : offset + max_results]
+        content: dict[str, Any] = {
+            "kind": "calendar#events",
+            "etag": '"list"',
+            "summary": calendar_id,
+            "description": "",
+            "updated": _format(datetime.now(timezone.utc)),
+            "timeZone": time_zone,
+            "accessRole": "owner",
+            "defaultReminders": [{"method": "popup", "minutes": 10}],
+            "items": page,
+        }
+
+        if offset + max_results < len(items):
+            content["nextPageToken"] = str(offset + max_results)
+        else:
+            content["nextSyncToken"] = next_sync_token
+
+        return _json(200, content)
+
+    def _watch(self, calendar_id: str, body: dict[str, Any]) -> Response:
+        ttl = int(body.get("params", {}).get("ttl", 604800))
+        channel = {
+            "kind": "api#channel",
+            "id": body["id"],
+            "resourceId": f"resource-{calendar_id}",
+            "resourceUri": f"{self.url}{CALENDAR_PREFIX}{calendar_id}/events",
+            "expiration": str(
+                int((datetime.now(timezone.utc).timestamp() + ttl) * 1000)
+            ),
+        }
+
+        if body.get("token") is not None:
+            channel["token"] = body["token"]
+
+        with self._lock:
+            self._channels[body["id"]] = {
+                **channel,
+                "calendar_id": calendar_id,
+                "address": body["address"],
+                "messages": count(),
+            }
+
+        self._notify(calendar_id, "sync", channel_id=body["id"])
+
+        return _json(200, channel)
+
+    def _notify(
+        self, calendar_id: str, state: str, channel_id: str | None = None
+    ) -> None:
+        """_notify 如同 Google 以 POST 通知 channel 的 address，於背景執行緒送出"""
+        from urllib.request import Request, urlopen
+
+        with self._lock:
+            channels = [
+                channel
+                for channel in self._channels.values()
+                if channel["calendar_id"] == calendar_id
+                and channel_id in (None, channel["id"])
+            ]
+            requests = [
+                Request(
+                    channel["address"],
+                    data=b"",
+                    method="POST",
+                    headers={
+                        "X-Goog-Channel-ID": channel["id"],
+                        "X-Goog-Channel-Expiration": channel["expiration"],
+                        "X-Goog-Resource-ID": channel["resourceId"],
+                        "X-Goog-Resource-URI": channel["resourceUri"],
+                        "X-Goog-Resource-State": state,
+                        "X-Goog-Message-Number": str(next(channel["messages"]) + 1),
+                        **(
+                            {"X-Goog-Channel-Token": channel["token"]}
+                            if "token" in channel
+                            else {}
+                        ),
+                    },
+                )
+                for channel in channels
+            ]
+            self.notifications += len(requests)
+
+        def send(request: Request) -> None:
+            try:
+                urlopen(request, timeout=5).close()
+            except OSError:
+                pass
+
+        for request in requests:
+            Thread(target=send, args=(request,), daemon=True).start()
+
+    def _freebusy(self, body: dict[str, Any]) -> Response:
+        time_min = _to_datetime(body["timeMin"])
+        time_max = _to_datetime(body["timeMax"])
+        calendars: dict[str, Any] = {}
+
+        for item in body.get("items", []):
+            with self._lock:
+                events = list(self._events.get(item["id"], {}).values())
+
+            busy = sorted(
+                (start, end)
+                for event in events
+                if (
+                    start := _to_datetime(
+                        event["start"].get("dateTime") or event["start"]["date"]
+                    )
+                )
+                < time_max
+                and (
+                    end := _to_datetime(
+                        event["end"].get("dateTime") or event["end"]["date"]
+                    )
+                )
+                > time_min
+            )
+            calendars[item["id"]] = {
+                "busy": [
+                    {"start": _format(start), "end": _format(end)}
+                    for start, end in busy
+                ]
+            }
+
+        return _json(
+            200,
+            {
+                "kind": "calendar#freeBusy",
+                "timeMin": body["timeMin"],
+                "timeMax": body["timeMax"],
+                "calendars": calendars,
+            },
+        )
+
+    def _batch(self, headers: dict[str, str], body: bytes) -> Response:
+        message = BytesParser(policy=compat32).parsebytes(
+            f"Content-Type: {headers['content-type']}\r\n\r\n".encode() + body
+        )
+        boundary = "batch_response_boundary"
+        parts: list[str] = []
+
+        for part in message.get_payload():
+            payload = part.get_payload().replace("\r\n", "\n")
+            request_head, _, request_body = payload.partition("\n\n")
+            request_line, *header_lines = request_head.split("\n")
+            method, path, _ = request_line.split(" ", 2)
+            part_headers = {
+                key.lower(): value
+                for key, _, value in (line.partition(": ") for line in header_lines)
+            }
+            status, response_headers, content = self.dispatch(
+                method, path, part_headers, request_body.encode(), batched=True
+            )
+            content_id = part["Content-ID"].strip("<>")
+            response_head = "".join(
+                f"{key}: {value}\r\n"
+                for key, value in {
+                    **response_headers,
+                    "Content-Length": str(len(content)),
+                }.items()
+            )
+            parts.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id}>\r\n\r\n"
+                f"HTTP/1.1 {status} {REASONS.get(status, 'Error')}\r\n"
+                f"{response_head}\r\n"
+                f"{content.decode()}\r\n"
+            )
+
+        with self._lock:
+            self.requests["batch"] += 1
+
+        return (
+            200,
+            {"Content-Type": f"multipart/mixed; boundary={boundary}"},
+            ("".join(parts) + f"--{boundary}--\r\n").encode(),
+        )
+
+    def dispatch(
+        self,
+        method: str,
+        path: str,
+        headers: dict[str, str],
+        body: bytes,
+        batched: bool = False,
+    ) -> Response:
+        """
+        dispatch 處理一個請求並回傳 (狀態碼, headers, 內容)
+
+        Args:
+            method (str): HTTP method
+            path (str): 請求路徑與 query string
+            headers (dict[str, str]): 請求 headers，名稱為小寫
+            body (bytes): 請求內容
+            batched (bool, optional): 是否為 batch 內的請求. Defaults to False.
+
+        Returns:
+            Response: (狀態碼, headers, 內容)
+        """
+        url = urlsplit(path)
+        repeated = parse_qs(url.query)
+        query = {key: values[-1] for key, values in repeated.items()}
+
+        if url.path == TOKEN_PATH and method == "POST":
+            operation = "token"
+            response = _json(
+                200,
+                {
+                    "access_token": f"token-{next(self._ids)}",
+                    "expires_in": 3600,
+                    "token_type": "Bearer",
+                },
+            )
+        elif url.path == BATCH_PATH and method == "POST":
+            return self._batch(headers, body)
+        elif url.path == CHANNELS_STOP_PATH and method == "POST":
+            operation = "channels.stop"
+
+            with self._lock:
+                channel = self._channels.pop(json.loads(body)["id"], None)
+
+            response = (
+                (204, {}, b"") if channel is not None else _error(404, "notFound")
+            )
+        elif url.path == FREEBUSY_PATH and method == "POST":
+            operation = "freebusy.query"
+            response = self._freebusy(json.loads(body))
+        elif url.path.startswith(CALENDAR_PREFIX):
+            calendar_id, _, rest = url.path[len(CALENDAR_PREFIX) :].partition("/")
+            calendar_id = unquote(calendar_id)
+            resource, _, event_id = rest.partition("/")
+            event_id = unquote(event_id)
+            if_match = headers.get("if-match")
+
+            if resource != "events":
+                operation, response = "unknown", _error(404, "notFound")
+            elif not event_id and method == "GET":
+                operation, response = (
+                    "events.list",
+                    self._list(calendar_id, query, repeated),
+                )
+            elif event_id == "watch" and method == "POST":
+                operation, response = (
+                    "events.watch",
+                    self._watch(calendar_id, json.loads(body)),
+                )
+            elif not event_id and method == "POST":
+                operation = "events.insert"
+                event = self._insert(calendar_id, json.loads(body))
+                response = (
+                    _json(200, event) if event is not None else _error(409, "duplicate")
+                )
+            elif method == "GET":
+                operation = "events.get"
+
+                with self._lock:
+                    event = self._events.get(calendar_id, {}).get(event_id)
+
+                response = (
+                    _json(200, event) if event is not None else _error(404, "notFound")
+                )
+            elif method in ("PUT", "PATCH"):
+                operation = "events.update" if method == "PUT" else "events.patch"
+                response = self._write(
+                    calendar_id,
+                    event_id,
+                    json.loads(body),
+                    if_match,
+                    replace=method == "PUT",
+                )
+            elif method == "DELETE":
+                operation = "events.delete"
+
+                with self._lock:
+                    deleted = self._events.get(calendar_id, {}).pop(event_id, None)
+
+                    if deleted is not None:
+                        self._touch(calendar_id, event_id)
+
+                response = (
+                    (204, {}, b"") if deleted is not None else _error(404, "notFound")
+                )
+            else:
+                operation, response = "unknown", _error(404, "notFound")
+        else:
+            operation, response = "unknown", _error(404, "notFound")
+
+        with self._lock:
+            self.requests[f"batched.{operation}" if batched else operation] += 1
+
+        if operation in WRITE_OPERATIONS and response[0] < 300:
+            self._notify(calendar_id, "exists")
+
+        return response
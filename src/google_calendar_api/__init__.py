@@ -1 +1,2 @@
+from .aio import AsyncGoogleCalendarAPI  # noqa: F401
 from .applications import GoogleCalendarAPI  # noqa: F401
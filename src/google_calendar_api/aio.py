@@ -0,0 +1,208 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
+from typing import Literal
+
+from typing_extensions import Self, Unpack
+
+from .applications import GoogleCalendarAPI
+from .schema.calendar import Event, QueryEvent
+from .schema.parse import ParseMode
+from .service.calendar import AsyncCalendarService
+from .types.calendar import ApplicationAddEventParam, EventListFilter
+
+__all__ = ["AsyncGoogleCalendarAPI"]
+
+
+class AsyncGoogleCalendarAPI:
+    """
+    AsyncGoogleCalendarAPI `GoogleCalendarAPI` 的 asyncio 版本，初始化參數相同，
+    `max_concurrency` 限制同時進行中的請求數
+
+    需要安裝 `httpx` (`pip install google-calendar-api[async]`)
+
+    Examples:
+        >>> async with AsyncGoogleCalendarAPI(token_json_path=..., scopes=..., calendar_config_path=...) as api:
+        ...     async for event in api.get_calendar_events(time_min=..., time_max=...):
+        ...         print(event.summary)
+    """
+
+    def __init__(
+        self,
+        token: str | None = None,
+        refresh_token: str | None = None,
+        token_uri: str | None = None,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        scopes: list[str] | None = None,
+        token_json_path: str | None = None,
+        credentials_json_path: str | None = None,
+        port: int = 0,
+        *,
+        calendar_config_path: str,
+        max_concurrency: int = 10,
+        discovery_cache_dir: str | None = None,
+        parse_mode: ParseMode = "strict",
+        auto_refresh: bool = False,
+    ) -> None:
+        self.credentials_service = GoogleCalendarAPI._load_credentials_service(
+            token=token,
+            refresh_token=refresh_token,
+            token_uri=token_uri,
+            client_id=client_id,
+            client_secret=client_secret,
+            scopes=scopes,
+            token_json_path=token_json_path,
+            credentials_json_path=credentials_json_path,
+            port=port,
+            discovery_cache_dir=discovery_cache_dir,
+        )
+
+        if auto_refresh:
+            self.credentials_service.token_manager.start()
+
+        self.service = self.credentials_service.get_service("calendar", "v3")
+        config = GoogleCalendarAPI._load_config(calendar_config_path)
+
+        self.calendar_service = AsyncCalendarService(
+            service=self.service,
+            calendar_id=config.calendar_id,
+            max_concurrency=max_concurrency,
+            parse_mode=parse_mode,
+        )
+        self.time_zone = config.time_zone
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.calendar_service.aclose()
+
+    async def replace_calendar_event(
+        self,
+        event_or_event_id: Event | str,
+        **event_param: Unpack[ApplicationAddEventParam],
+    ) -> Event:
+        event = (
+            await self.get_calendar_event(event_id=event_or_event_id)
+            if isinstance(event_or_event_id, str)
+            else event_or_event_id
+        )
+
+        return await self.calendar_service.replace_calendar_event(event, **event_param)
+
+    async def get_calendar_event(self, event_id: str) -> Event:
+        return await self.calendar_service.get_calendar_event(event_id)
+
+    async def get_calendar_events(
+        self,
+        *,
+        time_min: str,
+        time_max: str,
+        max_results: int | None = None,
+        order_by: Literal["startTime", "updated"] = "startTime",
+        q: str | None = None,
+        single_events: bool = True,
+        show_deleted: bool = False,
+        **filters: Unpack[EventListFilter],
+    ) -> AsyncGenerator[Event, None]:
+        """
+        get_calendar_events 逐一回傳時間區間內的事件，回傳目前頁面的同時於背景取得下一頁；
+        篩選條件由伺服器端處理，每頁預設為 `MAX_LIST_RESULTS`
+        """
+
+        def fetch(page_token: str | None) -> "asyncio.Task[QueryEvent]":
+            return asyncio.ensure_future(
+                self.calendar_service.get_calendar_events(
+                    time_min=time_min,
+                    time_max=time_max,
+                    page_token=page_token,
+                    max_results=max_results,
+                    order_by=order_by,
+                    q=q,
+                    single_events=single_events,
+                    time_zone=self.time_zone,
+                    show_deleted=show_deleted,
+                    **filters,
+                )
+            )
+
+        next_page: asyncio.Task[QueryEvent] | None = fetch(None)
+
+        try:
+            while next_page is not None:
+                query_event = await next_page
+                next_page = (
+                    fetch(query_event.nextPageToken)
+                    if query_event.nextPageToken
+                    else None
+                )
+
+                for event in query_event.items:
+                    yield event
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def upsert_calendar_event(
+        self, key: str, **event_param: Unpack[ApplicationAddEventParam]
+    ) -> Event:
+        return await self.calendar_service.upsert_calendar_event(
+            key, time_zone=self.time_zone, **event_param
+        )
+
+    async def add_calendar_event(
+        self,
+        replace: bool = False,
+        key: str | None = None,
+        **event_param: Unpack[ApplicationAddEventParam],
+    ) -> Event | None:
+        """
+        add_calendar_event 新增事件，`replace` 與 `key` 的行為與 `GoogleCalendarAPI.add_calendar_event` 相同
+        """
+        if key is not None:
+            return await self.upsert_calendar_event(key, **event_param)
+
+        if replace:
+            async with aclosing(
+                self.get_calendar_events(
+                    time_min=event_param["start_time"],
+                    time_max=event_param["end_time"],
+                    max_results=1,
+                    q=event_param["summary"],
+                )
+            ) as events:
+                event = await anext(events, None)
+
+            if event is None:
+                return None
+
+            return await self.replace_calendar_event(
+                event_or_event_id=event, **event_param
+            )
+
+        return await self.calendar_service.add_calendar_event(
+            time_zone=self.time_zone, **event_param
+        )
+
+    async def add_calendar_events(
+        self, event_params: list[ApplicationAddEventParam]
+    ) -> list[Event | BaseException]:
+        """
+        add_calendar_events 同時新增多個事件，同時進行中的請求數受 `max_concurrency` 限制
+
+        Args:
+            event_params (list[ApplicationAddEventParam]): 預計新增的事件
+
+        Returns:
+            list[Event | BaseException]: 依 `event_params` 順序回傳已新增的事件或錯誤
+        """
+        return await self.calendar_service.add_calendar_events(
+            [
+                {"time_zone": self.time_zone, **event_param}
+                for event_param in event_params
+            ]  # type: ignore
+        )
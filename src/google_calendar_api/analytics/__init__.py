@@ -0,0 +1,3 @@
+from .analytics import *  # noqa: F403
+from .columns import *  # noqa: F403
+from .frame import *  # noqa: F403
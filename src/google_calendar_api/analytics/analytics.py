@@ -0,0 +1,370 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from typing_extensions import Self
+
+from ..log import LOGGER
+from .columns import EVENT_FIELDS, EventColumns
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
+    from ..calendar import Calendar
+    from ..service.credentials import CredentialsService
+
+__all__ = [
+    "DURATION_BUCKETS",
+    "EventStats",
+    "EventAggregate",
+    "Shard",
+    "plan_shards",
+    "aggregate_columns",
+    "fetch_columns",
+    "analyze_calendars",
+]
+
+DURATION_BUCKETS = (15, 30, 60, 120, 240, 480)
+"""事件長度分組的上限 (分鐘)，超過最後一組的事件歸入 `>480`"""
+
+
+@dataclass
+class EventStats:
+    count: int = 0
+    seconds: float = 0.0
+
+    def add(self, seconds: float, count: int = 1) -> None:
+        self.count += count
+        self.seconds += seconds
+
+    def merge(self, other: "EventStats") -> None:
+        self.add(other.seconds, other.count)
+
+
+def _merge_stats(target: dict[str, EventStats], source: dict[str, EventStats]) -> None:
+    for key, stats in source.items():
+        if key in target:
+            target[key].merge(stats)
+        else:
+            target[key] = EventStats(stats.count, stats.seconds)
+
+
+@dataclass
+class EventAggregate:
+    """
+    EventAggregate 事件數與總秒數，依日曆、參加者、週 (ISO week，例如 `2024-W05`) 與長度分組
+
+    各 shard 的部分結果以 `merge` 合併，結果與順序無關
+    """
+
+    total: EventStats = field(default_factory=EventStats)
+    by_calendar: dict[str, EventStats] = field(default_factory=dict)
+    by_attendee: dict[str, EventStats] = field(default_factory=dict)
+    by_week: dict[str, EventStats] = field(default_factory=dict)
+    by_duration: dict[str, EventStats] = field(default_factory=dict)
+
+    def merge(self, other: "EventAggregate") -> Self:
+        self.total.merge(other.total)
+        _merge_stats(self.by_calendar, other.by_calendar)
+        _merge_stats(self.by_attendee, other.by_attendee)
+        _merge_stats(self.by_week, other.by_week)
+        _merge_stats(self.by_duration, other.by_duration)
+
+        return self
+
+
+def _duration_label(seconds: float) -> str:
+    minutes = seconds / 60
+
+    for bound in DURATION_BUCKETS:
+        if minutes <= bound:
+            return f"<={bound}"
+
+    return f">{DURATION_BUCKETS[-1]}"
+
+
+def aggregate_columns(
+    columns: EventColumns, time_zone: str | None = None
+) -> EventAggregate:
+    """
+    aggregate_columns 將一個日曆的事件欄位彙總為 `EventAggregate`
+
+    Args:
+        columns (EventColumns): 事件欄位
+        time_zone (str | None, optional): 決定事件屬於哪一週的時區，預設為 UTC. Defaults to None.
+
+    Returns:
+        EventAggregate: 彙總結果
+    """
+    from datetime import datetime, timezone
+    from zoneinfo import ZoneInfo
+
+    tz = ZoneInfo(time_zone) if time_zone else timezone.utc
+    weeks: dict[int, str] = {}  # 時差都是 15 分鐘的倍數，同一個 15 分鐘內的週相同
+    aggregate = EventAggregate()
+    by_week = aggregate.by_week
+    by_duration = aggregate.by_duration
+    attendee_count = [0] * len(columns.attendees)
+    attendee_seconds = [0.0] * len(columns.attendees)
+    offsets, attendee_ids = columns.attendee_offsets, columns.attendee_ids
+    total = 0.0
+
+    for index, (start, end) in enumerate(zip(columns.start, columns.end, strict=True)):
+        seconds = end - start
+        total += seconds
+
+        if (week := weeks.get(slot := int(start // 900))) is None:
+            year, number, _ = datetime.fromtimestamp(start, tz).isocalendar()
+            week = weeks[slot] = f"{year}-W{number:02d}"
+
+        by_week.setdefault(week, EventStats()).add(seconds)
+        by_duration.setdefault(_duration_label(seconds), EventStats()).add(seconds)
+
+        for attendee_id in attendee_ids[offsets[index] : offsets[index + 1]]:
+            attendee_count[attendee_id] += 1
+            attendee_seconds[attendee_id] += seconds
+
+    aggregate.total.add(total, len(columns))
+    aggregate.by_calendar[columns.calendar_id] = EventStats(len(columns), total)
+    aggregate.by_attendee = {
+        email: EventStats(count, seconds)
+        for email, count, seconds in zip(
+            columns.attendees, attendee_count, attendee_seconds, strict=True
+        )
+        if count
+    }
+
+    return aggregate
+
+
+@dataclass(frozen=True)
+class Shard:
+    """
+    Shard 一個日曆在一段時間區間內的工作
+
+    events.list 會回傳與區間重疊的事件，跨越區間的事件只計入起始時間所在的 shard；
+    `first` 的 shard 另外包含在整個區間開始前就已開始的事件
+    """
+
+    calendar_id: str
+    time_min: str
+    time_max: str
+    first: bool = True
+
+
+def plan_shards(
+    calendar_ids: Sequence[str],
+    time_min: str,
+    time_max: str,
+    shard_days: float | None = None,
+) -> list[Shard]:
+    """
+    plan_shards 依日曆與時間區間切分工作
+
+    Args:
+        calendar_ids (Sequence[str]): 日曆
+        time_min (str): 時間區間起始時間
+        time_max (str): 時間區間結束時間
+        shard_days (float | None, optional): 每個 shard 的天數，None 時每個日曆一個 shard. Defaults to None.
+
+    Returns:
+        list[Shard]: 工作，事件較多的日曆應以較小的 `shard_days` 分散到多個 process
+    """
+    from datetime import datetime, timedelta, timezone
+    from itertools import pairwise
+
+    from ..utils._datetime import to_timestamp
+
+    if shard_days is None:
+        return [Shard(calendar_id, time_min, time_max) for calendar_id in calendar_ids]
+
+    if shard_days <= 0:
+        raise ValueError("shard_days must be positive")
+
+    start, stop = to_timestamp(time_min), to_timestamp(time_max)
+    step = timedelta(days=shard_days).total_seconds()
+    bounds = [time_min]
+    cursor = start + step
+
+    while cursor < stop:
+        bounds.append(
+            datetime.fromtimestamp(cursor, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        )
+        cursor += step
+
+    bounds.append(time_max)
+
+    return [
+        Shard(calendar_id, shard_min, shard_max, first=index == 0)
+        for calendar_id in calendar_ids
+        for index, (shard_min, shard_max) in enumerate(pairwise(bounds))
+    ]
+
+
+def fetch_columns(
+    calendar: "Calendar", shard: Shard, max_results: int | None = None
+) -> EventColumns:
+    """
+    fetch_columns 以 partial response 只讀取 `EVENT_FIELDS`，直接轉換為 `EventColumns`
+
+    Args:
+        calendar (Calendar): 日曆
+        shard (Shard): 工作
+        max_results (int | None, optional): 每頁最大的回傳數，預設為 `MAX_LIST_RESULTS`. Defaults to None.
+
+    Returns:
+        EventColumns: 起始時間屬於 `shard` 的事件，全天事件以日曆的時區判斷
+    """
+    from zoneinfo import ZoneInfo
+
+    from ..calendar import MAX_LIST_RESULTS
+    from ..utils._datetime import to_timestamp
+
+    columns = EventColumns(shard.calendar_id)
+    lower = None if shard.first else to_timestamp(shard.time_min)
+    upper = to_timestamp(shard.time_max)
+    metadata: dict[str, Any] = {}
+    page_token: str | None = None
+
+    while True:
+        items, page_token = calendar.list_event_fields(
+            shard.calendar_id,
+            EVENT_FIELDS,
+            page_token,
+            time_min=shard.time_min,
+            time_max=shard.time_max,
+            max_results=max_results or MAX_LIST_RESULTS,
+            metadata=metadata,
+        )
+        # API 以日曆的時區判斷全天事件是否與區間重疊，分配 shard 時也需使用相同的時區
+        tz = ZoneInfo(metadata["timeZone"]) if "timeZone" in metadata else None
+
+        for item in items:
+            columns.append(item, min_start=lower, max_start=upper, tz=tz)
+
+        if not page_token:
+            return columns
+
+
+_worker_calendar: "Calendar | None" = None
+
+
+def _init_worker(
+    credentials_info: dict[str, Any],
+    token_json_path: str | None,
+    discovery_cache_dir: str | None,
+    pool_size: int | None,
+    user_rate: float,
+    project_rate: float,
+) -> None:
+    """_init_worker 每個 process 只建立一次 `Calendar`，process 間以 token.json 協調刷新"""
+    global _worker_calendar
+
+    from ..calendar import Calendar
+    from ..credentials import Credentials
+    from ..scheduler import RequestScheduler
+    from ..service.credentials import CredentialsService
+
+    credentials_service = CredentialsService(
+        Credentials.from_authorized_user_info(credentials_info),
+        token_json_path=token_json_path,
+        discovery_cache_dir=discovery_cache_dir,
+        pool_size=pool_size,
+    )
+    _worker_calendar = Calendar(
+        credentials_service.get_service("calendar", "v3"),
+        scheduler=RequestScheduler(user_rate=user_rate, project_rate=project_rate),
+    )
+
+
+def _run_shard(
+    shard: Shard, time_zone: str | None, max_results: int | None
+) -> EventAggregate:
+    if _worker_calendar is None:
+        raise RuntimeError("worker is not initialized")
+
+    return aggregate_columns(
+        fetch_columns(_worker_calendar, shard, max_results), time_zone
+    )
+
+
+def analyze_calendars(
+    credentials_service: "CredentialsService",
+    calendar_ids: Sequence[str],
+    *,
+    time_min: str,
+    time_max: str,
+    shard_days: float | None = None,
+    time_zone: str | None = None,
+    max_workers: int | None = None,
+    max_results: int | None = None,
+    user_rate: float = 10,
+    project_rate: float = 160,
+    mp_context: "BaseContext | None" = None,
+) -> EventAggregate:
+    """
+    analyze_calendars 以 process pool 平行讀取並彙總多個日曆的事件
+
+    每個 shard 在 worker process 內讀取 (只取得 `EVENT_FIELDS`)、轉換為 `EventColumns` 並彙總，
+    只有小型的 `EventAggregate` 會傳回主 process 合併，解析與彙總的 CPU 成本隨 process 數分散
+
+    Args:
+        credentials_service (CredentialsService): 憑證，worker 以相同的憑證建立服務對象
+        calendar_ids (Sequence[str]): 日曆
+        time_min (str): 時間區間起始時間
+        time_max (str): 時間區間結束時間
+        shard_days (float | None, optional): 每個 shard 的天數，None 時每個日曆一個 shard. Defaults to None.
+        time_zone (str | None, optional): 決定事件屬於哪一週的時區. Defaults to None.
+        max_workers (int | None, optional): process 數，預設為 CPU 數. Defaults to None.
+        max_results (int | None, optional): 每頁最大的回傳數. Defaults to None.
+        user_rate (float, optional): 所有 worker 合計的每秒請求數上限，平均分配給每個 worker. Defaults to 10.
+        project_rate (float, optional): 所有 worker 合計的專案每秒請求數上限. Defaults to 160.
+        mp_context (BaseContext | None, optional): multiprocessing context，預設為 `spawn`，避免 fork 複製執行緒與連線. Defaults to None.
+
+    Returns:
+        EventAggregate: 合併後的結果
+    """
+    import json
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from multiprocessing import get_context
+    from os import cpu_count
+
+    shards = plan_shards(calendar_ids, time_min, time_max, shard_days)
+    workers = max(1, min(max_workers or cpu_count() or 1, len(shards)))
+    result = EventAggregate()
+
+    if not shards:
+        return result
+
+    # 先刷新即將過期的 token，worker 不需各自刷新
+    credentials_service.token_manager.refresh()
+
+    LOGGER.info(
+        "Analyzing %d calendars in %d shards with %d processes",
+        len(calendar_ids),
+        len(shards),
+        workers,
+    )
+
+    with ProcessPoolExecutor(
+        workers,
+        mp_context=mp_context or get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(
+            json.loads(credentials_service.credentials.to_json()),
+            credentials_service.token_json_path,
+            credentials_service.discovery_cache_dir,
+            credentials_service.pool_size,
+            user_rate / workers,
+            project_rate / workers,
+        ),
+    ) as executor:
+        futures = [
+            executor.submit(_run_shard, shard, time_zone, max_results)
+            for shard in shards
+        ]
+
+        for future in as_completed(futures):
+            result.merge(future.result())
+
+    return result
@@ -0,0 +1,144 @@
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, tzinfo
+from typing import Any, ClassVar
+
+from ..utils._datetime import to_timestamp
+
+__all__ = ["EVENT_FIELDS", "EventColumns"]
+
+EVENT_FIELDS = ("start", "end", "attendees/email")
+"""建立 `EventColumns` 只需要的事件欄位，讀取時以 partial response 只取得這些欄位"""
+
+
+def _parse_time(value: Any, tz: tzinfo | None = None) -> tuple[float, bool]:
+    """
+    _parse_time 事件 `start`/`end` (dict 或 `EventTime`/`EventDate`) 的 epoch 秒與是否為全天事件，
+    全天事件的日期以 `tz` 的 00:00 計算，預設為 UTC
+    """
+    if isinstance(value, dict):
+        date_time, day = value.get("dateTime"), value.get("date")
+    else:
+        date_time, day = getattr(value, "dateTime", None), getattr(value, "date", None)
+
+    if date_time:
+        return to_timestamp(date_time), False
+
+    if tz is None:
+        return to_timestamp(day), True  # type: ignore[arg-type]
+
+    return datetime.fromisoformat(day).replace(tzinfo=tz).timestamp(), True  # type: ignore[arg-type]
+
+
+def _intern(values: list[str], index: dict[str, int], value: str) -> int:
+    """_intern `value` 在 `values` 中的位置，第一次出現時加入"""
+    if (code := index.get(value)) is None:
+        code = index[value] = len(values)
+        values.append(value)
+
+    return code
+
+
+@dataclass
+class EventColumns:
+    """
+    EventColumns 以欄位陣列保存事件，每個事件只佔數十 bytes，不會建立 `Event`
+
+    參加者以 CSR 格式保存：第 i 個事件的參加者為
+    `attendee_ids[attendee_offsets[i]:attendee_offsets[i + 1]]`，id 為 `attendees` 的位置
+
+    Args:
+        calendar_id (str): 事件所屬的`calendarID`
+    """
+
+    # 字串的索引 -> 對應的字串列表，索引可由列表重建，傳送到其他 process 時不需要
+    _INDEXES: ClassVar[dict[str, str]] = {"_attendee_index": "attendees"}
+
+    calendar_id: str
+    start: array = field(default_factory=lambda: array("d"))  # epoch 秒
+    end: array = field(default_factory=lambda: array("d"))  # epoch 秒
+    attendee_offsets: array = field(default_factory=lambda: array("q", [0]))
+    attendee_ids: array = field(default_factory=lambda: array("l"))
+    attendees: list[str] = field(default_factory=list)  # attendee id 對應的 email
+    _attendee_index: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @property
+    def duration(self) -> array:
+        """duration 每個事件的秒數"""
+        return array(
+            "d", (end - start for start, end in zip(self.start, self.end, strict=True))
+        )
+
+    def _attendee_id(self, email: str) -> int:
+        return _intern(self.attendees, self._attendee_index, email)
+
+    def _add(self, start: float, end: float, emails: Iterable[str]) -> None:
+        self.start.append(start)
+        self.end.append(end)
+        self.attendee_ids.extend(self._attendee_id(email) for email in emails)
+        self.attendee_offsets.append(len(self.attendee_ids))
+
+    def append(
+        self,
+        item: dict[str, Any],
+        min_start: float | None = None,
+        max_start: float | None = None,
+        tz: tzinfo | None = None,
+    ) -> bool:
+        """
+        append 加入一個 events 資源，只讀取 `EVENT_FIELDS`
+
+        Args:
+            item (dict[str, Any]): events 資源或只包含 `EVENT_FIELDS` 的部分回應
+            min_start (float | None, optional): 起始時間早於此 epoch 秒的事件不會加入. Defaults to None.
+            max_start (float | None, optional): 起始時間不早於此 epoch 秒的事件不會加入. Defaults to None.
+            tz (tzinfo | None, optional): 全天事件的日期使用的時區，通常為日曆的時區，預設為 UTC. Defaults to None.
+
+        Returns:
+            bool: 是否已加入
+        """
+        start, _ = _parse_time(item["start"], tz)
+
+        if (min_start is not None and start < min_start) or (
+            max_start is not None and start >= max_start
+        ):
+            return False
+
+        self._add(
+            start,
+            _parse_time(item["end"], tz)[0],
+            (
+                attendee["email"]
+                for attendee in item.get("attendees", ())
+                if "email" in attendee
+            ),
+        )
+
+        return True
+
+    def extend(self, items: Iterable[dict[str, Any]]) -> None:
+        for item in items:
+            self.append(item)
+
+    def event_attendees(self, index: int) -> array:
+        """event_attendees 第 `index` 個事件的 attendee id"""
+        return self.attendee_ids[
+            self.attendee_offsets[index] : self.attendee_offsets[index + 1]
+        ]
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {**self.__dict__, **{name: {} for name in self._INDEXES}}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+
+        for name, values in self._INDEXES.items():
+            setattr(
+                self,
+                name,
+                {value: code for code, value in enumerate(getattr(self, values))},
+            )
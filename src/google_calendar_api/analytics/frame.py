@@ -0,0 +1,146 @@
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from pydantic import BaseModel
+
+from .columns import EventColumns, _intern, _parse_time
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+
+__all__ = ["FRAME_FIELDS", "STATUSES", "EventFrame"]
+
+FRAME_FIELDS = ("id", "status", "start", "end")
+"""建立 `EventFrame` 只需要的事件欄位，讀取時以 partial response 只取得這些欄位"""
+
+STATUSES = ("confirmed", "tentative", "cancelled")
+"""`status_codes` 對應的狀態，沒有狀態的事件 (例如 `EventSlot`) 視為 `confirmed`"""
+
+_STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+
+@dataclass
+class EventFrame(EventColumns):
+    """
+    EventFrame 多個日曆的 `EventColumns`，另外保存事件 id、日曆、狀態與是否為全天事件
+
+    - `start`/`end`: UTC epoch 秒，全天事件為該日 00:00 UTC
+    - `all_day`: 1 為全天事件
+    - `calendar_codes`: `calendars` 的位置；`status_codes`: `STATUSES` 的位置
+    - `ids`: 事件 id
+
+    `to_numpy` 不複製資料即轉為 NumPy 陣列，重疊、使用率或分佈可以向量化計算
+
+    Examples:
+        >>> frame = api.get_calendar_event_frame(time_min=..., time_max=...)
+        >>> columns = frame.to_numpy()
+        >>> busy = (columns["end"] - columns["start"])[~columns["all_day"]].sum()
+    """
+
+    _INDEXES: ClassVar[dict[str, str]] = {
+        **EventColumns._INDEXES,
+        "_calendar_index": "calendars",
+    }
+
+    calendar_id: str = "primary"  # `append` 未指定時使用的`calendarID`
+    ids: list[str] = field(default_factory=list)
+    all_day: array = field(default_factory=lambda: array("b"))
+    calendar_codes: array = field(default_factory=lambda: array("i"))
+    status_codes: array = field(default_factory=lambda: array("b"))
+    # calendar code 對應的`calendarID`
+    calendars: list[str] = field(default_factory=list)
+    _calendar_index: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def _calendar_code(self, calendar_id: str) -> int:
+        return _intern(self.calendars, self._calendar_index, calendar_id)
+
+    def append(  # type: ignore[override]
+        self, event: BaseModel | dict[str, Any], calendar_id: str | None = None
+    ) -> None:
+        """
+        append 加入一個事件
+
+        Args:
+            event (BaseModel | dict[str, Any]): `Event`、`EventSlot` 或包含 `FRAME_FIELDS` 的部分回應
+            calendar_id (str | None, optional): 事件所屬的`calendarID`，預設為 `calendar_id`. Defaults to None.
+        """
+        if isinstance(event, BaseModel):
+            event_id, status = event.id, getattr(event, "status", None)  # type: ignore[attr-defined]
+            start, end = event.start, event.end  # type: ignore[attr-defined]
+            emails: Iterable[str] = (
+                attendee.email for attendee in getattr(event, "attendees", None) or ()
+            )
+        else:
+            event_id, status = event["id"], event.get("status")
+            start, end = event["start"], event["end"]
+            emails = (
+                attendee["email"]
+                for attendee in event.get("attendees", ())
+                if "email" in attendee
+            )
+
+        start, all_day = _parse_time(start)
+
+        # NumPy 陣列存在時 array 無法擴充，先加入 array 避免欄位長度不一致
+        self._add(start, _parse_time(end)[0], emails)
+        self.all_day.append(all_day)
+        self.status_codes.append(_STATUS_CODES.get(status or "confirmed", 0))
+        self.calendar_codes.append(self._calendar_code(calendar_id or self.calendar_id))
+        self.ids.append(event_id)
+
+    def extend(  # type: ignore[override]
+        self,
+        events: Iterable[BaseModel | dict[str, Any]],
+        calendar_id: str | None = None,
+    ) -> None:
+        for event in events:
+            self.append(event, calendar_id)
+
+    @classmethod
+    def from_events(
+        cls,
+        events: Iterable[BaseModel | dict[str, Any]],
+        calendar_id: str = "primary",
+    ) -> "EventFrame":
+        """from_events 由同一日曆的事件建立 `EventFrame`"""
+        frame = cls(calendar_id)
+        frame.extend(events)
+
+        return frame
+
+    @classmethod
+    def from_calendar_events(
+        cls, items: Iterable[tuple[str, BaseModel | dict[str, Any]]]
+    ) -> "EventFrame":
+        """from_calendar_events 由 (`calendarID`, 事件) 建立，例如 `get_multi_calendar_events` 的結果"""
+        frame = cls()
+
+        for calendar_id, event in items:
+            frame.append(event, calendar_id)
+
+        return frame
+
+    def to_numpy(self) -> dict[str, "ndarray"]:
+        """
+        to_numpy 轉為 NumPy 陣列，數值欄位與本身共用記憶體，NumPy 陣列存在期間不能再加入事件
+
+        需要安裝 `numpy` (`pip install google-calendar-api[numpy]`)
+
+        Returns:
+            dict[str, ndarray]: `id`、`start`、`end`、`all_day`、`calendar`、`status` 與
+            code 對應的 `calendars`、`statuses`
+        """
+        import numpy as np
+
+        return {
+            "id": np.array(self.ids, dtype=object),
+            "start": np.frombuffer(self.start, dtype=np.float64),
+            "end": np.frombuffer(self.end, dtype=np.float64),
+            "all_day": np.frombuffer(self.all_day, dtype=np.int8).view(np.bool_),
+            "calendar": np.frombuffer(self.calendar_codes, dtype=np.int32),
+            "status": np.frombuffer(self.status_codes, dtype=np.int8),
+            "calendars": np.array(self.calendars, dtype=object),
+            "statuses": np.array(STATUSES, dtype=object),
+        }
@@ -1,15 +1,28 @@
-from collections.abc import Generator
-from typing import Literal
+from collections.abc import Callable, Generator, Sequence
+from typing import Any, Literal
 
-from googleapiclient.discovery import Resource
 from typing_extensions import Unpack
 
+from .analytics import EventAggregate, EventFrame
+from .bulk import DEFAULT_CHUNK_SIZE, FileFormat, ImportResult
+from .calendar import BatchResult
 from .config import CalendarConfig
 from .log import LOGGER
-from .schema.calendar import Event
-from .service.calendar import CalendarService
+from .schedule import Conflict, ReschedulePlan, find_conflicts, plan_reschedule
+from .schema.calendar import Event, EventSlot, SyncEvent
+from .schema.freebusy import TimePeriod
+from .schema.parse import ParseMode
+from .service.calendar import (
+    CalendarService,
+    CalendarServiceBatch,
+    CalendarSync,
+    UpsertMode,
+)
 from .service.credentials import CredentialsService
-from .types.calendar import ApplicationAddEventParam
+from .service.freebusy import FreeBusyService
+from .store import EventStore
+from .types.calendar import ApplicationAddEventParam, EventListFilter
+from .watch import DEFAULT_COALESCE_DELAY, CalendarWatcher
 
 
 class GoogleCalendarAPI:
@@ -26,7 +39,56 @@ class GoogleCalendarAPI:
         port: int = 0,
         *,
         calendar_config_path: str,
+        event_store_path: str | None = None,
+        discovery_cache_dir: str | None = None,
+        pool_size: int | None = None,
+        parse_mode: ParseMode = "strict",
+        auto_refresh: bool = False,
     ) -> None:
+        self.credentials_service = self._load_credentials_service(
+            token=token,
+            refresh_token=refresh_token,
+            token_uri=token_uri,
+            client_id=client_id,
+            client_secret=client_secret,
+            scopes=scopes,
+            token_json_path=token_json_path,
+            credentials_json_path=credentials_json_path,
+            port=port,
+            discovery_cache_dir=discovery_cache_dir,
+            pool_size=pool_size,
+        )
+
+        if auto_refresh:
+            self.credentials_service.token_manager.start()
+
+        self.service = self.credentials_service.get_service("calendar", "v3")
+        config = self._load_config(calendar_config_path)
+
+        self.calendar_service = CalendarService(
+            service=self.service,
+            calendar_id=config.calendar_id,
+            store=EventStore(event_store_path) if event_store_path else None,
+            parse_mode=parse_mode,
+        )
+        self.freebusy_service = FreeBusyService(service=self.service)
+        self.time_zone = config.time_zone
+
+    @classmethod
+    def _load_credentials_service(
+        cls,
+        token: str | None = None,
+        refresh_token: str | None = None,
+        token_uri: str | None = None,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        scopes: list[str] | None = None,
+        token_json_path: str | None = None,
+        credentials_json_path: str | None = None,
+        port: int = 0,
+        discovery_cache_dir: str | None = None,
+        pool_size: int | None = None,
+    ) -> CredentialsService:
         if (
             token
             and refresh_token
@@ -35,33 +97,39 @@ class GoogleCalendarAPI:
             and client_secret
             and scopes
         ):
-            self.service = self._load_from_token_params(
+            return cls._load_from_token_params(
                 token,
                 refresh_token,
                 token_uri,
                 client_id,
                 client_secret,
                 scopes,
+                discovery_cache_dir,
+                pool_size,
             )
         elif token_json_path and scopes:
-            self.service = self._load_from_token_json(token_json_path, scopes)
+            return cls._load_from_token_json(
+                token_json_path, scopes, discovery_cache_dir, pool_size
+            )
         elif credentials_json_path and port and scopes and token_json_path:
-            self.service = self._load_from_credentials_json(
-                credentials_json_path, scopes, port, token_json_path
+            return cls._load_from_credentials_json(
+                credentials_json_path,
+                scopes,
+                port,
+                token_json_path,
+                discovery_cache_dir,
+                pool_size,
             )
         else:
             LOGGER.error("Invalid initialization parameters for GoogleCalendarAPI")
             raise ValueError("Invalid initialization parameters for GoogleCalendarAPI")
 
-        config = CalendarConfig.set_model_config(
+    @staticmethod
+    def _load_config(calendar_config_path: str) -> CalendarConfig:
+        return CalendarConfig.set_model_config(
             {"json_file": calendar_config_path, "json_file_encoding": "UTF-8"}
         )()  # type: ignore
 
-        self.calendar_service = CalendarService(
-            service=self.service, calendar_id=config.calendar_id
-        )
-        self.time_zone = config.time_zone
-
     @staticmethod
     def _load_from_token_params(
         token: str,
@@ -70,7 +138,9 @@ class GoogleCalendarAPI:
         client_id: str,
         client_secret: str,
         scopes: list[str],
-    ) -> Resource:
+        discovery_cache_dir: str | None = None,
+        pool_size: int | None = None,
+    ) -> CredentialsService:
         return CredentialsService.from_token_params(
             token=token,
             refresh_token=refresh_token,
@@ -78,13 +148,23 @@ class GoogleCalendarAPI:
             client_id=client_id,
             client_secret=client_secret,
             scopes=scopes,
-        ).get_service("calendar", "v3")
+            discovery_cache_dir=discovery_cache_dir,
+            pool_size=pool_size,
+        )
 
     @staticmethod
-    def _load_from_token_json(token_json_path: str, scopes: list[str]) -> Resource:
+    def _load_from_token_json(
+        token_json_path: str,
+        scopes: list[str],
+        discovery_cache_dir: str | None = None,
+        pool_size: int | None = None,
+    ) -> CredentialsService:
         return CredentialsService.from_authorized_user_file(
-            token_json_path=token_json_path, scopes=scopes
-        ).get_service("calendar", "v3")
+            token_json_path=token_json_path,
+            scopes=scopes,
+            discovery_cache_dir=discovery_cache_dir,
+            pool_size=pool_size,
+        )
 
     @staticmethod
     def _load_from_credentials_json(
@@ -92,29 +172,67 @@ class GoogleCalendarAPI:
         scopes: list[str],
         port: int,
         output_token_json: str,
-    ) -> Resource:
+        discovery_cache_dir: str | None = None,
+        pool_size: int | None = None,
+    ) -> CredentialsService:
         return CredentialsService.from_client_secrets_file(
             credentials_json_path=credentials_json_path,
             scopes=scopes,
             port=port,
             output_token_json=output_token_json,
-        ).get_service("calendar", "v3")
+            discovery_cache_dir=discovery_cache_dir,
+            pool_size=pool_size,
+        )
+
+    def batch(
+        self, batch_size: int | None = None, batch_uri: str | None = None
+    ) -> CalendarServiceBatch:
+        """
+        batch 將多個新增/修改/刪除合併成 multipart batch request，減少 round trip
+
+        Args:
+            batch_size (int | None, optional): 每個 batch request 的最大請求數，預設為 API 上限. Defaults to None.
+            batch_uri (str | None, optional): batch endpoint，可指向本地測試用的 server. Defaults to None.
+
+        Returns:
+            CalendarServiceBatch: 依排入順序回傳 `Event`、`None`(刪除) 或 `HttpError`
+
+        Examples:
+            >>> with api.batch() as batch:
+            ...     batch.add_calendar_event(summary="a", start_time=..., end_time=...)
+            ...     batch.delete_event("event_id")
+            >>> batch.results
+        """
+        return self.calendar_service.batch(
+            batch_size=batch_size, batch_uri=batch_uri, time_zone=self.time_zone
+        )
 
     def replace_calendar_event(
         self,
         event_or_event_id: Event | str,
         **event_param: Unpack[ApplicationAddEventParam],
     ) -> Event:
-        if isinstance(event_or_event_id, str):
-            event = self.get_calendar_event(event_id=event_or_event_id)
+        """
+        replace_calendar_event 更新事件
 
-        replace_event = event.model_copy(update=event_param)  # type: ignore
+        傳入 `Event` 時以其 `etag` 直接送出條件式 update，只需一次請求；
+        傳入事件id 時會先取得事件。
 
-        return self.calendar_service.update_calendar_event(
-            event_id=replace_event.id,
-            **self.calendar_service.process_event_to_event_param(event=replace_event),
+        Args:
+            event_or_event_id (Event | str): 呼叫端持有的事件或事件id
+            **event_param (ApplicationAddEventParam): 預修改的內容
+
+        Returns:
+            Event: 回傳已修改的事件
+        """
+        event = (
+            self.get_calendar_event(event_id=event_or_event_id)
+            if isinstance(event_or_event_id, str)
+            else event_or_event_id
         )
 
+        return self.calendar_service.replace_calendar_event(event, **event_param)
+
     def get_calendar_event(self, event_id: str) -> Event:
         return self.calendar_service.get_calendar_event(event_id)
 
@@ -123,10 +241,94 @@ class GoogleCalendarAPI:
         *,
         time_min: str,
         time_max: str,
-        max_results: int = 10,
+        max_results: int | None = None,
         order_by: Literal["startTime", "updated"] = "startTime",
         q: str | None = None,
+        read_ahead: int = 0,
+        expand_recurring: bool = False,
+        incremental: bool = False,
+        single_events: bool = True,
+        show_deleted: bool = False,
+        **filters: Unpack[EventListFilter],
     ) -> Generator[Event, None, None]:
+        """
+        get_calendar_events 逐一回傳時間區間內的事件
+
+        篩選條件都由伺服器端處理，只傳輸需要的事件；每頁預設為 API 上限 `MAX_LIST_RESULTS`，
+        讀取全部事件時請求數最少。提供篩選條件、`max_results`、`read_ahead`、`expand_recurring`
+        或 `incremental` 時不使用本地事件快取。
+
+        Args:
+            time_min (str): 時間區間起始時間
+            time_max (str): 時間區間結束時間
+            max_results (int | None, optional): 每頁最大的回傳數，預設為 `MAX_LIST_RESULTS`. Defaults to None.
+            order_by (Literal["startTime", "updated"], optional): 排序方式，`single_events` 為 False 時不使用 `startTime`. Defaults to "startTime".
+            q (str | None, optional): 搜尋關鍵字. Defaults to None.
+            read_ahead (int, optional): 大於 0 時為串流模式，呼叫端處理目前頁面時於背景預先取得最多 `read_ahead` 頁. Defaults to 0.
+            expand_recurring (bool, optional): 只取得重複事件的主體與例外並在本地展開，結果依起始時間排序，忽略 `order_by` 與 `max_results`. Defaults to False.
+            incremental (bool, optional): 逐一解碼回應中的事件並立即回傳，記憶體用量不隨 `max_results` 增加，忽略 `read_ahead`. Defaults to False.
+            single_events (bool, optional): 如果為True，將重複事件展平為單個事件. Defaults to True.
+            show_deleted (bool, optional): 如果為True，則包括已刪除的事件. Defaults to False.
+            **filters (EventListFilter): `updated_min`、`private_extended_property`、`shared_extended_property`、`event_types`、`i_cal_uid`
+
+        Yields:
+            Event: calendar event
+        """
+        if (
+            self.calendar_service.store is not None
+            and q is None
+            and single_events
+            and not show_deleted
+            and not filters
+            and max_results is None
+            and not read_ahead
+            and not expand_recurring
+            and not incremental
+        ):
+            yield from self.calendar_service.get_cached_calendar_events(
+                time_min=time_min, time_max=time_max, order_by=order_by
+            )
+            return
+
+        if expand_recurring:
+            yield from self.calendar_service.expand_calendar_events(
+                time_min=time_min,
+                time_max=time_max,
+                q=q,
+                time_zone=self.time_zone,
+                **filters,
+            )
+            return
+
+        if incremental:
+            yield from self.calendar_service.iter_calendar_events(
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+                order_by=order_by,
+                q=q,
+                single_events=single_events,
+                time_zone=self.time_zone,
+                show_deleted=show_deleted,
+                **filters,
+            )
+            return
+
+        if read_ahead:
+            yield from self.calendar_service.stream_calendar_events(
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+                order_by=order_by,
+                q=q,
+                single_events=single_events,
+                time_zone=self.time_zone,
+                show_deleted=show_deleted,
+                read_ahead=read_ahead,
+                **filters,
+            )
+            return
+
         page_token: str | None = None
 
         while True:
@@ -137,30 +339,592 @@ class GoogleCalendarAPI:
                 max_results=max_results,
                 order_by=order_by,
                 q=q,
+                single_events=single_events,
                 time_zone=self.time_zone,
+                show_deleted=show_deleted,
+                **filters,
             )
 
-            if page_token := query_event.nextPageToken:
-                yield from query_event.items
-            else:
+            yield from query_event.items
+
+            if not (page_token := query_event.nextPageToken):
                 break
 
+    def get_calendar_event_slots(
+        self,
+        *,
+        time_min: str,
+        time_max: str,
+        max_results: int | None = None,
+        order_by: Literal["startTime", "updated"] = "startTime",
+        q: str | None = None,
+        **filters: Unpack[EventListFilter],
+    ) -> Generator[EventSlot, None, None]:
+        """
+        get_calendar_event_slots 只取得 id、摘要與起訖時間，逐一回傳 `EventSlot`
+
+        Args:
+            time_min (str): 時間區間起始時間
+            time_max (str): 時間區間結束時間
+            max_results (int | None, optional): 每頁最大的回傳數，預設為 `MAX_LIST_RESULTS`. Defaults to None.
+            order_by (Literal["startTime", "updated"], optional): 排序方式. Defaults to "startTime".
+            q (str | None, optional): 搜尋關鍵字. Defaults to None.
+            **filters (EventListFilter): 由伺服器端篩選的條件
+
+        Yields:
+            EventSlot: 輕量的事件
+        """
+        yield from self.calendar_service.get_calendar_events_as(
+            EventSlot,
+            time_min=time_min,
+            time_max=time_max,
+            max_results=max_results,
+            order_by=order_by,
+            q=q,
+            time_zone=self.time_zone,
+            **filters,
+        )
+
+    def get_calendar_event_rows(
+        self,
+        fields: Sequence[str] = ("id", "start", "end", "summary"),
+        *,
+        time_min: str,
+        time_max: str,
+        max_results: int | None = None,
+        order_by: Literal["startTime", "updated"] = "startTime",
+        q: str | None = None,
+        **filters: Unpack[EventListFilter],
+    ) -> Generator[tuple[Any, ...], None, None]:
+        """
+        get_calendar_event_rows 只取得 `fields`，逐一回傳依 `fields` 順序排列的 tuple
+
+        Args:
+            fields (Sequence[str], optional): 事件的欄位. Defaults to ("id", "start", "end", "summary").
+            time_min (str): 時間區間起始時間
+            time_max (str): 時間區間結束時間
+            max_results (int | None, optional): 每頁最大的回傳數，預設為 `MAX_LIST_RESULTS`. Defaults to None.
+            order_by (Literal["startTime", "updated"], optional): 排序方式. Defaults to "startTime".
+            q (str | None, optional): 搜尋關鍵字. Defaults to None.
+            **filters (EventListFilter): 由伺服器端篩選的條件
+
+        Yields:
+            tuple[Any, ...]: 依 `fields` 順序排列的值
+        """
+        yield from self.calendar_service.get_calendar_event_rows(
+            fields,
+            time_min=time_min,
+            time_max=time_max,
+            max_results=max_results,
+            order_by=order_by,
+            q=q,
+            time_zone=self.time_zone,
+            **filters,
+        )
+
+    def get_calendar_event_frame(
+        self,
+        *,
+        time_min: str,
+        time_max: str,
+        calendar_ids: list[str] | None = None,
+        max_results: int | None = None,
+        q: str | None = None,
+        **filters: Unpack[EventListFilter],
+    ) -> EventFrame:
+        """
+        get_calendar_event_frame 將一或多個日曆的事件轉為欄位陣列，以 `to_numpy` 向量化計算
+
+        Args:
+            time_min (str): 時間區間起始時間
+            time_max (str): 時間區間結束時間
+            calendar_ids (list[str] | None, optional): 要讀取的日曆，預設為設定檔的日曆. Defaults to None.
+            max_results (int | None, optional): 每頁最大的回傳數，預設為 `MAX_LIST_RESULTS`. Defaults to None.
+            q (str | None, optional): 搜尋關鍵字. Defaults to None.
+            **filters (EventListFilter): 由伺服器端篩選的條件
+
+        Returns:
+            EventFrame: 事件的時間區間，`calendars` 依 `calendar_ids` 的順序
+        """
+        frame = EventFrame()
+
+        for calendar_id in calendar_ids or [self.calendar_service.calendar_id]:
+            calendar_service = (
+                self.calendar_service
+                if calendar_id == self.calendar_service.calendar_id
+                else CalendarService(service=self.service, calendar_id=calendar_id)
+            )
+            calendar_service.get_calendar_event_frame(
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+                q=q,
+                time_zone=self.time_zone,
+                frame=frame,
+                **filters,
+            )
+
+        return frame
+
+    def calendar_sync(
+        self,
+        sync_token_path: str | None = None,
+        *,
+        time_min: str | None = None,
+        time_max: str | None = None,
+    ) -> CalendarSync:
+        """
+        calendar_sync 建立增量同步，每次 `sync()` 只取得上次同步後變更與刪除的事件
+
+        Args:
+            sync_token_path (str | None, optional): 保存 `syncToken` 的檔案路徑，未提供時只保存在記憶體. Defaults to None.
+            time_min (str | None, optional): 完整同步時的時間區間起始時間. Defaults to None.
+            time_max (str | None, optional): 完整同步時的時間區間結束時間. Defaults to None.
+
+        Returns:
+            CalendarSync: 增量同步
+        """
+        return CalendarSync(
+            self.calendar_service,
+            sync_token_path=sync_token_path,
+            time_min=time_min,
+            time_max=time_max,
+        )
+
+    def calendar_watcher(
+        self,
+        on_change: Callable[[str, SyncEvent], Any],
+        address: str | None = None,
+        *,
+        calendar_ids: list[str] | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str = "/",
+        ttl: int | None = None,
+        delay: float = DEFAULT_COALESCE_DELAY,
+    ) -> CalendarWatcher:
+        """
+        calendar_watcher 建立推播通知的監看，取代定時輪詢 `get_calendar_events`
+
+        Args:
+            on_change (Callable[[str, SyncEvent], Any]): 有變更時以 (`calendarID`, 變更) 呼叫
+            address (str | None, optional): Google 通知的 HTTPS URL，需轉送到 `host:port`. Defaults to None.
+            calendar_ids (list[str] | None, optional): 要監看的日曆，預設為設定檔的日曆. Defaults to None.
+            host (str, optional): receiver 監聽的位址. Defaults to "127.0.0.1".
+            port (int, optional): receiver 監聽的 port. Defaults to 0.
+            path (str, optional): receiver 接收通知的路徑. Defaults to "/".
+            ttl (int | None, optional): channel 的存活秒數. Defaults to None.
+            delay (float, optional): 合併通知的等待秒數. Defaults to DEFAULT_COALESCE_DELAY.
+
+        Returns:
+            CalendarWatcher: 尚未啟動的監看，以 `with` 或 `start()` 啟動
+        """
+        calendar_services = [
+            self.calendar_service
+            if calendar_id == self.calendar_service.calendar_id
+            else CalendarService(
+                service=self.service,
+                calendar_id=calendar_id,
+                parse_mode=self.calendar_service.calendar.parse_mode,
+            )
+            for calendar_id in calendar_ids or [self.calendar_service.calendar_id]
+        ]
+
+        return CalendarWatcher(
+            calendar_services,
+            on_change,
+            address,
+            host=host,
+            port=port,
+            path=path,
+            ttl=ttl,
+            delay=delay,
+        )
+
+    def get_multi_calendar_events(
+        self,
+        calendar_ids: list[str],
+        *,
+        time_min: str,
+        time_max: str,
+        max_results: int | None = None,
+        q: str | None = None,
+        max_workers: int = 8,
+    ) -> Generator[tuple[str, Event], None, None]:
+        """
+        get_multi_calendar_events 同時讀取多個日曆在時間區間內的事件，依起始時間合併後逐一回傳
+
+        Args:
+            calendar_ids (list[str]): 要讀取的`calendarID`
+            time_min (str): 時間區間起始時間
+            time_max (str): 時間區間結束時間
+            max_results (int | None, optional): 每個日曆每頁最大的回傳數，預設為 `MERGE_PAGE_SIZE`. Defaults to None.
+            q (str | None, optional): 搜尋關鍵字. Defaults to None.
+            max_workers (int, optional): 同時進行中的最大請求數. Defaults to 8.
+
+        Yields:
+            tuple[str, Event]: (`calendarID`, 事件)，依起始時間排序
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        from .service.calendar import merge_calendars_events
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from merge_calendars_events(
+                self.calendar_service.calendar,
+                calendar_ids,
+                executor,
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+                q=q,
+                time_zone=self.time_zone,
+            )
+
+    def find_free_slots(
+        self,
+        calendar_ids: list[str],
+        *,
+        time_min: str,
+        time_max: str,
+        duration_minutes: float,
+        count: int = 1,
+    ) -> list[TimePeriod]:
+        """
+        find_free_slots 找出所有日曆共同的前 `count` 個空閒時段
+
+        設定本地事件快取時，本身的日曆由快取的事件計算，其他日曆以單一 freebusy 請求查詢。
+
+        Args:
+            calendar_ids (list[str]): 要查詢的`calendarID`
+            time_min (str): 時間區間起始時間
+            time_max (str): 時間區間結束時間
+            duration_minutes (float): 空閒時段的長度(分鐘)
+            count (int, optional): 最多回傳的時段數. Defaults to 1.
+
+        Returns:
+            list[TimePeriod]: 空閒時段
+
+        Raises:
+            FreeBusyQueryError: 任一日曆的 freebusy 查詢失敗
+        """
+        calendar_id = self.calendar_service.calendar_id
+        events: list[Event] = []
+
+        if self.calendar_service.store is not None and calendar_id in calendar_ids:
+            events = self.calendar_service.get_cached_calendar_events(
+                time_min=time_min, time_max=time_max
+            )
+            calendar_ids = [cid for cid in calendar_ids if cid != calendar_id]
+
+        return self.freebusy_service.find_free_slots(
+            calendar_ids,
+            time_min=time_min,
+            time_max=time_max,
+            duration=duration_minutes * 60,
+            count=count,
+            events=events,
+        )
+
+    def find_calendar_conflicts(
+        self,
+        *,
+        time_min: str,
+        time_max: str,
+        calendar_ids: list[str] | None = None,
+    ) -> list[Conflict]:
+        """
+        find_calendar_conflicts 找出一或多個日曆在時間區間內所有時間重疊的事件
+
+        Args:
+            time_min (str): 時間區間起始時間
+            time_max (str): 時間區間結束時間
+            calendar_ids (list[str] | None, optional): 要檢查的日曆，預設為設定檔的日曆. Defaults to None.
+
+        Returns:
+            list[Conflict]: 重疊的事件
+        """
+        return find_conflicts(
+            self.get_calendar_event_frame(
+                time_min=time_min,
+                time_max=time_max,
+                calendar_ids=calendar_ids,
+            )
+        )
+
+    def reschedule_calendar_events(
+        self,
+        event_ids: list[str],
+        *,
+        time_min: str,
+        time_max: str,
+        calendar_ids: list[str] | None = None,
+        blocked: Sequence[TimePeriod] = (),
+        buffer_minutes: float = 0,
+        step_minutes: float | None = None,
+        dry_run: bool = False,
+        batch_size: int | None = None,
+    ) -> ReschedulePlan:
+        """
+        reschedule_calendar_events 將本身日曆的多個事件移到互不重疊的時段，並以 batch request 一次套用
+
+        每個日曆只讀取一次 (只取得 id、狀態與起訖時間)，之後由 `plan_reschedule` 計算所有移動，
+        每個需要移動的事件只送出一次 patch，不需要逐一讀取後再修改。
+
+        Args:
+            event_ids (list[str]): 要移動的事件 id
+            time_min (str): 新時段最早的起始時間，也是讀取事件的範圍
+            time_max (str): 新時段最晚的結束時間，也是讀取事件的範圍
+            calendar_ids (list[str] | None, optional): 新時段不可與之重疊的其他日曆 (例如會議室). Defaults to None.
+            blocked (Sequence[TimePeriod], optional): 不可使用的時段，例如會議室停用的時間. Defaults to ().
+            buffer_minutes (float, optional): 與其他事件之間至少間隔的分鐘數. Defaults to 0.
+            step_minutes (float | None, optional): 新的起始時間對齊的分鐘數. Defaults to None.
+            dry_run (bool, optional): 只計算不寫入. Defaults to False.
+            batch_size (int | None, optional): 每個 batch request 的最大請求數. Defaults to None.
+
+        Returns:
+            ReschedulePlan: 重新安排的結果，套用後 `results` 為每個 patch 的結果
+        """
+        calendar_id = self.calendar_service.calendar_id
+        frame = self.get_calendar_event_frame(
+            time_min=time_min,
+            time_max=time_max,
+            calendar_ids=[
+                calendar_id,
+                *(cid for cid in calendar_ids or [] if cid != calendar_id),
+            ],
+        )
+        plan = plan_reschedule(
+            frame,
+            event_ids,
+            calendar_id=calendar_id,
+            time_min=time_min,
+            time_max=time_max,
+            blocked=blocked,
+            buffer=buffer_minutes * 60,
+            step=step_minutes * 60 if step_minutes else None,
+        )
+
+        LOGGER.info(
+            "Reschedule plan: %d moves, %d kept, %d unplaced",
+            len(plan.moves),
+            len(plan.kept),
+            len(plan.unplaced),
+        )
+
+        if plan.moves and not dry_run:
+            plan.results = self.calendar_service.move_calendar_events(
+                plan.moves, batch_size=batch_size, time_zone=self.time_zone
+            )
+
+        return plan
+
+    def analyze_calendars(
+        self,
+        calendar_ids: list[str],
+        *,
+        time_min: str,
+        time_max: str,
+        shard_days: float | None = None,
+        max_workers: int | None = None,
+        max_results: int | None = None,
+        user_rate: float = 10,
+        project_rate: float = 160,
+    ) -> EventAggregate:
+        """
+        analyze_calendars 以 process pool 彙總多個日曆在時間區間內的事件數與時數
+
+        Args:
+            calendar_ids (list[str]): 要彙總的`calendarID`
+            time_min (str): 時間區間起始時間
+            time_max (str): 時間區間結束時間
+            shard_days (float | None, optional): 每個 shard 的天數，None 時每個日曆一個 shard. Defaults to None.
+            max_workers (int | None, optional): process 數，預設為 CPU 數. Defaults to None.
+            max_results (int | None, optional): 每頁最大的回傳數. Defaults to None.
+            user_rate (float, optional): 所有 process 合計的每秒請求數上限. Defaults to 10.
+            project_rate (float, optional): 所有 process 合計的專案每秒請求數上限. Defaults to 160.
+
+        Returns:
+            EventAggregate: 依日曆、參加者、週與長度分組的彙總結果
+        """
+        from .analytics import analyze_calendars
+
+        return analyze_calendars(
+            self.credentials_service,
+            calendar_ids,
+            time_min=time_min,
+            time_max=time_max,
+            shard_days=shard_days,
+            time_zone=self.time_zone,
+            max_workers=max_workers,
+            max_results=max_results,
+            user_rate=user_rate,
+            project_rate=project_rate,
+        )
+
+    def export_calendar_events(
+        self,
+        path: str,
+        *,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        q: str | None = None,
+        file_format: FileFormat | None = None,
+    ) -> int:
+        """
+        export_calendar_events 串流讀取事件並逐頁寫入 JSONL 或 ICS 檔案，記憶體用量與事件數無關
+
+        Args:
+            path (str): 輸出檔案路徑，副檔名為 `.ics` 時預設為 ICS
+            time_min (str | None, optional): 時間區間起始時間. Defaults to None.
+            time_max (str | None, optional): 時間區間結束時間. Defaults to None.
+            q (str | None, optional): 搜尋關鍵字. Defaults to None.
+            file_format (FileFormat | None, optional): 檔案格式，預設依副檔名判斷. Defaults to None.
+
+        Returns:
+            int: 匯出的事件數
+        """
+        from .bulk import write_events
+        from .calendar import MAX_LIST_RESULTS
+
+        count = write_events(
+            self.calendar_service.stream_calendar_events(
+                time_min=time_min,
+                time_max=time_max,
+                max_results=MAX_LIST_RESULTS,
+                q=q,
+                time_zone=self.time_zone,
+            ),
+            path,
+            file_format,
+        )
+        LOGGER.info("Exported %d events to %s", count, path)
+
+        return count
+
+    def import_calendar_events(
+        self,
+        path: str,
+        *,
+        checkpoint_path: str | None = None,
+        failed_path: str | None = None,
+        file_format: FileFormat | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        batch_size: int | None = None,
+    ) -> ImportResult:
+        """
+        import_calendar_events 分段讀取 JSONL 或 ICS 檔案並以 batch request 新增事件
+
+        提供 `checkpoint_path` 時每段完成後保存進度，中斷後以相同參數重新呼叫即可從中斷處繼續，
+        不會重複新增事件
+
+        Args:
+            path (str): 匯入的檔案路徑，副檔名為 `.ics` 時預設為 ICS
+            checkpoint_path (str | None, optional): checkpoint 檔案路徑. Defaults to None.
+            failed_path (str | None, optional): 以 JSONL 記錄失敗的記錄與錯誤. Defaults to None.
+            file_format (FileFormat | None, optional): 檔案格式，預設依副檔名判斷. Defaults to None.
+            chunk_size (int, optional): 每段的記錄數. Defaults to DEFAULT_CHUNK_SIZE.
+            batch_size (int | None, optional): 每個 batch request 的最大請求數. Defaults to None.
+
+        Returns:
+            ImportResult: 匯入的結果
+        """
+        from os.path import abspath
+
+        from .bulk import EventImporter, read_records
+
+        importer = EventImporter(
+            self.calendar_service,
+            checkpoint_path=checkpoint_path,
+            failed_path=failed_path,
+            chunk_size=chunk_size,
+            batch_size=batch_size,
+            time_zone=self.time_zone,
+        )
+
+        return importer.run(read_records(path, file_format), source=abspath(path))
+
+    def upsert_calendar_event(
+        self,
+        key: str,
+        mode: UpsertMode = "id",
+        **event_param: Unpack[ApplicationAddEventParam],
+    ) -> Event:
+        """
+        upsert_calendar_event 以 `key` 新增或修改事件，重複呼叫不會產生重複的事件
+
+        Args:
+            key (str): 呼叫端的唯一識別
+            mode (UpsertMode, optional): `id` 以 `key` 產生事件id，`property` 將 `key` 記錄在私有屬性. Defaults to "id".
+
+        Returns:
+            Event: 已新增或修改的事件
+        """
+        return self.calendar_service.upsert_calendar_event(
+            key, mode, time_zone=self.time_zone, **event_param
+        )
+
+    def upsert_calendar_events(
+        self,
+        items: Sequence[tuple[str, ApplicationAddEventParam]],
+        mode: UpsertMode = "id",
+        batch_size: int | None = None,
+    ) -> list[BatchResult]:
+        """
+        upsert_calendar_events 以 batch request 新增或修改多個事件，每個事件一次寫入，不會搜尋事件
+
+        Args:
+            items (Sequence[tuple[str, ApplicationAddEventParam]]): `key` 與事件內容
+            mode (UpsertMode, optional): 事件與 `key` 的對應方式. Defaults to "id".
+            batch_size (int | None, optional): 每個 batch request 的最大請求數. Defaults to None.
+
+        Returns:
+            list[BatchResult]: 依 `items` 順序排列的結果
+        """
+        return self.calendar_service.upsert_calendar_events(
+            items,  # type: ignore
+            mode=mode,
+            batch_size=batch_size,
+            time_zone=self.time_zone,
+        )
+
     def add_calendar_event(
-        self, replace: bool = False, **event_param: Unpack[ApplicationAddEventParam]
+        self,
+        replace: bool = False,
+        key: str | None = None,
+        **event_param: Unpack[ApplicationAddEventParam],
     ) -> Event | None:
+        """
+        add_calendar_event 新增事件
+
+        Args:
+            replace (bool, optional): 在起訖時間內以摘要搜尋事件並取代第一個符合的事件，
+                找不到時不會新增並回傳 None. Defaults to False.
+            key (str | None, optional): 指定時以 `upsert_calendar_event` 新增或修改此 `key` 的事件，
+                重複呼叫不會產生重複的事件，此時會忽略 `replace`. Defaults to None.
+
+        Returns:
+            Event | None: 已新增或修改的事件，`replace` 找不到事件時為 None
+        """
+        if key is not None:
+            return self.upsert_calendar_event(key, **event_param)
+
         if replace:
             try:
                 return self.replace_calendar_event(
-                    event_or_event_id=self.get_calendar_events(
-                        time_min=event_param["start_time"],
-                        time_max=event_param["end_time"],
-                        q=event_param["summary"],
-                    ).__next__(),
+                    event_or_event_id=next(
+                        self.get_calendar_events(
+                            time_min=event_param["start_time"],
+                            time_max=event_param["end_time"],
+                            max_results=1,
+                            q=event_param["summary"],
+                        )
+                    ),
                     **event_param,
                 )
             except StopIteration:
                 return None
-        else:
-            return self.calendar_service.add_calendar_event(
-                time_zone=self.time_zone, **event_param
-            )
+
+        return self.calendar_service.add_calendar_event(
+            time_zone=self.time_zone, **event_param
+        )
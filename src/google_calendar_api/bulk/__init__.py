@@ -0,0 +1,2 @@
+from .bulk import *  # noqa: F403
+from .ics import *  # noqa: F403
@@ -0,0 +1,349 @@
+import json
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Literal
+
+from pydantic import BaseModel
+
+from ..collection import remove_dict_value_none
+from ..log import LOGGER
+from ..schema.calendar import Attendee, Event, Reminders
+from ..schema.parse import EventView
+from ..types.calendar import EventParam
+from .ics import ICS_FOOTER, ICS_HEADER, event_to_ics, read_ics
+
+if TYPE_CHECKING:
+    from ..service.calendar import CalendarService
+
+__all__ = [
+    "FileFormat",
+    "DEFAULT_CHUNK_SIZE",
+    "ImportResult",
+    "EventImporter",
+    "infer_format",
+    "write_events",
+    "read_records",
+    "to_event_param",
+    "import_event_id",
+]
+
+FileFormat = Literal["jsonl", "ics"]
+
+DEFAULT_CHUNK_SIZE = 500
+"""每次送出並寫入 checkpoint 的記錄數"""
+
+
+def infer_format(path: str) -> FileFormat:
+    """infer_format 副檔名為 `.ics` 時為 ICS，其他為 JSONL"""
+    return "ics" if path.lower().endswith(".ics") else "jsonl"
+
+
+def write_events(
+    events: Iterable[Event], path: str, file_format: FileFormat | None = None
+) -> int:
+    """
+    write_events 逐一將事件寫入 JSONL 或 ICS 檔案，不會保留已寫入的事件
+
+    JSONL 每行為一個 events 資源；trusted 模式的 `EventView` 直接寫出原始資料，不需驗證
+
+    Args:
+        events (Iterable[Event]): 事件，通常為串流讀取的結果
+        path (str): 輸出檔案路徑
+        file_format (FileFormat | None, optional): 檔案格式，預設依副檔名判斷. Defaults to None.
+
+    Returns:
+        int: 寫入的事件數
+    """
+    file_format = file_format or infer_format(path)
+    count = 0
+
+    with open(path, mode="w", encoding="UTF-8", newline="") as file:
+        if file_format == "ics":
+            file.write(ICS_HEADER)
+
+        for event in events:
+            if file_format == "ics":
+                file.write(event_to_ics(event))
+            elif isinstance(event, EventView):
+                file.write(json.dumps(event.raw, ensure_ascii=False))
+                file.write("\n")
+            else:
+                file.write(event.model_dump_json(exclude_none=True))
+                file.write("\n")
+
+            count += 1
+
+        if file_format == "ics":
+            file.write(ICS_FOOTER)
+
+    return count
+
+
+def read_records(
+    path: str, file_format: FileFormat | None = None
+) -> Iterator[dict[str, Any]]:
+    """
+    read_records 逐一讀取 JSONL 或 ICS 檔案中的事件，轉換為 events 資源格式的 dict
+
+    Args:
+        path (str): 檔案路徑
+        file_format (FileFormat | None, optional): 檔案格式，預設依副檔名判斷. Defaults to None.
+
+    Yields:
+        dict[str, Any]: events 資源
+    """
+    file_format = file_format or infer_format(path)
+
+    with open(path, encoding="UTF-8", newline="") as file:
+        if file_format == "ics":
+            yield from read_ics(file)
+            return
+
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def to_event_param(record: dict[str, Any]) -> EventParam:
+    """
+    to_event_param 將 events 資源轉換為新增事件使用的 `EventParam`
+
+    沒有 `end` 時，全天事件為一天，其他與 `start` 相同
+
+    Args:
+        record (dict[str, Any]): events 資源
+
+    Returns:
+        EventParam: 新增事件的參數
+    """
+    from datetime import date, timedelta
+
+    start = record["start"]
+    end = record.get("end")
+
+    if end is None:
+        end = (
+            {"date": str(date.fromisoformat(start["date"]) + timedelta(days=1))}
+            if "date" in start
+            else start
+        )
+
+    param = EventParam(
+        summary=record.get("summary", ""),
+        start_time=start.get("dateTime") or start.get("date"),
+        end_time=end.get("dateTime") or end.get("date"),
+        time_zone=start.get("timeZone"),
+        location=record.get("location"),
+        description=record.get("description"),
+        recurrence=record.get("recurrence"),
+        attendees=[
+            Attendee.model_validate(attendee) for attendee in record["attendees"]
+        ]
+        if record.get("attendees")
+        else None,
+        reminders=Reminders.model_validate(record["reminders"])
+        if record.get("reminders")
+        else None,
+    )
+
+    # 沒有值的欄位不傳入，讓批次寫入可以補上預設的時區
+    return EventParam(**remove_dict_value_none(param))  # type: ignore
+
+
+def import_event_id(calendar_id: str, position: int, record: dict[str, Any]) -> str:
+    """
+    import_event_id 由日曆、記錄位置與內容產生固定的事件id
+
+    中斷後重新匯入同一個檔案時會產生相同的 id，已新增的事件以 409 回應而不會重複新增
+
+    Returns:
+        str: 32 個 base32hex 字元的事件id
+    """
+    from base64 import b32hexencode
+    from hashlib import sha1
+
+    content = json.dumps(record, sort_keys=True, ensure_ascii=False)
+    digest = sha1(
+        f"{calendar_id}\0{position}\0{content}".encode(), usedforsecurity=False
+    ).digest()
+
+    return b32hexencode(digest).decode().lower()
+
+
+class ImportResult(BaseModel):
+    position: int = 0  # 已處理的記錄數，恢復時從此位置繼續
+    inserted: int = 0
+    existing: int = 0  # 先前中斷時已新增的事件
+    failed: int = 0
+
+
+class EventImporter:
+    """
+    EventImporter 以 batch request 分段新增大量事件，每段完成後寫入 checkpoint，中斷後可從 checkpoint 繼續
+
+    每筆記錄以 `import_event_id` 指定固定的事件id，中斷時已送出但未寫入 checkpoint 的記錄重新送出時
+    API 回傳 409，視為已新增；配額或暫時性錯誤會重新送出，其他錯誤計入 `failed` 並寫入 `failed_path`。
+
+    Args:
+        calendar_service (CalendarService): 寫入的日曆
+        checkpoint_path (str | None, optional): checkpoint 檔案路徑，None 時不會保存進度. Defaults to None.
+        failed_path (str | None, optional): 以 JSONL 記錄失敗的記錄與錯誤. Defaults to None.
+        chunk_size (int, optional): 每段的記錄數，記憶體用量只與此有關. Defaults to DEFAULT_CHUNK_SIZE.
+        batch_size (int | None, optional): 每個 batch request 的最大請求數. Defaults to None.
+        time_zone (str | None, optional): 記錄沒有時區時使用的時區. Defaults to None.
+        max_retries (int, optional): 暫時性錯誤重新送出的次數. Defaults to 3.
+    """
+
+    def __init__(
+        self,
+        calendar_service: "CalendarService",
+        checkpoint_path: str | None = None,
+        failed_path: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        batch_size: int | None = None,
+        time_zone: str | None = None,
+        max_retries: int = 3,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        self.calendar_service = calendar_service
+        self.checkpoint_path = checkpoint_path
+        self.failed_path = failed_path
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        self.time_zone = time_zone
+        self.max_retries = max_retries
+
+    def _load_checkpoint(self, source: str) -> ImportResult:
+        from os.path import exists
+
+        if self.checkpoint_path is None or not exists(self.checkpoint_path):
+            return ImportResult()
+
+        with open(self.checkpoint_path, encoding="UTF-8") as file:
+            checkpoint = json.load(file)
+
+        calendar_id = self.calendar_service.calendar_id
+
+        if (checkpoint.get("source"), checkpoint.get("calendar_id")) != (
+            source,
+            calendar_id,
+        ):
+            LOGGER.warning(
+                "Checkpoint %s belongs to another import, starting over",
+                self.checkpoint_path,
+            )
+            return ImportResult()
+
+        return ImportResult.model_validate(checkpoint["result"])
+
+    def _save_checkpoint(self, source: str, result: ImportResult) -> None:
+        from os import replace
+
+        if self.checkpoint_path is None:
+            return
+
+        tmp_path = f"{self.checkpoint_path}.tmp"
+
+        with open(tmp_path, mode="w", encoding="UTF-8") as file:
+            json.dump(
+                {
+                    "source": source,
+                    "calendar_id": self.calendar_service.calendar_id,
+                    "result": result.model_dump(),
+                },
+                file,
+            )
+
+        replace(tmp_path, self.checkpoint_path)
+
+    def _record_failure(self, record: dict[str, Any], error: Exception) -> None:
+        LOGGER.warning("Import failed: %s", error)
+
+        if self.failed_path is None:
+            return
+
+        with open(self.failed_path, mode="a", encoding="UTF-8") as file:
+            file.write(
+                json.dumps({"record": record, "error": str(error)}, ensure_ascii=False)
+            )
+            file.write("\n")
+
+    def _import_chunk(
+        self, chunk: list[tuple[int, dict[str, Any]]], result: ImportResult
+    ) -> None:
+        from time import sleep
+
+        from googleapiclient.errors import HttpError
+
+        from ..scheduler import RequestScheduler
+
+        calendar_id = self.calendar_service.calendar_id
+        pending = chunk
+
+        for attempt in range(self.max_retries + 1):
+            batch = self.calendar_service.batch(
+                batch_size=self.batch_size, time_zone=self.time_zone
+            )
+
+            for position, record in pending:
+                batch.add_calendar_event(
+                    event_id=import_event_id(calendar_id, position, record),
+                    **to_event_param(record),
+                )
+
+            retry: list[tuple[int, dict[str, Any]]] = []
+
+            for (position, record), response in zip(
+                pending, batch.execute(), strict=True
+            ):
+                if not isinstance(response, Exception):
+                    result.inserted += 1
+                elif isinstance(response, HttpError) and response.resp.status == 409:
+                    result.existing += 1
+                elif attempt < self.max_retries and RequestScheduler.is_retryable(
+                    response
+                ):
+                    retry.append((position, record))
+                else:
+                    result.failed += 1
+                    self._record_failure(record, response)
+
+            if not retry:
+                return
+
+            LOGGER.info("Retrying %d rate limited imports", len(retry))
+            sleep(min(2**attempt, 30))
+            pending = retry
+
+    def run(self, records: Iterable[dict[str, Any]], source: str) -> ImportResult:
+        """
+        run 從 checkpoint 的位置開始分段匯入記錄
+
+        Args:
+            records (Iterable[dict[str, Any]]): events 資源，通常為 `read_records` 的結果
+            source (str): 記錄來源的識別，checkpoint 只會用於相同來源
+
+        Returns:
+            ImportResult: 匯入的結果
+        """
+        from itertools import islice
+
+        result = self._load_checkpoint(source)
+        iterator = enumerate(islice(records, result.position, None), result.position)
+
+        if result.position:
+            LOGGER.info("Resuming import of %s at record %d", source, result.position)
+
+        while chunk := list(islice(iterator, self.chunk_size)):
+            self._import_chunk(chunk, result)
+            result.position = chunk[-1][0] + 1
+            self._save_checkpoint(source, result)
+            LOGGER.info(
+                "Imported %d records into %s (%d failed)",
+                result.position,
+                self.calendar_service.calendar_id,
+                result.failed,
+            )
+
+        return result
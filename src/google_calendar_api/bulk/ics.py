@@ -0,0 +1,220 @@
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from typing import IO, Any
+
+from ..schema.calendar import Event, EventDate, EventTime
+
+__all__ = ["ICS_HEADER", "ICS_FOOTER", "event_to_ics", "read_ics"]
+
+ICS_HEADER = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "PRODID:-//google-calendar-api//EN\r\n"
+    "CALSCALE:GREGORIAN\r\n"
+)
+ICS_FOOTER = "END:VCALENDAR\r\n"
+
+PARTSTAT = {
+    "needsAction": "NEEDS-ACTION",
+    "declined": "DECLINED",
+    "tentative": "TENTATIVE",
+    "accepted": "ACCEPTED",
+}
+RESPONSE_STATUS = {value: key for key, value in PARTSTAT.items()}
+RECURRENCE_PROPERTIES = ("RRULE", "EXRULE", "EXDATE", "RDATE")
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _unescape(value: str) -> str:
+    result: list[str] = []
+    chars = iter(value)
+
+    for char in chars:
+        if char == "\\":
+            char = next(chars, "")
+            result.append("\n" if char in "nN" else char)
+        else:
+            result.append(char)
+
+    return "".join(result)
+
+
+def _fold(line: str) -> str:
+    """_fold 依 RFC 5545 將超過 75 octets 的內容行折行，不會切開 UTF-8 字元"""
+    if len(line.encode("UTF-8")) <= 75:
+        return f"{line}\r\n"
+
+    parts: list[str] = []
+    current, size, limit = [], 0, 75
+
+    for char in line:
+        width = len(char.encode("UTF-8"))
+
+        if size + width > limit:
+            parts.append("".join(current))
+            current, size, limit = [], 0, 74  # 接續行以一個空白開頭
+
+        current.append(char)
+        size += width
+
+    parts.append("".join(current))
+
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _format_time(name: str, value: EventTime | EventDate) -> str:
+    if isinstance(value, EventDate):
+        return f"{name};VALUE=DATE:{value.date.replace('-', '')}"
+
+    instant = datetime.fromisoformat(value.dateTime.replace("Z", "+00:00"))
+
+    return f"{name}:{instant.astimezone(timezone.utc):%Y%m%dT%H%M%SZ}"
+
+
+def _parse_time(params: dict[str, str], value: str) -> dict[str, Any]:
+    """_parse_time 將 DTSTART/DTEND 轉換為 events 資源的 `start`/`end`"""
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        return {"date": f"{value[:4]}-{value[4:6]}-{value[6:8]}"}
+
+    date_time = datetime.strptime(value.rstrip("Z"), "%Y%m%dT%H%M%S").isoformat()
+
+    if value.endswith("Z"):
+        return {"dateTime": f"{date_time}Z"}
+
+    if "TZID" in params:
+        return {"dateTime": date_time, "timeZone": params["TZID"]}
+
+    return {"dateTime": date_time}
+
+
+def event_to_ics(event: Event) -> str:
+    """
+    event_to_ics 將事件轉換為 VEVENT，時間一律以 UTC 表示
+
+    Args:
+        event (Event): calendar event
+
+    Returns:
+        str: 以 CRLF 結尾且已折行的 VEVENT
+    """
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{event.iCalUID}",
+        _format_time("DTSTAMP", EventTime(dateTime=event.updated)),
+        _format_time("DTSTART", event.start),
+        _format_time("DTEND", event.end),
+        f"SUMMARY:{_escape(event.summary)}",
+        f"STATUS:{event.status.upper()}",
+        f"SEQUENCE:{event.sequence}",
+    ]
+
+    if event.originalStartTime is not None:
+        lines.append(_format_time("RECURRENCE-ID", event.originalStartTime))
+
+    if event.description:
+        lines.append(f"DESCRIPTION:{_escape(event.description)}")
+
+    if event.location:
+        lines.append(f"LOCATION:{_escape(event.location)}")
+
+    lines.extend(event.recurrence or [])
+    lines.extend(
+        f"ATTENDEE;PARTSTAT={PARTSTAT[attendee.responseStatus]}:mailto:{attendee.email}"
+        for attendee in event.attendees
+    )
+    lines.append("END:VEVENT")
+
+    return "".join(_fold(line) for line in lines)
+
+
+def _unfold(lines: Iterable[str]) -> Iterator[str]:
+    current: str | None = None
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+
+        if current:
+            yield current
+
+        current = line
+
+    if current:
+        yield current
+
+
+def read_ics(file: IO[str]) -> Iterator[dict[str, Any]]:
+    """
+    read_ics 逐一讀取 ICS 檔案中的 VEVENT，轉換為 events 資源格式的 dict，只保留一個 VEVENT 在記憶體中
+
+    支援 SUMMARY、DESCRIPTION、LOCATION、DTSTART/DTEND (DATE、UTC 與 TZID)、
+    RRULE/EXRULE/EXDATE/RDATE、ATTENDEE 與 UID；VALARM 等巢狀元件會被忽略
+
+    Args:
+        file (IO[str]): 以文字模式開啟的 ICS 檔案
+
+    Yields:
+        dict[str, Any]: events 資源
+    """
+    record: dict[str, Any] | None = None
+    depth = 0
+
+    for line in _unfold(file):
+        name_params, _, value = line.partition(":")
+        name, *raw_params = name_params.split(";")
+        name = name.upper()
+
+        if name == "BEGIN":
+            if value.upper() == "VEVENT" and record is None:
+                record, depth = {}, 0
+            elif record is not None:
+                depth += 1
+            continue
+
+        if name == "END":
+            if record is not None and depth:
+                depth -= 1
+            elif record is not None and value.upper() == "VEVENT":
+                yield record
+                record = None
+            continue
+
+        if record is None or depth:
+            continue
+
+        params = {
+            key.upper(): param_value.strip('"')
+            for key, _, param_value in (param.partition("=") for param in raw_params)
+        }
+
+        if name in ("SUMMARY", "DESCRIPTION", "LOCATION"):
+            record[name.lower()] = _unescape(value)
+        elif name == "DTSTART":
+            record["start"] = _parse_time(params, value)
+        elif name == "DTEND":
+            record["end"] = _parse_time(params, value)
+        elif name == "UID":
+            record["iCalUID"] = value
+        elif name in RECURRENCE_PROPERTIES:
+            record.setdefault("recurrence", []).append(line)
+        elif name == "ATTENDEE":
+            record.setdefault("attendees", []).append(
+                {
+                    "email": value.removeprefix("mailto:").removeprefix("MAILTO:"),
+                    "responseStatus": RESPONSE_STATUS.get(
+                        params.get("PARTSTAT", ""), "needsAction"
+                    ),
+                }
+            )
@@ -1 +1,4 @@
+from .aio import *  # noqa: F403
+from .batch import *  # noqa: F403
 from .calendar import *  # noqa: F403
+from .pager import *  # noqa: F403
@@ -0,0 +1,336 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, Literal
+
+from googleapiclient.discovery import Resource
+from googleapiclient.http import HttpRequest
+from typing_extensions import Self, Unpack
+
+from ..scheduler import Priority, RequestScheduler, get_default_scheduler
+from ..schema.calendar import Attendee, Event, QueryEvent, Reminders
+from ..schema.parse import ParseMode, parse_query_event
+from ..types.calendar import EventListFilter, EventParam
+from .calendar import MAX_LIST_RESULTS, Calendar
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+
+__all__ = ["AsyncCalendar"]
+
+
+class AsyncCalendar:
+    """
+    AsyncCalendar `Calendar` 的 asyncio 版本，請求由 discovery document 建立後以 `httpx.AsyncClient` 送出，
+    同時進行中的請求數由 `max_concurrency` 限制
+
+    請求與 `Calendar` 相同經由 `RequestScheduler` 取得配額並重試，預設與同步的請求共用 process 內的排程器
+
+    需要安裝 `httpx` (`pip install google-calendar-api[async]`)
+
+    Args:
+        service (Resource): Google API 服務對象
+        max_concurrency (int, optional): 同時進行中的最大請求數. Defaults to 10.
+        client (AsyncClient | None, optional): 共用的 `httpx.AsyncClient`，未提供時自行建立. Defaults to None.
+        parse_mode (ParseMode, optional): `list_events` 事件的轉換方式. Defaults to "strict".
+        scheduler (RequestScheduler | None, optional): 請求排程器，預設為 process 內共用的排程器. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        service: Resource,
+        max_concurrency: int = 10,
+        client: "AsyncClient | None" = None,
+        parse_mode: ParseMode = "strict",
+        scheduler: RequestScheduler | None = None,
+    ) -> None:
+        from httpx import AsyncClient, Limits
+
+        self.calendar = Calendar(
+            service=service,
+            scheduler=scheduler or get_default_scheduler(),
+            parse_mode=parse_mode,
+        )
+        self.scheduler = self.calendar.scheduler
+        self.client = client or AsyncClient(
+            limits=Limits(max_connections=max_concurrency)
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    @staticmethod
+    async def _authorize(request: HttpRequest, headers: dict[str, str]) -> None:
+        from google.auth.credentials import Credentials
+
+        credentials = getattr(request.http, "credentials", None)
+
+        if not isinstance(credentials, Credentials):
+            return
+
+        if not credentials.valid:
+            from google.auth.transport.requests import Request
+
+            await asyncio.to_thread(credentials.refresh, Request())
+
+        credentials.apply(headers)
+
+    async def execute(
+        self,
+        request: HttpRequest,
+        priority: Priority = Priority.INTERACTIVE,
+        retry: bool = True,
+    ) -> Any:
+        """
+        execute 經由 `scheduler` 取得配額後以 `httpx.AsyncClient` 送出 `HttpRequest`，可重試的錯誤會以 backoff 重試
+
+        Args:
+            request (HttpRequest): 尚未執行的請求
+            priority (Priority, optional): 優先順序. Defaults to Priority.INTERACTIVE.
+            retry (bool, optional): 是否重試，沒有呼叫端指定id 的新增需設為 False. Defaults to True.
+
+        Raises:
+            HttpError: 回應狀態碼不為 2xx
+
+        Returns:
+            Any: 解析後的 JSON 回應，無內容時為 None
+        """
+        return await self.scheduler.acall(
+            lambda: self._send(request),
+            user=self.scheduler.user_key(request),
+            priority=priority,
+            retry=retry,
+        )
+
+    async def _send(self, request: HttpRequest) -> Any:
+        """
+        _send 送出一次 `HttpRequest`
+
+        Args:
+            request (HttpRequest): 尚未執行的請求
+
+        Raises:
+            HttpError: 回應狀態碼不為 2xx
+
+        Returns:
+            Any: 解析後的 JSON 回應，無內容時為 None
+        """
+        from time import perf_counter
+
+        from googleapiclient.errors import HttpError
+        from httplib2 import Response
+
+        from ..instrumentation import RequestRecord, emit_request, get_request_hooks
+
+        record = RequestRecord.from_request(request) if get_request_hooks() else None
+        start = perf_counter()
+
+        try:
+            headers = dict(request.headers)
+            await self._authorize(request, headers)
+
+            async with self._semaphore:
+                response = await self.client.request(
+                    request.method,
+                    request.uri,
+                    content=request.body,
+                    headers=headers,
+                )
+
+            if record is not None:
+                record.status = response.status_code
+                record.response_bytes = len(response.content)
+
+            if not 200 <= response.status_code < 300:
+                raise HttpError(
+                    Response({"status": response.status_code, **response.headers}),
+                    response.content,
+                    uri=request.uri,
+                )
+
+            parse_start = perf_counter()
+            result = response.json() if response.content else None
+
+            if record is not None:
+                record.parse_time = perf_counter() - parse_start
+
+            return result
+        except Exception as error:
+            if record is not None:
+                record.error = error
+
+            raise
+        finally:
+            if record is not None:
+                record.latency = perf_counter() - start
+                emit_request(record)
+
+    async def get_event(self, calendar_id: str, event_id: str) -> Event:
+        return Event(
+            **await self.execute(
+                self.calendar.events.get(calendarId=calendar_id, eventId=event_id)  # type: ignore
+            )
+        )
+
+    async def get_events(self, calendar_id: str, event_ids: list[str]) -> list[Event]:
+        """
+        get_events 同時取得多個事件，依 `event_ids` 順序回傳
+
+        Args:
+            calendar_id (str): 分享時的`calendarID`
+            event_ids (list[str]): 事件的id
+
+        Returns:
+            list[Event]: calendar events
+        """
+        return list(
+            await asyncio.gather(
+                *(self.get_event(calendar_id, event_id) for event_id in event_ids)
+            )
+        )
+
+    async def list_events(
+        self,
+        calendar_id: str = "primary",
+        page_token: str | None = None,
+        *,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        max_results: int = MAX_LIST_RESULTS,
+        order_by: Literal["startTime", "updated"] = "startTime",
+        q: str | None = None,
+        single_events: bool = True,
+        time_zone: str | None = None,
+        show_deleted: bool = False,
+        **filters: Unpack[EventListFilter],
+    ) -> QueryEvent:
+        return parse_query_event(
+            await self.execute(
+                self.calendar._list_request(
+                    calendar_id=calendar_id,
+                    page_token=page_token,
+                    time_min=time_min,
+                    time_max=time_max,
+                    max_results=max_results,
+                    order_by=order_by,
+                    q=q,
+                    single_events=single_events,
+                    time_zone=time_zone,
+                    show_deleted=show_deleted,
+                    **filters,
+                )
+            ),
+            self.calendar.parse_mode,
+        )
+
+    async def update_event(
+        self,
+        calendar_id: str,
+        event_id: str,
+        *,
+        summary: str | None = None,
+        start_time: str | None = None,
+        end_time: str | None = None,
+        location: str | None = None,
+        description: str | None = None,
+        attendees: list[Attendee] | None = None,
+        reminders: Reminders | None = None,
+        time_zone: str | None = None,
+    ) -> Event:
+        event = await self.get_event(calendar_id=calendar_id, event_id=event_id)
+
+        update_event = self.calendar._merge_event(
+            event,
+            summary=summary,
+            start_time=start_time,
+            end_time=end_time,
+            location=location,
+            description=description,
+            attendees=attendees,
+            reminders=reminders,
+            time_zone=time_zone,
+        )
+
+        return Event(
+            **await self.execute(
+                self.calendar._update_request(
+                    calendar_id=calendar_id, event=update_event
+                )
+            )
+        )
+
+    async def conditional_update_event(
+        self, calendar_id: str, event: Event, **event_params: Unpack[EventParam]
+    ) -> Event:
+        from googleapiclient.errors import HttpError
+
+        refetched = False
+
+        while True:
+            request = self.calendar._update_request(
+                calendar_id=calendar_id,
+                event=self.calendar._merge_event(event, **event_params),
+            )
+            request.headers["If-Match"] = event.etag
+
+            try:
+                return Event(**await self.execute(request))
+            except HttpError as error:
+                if error.resp.status != 412 or refetched:
+                    raise
+
+            event = await self.get_event(calendar_id=calendar_id, event_id=event.id)
+            refetched = True
+
+    async def patch_event(
+        self, calendar_id: str, event_id: str, **event_params: Unpack[EventParam]
+    ) -> Event:
+        return Event(
+            **await self.execute(
+                self.calendar._patch_request(calendar_id, event_id, **event_params)
+            )
+        )
+
+    async def insert_event(
+        self, calendar_id: str, **event_params: Unpack[EventParam]
+    ) -> Event:
+        return Event(
+            **await self.execute(
+                self.calendar._insert_request(calendar_id, **event_params),
+                retry=False,
+            )
+        )
+
+    async def upsert_event(
+        self,
+        calendar_id: str,
+        event_id: str,
+        exists: bool = False,
+        **event_params: Unpack[EventParam],
+    ) -> Event:
+        """upsert_event 同 `Calendar.upsert_event`，`exists` 時先 patch，否則先以 `event_id` 新增"""
+        from googleapiclient.errors import HttpError
+
+        insert = self.calendar._insert_request(
+            calendar_id, **{**event_params, "event_id": event_id}
+        )
+        patch = self.calendar._upsert_patch_request(
+            calendar_id, event_id, **event_params
+        )
+        first, second = (patch, insert) if exists else (insert, patch)
+
+        try:
+            return Event(**await self.execute(first))
+        except HttpError as error:
+            if error.resp.status != (404 if exists else 409):
+                raise
+
+        return Event(**await self.execute(second))
+
+    async def delete_event(self, calendar_id: str, event_id: str) -> None:
+        await self.execute(self.calendar._delete_request(calendar_id, event_id))
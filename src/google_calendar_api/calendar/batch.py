@@ -0,0 +1,220 @@
+from collections.abc import Callable
+from time import time
+from typing import TYPE_CHECKING, Any
+
+from googleapiclient.errors import HttpError
+from googleapiclient.http import BatchHttpRequest, HttpRequest
+from typing_extensions import Self, Unpack
+
+from ..instrumentation import RequestRecord, get_request_hooks, record_call
+from ..log import LOGGER
+from ..scheduler import Priority
+from ..schema.calendar import Event
+from ..types.calendar import EventParam
+
+if TYPE_CHECKING:
+    from .calendar import Calendar
+
+__all__ = ["MAX_BATCH_SIZE", "BatchResult", "CalendarBatch"]
+
+MAX_BATCH_SIZE = 50
+"""Google Calendar API 單一 batch request 可包含的最大請求數"""
+
+BatchResult = Event | HttpError | Exception | None
+"""
+每個排入佇列的操作結果: 成功時為 `Event`(刪除為 `None`)，失敗時為 `HttpError`；
+整段 batch request 送出失敗 (連線錯誤或 5xx) 時，該段每個操作的結果都是該例外
+"""
+
+
+class CalendarBatch:
+    """
+    CalendarBatch 將 insert/patch/update/delete 排入佇列，並以 multipart batch request 送出
+    doc : https://developers.google.com/calendar/api/guides/batch
+
+    Examples:
+        >>> with calendar.batch() as batch:
+        ...     batch.insert_event("primary", summary="a")
+        ...     batch.delete_event("primary", "event_id")
+        >>> batch.results
+        [Event(...), None]
+    """
+
+    def __init__(
+        self,
+        calendar: "Calendar",
+        batch_size: int = MAX_BATCH_SIZE,
+        batch_uri: str | None = None,
+    ) -> None:
+        if not 0 < batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}")
+
+        self.calendar = calendar
+        self.batch_size = batch_size
+        self.batch_uri = batch_uri
+        self.results: list[BatchResult] = []
+        self._queue: list[tuple[HttpRequest, Callable[[Any], BatchResult]]] = []
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:
+        if exc_type is None:
+            self.execute()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    @staticmethod
+    def _parse_event(response: Any) -> Event:
+        return Event(**response)
+
+    @staticmethod
+    def _parse_none(response: Any) -> None:
+        return None
+
+    def _new_batch_request(self) -> BatchHttpRequest:
+        if self.batch_uri:
+            return BatchHttpRequest(batch_uri=self.batch_uri)
+
+        return self.calendar.service.new_batch_http_request()  # type: ignore
+
+    def add(self, request: HttpRequest, parser: Callable[[Any], BatchResult]) -> int:
+        """
+        add 將請求排入佇列
+
+        Args:
+            request (HttpRequest): 尚未執行的請求
+            parser (Callable[[Any], BatchResult]): 將回應轉換為結果的函式
+
+        Returns:
+            int: 該請求在結果中的位置
+        """
+        self._queue.append((request, parser))
+
+        return len(self._queue) - 1
+
+    def insert_event(self, calendar_id: str, **event_params: Unpack[EventParam]) -> int:
+        return self.add(
+            self.calendar._insert_request(calendar_id, **event_params),
+            self._parse_event,
+        )
+
+    def patch_event(
+        self, calendar_id: str, event_id: str, **event_params: Unpack[EventParam]
+    ) -> int:
+        return self.add(
+            self.calendar._patch_request(calendar_id, event_id, **event_params),
+            self._parse_event,
+        )
+
+    def upsert_patch_event(
+        self, calendar_id: str, event_id: str, **event_params: Unpack[EventParam]
+    ) -> int:
+        """upsert_patch_event 排入 patch，並將已刪除的事件恢復為 confirmed"""
+        return self.add(
+            self.calendar._upsert_patch_request(calendar_id, event_id, **event_params),
+            self._parse_event,
+        )
+
+    def update_event(
+        self, calendar_id: str, event: Event, **event_params: Unpack[EventParam]
+    ) -> int:
+        """
+        update_event 以呼叫端持有的 `Event` 合併修改內容後排入 update，不會再額外 get 一次
+
+        Args:
+            calendar_id (str): 分享時的`calendarID`
+            event (Event): 預修改的事件
+            **event_params (EventParam): 預修改的內容
+
+        Returns:
+            int: 該請求在結果中的位置
+        """
+        update_event = self.calendar._merge_event(event, **event_params)
+
+        return self.add(
+            self.calendar._update_request(calendar_id, update_event),
+            self._parse_event,
+        )
+
+    def delete_event(self, calendar_id: str, event_id: str) -> int:
+        return self.add(
+            self.calendar._delete_request(calendar_id, event_id), self._parse_none
+        )
+
+    def execute(self) -> list[BatchResult]:
+        """
+        execute 依 `batch_size` 分段送出所有排入佇列的請求
+
+        某一段送出失敗時，該段每個操作的結果為該例外，其他段照常送出，
+        因此結果數量永遠與排入的操作數相同
+
+        Returns:
+            list[BatchResult]: 依排入順序排列的結果
+        """
+        queue, self._queue = self._queue, []
+        results: list[BatchResult] = [None] * len(queue)
+        done: set[int] = set()
+
+        for offset in range(0, len(queue), self.batch_size):
+            batch_request = self._new_batch_request()
+            chunk = range(offset, min(offset + self.batch_size, len(queue)))
+
+            def callback(
+                request_id: str, response: Any, exception: HttpError | None
+            ) -> None:
+                index = int(request_id)
+                done.add(index)
+
+                if exception is not None:
+                    results[index] = exception
+                else:
+                    results[index] = queue[index][1](response)
+
+            for index in chunk:
+                batch_request.add(
+                    queue[index][0], callback=callback, request_id=str(index)
+                )
+
+            tokens = len(chunk)
+            user = self.calendar.scheduler.user_key(queue[offset][0])
+
+            def call(
+                send: Callable[[], Any], user: str = user, tokens: int = tokens
+            ) -> Any:
+                return self.calendar.scheduler.call(
+                    send,
+                    user=user,
+                    priority=Priority.BULK,
+                    tokens=tokens,
+                    retry=False,
+                )
+
+            try:
+                if get_request_hooks():
+                    record_call(
+                        RequestRecord(
+                            method="batch",
+                            http_method="POST",
+                            calendar_id=None,
+                            start_time=time(),
+                            requests=tokens,
+                        ),
+                        call,
+                        batch_request.execute,
+                    )
+                else:
+                    call(batch_request.execute)
+            except Exception as error:
+                LOGGER.warning(
+                    "Batch request of %d operations failed: %s", tokens, error
+                )
+
+                for index in chunk:
+                    if index not in done:
+                        results[index] = error
+
+        self.results.extend(results)
+
+        return results
@@ -1,17 +1,59 @@
-from typing import Literal
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any, Literal, TypeVar
 
 from googleapiclient.discovery import Resource
+from googleapiclient.http import HttpRequest
+from pydantic import BaseModel
 from typing_extensions import Self, Unpack
 
-from ..schema.calendar import Attendee, Event, QueryEvent, Reminders
-from ..types.calendar import EventParam
+from ..instrumentation import record_request
+from ..scheduler import Priority, RequestScheduler, get_default_scheduler
+from ..schema.calendar import (
+    Attendee,
+    CancelledEvent,
+    Event,
+    EventTime,
+    QueryEvent,
+    Reminders,
+    SeriesEvent,
+    SyncEvent,
+)
+from ..schema.channel import Channel
+from ..schema.freebusy import FreeBusy
+from ..schema.parse import EventView, ParseMode, parse_event, parse_query_event
+from ..types.calendar import EventListFilter, EventParam
+from .batch import MAX_BATCH_SIZE, CalendarBatch
 
-__all__ = ["Calendar"]
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+__all__ = ["Calendar", "MAX_LIST_RESULTS", "MAX_FREEBUSY_CALENDARS"]
+
+MAX_LIST_RESULTS = 2500
+"""events.list 單頁可回傳的最大事件數"""
+
+MAX_FREEBUSY_CALENDARS = 50
+"""freebusy.query 單次可查詢的最大日曆數"""
 
 
 class Calendar:
-    def __init__(self, service: Resource) -> None:
+    def __init__(
+        self,
+        service: Resource,
+        scheduler: RequestScheduler | None = None,
+        parse_mode: ParseMode = "strict",
+    ) -> None:
+        """
+        Args:
+            service (Resource): Google API 服務對象
+            scheduler (RequestScheduler | None, optional): 請求排程器，預設為 process 內共用的排程器. Defaults to None.
+            parse_mode (ParseMode, optional): `list_events`/`sync_events` 事件的轉換方式，大量讀取時可使用 `trusted`. Defaults to "strict".
+        """
+        from threading import local
+
         self.service = service
+        self.scheduler = scheduler or get_default_scheduler()
+        self.parse_mode: ParseMode = parse_mode
+        self._thread_local = local()
 
     def __enter__(self) -> Self:
         return self
@@ -19,14 +61,234 @@ class Calendar:
     def __exit__(self, exc_type, exc, exc_tb) -> None:
         self.service.close()
 
+    def thread_http(self) -> Any:
+        """
+        thread_http 取得目前執行緒專用的 http 對象，`Resource` 內建的 httplib2 `Http` 並非 thread-safe
+
+        Returns:
+            Any: 使用相同憑證的 `AuthorizedHttp`；`Resource` 使用 thread-safe 的 transport (例如 `PooledHttp`)
+                或未使用憑證時回傳原本的 http 對象
+        """
+        from google.auth.credentials import Credentials
+
+        http = self.service._http  # type: ignore
+        credentials = getattr(http, "credentials", None)
+
+        if getattr(http, "thread_safe", False) or not isinstance(
+            credentials, Credentials
+        ):
+            return http
+
+        if (thread_http := getattr(self._thread_local, "http", None)) is None:
+            from google_auth_httplib2 import AuthorizedHttp
+            from httplib2 import Http
+
+            thread_http = self._thread_local.http = AuthorizedHttp(
+                credentials, http=Http()
+            )
+
+        return thread_http
+
+    def _execute(
+        self,
+        request: HttpRequest,
+        priority: Priority = Priority.INTERACTIVE,
+        http: Any = None,
+        parser: Callable[[Any], Any] | None = None,
+        retry: bool = True,
+    ) -> Any:
+        """
+        _execute 經由 `scheduler` 送出請求，並以 `record_request` 通知已註冊的 instrumentation hook
+
+        Args:
+            request (HttpRequest): 尚未執行的請求
+            priority (Priority, optional): 優先順序. Defaults to Priority.INTERACTIVE.
+            http (Any, optional): 執行請求使用的 http 對象. Defaults to None.
+            parser (Callable[[Any], Any] | None, optional): 將回應轉換為 model 的函式，轉換時間計入紀錄. Defaults to None.
+            retry (bool, optional): 是否重試，沒有呼叫端指定id 的新增等非冪等請求需設為 False，
+                避免伺服器已完成但回應失敗時重複新增. Defaults to True.
+
+        Returns:
+            Any: `parser` 的回傳值，沒有 `parser` 時為解析後的回應
+        """
+        return record_request(
+            request,
+            lambda send: self.scheduler.call(
+                send,
+                user=self.scheduler.user_key(request),
+                priority=priority,
+                retry=retry,
+            ),
+            parser=parser,
+            http=http,
+        )
+
     @property
     def events(self) -> Resource:
         return self.service.events()  # type: ignore
 
-    def _serial_event(self, **event_params: Unpack[EventParam]) -> EventParam:
+    def _serial_event(self, **event_params: Unpack[EventParam]) -> dict[str, Any]:
+        """
+        _serial_event 將 `EventParam` 轉換為 events 資源的 request body，值為 None 的欄位不會送出
+
+        `start_time`/`end_time` 為 `yyyy-mm-dd` 時視為全天事件 (`date`)，否則為 `dateTime`
+
+        Returns:
+            dict[str, Any]: events 資源
+        """
         from ..collection import remove_dict_value_none
 
-        return remove_dict_value_none(event_params)  # type: ignore
+        time_zone = event_params.get("time_zone")
+
+        def event_time(value: str | None) -> dict[str, Any] | None:
+            if value is None:
+                return None
+
+            if len(value) == 10:
+                return {"date": value}
+
+            return dict(
+                remove_dict_value_none({"dateTime": value, "timeZone": time_zone})
+            )
+
+        attendees = event_params.get("attendees")
+        reminders = event_params.get("reminders")
+        private_properties = event_params.get("private_properties")
+
+        return dict(
+            remove_dict_value_none(
+                {
+                    "id": event_params.get("event_id"),
+                    "summary": event_params.get("summary"),
+                    "location": event_params.get("location"),
+                    "description": event_params.get("description"),
+                    "start": event_time(event_params.get("start_time")),
+                    "end": event_time(event_params.get("end_time")),
+                    "attendees": (
+                        [attendee.model_dump() for attendee in attendees]
+                        if attendees is not None
+                        else None
+                    ),
+                    "reminders": (
+                        reminders.model_dump(exclude_none=True)
+                        if reminders is not None
+                        else None
+                    ),
+                    "recurrence": event_params.get("recurrence"),
+                    "extendedProperties": (
+                        {"private": private_properties}
+                        if private_properties is not None
+                        else None
+                    ),
+                }
+            )
+        )
+
+    def _merge_event(self, event: Event, **event_params: Unpack[EventParam]) -> Event:
+        """
+        _merge_event 將修改內容合併到 `event`，回傳新的 `Event`
+
+        Args:
+            event (Event): 原本的事件
+            **event_params (EventParam): 預修改的內容
+
+        Returns:
+            Event: 合併後的事件
+        """
+        merged = {**event.model_dump(), **self._serial_event(**event_params)}
+
+        for key in ("start", "end"):
+            # 只修改 dateTime 時沿用原本的 timeZone，避免時區被清除
+            original = getattr(event, key)
+
+            if (
+                "dateTime" in merged[key]
+                and "timeZone" not in merged[key]
+                and isinstance(original, EventTime)
+                and original.timeZone is not None
+            ):
+                merged[key] = {**merged[key], "timeZone": original.timeZone}
+
+        return Event.model_validate(merged)
+
+    def _list_request(
+        self,
+        calendar_id: str,
+        page_token: str | None = None,
+        *,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        max_results: int | None = None,
+        order_by: Literal["startTime", "updated"] | None = None,
+        q: str | None = None,
+        single_events: bool | None = None,
+        time_zone: str | None = None,
+        show_deleted: bool | None = None,
+        sync_token: str | None = None,
+        private_extended_property: str | list[str] | None = None,
+        shared_extended_property: list[str] | None = None,
+        updated_min: str | None = None,
+        event_types: list[str] | None = None,
+        i_cal_uid: str | None = None,
+        fields: str | None = None,
+    ) -> HttpRequest:
+        if order_by == "startTime" and single_events is False:
+            # orderBy=startTime 只能與 singleEvents=True 一起使用
+            order_by = None
+
+        return self.events.list(  # type: ignore
+            calendarId=calendar_id,
+            pageToken=page_token,
+            timeMin=time_min,
+            timeMax=time_max,
+            maxResults=max_results,
+            orderBy=order_by,
+            q=q,
+            singleEvents=single_events,
+            timeZone=time_zone,
+            showDeleted=show_deleted,
+            syncToken=sync_token,
+            privateExtendedProperty=private_extended_property,
+            sharedExtendedProperty=shared_extended_property,
+            updatedMin=updated_min,
+            eventTypes=event_types,
+            iCalUID=i_cal_uid,
+            fields=fields,
+        )
+
+    def _insert_request(
+        self, calendar_id: str, **event_params: Unpack[EventParam]
+    ) -> HttpRequest:
+        return self.events.insert(  # type: ignore
+            calendarId=calendar_id, body=self._serial_event(**event_params)
+        )
+
+    def _patch_request(
+        self, calendar_id: str, event_id: str, **event_params: Unpack[EventParam]
+    ) -> HttpRequest:
+        return self.events.patch(  # type: ignore
+            calendarId=calendar_id,
+            eventId=event_id,
+            body=self._serial_event(**event_params),
+        )
+
+    def _upsert_patch_request(
+        self, calendar_id: str, event_id: str, **event_params: Unpack[EventParam]
+    ) -> HttpRequest:
+        """_upsert_patch_request 同 `_patch_request`，並將已刪除 (cancelled) 的事件恢復為 confirmed"""
+        return self.events.patch(  # type: ignore
+            calendarId=calendar_id,
+            eventId=event_id,
+            body={**self._serial_event(**event_params), "status": "confirmed"},
+        )
+
+    def _update_request(self, calendar_id: str, event: Event) -> HttpRequest:
+        return self.events.update(  # type: ignore
+            calendarId=calendar_id, eventId=event.id, body=event.model_dump()
+        )
+
+    def _delete_request(self, calendar_id: str, event_id: str) -> HttpRequest:
+        return self.events.delete(calendarId=calendar_id, eventId=event_id)  # type: ignore
 
     def get_event(self, calendar_id: str, event_id: str) -> Event:
         """
@@ -40,8 +302,9 @@ class Calendar:
         Returns:
             Event: calendar event
         """
-        return Event(
-            **self.events.get(calendarId=calendar_id, eventId=event_id).execute()  # type: ignore
+        return self._execute(
+            self.events.get(calendarId=calendar_id, eventId=event_id),  # type: ignore
+            parser=Event.model_validate,
         )
 
     def list_events(
@@ -51,12 +314,14 @@ class Calendar:
         *,
         time_min: str | None = None,
         time_max: str | None = None,
-        max_results: int = 10,
+        max_results: int = MAX_LIST_RESULTS,
         order_by: Literal["startTime", "updated"] = "startTime",
         q: str | None = None,
         single_events: bool = True,
         time_zone: str | None = None,
         show_deleted: bool = False,
+        http: Any = None,
+        **filters: Unpack[EventListFilter],
     ) -> QueryEvent:
         """
         list_events Read All events
@@ -67,20 +332,22 @@ class Calendar:
             page_token: str | None = None : 結果的下一頁token Defaults to None
             time_min (str | None, optional): 時間區間起始時間 datetime string `example : 2024-07-15T09:00:00-07:00`. Defaults to None.
             time_max (str | None, optional): 時間區間結束時間 datetime string `example : 2024-07-16T09:00:00-07:00`. Defaults to None.
-            max_results (int, optional): 最大的回傳數. Defaults to 10.
+            max_results (int, optional): 每頁最大的回傳數. Defaults to MAX_LIST_RESULTS.
             order_by (Literal[&quot;startTime&quot;, &quot;updated&quot;], optional): 排序方式 由開始時間(startTime)或者更新時間(updated). Defaults to "startTime".
             q (str | None, optional): 搜尋關鍵字. Defaults to None.
             single_events (bool, optional): 如果為True，將重複事件展平為單個事件. Defaults to True.
             time_zone (str | None, optional): 時區，返回的事件時間將根據此時區調整. Defaults to None.
             show_deleted (bool, optional): 如果為True，則包括已刪除的事件. Defaults to False.
+            http (Any, optional): 執行請求使用的 http 對象，多執行緒時每個執行緒需使用各自的對象. Defaults to None.
+            **filters (EventListFilter): 由伺服器端篩選的條件
 
         Returns:
             QueryEvent: 包含事件列表的字典
         """
-        return QueryEvent(
-            **self.events.list(  # type: ignore
+        return self._execute(
+            self._list_request(
                 calendar_id=calendar_id,
-                pageToken=page_token,
+                page_token=page_token,
                 time_min=time_min,
                 time_max=time_max,
                 max_results=max_results,
@@ -89,7 +356,478 @@ class Calendar:
                 single_events=single_events,
                 time_zone=time_zone,
                 show_deleted=show_deleted,
-            ).execute()
+                **filters,
+            ),
+            http=http,
+            parser=lambda response: parse_query_event(response, self.parse_mode),
+        )
+
+    def _iter_response(
+        self, request: HttpRequest, priority: Priority = Priority.INTERACTIVE
+    ) -> Iterator[str]:
+        """
+        _iter_response 送出請求並逐段回傳回應內容
+
+        http 對象提供 `stream` (例如 `PooledHttp`) 時直接從連線逐段讀取；
+        否則 httplib2 會讀取完整的回應，只有之後的解碼與解析是逐段進行
+
+        Returns:
+            Iterator[str]: 回應內容的文字片段
+        """
+        from ..instrumentation import RequestRecord, get_request_hooks, record_stream
+        from ..schema.stream import STREAM_CHUNK_SIZE, decode_chunks
+
+        http = self.thread_http()
+
+        if not callable(getattr(http, "stream", None)):
+            request.postproc = lambda resp, content: content
+            content = memoryview(self._execute(request, priority, http=http))
+
+            return decode_chunks(
+                content[offset : offset + STREAM_CHUNK_SIZE]
+                for offset in range(0, len(content), STREAM_CHUNK_SIZE)
+            )
+
+        record = RequestRecord.from_request(request)
+
+        def send() -> Iterator[bytes]:
+            record.status, chunks = http.stream(
+                request.uri,
+                request.method,
+                request.body,
+                request.headers,
+                STREAM_CHUNK_SIZE,
+            )
+
+            return chunks
+
+        def call(send: Callable[[], Iterator[bytes]]) -> Iterator[bytes]:
+            return self.scheduler.call(
+                send, user=self.scheduler.user_key(request), priority=priority
+            )
+
+        if not get_request_hooks():
+            return decode_chunks(call(send))
+
+        # 讀取完回應才通知 hook，延遲與回應大小包含逐段讀取的部分
+        return decode_chunks(record_stream(record, call, send))
+
+    def iter_events(
+        self,
+        calendar_id: str = "primary",
+        *,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        max_results: int = MAX_LIST_RESULTS,
+        order_by: Literal["startTime", "updated"] = "startTime",
+        q: str | None = None,
+        single_events: bool = True,
+        time_zone: str | None = None,
+        show_deleted: bool = False,
+        **filters: Unpack[EventListFilter],
+    ) -> Iterator[Event | EventView]:
+        """
+        iter_events 逐一回傳時間區間內的事件，每個事件解碼後立即回傳，會自動讀取所有分頁
+        doc : https://developers.google.com/calendar/api/v3/reference/events/list
+
+        回應的 `items` 陣列以 `iter_json_items` 逐一解碼，不會建立整頁的 dict 與 `QueryEvent`；
+        使用 `PooledHttp` 時回應也是逐段從連線讀取，記憶體用量只與單一事件有關，與 `max_results` 無關
+
+        Args:
+            calendar_id (str, optional): 分享時的`calendarID` 或者是預設 `primary`. Defaults to "primary".
+            time_min (str | None, optional): 時間區間起始時間. Defaults to None.
+            time_max (str | None, optional): 時間區間結束時間. Defaults to None.
+            max_results (int, optional): 每頁最大的回傳數. Defaults to MAX_LIST_RESULTS.
+            order_by (Literal["startTime", "updated"], optional): 排序方式. Defaults to "startTime".
+            q (str | None, optional): 搜尋關鍵字. Defaults to None.
+            single_events (bool, optional): 如果為True，將重複事件展平為單個事件. Defaults to True.
+            time_zone (str | None, optional): 時區. Defaults to None.
+            show_deleted (bool, optional): 如果為True，則包括已刪除的事件. Defaults to False.
+            **filters (EventListFilter): 由伺服器端篩選的條件
+
+        Yields:
+            Event | EventView: calendar event，`trusted` 模式為 `EventView`
+        """
+        from ..schema.stream import iter_json_items
+
+        page_token: str | None = None
+
+        while True:
+            metadata: dict[str, Any] = {}
+            chunks = self._iter_response(
+                self._list_request(
+                    calendar_id=calendar_id,
+                    page_token=page_token,
+                    time_min=time_min,
+                    time_max=time_max,
+                    max_results=max_results,
+                    order_by=order_by,
+                    q=q,
+                    single_events=single_events,
+                    time_zone=time_zone,
+                    show_deleted=show_deleted,
+                    **filters,
+                )
+            )
+
+            for item in iter_json_items(chunks, metadata):
+                yield parse_event(item, self.parse_mode)
+
+            if not (page_token := metadata.get("nextPageToken")):
+                break
+
+    @staticmethod
+    def fields_mask(
+        fields: Sequence[str],
+        *,
+        list_items: bool = False,
+        list_fields: Sequence[str] = (),
+    ) -> str:
+        """
+        fields_mask 產生部分回應 (partial response) 使用的 `fields` 參數
+        doc : https://developers.google.com/calendar/api/guides/performance#partial-response
+
+        Args:
+            fields (Sequence[str]): 事件的欄位，例如 `("id", "start", "end", "summary")`
+            list_items (bool, optional): 是否為 events.list 的回應. Defaults to False.
+            list_fields (Sequence[str], optional): events.list 回應本身的其他欄位，例如 `timeZone`. Defaults to ().
+
+        Returns:
+            str: 例如 `nextPageToken,items(id,start,end,summary)`
+        """
+        mask = ",".join(fields)
+
+        if not list_items:
+            return mask
+
+        return ",".join(("nextPageToken", *list_fields, f"items({mask})"))
+
+    def get_event_fields(
+        self, calendar_id: str, event_id: str, fields: Sequence[str]
+    ) -> dict[str, Any]:
+        """
+        get_event_fields 只取得事件的部分欄位
+
+        Args:
+            calendar_id (str): 分享時的`calendarID`
+            event_id (str): 事件的id
+            fields (Sequence[str]): 事件的欄位
+
+        Returns:
+            dict[str, Any]: 只包含 `fields` 的事件
+        """
+        return self._execute(
+            self.events.get(  # type: ignore
+                calendarId=calendar_id,
+                eventId=event_id,
+                fields=self.fields_mask(fields),
+            )
+        )
+
+    def list_event_fields(
+        self,
+        calendar_id: str,
+        fields: Sequence[str],
+        page_token: str | None = None,
+        *,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        max_results: int = MAX_LIST_RESULTS,
+        order_by: Literal["startTime", "updated"] = "startTime",
+        q: str | None = None,
+        single_events: bool = True,
+        time_zone: str | None = None,
+        http: Any = None,
+        metadata: dict[str, Any] | None = None,
+        **filters: Unpack[EventListFilter],
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        list_event_fields 只取得事件的部分欄位，回應大小與解析成本只與 `fields` 有關
+
+        Args:
+            calendar_id (str): 分享時的`calendarID`
+            fields (Sequence[str]): 事件的欄位
+            page_token (str | None, optional): 結果的下一頁token. Defaults to None.
+            time_min (str | None, optional): 時間區間起始時間. Defaults to None.
+            time_max (str | None, optional): 時間區間結束時間. Defaults to None.
+            max_results (int, optional): 每頁最大的回傳數. Defaults to MAX_LIST_RESULTS.
+            order_by (Literal["startTime", "updated"], optional): 排序方式. Defaults to "startTime".
+            q (str | None, optional): 搜尋關鍵字. Defaults to None.
+            single_events (bool, optional): 如果為True，將重複事件展平為單個事件. Defaults to True.
+            time_zone (str | None, optional): 時區. Defaults to None.
+            http (Any, optional): 執行請求使用的 http 對象. Defaults to None.
+            metadata (dict[str, Any] | None, optional): 提供時一併取得日曆的 `timeZone` 並寫入此 dict. Defaults to None.
+            **filters (EventListFilter): 由伺服器端篩選的條件
+
+        Returns:
+            tuple[list[dict[str, Any]], str | None]: 只包含 `fields` 的事件與下一頁token
+        """
+        response = self._execute(
+            self._list_request(
+                calendar_id=calendar_id,
+                page_token=page_token,
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+                order_by=order_by,
+                q=q,
+                single_events=single_events,
+                time_zone=time_zone,
+                fields=self.fields_mask(
+                    fields,
+                    list_items=True,
+                    list_fields=("timeZone",) if metadata is not None else (),
+                ),
+                **filters,
+            ),
+            http=http,
+        )
+
+        if metadata is not None and "timeZone" in response:
+            metadata["timeZone"] = response["timeZone"]
+
+        return response.get("items", []), response.get("nextPageToken")
+
+    def get_event_as(
+        self, model: type[ModelT], calendar_id: str, event_id: str
+    ) -> ModelT:
+        """
+        get_event_as 只取得 `model` 需要的欄位並轉換為 `model`
+
+        Args:
+            model (type[ModelT]): 輕量的事件 model，例如 `EventSlot`
+            calendar_id (str): 分享時的`calendarID`
+            event_id (str): 事件的id
+
+        Returns:
+            ModelT: 事件
+        """
+        return model(
+            **self.get_event_fields(calendar_id, event_id, tuple(model.model_fields))
+        )
+
+    def sync_events(
+        self,
+        calendar_id: str = "primary",
+        sync_token: str | None = None,
+        *,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        max_results: int = MAX_LIST_RESULTS,
+        single_events: bool = True,
+    ) -> SyncEvent:
+        """
+        sync_events 以 `syncToken` 取得自上次同步後變更與刪除的事件，會自動讀取所有分頁
+        doc : https://developers.google.com/calendar/api/guides/sync
+
+        沒有 `sync_token` 時為完整同步，此時才會使用 `time_min`/`time_max`；
+        `sync_token` 過期時 API 會回傳 410 Gone (`HttpError`)，需清除 token 後重新完整同步。
+
+        Args:
+            calendar_id (str, optional): 分享時的`calendarID` 或者是預設 `primary`. Defaults to "primary".
+            sync_token (str | None, optional): 上次同步取得的 `nextSyncToken`. Defaults to None.
+            time_min (str | None, optional): 完整同步時的時間區間起始時間. Defaults to None.
+            time_max (str | None, optional): 完整同步時的時間區間結束時間. Defaults to None.
+            max_results (int, optional): 每頁最大的回傳數. Defaults to MAX_LIST_RESULTS.
+            single_events (bool, optional): 如果為True，將重複事件展平為單個事件，需與完整同步時相同. Defaults to True.
+
+        Returns:
+            SyncEvent: 變更的事件、已刪除的事件id 與新的 `syncToken`
+        """
+        events: list[Event | EventView] = []
+        deleted: list[str] = []
+        page_token: str | None = None
+
+        while True:
+            response = self._execute(
+                self._list_request(
+                    calendar_id=calendar_id,
+                    page_token=page_token,
+                    time_min=None if sync_token else time_min,
+                    time_max=None if sync_token else time_max,
+                    max_results=max_results,
+                    order_by=None,
+                    single_events=single_events,
+                    show_deleted=bool(sync_token) or None,
+                    sync_token=sync_token,
+                )
+            )
+
+            for item in response.get("items", []):
+                if item.get("status") == "cancelled":
+                    deleted.append(item["id"])
+                else:
+                    events.append(parse_event(item, self.parse_mode))
+
+            if not (page_token := response.get("nextPageToken")):
+                break
+
+        # 事件已由 parse_event 轉換，trusted 模式的 EventView 無法通過 `Event` 驗證，因此不再驗證
+        return SyncEvent.model_construct(
+            events=events,
+            deleted=deleted,
+            sync_token=response.get("nextSyncToken"),
+            full_sync=sync_token is None,
+        )
+
+    def list_series(
+        self,
+        calendar_id: str = "primary",
+        *,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        q: str | None = None,
+        time_zone: str | None = None,
+        max_results: int = MAX_LIST_RESULTS,
+        **filters: Unpack[EventListFilter],
+    ) -> SeriesEvent:
+        """
+        list_series 以 `singleEvents=False` 取得時間區間內的事件，重複事件只回傳主體與例外，會自動讀取所有分頁
+        doc : https://developers.google.com/calendar/api/v3/reference/events/list
+
+        重複事件在本地以 `recurrence.expand_events` 展開，時間區間越寬，傳輸與解析的資料相對於
+        `singleEvents=True` 越少
+
+        Args:
+            calendar_id (str, optional): 分享時的`calendarID` 或者是預設 `primary`. Defaults to "primary".
+            time_min (str | None, optional): 時間區間起始時間. Defaults to None.
+            time_max (str | None, optional): 時間區間結束時間. Defaults to None.
+            q (str | None, optional): 搜尋關鍵字. Defaults to None.
+            time_zone (str | None, optional): 時區. Defaults to None.
+            max_results (int, optional): 每頁最大的回傳數. Defaults to MAX_LIST_RESULTS.
+            **filters (EventListFilter): 由伺服器端篩選的條件，套用於重複事件的主體
+
+        Returns:
+            SeriesEvent: 單次事件、重複事件主體與被修改或刪除的單次事件
+        """
+        events: list[Event | EventView] = []
+        cancelled: list[CancelledEvent] = []
+        page_token: str | None = None
+
+        while True:
+            response = self._execute(
+                self._list_request(
+                    calendar_id=calendar_id,
+                    page_token=page_token,
+                    time_min=time_min,
+                    time_max=time_max,
+                    max_results=max_results,
+                    q=q,
+                    single_events=False,
+                    time_zone=time_zone,
+                    **filters,
+                )
+            )
+
+            for item in response.get("items", []):
+                # singleEvents=False 時被刪除的單次事件仍會回傳，只包含少數欄位
+                if item.get("status") == "cancelled":
+                    cancelled.append(CancelledEvent.model_validate(item))
+                else:
+                    events.append(parse_event(item, self.parse_mode))
+
+            if not (page_token := response.get("nextPageToken")):
+                break
+
+        # 同 sync_events，事件已由 parse_event 轉換，不再驗證
+        return SeriesEvent.model_construct(events=events, cancelled=cancelled)
+
+    def watch_events(
+        self,
+        calendar_id: str,
+        channel_id: str,
+        address: str,
+        *,
+        token: str | None = None,
+        ttl: int | None = None,
+    ) -> Channel:
+        """
+        watch_events 建立 channel，日曆的事件變更時 Google 會以 POST 通知 `address`
+        doc : https://developers.google.com/calendar/api/v3/reference/events/watch
+
+        Args:
+            calendar_id (str): 分享時的`calendarID`
+            channel_id (str): channel 的唯一id，例如 uuid
+            address (str): 接收通知的 HTTPS URL
+            token (str | None, optional): 每次通知都會帶回的 token，用於驗證通知來源. Defaults to None.
+            ttl (int | None, optional): channel 的存活秒數，None 時由 API 決定. Defaults to None.
+
+        Returns:
+            Channel: 已建立的 channel，包含停止時需要的 `resourceId` 與過期時間
+        """
+        from ..collection import remove_dict_value_none
+
+        return self._execute(
+            self.events.watch(  # type: ignore
+                calendarId=calendar_id,
+                body=remove_dict_value_none(
+                    {
+                        "id": channel_id,
+                        "type": "web_hook",
+                        "address": address,
+                        "token": token,
+                        "params": {"ttl": str(ttl)} if ttl is not None else None,
+                    }
+                ),
+            ),
+            parser=Channel.model_validate,
+            retry=False,
+        )
+
+    def stop_channel(self, channel_id: str, resource_id: str) -> None:
+        """
+        stop_channel 停止 channel，之後不會再收到通知
+        doc : https://developers.google.com/calendar/api/v3/reference/channels/stop
+
+        Args:
+            channel_id (str): channel 的id
+            resource_id (str): 建立 channel 時回傳的 `resourceId`
+        """
+        self._execute(
+            self.service.channels().stop(  # type: ignore
+                body={"id": channel_id, "resourceId": resource_id}
+            )
+        )
+
+    def query_freebusy(
+        self,
+        calendar_ids: list[str],
+        time_min: str,
+        time_max: str,
+        time_zone: str | None = None,
+    ) -> FreeBusy:
+        """
+        query_freebusy 以單一請求查詢多個日曆的忙碌時段
+        doc : https://developers.google.com/calendar/api/v3/reference/freebusy/query
+
+        Args:
+            calendar_ids (list[str]): 要查詢的`calendarID`，最多 `MAX_FREEBUSY_CALENDARS` 個
+            time_min (str): 時間區間起始時間 datetime string `example : 2024-07-15T09:00:00-07:00`
+            time_max (str): 時間區間結束時間 datetime string `example : 2024-07-16T09:00:00-07:00`
+            time_zone (str | None, optional): 回傳時間使用的時區. Defaults to None.
+
+        Returns:
+            FreeBusy: 每個日曆的忙碌時段
+        """
+        if len(calendar_ids) > MAX_FREEBUSY_CALENDARS:
+            raise ValueError(
+                f"freebusy query supports at most {MAX_FREEBUSY_CALENDARS} calendars"
+            )
+
+        from ..collection import remove_dict_value_none
+
+        return self._execute(
+            self.service.freebusy().query(  # type: ignore
+                body=remove_dict_value_none(
+                    {
+                        "timeMin": time_min,
+                        "timeMax": time_max,
+                        "timeZone": time_zone,
+                        "items": [{"id": calendar_id} for calendar_id in calendar_ids],
+                    }
+                )
+            ),
+            parser=FreeBusy.model_validate,
         )
 
     def update_event(
@@ -127,27 +865,62 @@ class Calendar:
         """
         event: Event = self.get_event(calendar_id=calendar_id, event_id=event_id)
 
-        update_event = event.model_copy(
-            update=self._serial_event(
-                summary=summary,
-                start_time=start_time,
-                end_time=end_time,
-                location=location,
-                description=description,
-                attendees=attendees,
-                reminders=reminders,
-                time_zone=time_zone,
-            )  # type: ignore
+        update_event = self._merge_event(
+            event,
+            summary=summary,
+            start_time=start_time,
+            end_time=end_time,
+            location=location,
+            description=description,
+            attendees=attendees,
+            reminders=reminders,
+            time_zone=time_zone,
         )
 
-        return Event(
-            **self.events.update(  # type: ignore
-                calendarId=calendar_id,
-                eventId=event_id,
-                body=update_event.model_dump(),
-            )
+        return self._execute(
+            self._update_request(calendar_id=calendar_id, event=update_event),
+            parser=Event.model_validate,
         )
 
+    def conditional_update_event(
+        self,
+        calendar_id: str,
+        event: Event,
+        **event_params: Unpack[EventParam],
+    ) -> Event:
+        """
+        conditional_update_event 以呼叫端持有的 `Event` 與其 `etag` 直接送出 update (`If-Match`)，
+        只有在事件已被其他人修改 (412 Precondition Failed) 時才重新取得事件並再送出一次
+        doc : `https://developers.google.com/calendar/api/guide/version-resources`
+
+        Args:
+            calendar_id (str): 分享時的`calendarID`
+            event (Event): 呼叫端持有的事件
+            **event_params (EventParam): 預修改的內容
+
+        Returns:
+            Event: 回傳已修改的事件
+        """
+        from googleapiclient.errors import HttpError
+
+        refetched = False
+
+        while True:
+            request = self._update_request(
+                calendar_id=calendar_id,
+                event=self._merge_event(event, **event_params),
+            )
+            request.headers["If-Match"] = event.etag
+
+            try:
+                return self._execute(request, parser=Event.model_validate)
+            except HttpError as error:
+                if error.resp.status != 412 or refetched:
+                    raise
+
+            event = self.get_event(calendar_id=calendar_id, event_id=event.id)
+            refetched = True
+
     def patch_event(
         self,
         calendar_id: str,
@@ -181,21 +954,20 @@ class Calendar:
         Returns:
             Event: 回傳已修改的事件
         """
-        return Event(
-            **self.events.patch(  # type: ignore
-                calendarId=calendar_id,
-                eventId=event_id,
-                body=self._serial_event(
-                    summary=summary,
-                    start_time=start_time,
-                    end_time=end_time,
-                    location=location,
-                    description=description,
-                    attendees=attendees,
-                    reminders=reminders,
-                    time_zone=time_zone,
-                ),
-            )
+        return self._execute(
+            self._patch_request(
+                calendar_id=calendar_id,
+                event_id=event_id,
+                summary=summary,
+                start_time=start_time,
+                end_time=end_time,
+                location=location,
+                description=description,
+                attendees=attendees,
+                reminders=reminders,
+                time_zone=time_zone,
+            ),
+            parser=Event.model_validate,
         )
 
     def insert_event(
@@ -229,21 +1001,121 @@ class Calendar:
         Returns:
             Event: 已新增的事件
         """
-        return Event(
-            **self.events.insert(  # type: ignore
-                calendarId=calendar_id,
-                body=self._serial_event(
-                    summary=summary,
-                    start_time=start_time,
-                    end_time=end_time,
-                    location=location,
-                    description=description,
-                    attendees=attendees,
-                    reminders=reminders,
-                    time_zone=time_zone,
+        return self._execute(
+            self._insert_request(
+                calendar_id=calendar_id,
+                summary=summary,
+                start_time=start_time,
+                end_time=end_time,
+                location=location,
+                description=description,
+                attendees=attendees,
+                reminders=reminders,
+                time_zone=time_zone,
+            ),
+            parser=Event.model_validate,
+            retry=False,
+        )
+
+    def upsert_event(
+        self,
+        calendar_id: str,
+        event_id: str | None = None,
+        exists: bool | None = None,
+        **event_params: Unpack[EventParam],
+    ) -> Event:
+        """
+        upsert_event 以固定的事件id 新增或修改事件，不需先搜尋事件
+        doc : https://developers.google.com/calendar/api/v3/reference/events/insert
+
+        已知事件存在時先 patch，回傳 404 才新增；否則先以 `event_id` 新增，id 已存在 (409) 時改為 patch。
+        id 已存在但事件已被刪除時，patch 會將事件恢復。
+
+        Args:
+            calendar_id (str): 分享時的`calendarID`
+            event_id (str | None, optional): 事件id，需為 5~1024 個 base32hex 字元；None 時只會新增. Defaults to None.
+            exists (bool | None, optional): 呼叫端的索引是否記錄事件已存在，決定先送出的請求. Defaults to None.
+            **event_params (EventParam): 事件內容
+
+        Returns:
+            Event: 已新增或修改的事件
+        """
+        from googleapiclient.errors import HttpError
+
+        if event_id is None:
+            return self._execute(
+                self._insert_request(calendar_id, **event_params),
+                parser=Event.model_validate,
+                retry=False,
+            )
+
+        requests = [
+            lambda: self._insert_request(
+                calendar_id, **{**event_params, "event_id": event_id}
+            ),
+            lambda: self._upsert_patch_request(calendar_id, event_id, **event_params),
+        ]
+        fallback_status = 409
+
+        if exists:
+            requests.reverse()
+            fallback_status = 404
+
+        # 以 `event_id` 新增時重試只會得到 409，之後改為 patch，因此可以重試
+        try:
+            return self._execute(requests[0](), parser=Event.model_validate)
+        except HttpError as error:
+            if error.resp.status != fallback_status:
+                raise
+
+        return self._execute(requests[1](), parser=Event.model_validate)
+
+    def find_event_ids_by_property(
+        self, calendar_id: str, name: str, value: str | None = None
+    ) -> dict[str, str]:
+        """
+        find_event_ids_by_property 以 `privateExtendedProperty` 取得具有私有屬性 `name` 的事件id，會自動讀取所有分頁
+
+        只要求 `id` 與 `extendedProperties/private` 欄位，重複事件只回傳主體
+
+        Args:
+            calendar_id (str): 分享時的`calendarID`
+            name (str): 私有屬性名稱
+            value (str | None, optional): 屬性值，None 時取得所有具有此屬性的事件. Defaults to None.
+
+        Returns:
+            dict[str, str]: 屬性值對應的事件id
+        """
+        event_ids: dict[str, str] = {}
+        page_token: str | None = None
+
+        while True:
+            response = self._execute(
+                self._list_request(
+                    calendar_id=calendar_id,
+                    page_token=page_token,
+                    max_results=MAX_LIST_RESULTS,
+                    single_events=False,
+                    private_extended_property=(
+                        f"{name}={value}" if value is not None else None
+                    ),
+                    fields=self.fields_mask(
+                        ("id", "extendedProperties/private"), list_items=True
+                    ),
                 ),
+                Priority.BULK,
             )
-        )
+
+            for item in response.get("items", []):
+                private = item.get("extendedProperties", {}).get("private", {})
+
+                if (key := private.get(name)) is not None:
+                    event_ids[key] = item["id"]
+
+            if not (page_token := response.get("nextPageToken")):
+                break
+
+        return event_ids
 
     def delete_event(self, calendar_id: str, event_id: str) -> None:
         """
@@ -254,4 +1126,22 @@ class Calendar:
             calendar_id (str): 分享時的`calendarID`
             event_id (str): 預計刪除的事件ID
         """
-        self.events().delete(calendarId=calendar_id, eventId=event_id).execute()  # type: ignore
+        self._execute(self._delete_request(calendar_id=calendar_id, event_id=event_id))
+
+    def batch(
+        self,
+        batch_size: int = MAX_BATCH_SIZE,
+        batch_uri: str | None = None,
+    ) -> CalendarBatch:
+        """
+        batch 建立批次請求，將多個寫入操作合併為 multipart batch request 送出
+        doc : https://developers.google.com/calendar/api/guides/batch
+
+        Args:
+            batch_size (int, optional): 每個 batch request 的最大請求數. Defaults to MAX_BATCH_SIZE.
+            batch_uri (str | None, optional): batch endpoint，預設由 discovery document 決定. Defaults to None.
+
+        Returns:
+            CalendarBatch: 批次請求
+        """
+        return CalendarBatch(calendar=self, batch_size=batch_size, batch_uri=batch_uri)
@@ -0,0 +1,108 @@
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future
+from threading import RLock
+from weakref import WeakSet
+
+from typing_extensions import Self
+
+from ..schema.calendar import Event, QueryEvent
+
+__all__ = ["EventPager"]
+
+
+class EventPager(Iterator[Event]):
+    """
+    EventPager 逐一回傳分頁結果中的事件，並於 `executor` 內預先取得之後的分頁
+
+    建立時即開始取得第一頁，之後最多預先取得 `read_ahead` 頁；
+    每次取得一頁都是獨立的工作，不會佔用 `executor` 等待呼叫端消化結果。
+
+    Args:
+        fetch_page (Callable[[str | None], QueryEvent]): 以 page token 取得一頁事件的函式
+        executor (Executor): 執行 `fetch_page` 的 executor
+        read_ahead (int, optional): 預先取得的最大頁數. Defaults to 1.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[str | None], QueryEvent],
+        executor: Executor,
+        read_ahead: int = 1,
+    ) -> None:
+        if read_ahead < 1:
+            raise ValueError("read_ahead must be at least 1")
+
+        self.fetch_page = fetch_page
+        self.executor = executor
+        self.read_ahead = read_ahead
+        self.pages_fetched = 0
+        # 已完成的 future 會在 add_done_callback 內同步呼叫 _on_page
+        self._lock = RLock()
+        self._pages: deque[Future[QueryEvent]] = deque()
+        self._handled: WeakSet[Future[QueryEvent]] = WeakSet()
+        self._next_page_token: str | None = None
+        self._closed = False
+        self._items: Iterator[Event] = iter(())
+
+        with self._lock:
+            self._submit(None)
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> Event:
+        while True:
+            for event in self._items:
+                return event
+
+            with self._lock:
+                if not self._pages:
+                    raise StopIteration
+
+                future = self._pages.popleft()
+                self._maybe_submit()
+
+            query_event = future.result()
+
+            with self._lock:
+                self._handle(future)
+
+            self._items = iter(query_event.items)
+
+    def close(self) -> None:
+        """close 停止預先取得並取消尚未開始的請求"""
+        with self._lock:
+            self._closed = True
+
+            for future in self._pages:
+                future.cancel()
+
+            self._pages.clear()
+
+    def _submit(self, page_token: str | None) -> None:
+        future = self.executor.submit(self.fetch_page, page_token)
+        self._pages.append(future)
+        self.pages_fetched += 1
+        future.add_done_callback(self._on_page)
+
+    def _on_page(self, future: "Future[QueryEvent]") -> None:
+        with self._lock:
+            self._handle(future)
+
+    def _handle(self, future: "Future[QueryEvent]") -> None:
+        if future in self._handled or future.cancelled() or future.exception():
+            return
+
+        self._handled.add(future)
+        self._next_page_token = future.result().nextPageToken
+        self._maybe_submit()
+
+    def _maybe_submit(self) -> None:
+        if (
+            self._next_page_token
+            and not self._closed
+            and len(self._pages) < self.read_ahead
+        ):
+            page_token, self._next_page_token = self._next_page_token, None
+            self._submit(page_token)
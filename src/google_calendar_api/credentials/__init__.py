@@ -1 +1,2 @@
 from .credentials import *  # noqa: F403
+from .token import *  # noqa: F403
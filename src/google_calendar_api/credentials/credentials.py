@@ -1,3 +1,5 @@
+from typing import Any
+
 from google.auth import credentials
 from googleapiclient.discovery import Resource
 from typing_extensions import Self
@@ -74,12 +76,25 @@ class Credentials:
 
         raise FileNotFoundError(f"{credentials_json_path} is not exist")
 
-    def need_refresh(self) -> bool:
-        return (
-            self.credential.valid
-            and self.credential.expired
-            and self.credential.refresh_token
-        )
+    def need_refresh(self, margin: float = 0.0) -> bool:
+        """
+        need_refresh 憑證可以刷新，且已失效或距離過期少於 `margin` 秒
+
+        Args:
+            margin (float, optional): 提前刷新的秒數. Defaults to 0.0.
+        """
+        from .token import utcnow
+
+        if not self.credential.refresh_token:
+            return False
+
+        if not self.credential.valid:
+            return True
+
+        if self.credential.expiry is None:
+            return False
+
+        return (self.credential.expiry - utcnow()).total_seconds() <= margin
 
     @classmethod
     def from_authorized_user_file(
@@ -98,14 +113,70 @@ class Credentials:
 
         raise FileNotFoundError(f"{token_json_path} is not exist")
 
+    @classmethod
+    def from_authorized_user_info(cls, info: dict[str, Any]) -> "Credentials":
+        """
+        from_authorized_user_info 由 `to_json` 的內容建立憑證，保留 `token_uri` 與尚未過期的 token
+
+        Args:
+            info (dict[str, Any]): `to_json` 解析後的 dict
+
+        Returns:
+            Credentials: 已建立 google-auth 憑證的 `Credentials`
+        """
+        from datetime import datetime
+
+        expiry = info.get("expiry")
+
+        return cls(
+            token=info.get("token"),
+            refresh_token=info.get("refresh_token"),
+            token_uri=info.get("token_uri"),
+            client_id=info.get("client_id"),
+            client_secret=info.get("client_secret"),
+            scopes=info.get("scopes"),
+            universe_domain=info.get("universe_domain")
+            or credentials.DEFAULT_UNIVERSE_DOMAIN,
+            account=info.get("account"),
+            expiry=datetime.fromisoformat(expiry.rstrip("Z")) if expiry else None,  # type: ignore
+        ).create_credentials()
+
     def to_json(self) -> str:
         return self.credential.to_json()
 
     def to_json_file(self, token_json_path: str) -> None:
-        with open(token_json_path, mode="w+", encoding="UTF-8") as json_file:
+        """to_json_file 以暫存檔寫入後取代的方式保存憑證，其他 process 不會讀到寫到一半的檔案"""
+        from os import fsync, replace
+        from os.path import abspath, dirname
+        from tempfile import NamedTemporaryFile
+
+        with NamedTemporaryFile(
+            mode="w",
+            encoding="UTF-8",
+            dir=dirname(abspath(token_json_path)),
+            prefix=".token-",
+            suffix=".tmp",
+            delete=False,
+        ) as json_file:
             json_file.write(self.to_json())
+            json_file.flush()
+            fsync(json_file.fileno())
 
-    def build_service(self, service_name: str, version: str) -> Resource:
-        from googleapiclient.discovery import build
+        replace(json_file.name, token_json_path)
 
-        return build(serviceName=service_name, version=version)
+    def build_service(
+        self,
+        service_name: str,
+        version: str,
+        cache_dir: str | None = None,
+        pool_size: int | None = None,
+    ) -> Resource:
+        from ..discovery import get_resource
+
+        return get_resource(
+            service_name,
+            version,
+            credentials=self.credential,
+            cache_dir=cache_dir,
+            pool_size=pool_size,
+        )
@@ -0,0 +1,266 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from threading import Event, Lock, RLock, Thread
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from typing_extensions import Self
+
+from ..log import LOGGER
+
+if TYPE_CHECKING:
+    from .credentials import Credentials
+
+__all__ = [
+    "DEFAULT_REFRESH_MARGIN",
+    "TokenManager",
+    "get_token_manager",
+    "utcnow",
+]
+
+DEFAULT_REFRESH_MARGIN = 300.0
+"""距離過期少於此秒數時刷新，需大於 google-auth 判定過期的緩衝 (約 225 秒) 才能避免請求時才刷新"""
+
+REFRESH_DEBOUNCE = 5.0
+"""剛刷新過的秒數內，收到 401 而要求的刷新直接沿用新的 token"""
+
+RETRY_DELAY = 30.0
+MAX_RETRY_DELAY = 300.0
+
+
+def utcnow() -> datetime:
+    """utcnow 與 google-auth 相同，以不含時區的 UTC 時間表示現在"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@contextmanager
+def _file_lock(path: str | None) -> Iterator[None]:
+    """_file_lock 以 `<path>.lock` 取得跨 process 的獨佔鎖，`path` 為 None 時不上鎖"""
+    if path is None:
+        yield
+        return
+
+    import os
+
+    with open(f"{path}.lock", mode="a+", encoding="UTF-8") as lock_file:
+        if os.name == "nt":
+            import msvcrt
+
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class TokenManager:
+    """
+    TokenManager 在 access token 過期前主動刷新，並在執行緒與 process 間協調刷新
+
+    - 同一憑證的所有 `Resource` 共用同一個 google-auth 憑證對象，刷新後立即使用新的 token
+    - 收到 401 時 google-auth 要求的刷新改經由 `refresh_on_demand`，多個執行緒同時要求時只刷新一次
+    - 提供 `token_json_path` 時以檔案鎖協調共用同一個 token.json 的 process：
+      刷新前先讀取檔案，其他 process 已刷新時直接採用，否則刷新後以原子寫入保存
+
+    通常經由 `get_token_manager` 取得，同一憑證共用同一個 TokenManager
+
+    Args:
+        credentials (Credentials): 已建立 google-auth 憑證的 `Credentials`
+        token_json_path (str | None, optional): 共用的 token.json 路徑. Defaults to None.
+        refresh_margin (float, optional): 距離過期少於此秒數時刷新. Defaults to DEFAULT_REFRESH_MARGIN.
+        jitter (float, optional): 背景刷新提前的隨機秒數上限，避免多個 process 同時刷新. Defaults to 60.0.
+
+    Examples:
+        >>> manager = get_token_manager(credentials, "token.json").start()
+        >>> service = credentials.build_service("calendar", "v3")  # 長時間使用也不會因 token 過期而失敗
+    """
+
+    def __init__(
+        self,
+        credentials: "Credentials",
+        token_json_path: str | None = None,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        jitter: float = 60.0,
+    ) -> None:
+        self.credentials = credentials
+        self.token_json_path = token_json_path
+        self.refresh_margin = refresh_margin
+        self.jitter = jitter
+        self._lock = RLock()
+        self._refreshed_at = float("-inf")
+        self._stop = Event()
+        self._thread: Thread | None = None
+        self._refresh = self._install()
+
+    def _install(self) -> Callable[[Any], None]:
+        """_install 以 `refresh_on_demand` 取代憑證的 `refresh`，回傳原本的 `refresh`"""
+        credential = self.credentials.credential
+        refresh = credential.refresh
+        credential.refresh = self.refresh_on_demand
+
+        return refresh
+
+    def expires_in(self) -> float:
+        """expires_in 距離 access token 過期的秒數，沒有過期時間時為無限大"""
+        expiry = self.credentials.credential.expiry
+
+        if expiry is None:
+            return float("inf")
+
+        return (expiry - utcnow()).total_seconds()
+
+    def _adopt(self) -> bool:
+        """_adopt 讀取 token.json，其他 process 已刷新且尚未接近過期時採用其 token"""
+        import json
+
+        if self.token_json_path is None:
+            return False
+
+        try:
+            with open(self.token_json_path, encoding="UTF-8") as json_file:
+                info = json.load(json_file)
+        except (OSError, ValueError):
+            return False
+
+        token, expiry = info.get("token"), info.get("expiry")
+        credential = self.credentials.credential
+
+        if not token or not expiry or token == credential.token:
+            return False
+
+        expiry = datetime.strptime(
+            expiry.rstrip("Z").split(".")[0], "%Y-%m-%dT%H:%M:%S"
+        )
+
+        if (expiry - utcnow()).total_seconds() <= self.refresh_margin:
+            return False
+
+        credential.token = token
+        credential.expiry = expiry
+        LOGGER.info("token adopted from %s", self.token_json_path)
+
+        return True
+
+    def _locked_refresh(self, request: Any = None) -> bool:
+        from google.auth.transport.requests import Request
+
+        with _file_lock(self.token_json_path):
+            if self._adopt():
+                self._refreshed_at = monotonic()
+                return False
+
+            self._refresh(request or Request())
+            self._refreshed_at = monotonic()
+            LOGGER.info(
+                "token refresh, expires at %s", self.credentials.credential.expiry
+            )
+
+            if self.token_json_path:
+                self.credentials.to_json_file(self.token_json_path)
+
+        return True
+
+    def refresh(self) -> bool:
+        """
+        refresh 在 token 即將過期時刷新，已由其他執行緒或 process 刷新時直接採用
+
+        Returns:
+            bool: 是否實際向 token URI 刷新
+        """
+        with self._lock:
+            if not self.credentials.need_refresh(self.refresh_margin):
+                return False
+
+            return self._locked_refresh()
+
+    def refresh_on_demand(self, request: Any) -> None:
+        """refresh_on_demand google-auth 在 token 失效或收到 401 時呼叫，剛刷新過時直接沿用"""
+        with self._lock:
+            if monotonic() - self._refreshed_at < REFRESH_DEBOUNCE:
+                return
+
+            self._locked_refresh(request)
+
+    def _next_delay(self) -> float:
+        from random import uniform
+
+        return max(
+            self.expires_in() - self.refresh_margin - uniform(0, self.jitter), 0.0
+        )
+
+    def _run(self) -> None:
+        retry_delay = RETRY_DELAY
+
+        while not self._stop.wait(min(self._next_delay(), MAX_RETRY_DELAY)):
+            try:
+                self.refresh()
+                retry_delay = RETRY_DELAY
+            except Exception:
+                LOGGER.exception("token refresh failed, retry in %.0fs", retry_delay)
+
+                if self._stop.wait(retry_delay):
+                    break
+
+                retry_delay = min(retry_delay * 2, MAX_RETRY_DELAY)
+
+    def start(self) -> Self:
+        """start 啟動背景刷新的 daemon 執行緒，已啟動時不做任何事"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = Thread(
+                    target=self._run, name="token-refresh", daemon=True
+                )
+                self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        """stop 停止背景刷新"""
+        self._stop.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+_managers_lock = Lock()
+
+
+def get_token_manager(
+    credentials: "Credentials",
+    token_json_path: str | None = None,
+) -> TokenManager:
+    """
+    get_token_manager 取得憑證共用的 TokenManager，同一個 google-auth 憑證在 process 內只有一個
+
+    Args:
+        credentials (Credentials): 已建立 google-auth 憑證的 `Credentials`
+        token_json_path (str | None, optional): 共用的 token.json 路徑. Defaults to None.
+
+    Returns:
+        TokenManager: 憑證的 TokenManager
+    """
+    with _managers_lock:
+        # 已建立的 TokenManager 會取代憑證的 refresh，從中取回以便共用
+        manager = getattr(credentials.credential.refresh, "__self__", None)
+
+        if not isinstance(manager, TokenManager):
+            manager = TokenManager(credentials, token_json_path)
+        elif manager.token_json_path is None:
+            manager.token_json_path = token_json_path
+
+        return manager
@@ -0,0 +1 @@
+from .discovery import *  # noqa: F403
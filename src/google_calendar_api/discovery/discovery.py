@@ -0,0 +1,221 @@
+from functools import cache
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from googleapiclient.discovery import Resource
+
+from ..log import LOGGER
+
+if TYPE_CHECKING:
+    from google.auth.credentials import Credentials
+
+__all__ = [
+    "get_discovery_document",
+    "get_resource",
+    "share_credentials",
+    "clear_resources",
+]
+
+DISCOVERY_URI = "https://{api}.googleapis.com/$discovery/rest?version={api_version}"
+
+_resources: dict[tuple[Any, ...], Resource] = {}
+_credentials: dict[tuple[Any, ...], "Credentials"] = {}
+_resources_lock = Lock()
+
+
+def _credentials_key(credentials: "Credentials") -> tuple[Any, ...]:
+    """
+    _credentials_key 以憑證的 client、token URI 與帳號識別憑證，每次重新建立的憑證對象也會得到相同的 key
+
+    client secret 與 refresh token (沒有時為 access token) 只以 hash 保存，用來區分同一個 client 的不同使用者
+    """
+    from hashlib import sha256
+
+    secrets = (
+        getattr(credentials, "client_secret", None) or "",
+        getattr(credentials, "refresh_token", None)
+        or getattr(credentials, "token", None)
+        or "",
+    )
+
+    return (
+        type(credentials).__qualname__,
+        getattr(credentials, "client_id", None),
+        getattr(credentials, "token_uri", None),
+        getattr(credentials, "service_account_email", None),
+        tuple(getattr(credentials, "scopes", None) or ()),
+        sha256("\0".join(secrets).encode()).hexdigest(),
+    )
+
+
+def share_credentials(credentials: "Credentials") -> "Credentials":
+    """
+    share_credentials 取得 process 內與 `credentials` 相同 client 與帳號的憑證對象，第一次出現時註冊 `credentials` 本身
+
+    共用的 `Resource` 以此憑證送出請求，`TokenManager` 也必須管理同一個憑證對象，
+    否則刷新的憑證不會被任何請求使用
+
+    Args:
+        credentials (Credentials): google-auth 憑證
+
+    Returns:
+        Credentials: 共用的 google-auth 憑證
+    """
+    key = _credentials_key(credentials)
+
+    with _resources_lock:
+        return _credentials.setdefault(key, credentials)
+
+
+def _cache_file_path(cache_dir: str, service_name: str, version: str) -> str:
+    from os.path import join
+
+    from googleapiclient.version import __version__
+
+    return join(cache_dir, __version__, f"{service_name}.{version}.json")
+
+
+def _read_file(path: str) -> str | None:
+    from os.path import exists
+
+    if not exists(path):
+        return None
+
+    with open(path, encoding="UTF-8") as file:
+        return file.read()
+
+
+def _write_file(path: str, content: str) -> None:
+    from os import makedirs, replace
+    from os.path import dirname
+    from tempfile import NamedTemporaryFile
+
+    makedirs(dirname(path), exist_ok=True)
+
+    # 每次寫入使用不同的暫存檔，多個 process 同時寫入時不會互相覆蓋
+    with NamedTemporaryFile(
+        mode="w",
+        encoding="UTF-8",
+        dir=dirname(path),
+        prefix=".discovery-",
+        suffix=".tmp",
+        delete=False,
+    ) as file:
+        file.write(content)
+
+    replace(file.name, path)
+
+
+def _fetch_discovery_document(service_name: str, version: str) -> str:
+    from httplib2 import Http
+
+    uri = DISCOVERY_URI.format(api=service_name, api_version=version)
+    response, content = Http().request(uri)
+
+    if response.status >= 300:
+        raise ValueError(f"Failed to fetch discovery document {uri}: {response.status}")
+
+    return content.decode("UTF-8")
+
+
+@cache
+def get_discovery_document(
+    service_name: str, version: str, cache_dir: str | None = None
+) -> str:
+    """
+    get_discovery_document 取得 discovery document，同一個 process 內只讀取一次
+
+    依序使用:
+        1. `cache_dir` 內與目前 google-api-python-client 版本相同的快取
+        2. google-api-python-client 內建的 discovery document
+        3. 從網路下載，若有 `cache_dir` 則寫入快取
+
+    Args:
+        service_name (str): Google API 服務的名稱（例如 "calendar"）。
+        version (str): Google API 服務的版本（例如 "v3"）。
+        cache_dir (str | None, optional): discovery document 的快取目錄. Defaults to None.
+
+    Returns:
+        str: discovery document JSON
+    """
+    from googleapiclient.discovery_cache import get_static_doc
+
+    cache_path = (
+        _cache_file_path(cache_dir, service_name, version) if cache_dir else None
+    )
+
+    if cache_path and (content := _read_file(cache_path)):
+        return content
+
+    if content := get_static_doc(service_name, version):
+        return content
+
+    LOGGER.info("Downloading discovery document of %s %s", service_name, version)
+    content = _fetch_discovery_document(service_name, version)
+
+    if cache_path:
+        _write_file(cache_path, content)
+
+    return content
+
+
+def get_resource(
+    service_name: str,
+    version: str,
+    credentials: "Credentials",
+    cache_dir: str | None = None,
+    pool_size: int | None = None,
+    **build_kwargs: Any,
+) -> Resource:
+    """
+    get_resource 取得以 `credentials` 建立的 `Resource`，相同 client 與帳號的憑證及 API 版本會重複使用同一個 `Resource`
+
+    重新建立的憑證對象 (例如每次建立 `GoogleCalendarAPI`) 也會取得先前建立的 `Resource`，
+    此時請求使用 `share_credentials` 回傳的第一個憑證對象；`CredentialsService` 以同一個憑證對象
+    建立 `TokenManager`，主動刷新的就是請求使用的憑證
+
+    Args:
+        service_name (str): Google API 服務的名稱（例如 "calendar"）。
+        version (str): Google API 服務的版本（例如 "v3"）。
+        credentials (Credentials): google-auth 憑證
+        cache_dir (str | None, optional): discovery document 的快取目錄. Defaults to None.
+        pool_size (int | None, optional): 提供時使用 `PooledHttp` 連線池，`Resource` 可在多個執行緒間共用. Defaults to None.
+        **build_kwargs (Any): 傳給 `build_from_document` 的其他參數，提供時不使用共用的 `Resource`
+
+    Returns:
+        Resource: Google API 服務對象
+    """
+    from googleapiclient.discovery import build_from_document
+
+    if not build_kwargs:
+        credentials = share_credentials(credentials)
+
+    def build() -> Resource:
+        document = get_discovery_document(service_name, version, cache_dir)
+
+        if pool_size is not None:
+            from ..transport import PooledHttp
+
+            return build_from_document(
+                document, http=PooledHttp(credentials, pool_size), **build_kwargs
+            )
+
+        return build_from_document(document, credentials=credentials, **build_kwargs)
+
+    if build_kwargs:
+        return build()
+
+    key = (service_name, version, cache_dir, pool_size, _credentials_key(credentials))
+
+    with _resources_lock:
+        if key not in _resources:
+            _resources[key] = build()
+
+        return _resources[key]
+
+
+def clear_resources() -> None:
+    """clear_resources 清除所有共用的 `Resource` 與憑證"""
+    with _resources_lock:
+        _resources.clear()
+        _credentials.clear()
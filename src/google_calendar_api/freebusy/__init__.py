@@ -0,0 +1 @@
+from .index import *  # noqa: F403
@@ -0,0 +1,198 @@
+from bisect import bisect_right
+from collections.abc import Iterable
+from math import inf
+
+from ..schema.calendar import Event
+from ..schema.freebusy import TimePeriod
+from ..utils._datetime import from_timestamp, to_timestamp
+
+__all__ = ["BusyIndex"]
+
+
+class BusyIndex:
+    """
+    BusyIndex 多個日曆忙碌時段的聯集索引，用於查詢所有日曆共同的空閒時段
+
+    忙碌時段合併為不重疊且排序的區間，區間之間的空檔長度以 segment tree 保存最大值，
+    `first_free` 以二分搜尋定位後沿 segment tree 找出第一個足夠長的空檔，每次查詢為 O(log n)。
+    新增時段後的第一次查詢會重建索引 O(n log n)。
+
+    時間皆為 UTC epoch 秒數。
+    """
+
+    def __init__(self, periods: Iterable[tuple[float, float]] = ()) -> None:
+        self._periods: list[tuple[float, float]] = list(periods)
+        self._dirty = True
+        self._starts: list[float] = []
+        self._ends: list[float] = []
+        self._size = 1
+        self._tree: list[float] = []
+
+    def __len__(self) -> int:
+        self._build()
+
+        return len(self._starts)
+
+    def add(self, start: float, end: float) -> None:
+        if end > start:
+            self._periods.append((start, end))
+            self._dirty = True
+
+    def add_periods(self, periods: Iterable[TimePeriod]) -> None:
+        for period in periods:
+            self.add(to_timestamp(period.start), to_timestamp(period.end))
+
+    def add_events(self, events: Iterable[Event]) -> None:
+        """
+        add_events 將事件的起訖時間加入忙碌時段，已取消的事件會被略過
+
+        Args:
+            events (Iterable[Event]): calendar events
+        """
+        for event in events:
+            if event.status == "cancelled":
+                continue
+
+            start = getattr(event.start, "dateTime", None) or event.start.date
+            end = getattr(event.end, "dateTime", None) or event.end.date
+            self.add(to_timestamp(start), to_timestamp(end))
+
+    def _build(self) -> None:
+        if not self._dirty:
+            return
+
+        starts: list[float] = []
+        ends: list[float] = []
+
+        for start, end in sorted(self._periods):
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+
+        self._periods = list(zip(starts, ends, strict=True))
+        self._starts, self._ends = starts, ends
+
+        gap_count = len(starts) + 1
+        self._size = 1 << (gap_count - 1).bit_length()
+        self._tree = [-inf] * (2 * self._size)
+
+        for index in range(gap_count):
+            self._tree[self._size + index] = self._gap_end(index) - self._gap_start(
+                index
+            )
+
+        for node in range(self._size - 1, 0, -1):
+            self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
+
+        self._dirty = False
+
+    def _gap_start(self, index: int) -> float:
+        return self._ends[index - 1] if index > 0 else -inf
+
+    def _gap_end(self, index: int) -> float:
+        return self._starts[index] if index < len(self._starts) else inf
+
+    def _first_gap(self, lo: int, duration: float) -> int | None:
+        """第一個 index >= lo 且空檔長度 >= duration 的空檔"""
+
+        def search(node: int, node_lo: int, node_hi: int) -> int | None:
+            if node_hi <= lo or self._tree[node] < duration:
+                return None
+
+            if node >= self._size:
+                return node_lo
+
+            mid = (node_lo + node_hi) // 2
+
+            found = search(2 * node, node_lo, mid)
+
+            return found if found is not None else search(2 * node + 1, mid, node_hi)
+
+        return search(1, 0, self._size)
+
+    def is_free(self, start: float, end: float) -> bool:
+        self._build()
+
+        index = bisect_right(self._ends, start)
+
+        return self._gap_end(index) >= end and self._gap_start(index) <= start
+
+    def first_free(
+        self, after: float, duration: float, before: float = inf
+    ) -> float | None:
+        """
+        first_free 找出 `after` 之後第一個長度為 `duration` 的空閒時段
+
+        Args:
+            after (float): 空閒時段最早的起始時間
+            duration (float): 空閒時段的長度(秒)
+            before (float, optional): 空閒時段最晚的結束時間. Defaults to inf.
+
+        Returns:
+            float | None: 空閒時段的起始時間，找不到時為 None
+        """
+        self._build()
+
+        index = bisect_right(self._ends, after)
+
+        if self._gap_start(index) <= after and self._gap_end(index) - after >= duration:
+            start = after
+        elif (found := self._first_gap(index + 1, duration)) is not None:
+            start = self._gap_start(found)
+        else:
+            return None
+
+        return start if start + duration <= before else None
+
+    def free_slots(
+        self, time_min: float, time_max: float, duration: float, count: int = 1
+    ) -> list[tuple[float, float]]:
+        """
+        free_slots 找出時間區間內前 `count` 個長度為 `duration` 且互不重疊的空閒時段
+
+        Args:
+            time_min (float): 時間區間起始時間
+            time_max (float): 時間區間結束時間
+            duration (float): 空閒時段的長度(秒)
+            count (int, optional): 最多回傳的時段數. Defaults to 1.
+
+        Returns:
+            list[tuple[float, float]]: (起始時間, 結束時間)
+        """
+        slots: list[tuple[float, float]] = []
+        after = time_min
+
+        while len(slots) < count:
+            start = self.first_free(after, duration, before=time_max)
+
+            if start is None:
+                break
+
+            slots.append((start, start + duration))
+            after = start + duration
+
+        return slots
+
+    def free_periods(
+        self, time_min: str, time_max: str, duration: float, count: int = 1
+    ) -> list[TimePeriod]:
+        """
+        free_periods 同 `free_slots`，時間以 RFC3339 字符串表示
+
+        Args:
+            time_min (str): 時間區間起始時間 datetime string
+            time_max (str): 時間區間結束時間 datetime string
+            duration (float): 空閒時段的長度(秒)
+            count (int, optional): 最多回傳的時段數. Defaults to 1.
+
+        Returns:
+            list[TimePeriod]: 空閒時段
+        """
+        return [
+            TimePeriod(start=from_timestamp(start), end=from_timestamp(end))
+            for start, end in self.free_slots(
+                to_timestamp(time_min), to_timestamp(time_max), duration, count
+            )
+        ]
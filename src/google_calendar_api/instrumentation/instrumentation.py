@@ -0,0 +1,355 @@
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from threading import Lock
+from time import perf_counter, time
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from ..log import LOGGER
+
+if TYPE_CHECKING:
+    from googleapiclient.http import HttpRequest
+
+__all__ = [
+    "RequestRecord",
+    "RequestHook",
+    "MethodStats",
+    "RequestStats",
+    "OpenTelemetryHook",
+    "add_request_hook",
+    "remove_request_hook",
+    "get_request_hooks",
+    "emit_request",
+    "record_call",
+    "record_stream",
+    "record_request",
+]
+
+T = TypeVar("T")
+
+
+@dataclass
+class RequestRecord:
+    """
+    RequestRecord 一次 Calendar API HTTP 請求的量測結果
+
+    分頁讀取時每一頁都是一筆 `events.list` 紀錄，因此取得的頁數即為該方法的紀錄數
+    """
+
+    method: str  # discovery 的 method id，例如 `calendar.events.list`；batch 為 `batch`
+    http_method: str
+    calendar_id: str | None
+    start_time: float  # 開始時間 (epoch 秒)
+    latency: float = 0.0  # 包含等待配額與重試的總秒數
+    status: int | None = None
+    response_bytes: int = 0
+    retries: int = 0
+    parse_time: float = 0.0  # JSON 解析與轉換為 model 的秒數
+    requests: int = 1  # 消耗的配額數，batch 為其中的請求數
+    error: BaseException | None = None
+
+    @classmethod
+    def from_request(cls, request: "HttpRequest") -> "RequestRecord":
+        """from_request 以 `HttpRequest` 的 method id、HTTP method 與 URI 建立紀錄"""
+        from urllib.parse import unquote, urlsplit
+
+        _, found, rest = urlsplit(request.uri).path.partition("/calendars/")
+
+        return cls(
+            method=getattr(request, "methodId", None) or "unknown",
+            http_method=request.method,
+            calendar_id=unquote(rest.split("/", 1)[0]) if found else None,
+            start_time=time(),
+        )
+
+
+RequestHook = Callable[[RequestRecord], None]
+"""於每個請求結束後 (包含失敗) 呼叫，應盡快返回，例外會被記錄並忽略"""
+
+_hooks: tuple[RequestHook, ...] = ()
+_hooks_lock = Lock()
+
+
+def add_request_hook(hook: RequestHook) -> None:
+    """add_request_hook 註冊 process 內所有 Calendar 請求共用的 hook"""
+    global _hooks
+
+    with _hooks_lock:
+        _hooks = (*_hooks, hook)
+
+
+def remove_request_hook(hook: RequestHook) -> None:
+    """remove_request_hook 移除已註冊的 hook"""
+    global _hooks
+
+    with _hooks_lock:
+        _hooks = tuple(item for item in _hooks if item is not hook)
+
+
+def get_request_hooks() -> tuple[RequestHook, ...]:
+    return _hooks
+
+
+def emit_request(record: RequestRecord) -> None:
+    for hook in _hooks:
+        try:
+            hook(record)
+        except Exception:
+            LOGGER.exception("Request hook %r failed", hook)
+
+
+def record_call(
+    record: RequestRecord,
+    call: Callable[[Callable[[], Any]], Any],
+    send: Callable[[], Any],
+    parser: Callable[[Any], T] | None = None,
+) -> T | Any:
+    """
+    record_call 以 `call(send)` 送出請求，量測延遲、重試次數與轉換時間後通知所有 hook
+
+    Args:
+        record (RequestRecord): 請求的紀錄，結束時會填入量測結果
+        call (Callable[[Callable[[], Any]], Any]): 以傳入的函式送出請求，例如經由 `RequestScheduler.call`
+        send (Callable[[], Any]): 送出一次請求的函式，重試時會被再次呼叫
+        parser (Callable[[Any], T] | None, optional): 將回應轉換為 model 的函式，計入 `parse_time`. Defaults to None.
+
+    Returns:
+        T | Any: `parser` 的回傳值，沒有 `parser` 時為 `send` 的回傳值
+    """
+    attempts = 0
+
+    def counted_send() -> Any:
+        nonlocal attempts
+        attempts += 1
+
+        return send()
+
+    start = perf_counter()
+
+    try:
+        response = call(counted_send)
+
+        if parser is None:
+            return response
+
+        parse_start = perf_counter()
+        result = parser(response)
+        record.parse_time += perf_counter() - parse_start
+
+        return result
+    except Exception as error:
+        _record_error(record, error)
+
+        raise
+    finally:
+        record.latency = perf_counter() - start
+        record.retries = max(attempts - 1, 0)
+        emit_request(record)
+
+
+def _record_error(record: RequestRecord, error: Exception) -> None:
+    from googleapiclient.errors import HttpError
+
+    record.error = error
+
+    if isinstance(error, HttpError):
+        record.status = error.resp.status
+        record.response_bytes = len(error.content or b"")
+
+
+def record_stream(
+    record: RequestRecord,
+    call: Callable[[Callable[[], Iterator[bytes]]], Iterator[bytes]],
+    send: Callable[[], Iterator[bytes]],
+) -> Iterator[bytes]:
+    """
+    record_stream 同 `record_call`，但回應是逐段讀取的內容
+
+    讀取結束、失敗或關閉回傳的 iterator 時才通知所有 hook，`latency` 包含讀取回應的時間，
+    `response_bytes` 為已讀取的位元組數；`send` 需自行填入 `record.status`
+
+    Args:
+        record (RequestRecord): 請求的紀錄，結束時會填入量測結果
+        call (Callable[[Callable[[], Iterator[bytes]]], Iterator[bytes]]): 以傳入的函式送出請求
+        send (Callable[[], Iterator[bytes]]): 送出一次請求並回傳回應片段的函式，重試時會被再次呼叫
+
+    Returns:
+        Iterator[bytes]: 回應片段
+    """
+    attempts = 0
+
+    def counted_send() -> Iterator[bytes]:
+        nonlocal attempts
+        attempts += 1
+
+        return send()
+
+    start = perf_counter()
+
+    def finish() -> None:
+        record.latency = perf_counter() - start
+        record.retries = max(attempts - 1, 0)
+        emit_request(record)
+
+    try:
+        chunks = call(counted_send)
+    except Exception as error:
+        _record_error(record, error)
+        finish()
+
+        raise
+
+    def measured() -> Iterator[bytes]:
+        try:
+            for chunk in chunks:
+                record.response_bytes += len(chunk)
+                yield chunk
+        except Exception as error:
+            _record_error(record, error)
+
+            raise
+        finally:
+            if callable(close := getattr(chunks, "close", None)):
+                close()
+
+            finish()
+
+    return measured()
+
+
+def record_request(
+    request: "HttpRequest",
+    call: Callable[[Callable[[], Any]], Any],
+    parser: Callable[[Any], T] | None = None,
+    http: Any = None,
+) -> T | Any:
+    """
+    record_request 執行 `HttpRequest` 並記錄 method、calendar id 與回應大小；沒有 hook 時不做任何量測
+
+    Args:
+        request (HttpRequest): 尚未執行的請求
+        call (Callable[[Callable[[], Any]], Any]): 以傳入的函式送出請求，例如經由 `RequestScheduler.call`
+        parser (Callable[[Any], T] | None, optional): 將回應轉換為 model 的函式，計入 `parse_time`. Defaults to None.
+        http (Any, optional): 執行請求使用的 http 對象. Defaults to None.
+
+    Returns:
+        T | Any: `parser` 的回傳值，沒有 `parser` 時為解析後的回應
+    """
+    if not _hooks:
+        response = call(lambda: request.execute(http=http))
+
+        return parser(response) if parser is not None else response
+
+    record = RequestRecord.from_request(request)
+    postproc = request.postproc
+
+    def measured_postproc(resp: Any, content: bytes) -> Any:
+        record.status = resp.status
+        record.response_bytes = len(content or b"")
+        start = perf_counter()
+
+        try:
+            return postproc(resp, content)
+        finally:
+            record.parse_time += perf_counter() - start
+
+    request.postproc = measured_postproc
+
+    return record_call(record, call, lambda: request.execute(http=http), parser=parser)
+
+
+@dataclass
+class MethodStats:
+    count: int = 0
+    errors: int = 0
+    retries: int = 0
+    requests: int = 0
+    response_bytes: int = 0
+    latency: float = 0.0
+    max_latency: float = 0.0
+    parse_time: float = 0.0
+
+
+@dataclass
+class RequestStats:
+    """
+    RequestStats 依 method 累計請求數、錯誤、重試、回應大小與時間的 hook
+
+    Examples:
+        >>> stats = RequestStats()
+        >>> add_request_hook(stats)
+        >>> stats.snapshot()["calendar.events.list"].count  # 讀取的頁數
+        3
+    """
+
+    methods: dict[str, MethodStats] = field(default_factory=dict)
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+    def __call__(self, record: RequestRecord) -> None:
+        with self._lock:
+            stats = self.methods.setdefault(record.method, MethodStats())
+            stats.count += 1
+            stats.errors += record.error is not None
+            stats.retries += record.retries
+            stats.requests += record.requests * (record.retries + 1)
+            stats.response_bytes += record.response_bytes
+            stats.latency += record.latency
+            stats.max_latency = max(stats.max_latency, record.latency)
+            stats.parse_time += record.parse_time
+
+    def snapshot(self) -> dict[str, MethodStats]:
+        """snapshot 取得目前累計結果的複本"""
+        from copy import copy
+
+        with self._lock:
+            return {method: copy(stats) for method, stats in self.methods.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.methods.clear()
+
+
+class OpenTelemetryHook:
+    """
+    OpenTelemetryHook 將每個請求記錄為 OpenTelemetry span
+
+    需要安裝 `opentelemetry-api` (`pip install google-calendar-api[otel]`)
+
+    Args:
+        tracer (Any, optional): `opentelemetry.trace.Tracer`，未提供時使用全域的 tracer provider. Defaults to None.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        if tracer is None:
+            from opentelemetry import trace
+
+            tracer = trace.get_tracer("google_calendar_api")
+
+        self.tracer = tracer
+
+    def __call__(self, record: RequestRecord) -> None:
+        from opentelemetry.trace import Status, StatusCode
+
+        start_ns = int(record.start_time * 1e9)
+        span = self.tracer.start_span(
+            record.method,
+            start_time=start_ns,
+            attributes={
+                "http.request.method": record.http_method,
+                "gcal.calendar_id": record.calendar_id or "",
+                "gcal.retries": record.retries,
+                "gcal.requests": record.requests,
+                "gcal.parse_time_ms": record.parse_time * 1e3,
+                "http.response.body.size": record.response_bytes,
+                **(
+                    {"http.response.status_code": record.status}
+                    if record.status is not None
+                    else {}
+                ),
+            },
+        )
+
+        if record.error is not None:
+            span.record_exception(record.error)
+            span.set_status(Status(StatusCode.ERROR, str(record.error)))
+
+        span.end(end_time=start_ns + int(record.latency * 1e9))
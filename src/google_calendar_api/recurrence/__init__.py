@@ -0,0 +1 @@
+from .recurrence import *  # noqa: F403
@@ -0,0 +1,536 @@
+from calendar import monthrange
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from heapq import merge
+from typing import Any, Literal
+
+from ..schema.calendar import CancelledEvent, Event, EventDate, EventTime
+from ..schema.parse import EventView
+from ..utils._datetime import to_timestamp
+
+__all__ = ["RecurrenceRule", "RecurrenceSet", "expand_event", "expand_events"]
+
+WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+SUPPORTED_PARTS = frozenset(
+    {"FREQ", "INTERVAL", "COUNT", "UNTIL", "BYDAY", "BYMONTHDAY", "BYMONTH"}
+    | {"BYSETPOS", "WKST"}
+)
+
+Frequency = Literal["DAILY", "WEEKLY", "MONTHLY", "YEARLY"]
+
+
+def _parse_value(value: str, tz: tzinfo | None) -> date | datetime:
+    """_parse_value 解析 iCalendar 的 DATE 或 DATE-TIME，沒有 `Z` 的時間以 `tz` 為準"""
+    if len(value) == 8:
+        return datetime.strptime(value, "%Y%m%d").date()
+
+    if value.endswith("Z"):
+        return datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+
+    return datetime.strptime(value, "%Y%m%dT%H%M%S").replace(tzinfo=tz)
+
+
+def _nth_weekdays(days: list[date], by_day: tuple[tuple[int, int], ...]) -> set[date]:
+    """_nth_weekdays 從依序排列的 `days` 中取出 BYDAY 指定的星期，序數以 `days` 的範圍計算"""
+    result: set[date] = set()
+
+    for ordinal, weekday in by_day:
+        matched = [day for day in days if day.weekday() == weekday]
+
+        if ordinal == 0:
+            result.update(matched)
+        elif -len(matched) <= ordinal <= len(matched) and ordinal:
+            result.add(matched[ordinal - 1 if ordinal > 0 else ordinal])
+
+    return result
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """
+    RecurrenceRule RFC 5545 `RRULE` 中 Google Calendar 使用的子集
+
+    支援 `FREQ` 為 DAILY/WEEKLY/MONTHLY/YEARLY，以及 `INTERVAL`、`COUNT`、`UNTIL`、`BYDAY`、
+    `BYMONTHDAY`、`BYMONTH`、`BYSETPOS`、`WKST`；其他部分 (例如 `BYHOUR`、`BYWEEKNO`) 會拋出 `ValueError`
+    """
+
+    freq: Frequency
+    interval: int = 1
+    count: int | None = None
+    until: date | datetime | None = None
+    by_day: tuple[tuple[int, int], ...] = ()  # (序數，0 為每一個, 星期 0-6)
+    by_month_day: tuple[int, ...] = ()
+    by_month: tuple[int, ...] = ()
+    by_set_pos: tuple[int, ...] = ()
+    week_start: int = 0
+
+    @classmethod
+    def parse(cls, line: str, tz: tzinfo | None = None) -> "RecurrenceRule":
+        """
+        parse 解析 `RRULE:FREQ=WEEKLY;BYDAY=MO,WE` 格式的字串
+
+        Args:
+            line (str): RRULE，可省略 `RRULE:` 前綴
+            tz (tzinfo | None, optional): 沒有 `Z` 的 `UNTIL` 使用的時區. Defaults to None.
+
+        Returns:
+            RecurrenceRule: 重複規則
+        """
+        _, _, value = line.rpartition(":")
+        parts = dict(part.split("=", 1) for part in value.upper().split(";") if part)
+
+        if unsupported := set(parts) - SUPPORTED_PARTS:
+            raise ValueError(f"unsupported RRULE parts: {sorted(unsupported)}")
+
+        if parts.get("FREQ") not in ("DAILY", "WEEKLY", "MONTHLY", "YEARLY"):
+            raise ValueError(f"unsupported RRULE FREQ: {parts.get('FREQ')}")
+
+        def numbers(name: str) -> tuple[int, ...]:
+            if name not in parts:
+                return ()
+
+            return tuple(int(item) for item in parts[name].split(","))
+
+        return cls(
+            freq=parts["FREQ"],  # type: ignore
+            interval=int(parts.get("INTERVAL", 1)),
+            count=int(parts["COUNT"]) if "COUNT" in parts else None,
+            until=_parse_value(parts["UNTIL"], tz) if "UNTIL" in parts else None,
+            by_day=tuple(
+                (int(item[:-2] or 0), WEEKDAYS[item[-2:]])
+                for item in parts["BYDAY"].split(",")
+            )
+            if "BYDAY" in parts
+            else (),
+            by_month_day=numbers("BYMONTHDAY"),
+            by_month=numbers("BYMONTH"),
+            by_set_pos=numbers("BYSETPOS"),
+            week_start=WEEKDAYS[parts.get("WKST", "MO")],
+        )
+
+    def _month_days(self, year: int, month: int, default_day: int) -> set[date]:
+        size = monthrange(year, month)[1]
+        days: set[date] | None = None
+
+        if self.by_month_day:
+            days = {
+                date(year, month, day if day > 0 else size + 1 + day)
+                for day in self.by_month_day
+                if 0 < abs(day) <= size
+            }
+
+        if self.by_day:
+            weekdays = _nth_weekdays(
+                [date(year, month, day) for day in range(1, size + 1)], self.by_day
+            )
+            days = weekdays if days is None else days & weekdays
+
+        if days is None:
+            return {date(year, month, default_day)} if default_day <= size else set()
+
+        return days
+
+    def _period(self, index: int, dtstart: date) -> tuple[date, set[date]]:
+        """_period 第 `index` 個週期的起始日與其中的候選日期"""
+        if self.freq == "DAILY":
+            day = dtstart + timedelta(days=index * self.interval)
+            size = monthrange(day.year, day.month)[1]
+            matched = (
+                not self.by_month_day
+                or any(
+                    day.day == (value if value > 0 else size + 1 + value)
+                    for value in self.by_month_day
+                )
+            ) and (
+                not self.by_day
+                or day.weekday() in {weekday for _, weekday in self.by_day}
+            )
+
+            return day, {day} if matched else set()
+
+        if self.freq == "WEEKLY":
+            week = dtstart - timedelta(days=(dtstart.weekday() - self.week_start) % 7)
+            week += timedelta(weeks=index * self.interval)
+            weekdays = {weekday for _, weekday in self.by_day} or {dtstart.weekday()}
+
+            return week, {
+                day
+                for day in (week + timedelta(days=offset) for offset in range(7))
+                if day.weekday() in weekdays
+            }
+
+        if self.freq == "MONTHLY":
+            year, month = divmod(dtstart.month - 1 + index * self.interval, 12)
+            year, month = dtstart.year + year, month + 1
+
+            return date(year, month, 1), self._month_days(year, month, dtstart.day)
+
+        year = dtstart.year + index * self.interval
+
+        if self.by_day and not self.by_month and not self.by_month_day:
+            days = [date(year, 1, 1) + timedelta(days=offset) for offset in range(366)]
+
+            return date(year, 1, 1), _nth_weekdays(
+                [day for day in days if day.year == year], self.by_day
+            )
+
+        months = self.by_month or (
+            range(1, 13) if self.by_month_day else (dtstart.month,)
+        )
+
+        return date(year, 1, 1), {
+            day
+            for month in months
+            for day in self._month_days(year, month, dtstart.day)
+        }
+
+    def _first_index(self, dtstart: date, start: date) -> int:
+        """_first_index 可能包含 `start` 的第一個週期，用於跳過時間區間之前的週期"""
+        if self.freq == "DAILY":
+            periods = (start - dtstart).days
+        elif self.freq == "WEEKLY":
+            periods = (start - dtstart).days // 7
+        elif self.freq == "MONTHLY":
+            periods = (start.year - dtstart.year) * 12 + start.month - dtstart.month
+        else:
+            periods = start.year - dtstart.year
+
+        return max(periods // self.interval - 1, 0)
+
+    def iter_dates(
+        self, dtstart: date, stop: date, start: date | None = None
+    ) -> Iterator[date]:
+        """
+        iter_dates 依序產生 `dtstart` 之後符合規則的日期 (不包含 `dtstart` 本身)，直到週期起始日超過 `stop`
+
+        `COUNT` 與 `UNTIL` 由 `RecurrenceSet` 處理，因為兩者需要與 `DTSTART` 的時間一起計算；
+        沒有 `COUNT` 時可以提供 `start` 跳過之前的週期，但仍可能產生少數早於 `start` 的日期
+        """
+        index = self._first_index(dtstart, start) if start is not None else 0
+
+        while True:
+            period_start, days = self._period(index, dtstart)
+
+            if period_start > stop:
+                return
+
+            if self.by_month:
+                days = {day for day in days if day.month in self.by_month}
+
+            ordered = sorted(days)
+
+            if self.by_set_pos:
+                ordered = sorted(
+                    {
+                        ordered[pos - 1 if pos > 0 else pos]
+                        for pos in self.by_set_pos
+                        if 0 < abs(pos) <= len(ordered)
+                    }
+                )
+
+            for day in ordered:
+                if day > dtstart:
+                    yield day
+
+            index += 1
+
+
+class RecurrenceSet:
+    """
+    RecurrenceSet 重複事件主體的 `recurrence` (RRULE/EXDATE/RDATE) 與起始時間
+
+    重複的時間以事件的 `timeZone` 計算，跨越日光節約時間時保持相同的當地時間
+
+    Args:
+        event (Event | EventView): 重複事件的主體
+    """
+
+    def __init__(self, event: Event | EventView) -> None:
+        self.all_day = isinstance(event.start, EventDate)
+        self.tz: tzinfo | None = None
+
+        if isinstance(event.start, EventDate):
+            self.dtstart: date | datetime = date.fromisoformat(event.start.date)
+            self.duration = date.fromisoformat(event.end.date) - self.dtstart  # type: ignore
+        else:
+            from zoneinfo import ZoneInfo
+
+            start = datetime.fromisoformat(event.start.dateTime.replace("Z", "+00:00"))
+            end = datetime.fromisoformat(event.end.dateTime.replace("Z", "+00:00"))  # type: ignore
+            self.tz = (
+                ZoneInfo(event.start.timeZone) if event.start.timeZone else start.tzinfo
+            )
+            start, end = start.astimezone(self.tz), end.astimezone(self.tz)
+            self.dtstart = start
+            # 以當地時間計算長度，跨越日光節約時間的單次事件仍維持相同的當地起訖時間
+            self.duration = end.replace(tzinfo=None) - start.replace(tzinfo=None)
+
+        self.rules: list[RecurrenceRule] = []
+        self.exdates: set[date | datetime] = set()
+        self.rdates: set[date | datetime] = set()
+
+        for line in event.recurrence or []:
+            name, _, values = line.partition(":")
+            name, *params = name.split(";")
+            name = name.upper()
+            tz = self.tz
+
+            for param in params:
+                key, _, value = param.partition("=")
+
+                if key.upper() == "TZID":
+                    from zoneinfo import ZoneInfo
+
+                    tz = ZoneInfo(value)
+
+            if name == "RRULE":
+                self.rules.append(RecurrenceRule.parse(values, self.tz))
+            elif name in ("EXDATE", "RDATE"):
+                target = self.exdates if name == "EXDATE" else self.rdates
+                target.update(
+                    self._normalize(_parse_value(value, tz))
+                    for value in values.split(",")
+                )
+
+    def _normalize(self, value: date | datetime) -> date | datetime:
+        if isinstance(value, datetime):
+            return value.date() if self.all_day else value.astimezone(self.tz)
+
+        return value
+
+    def _at(self, day: date) -> date | datetime:
+        if self.all_day:
+            return day
+
+        local = self.dtstart.replace(tzinfo=None)  # type: ignore
+
+        return datetime.combine(day, local.time(), tzinfo=self.tz)
+
+    def _excluded(self, value: date | datetime) -> bool:
+        if value in self.exdates:
+            return True
+
+        return isinstance(value, datetime) and value.date() in self.exdates
+
+    def _before_until(self, rule: RecurrenceRule, value: date | datetime) -> bool:
+        if rule.until is None:
+            return True
+
+        if isinstance(rule.until, datetime):
+            if isinstance(value, datetime):
+                return value <= rule.until
+
+            return value <= rule.until.date()
+
+        return (value.date() if isinstance(value, datetime) else value) <= rule.until
+
+    def _iter_rule(
+        self, rule: RecurrenceRule, start: date, stop: date
+    ) -> Iterator[date | datetime]:
+        """_iter_rule 產生單一 RRULE 的起始時間，`DTSTART` 本身為第一次並計入 `COUNT`"""
+        from itertools import chain
+
+        dtstart_day = (
+            self.dtstart.date() if isinstance(self.dtstart, datetime) else self.dtstart
+        )
+        # 有 COUNT 時必須從 DTSTART 開始計數，無法跳過時間區間之前的週期
+        days = rule.iter_dates(dtstart_day, stop, start if rule.count is None else None)
+        values = chain((self.dtstart,), (self._at(day) for day in days))
+
+        for count, value in enumerate(values, start=1):
+            if rule.count is not None and count > rule.count:
+                return
+
+            if not self._before_until(rule, value):
+                return
+
+            yield value
+
+    @staticmethod
+    def sort_key(value: date | datetime) -> float:
+        """sort_key 起始時間的 UTC epoch 秒數，全天事件的日期與 `to_timestamp` 相同視為 UTC"""
+        if isinstance(value, datetime):
+            return value.timestamp()
+
+        return to_timestamp(value.isoformat())
+
+    def occurrences(self, start: date, stop: date) -> Iterator[date | datetime]:
+        """
+        occurrences 依序產生每一次的起始時間 (全天事件為 `date`)，已套用 EXDATE 與 RDATE
+
+        Args:
+            start (date): 盡量跳過此日期之前的週期，仍可能產生少數較早的起始時間
+            stop (date): 產生到此日期為止，`COUNT` 與 `UNTIL` 會更早結束
+
+        Yields:
+            date | datetime: 每一次的起始時間
+        """
+        streams: list[Iterable[date | datetime]] = [
+            self._iter_rule(rule, start, stop) for rule in self.rules
+        ]
+        streams.append(sorted(self.rdates, key=self.sort_key))
+        previous: date | datetime | None = None
+
+        for value in merge(*streams, key=self.sort_key):
+            if value == previous or self._excluded(value):
+                continue
+
+            previous = value
+
+            yield value
+
+    def end_of(self, start: date | datetime) -> date | datetime:
+        """end_of 以主體的長度計算該次的結束時間"""
+        if isinstance(start, datetime):
+            local = start.replace(tzinfo=None) + self.duration
+
+            return local.replace(tzinfo=self.tz)
+
+        return start + self.duration
+
+
+def _instance_id(event_id: str, start: date | datetime) -> str:
+    """_instance_id 與 API 相同的單次事件 id，例如 `abc_20240115T010000Z` 或全天事件的 `abc_20240115`"""
+    if isinstance(start, datetime):
+        return f"{event_id}_{start.astimezone(timezone.utc):%Y%m%dT%H%M%SZ}"
+
+    return f"{event_id}_{start:%Y%m%d}"
+
+
+def _time_data(value: date | datetime, time_zone: str | None) -> dict[str, Any]:
+    """_time_data 與 API 相同格式的 `start`/`end` 資料"""
+    if isinstance(value, datetime):
+        data = {"dateTime": value.isoformat()}
+
+        return {**data, "timeZone": time_zone} if time_zone else data
+
+    return {"date": value.isoformat()}
+
+
+def _event_time(data: dict[str, Any]) -> EventTime | EventDate:
+    return EventTime(**data) if "dateTime" in data else EventDate(**data)
+
+
+def _original_key(value: EventTime | EventDate) -> float:
+    return to_timestamp(getattr(value, "dateTime", None) or value.date)  # type: ignore
+
+
+def expand_event(
+    event: Event | EventView,
+    time_min: str,
+    time_max: str,
+    exceptions: Iterable[float] = (),
+) -> Iterator[Event | EventView]:
+    """
+    expand_event 將重複事件的主體展開為時間區間內的單次事件，依起始時間排序且逐一產生
+
+    單次事件複製主體的欄位，id、`start`/`end` 與 `originalStartTime` 與 API 展開的結果相同
+
+    Args:
+        event (Event | EventView): 重複事件的主體，沒有 `recurrence` 時只產生事件本身
+        time_min (str): 時間區間起始時間，結束時間晚於此時間的單次事件才會產生
+        time_max (str): 時間區間結束時間，起始時間早於此時間的單次事件才會產生
+        exceptions (Iterable[float], optional): 已被修改或刪除的單次事件原本起始時間 (UTC epoch 秒數)，不會產生. Defaults to ().
+
+    Yields:
+        Event | EventView: 單次事件，與主體的型別相同
+    """
+    if not event.recurrence:
+        start, end = _original_key(event.start), _original_key(event.end)
+
+        if start < to_timestamp(time_max) and end > to_timestamp(time_min):
+            yield event
+
+        return
+
+    recurrence = RecurrenceSet(event)
+    min_ts, max_ts = to_timestamp(time_min), to_timestamp(time_max)
+    # 以 UTC 日期前後各多取一天，涵蓋事件時區與 UTC 的日期差
+    first_day = datetime.fromtimestamp(min_ts, tz=timezone.utc).date()
+    last_day = datetime.fromtimestamp(max_ts, tz=timezone.utc).date()
+    first_day, last_day = first_day - timedelta(days=1), last_day + timedelta(days=1)
+    skipped = set(exceptions)
+    time_zone = getattr(event.start, "timeZone", None)
+
+    for start in recurrence.occurrences(first_day, last_day):
+        start_ts = recurrence.sort_key(start)
+
+        if start_ts >= max_ts:
+            return
+
+        end = recurrence.end_of(start)
+
+        if recurrence.sort_key(end) <= min_ts or start_ts in skipped:
+            continue
+
+        start_time = _time_data(start, time_zone)
+        update: dict[str, Any] = {
+            "id": _instance_id(event.id, start),
+            "start": start_time,
+            "end": _time_data(end, time_zone),
+            "recurringEventId": event.id,
+            "originalStartTime": start_time,
+            "recurrence": None,
+        }
+
+        if isinstance(event, EventView):
+            # trusted 模式的主體同樣以 EventView 產生單次事件，只複製原始資料
+            yield EventView({**event.raw, **update})
+        else:
+            for key in ("start", "end", "originalStartTime"):
+                update[key] = _event_time(update[key])
+
+            yield event.model_copy(update=update)
+
+
+def expand_events(
+    events: Iterable[Event | EventView],
+    time_min: str,
+    time_max: str,
+    cancelled: Iterable[CancelledEvent] = (),
+) -> Iterator[Event | EventView]:
+    """
+    expand_events 以 `singleEvents=False` 取得的事件在本地展開重複事件，結果與 `singleEvents=True` 相同
+
+    被修改的單次事件以 `recurringEventId` 與 `originalStartTime` 建立索引並取代展開的結果，
+    被刪除的單次事件 (`cancelled`) 不會產生；所有事件依起始時間合併後逐一產生。
+
+    Args:
+        events (Iterable[Event | EventView]): 單次事件、重複事件主體與被修改的單次事件
+        time_min (str): 時間區間起始時間
+        time_max (str): 時間區間結束時間
+        cancelled (Iterable[CancelledEvent], optional): 被刪除的單次事件. Defaults to ().
+
+    Yields:
+        Event | EventView: 依起始時間排序的單次事件
+    """
+    exceptions: dict[str, set[float]] = {}
+    masters: list[Event | EventView] = []
+    singles: list[Event | EventView] = []
+
+    for item in cancelled:
+        if item.recurringEventId and item.originalStartTime:
+            exceptions.setdefault(item.recurringEventId, set()).add(
+                _original_key(item.originalStartTime)
+            )
+
+    for event in events:
+        if event.recurrence:
+            masters.append(event)
+            continue
+
+        if event.recurringEventId and event.originalStartTime:
+            exceptions.setdefault(event.recurringEventId, set()).add(
+                _original_key(event.originalStartTime)
+            )
+
+        singles.append(event)
+
+    streams = [
+        expand_event(master, time_min, time_max, exceptions.get(master.id, ()))
+        for master in masters
+    ]
+    streams.append(sorted(singles, key=lambda event: _original_key(event.start)))
+
+    yield from merge(*streams, key=lambda event: _original_key(event.start))
@@ -0,0 +1,2 @@
+from .conflicts import *  # noqa: F403
+from .planner import *  # noqa: F403
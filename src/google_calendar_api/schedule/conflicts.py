@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..analytics import EventFrame
+
+__all__ = ["Conflict", "find_conflicts"]
+
+
+@dataclass(frozen=True)
+class Conflict:
+    """
+    Conflict 兩個時間重疊的事件，時間為 UTC epoch 秒數
+
+    `first` 的起始時間不晚於 `second`，(`start`, `end`) 為重疊的區間
+    """
+
+    first_calendar_id: str
+    first_id: str
+    second_calendar_id: str
+    second_id: str
+    start: int
+    end: int
+
+
+def find_conflicts(frame: "EventFrame") -> list[Conflict]:
+    """
+    find_conflicts 以依起始時間排序後的掃描線找出所有時間重疊的事件
+
+    掃描時以 heap 保存尚未結束的事件，每個事件只與仍在進行中的事件比較，
+    時間複雜度為 O(n log n + k)，k 為重疊的組數。已取消與全天事件不計入，
+    不同日曆中 id 相同的事件 (同一事件的參加者副本) 不視為衝突。
+
+    Args:
+        frame (EventFrame): 一或多個日曆的事件
+
+    Returns:
+        list[Conflict]: 依 `second` 的起始時間排序
+    """
+    from heapq import heappop, heappush
+
+    from ..analytics import STATUSES
+
+    cancelled = STATUSES.index("cancelled")
+    calendars, ids = frame.calendars, frame.ids
+    starts, ends = frame.start, frame.end
+    order = sorted(
+        (
+            index
+            for index in range(len(frame))
+            if not frame.all_day[index]
+            and frame.status_codes[index] != cancelled
+            and ends[index] > starts[index]
+        ),
+        key=starts.__getitem__,
+    )
+    active: list[tuple[float, int]] = []  # (結束時間, 事件位置)
+    conflicts: list[Conflict] = []
+
+    for index in order:
+        start = starts[index]
+
+        while active and active[0][0] <= start:
+            heappop(active)
+
+        for end, other in active:
+            if ids[other] == ids[index]:
+                continue
+
+            conflicts.append(
+                Conflict(
+                    first_calendar_id=calendars[frame.calendar_codes[other]],
+                    first_id=ids[other],
+                    second_calendar_id=calendars[frame.calendar_codes[index]],
+                    second_id=ids[index],
+                    start=int(start),
+                    end=int(min(end, ends[index])),
+                )
+            )
+
+        heappush(active, (ends[index], index))
+
+    return conflicts
@@ -0,0 +1,183 @@
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from ..freebusy import BusyIndex
+from ..utils._datetime import from_timestamp, to_timestamp
+
+if TYPE_CHECKING:
+    from ..analytics import EventFrame
+    from ..calendar import BatchResult
+    from ..schema.freebusy import TimePeriod
+
+__all__ = ["EventMove", "ReschedulePlan", "plan_reschedule"]
+
+
+@dataclass(frozen=True)
+class EventMove:
+    """EventMove 將事件由 (`start`, `end`) 移到 (`new_start`, `new_end`)，時間為 UTC epoch 秒數"""
+
+    calendar_id: str
+    event_id: str
+    start: int
+    end: int
+    new_start: int
+    new_end: int
+
+    @property
+    def start_time(self) -> str:
+        return from_timestamp(self.new_start)
+
+    @property
+    def end_time(self) -> str:
+        return from_timestamp(self.new_end)
+
+
+@dataclass
+class ReschedulePlan:
+    """
+    ReschedulePlan 重新安排的結果
+
+    - `moves`: 需要移動的事件，彼此之間與其他事件皆不重疊
+    - `kept`: 原本的時段已可用，不需移動的事件 id
+    - `unplaced`: 時間區間內找不到時段、全天事件或不在讀取範圍內的事件 id
+    - `results`: 套用後依 `moves` 順序排列的 patch 結果
+    """
+
+    moves: list[EventMove] = field(default_factory=list)
+    kept: list[str] = field(default_factory=list)
+    unplaced: list[str] = field(default_factory=list)
+    results: list["BatchResult"] = field(default_factory=list)
+
+
+def _first_slot(
+    busy: BusyIndex,
+    after: float,
+    duration: float,
+    latest: float,
+    buffer: float,
+    step: float | None,
+) -> float | None:
+    """`after` 之後第一個前後各保留 `buffer` 秒且對齊 `step` 的時段"""
+    from math import ceil
+
+    while True:
+        found = busy.first_free(
+            after - buffer, duration + 2 * buffer, before=latest + buffer
+        )
+
+        if found is None:
+            return None
+
+        start = found + buffer
+
+        if step is None:
+            return start
+
+        aligned = ceil(start / step) * step
+
+        if aligned + duration > latest:
+            return None
+
+        if busy.is_free(aligned - buffer, aligned + duration + buffer):
+            return aligned
+
+        after = aligned
+
+
+def plan_reschedule(
+    frame: "EventFrame",
+    event_ids: Collection[str],
+    *,
+    calendar_id: str,
+    time_min: str,
+    time_max: str,
+    blocked: Iterable["TimePeriod"] = (),
+    buffer: float = 0,
+    step: float | None = None,
+) -> ReschedulePlan:
+    """
+    plan_reschedule 為 `calendar_id` 中的事件找出互不重疊的新時段，只計算不寫入
+
+    `frame` 中其他事件與 `blocked` (例如會議室停用的時段) 建立 `BusyIndex`，
+    要移動的事件依原本的起始時間排序，逐一放在不早於原時段與前一個事件的第一個空檔，
+    因此保留原本的先後順序；原時段已可用的事件不會移動。
+    已取消與全天事件不會佔用時段。
+
+    Args:
+        frame (EventFrame): 目標日曆在時間區間內的事件，需包含要移動的事件
+        event_ids (Collection[str]): 要移動的事件 id
+        calendar_id (str): 要移動的事件所屬的`calendarID`
+        time_min (str): 新時段最早的起始時間
+        time_max (str): 新時段最晚的結束時間
+        blocked (Iterable[TimePeriod], optional): 不可使用的時段. Defaults to ().
+        buffer (float, optional): 與其他事件之間至少間隔的秒數. Defaults to 0.
+        step (float | None, optional): 新的起始時間對齊的秒數 (UTC)，例如 900 為每 15 分鐘. Defaults to None.
+
+    Returns:
+        ReschedulePlan: 重新安排的結果
+    """
+    from ..analytics import STATUSES
+
+    cancelled = STATUSES.index("cancelled")
+    calendar_code = (
+        frame.calendars.index(calendar_id) if calendar_id in frame.calendars else -1
+    )
+    wanted = set(event_ids)
+    busy = BusyIndex()
+    busy.add_periods(blocked)
+    moving: list[int] = []
+
+    for index, event_id in enumerate(frame.ids):
+        if frame.status_codes[index] == cancelled:
+            continue
+
+        if event_id in wanted:
+            # 其他日曆中同一事件的副本會一起移動，不佔用時段
+            if frame.calendar_codes[index] == calendar_code:
+                moving.append(index)
+        elif not frame.all_day[index]:
+            busy.add(frame.start[index], frame.end[index])
+
+    plan = ReschedulePlan()
+    found = {frame.ids[index] for index in moving}
+    plan.unplaced.extend(event_id for event_id in event_ids if event_id not in found)
+    earliest, latest = to_timestamp(time_min), to_timestamp(time_max)
+    cursor = earliest
+
+    for index in sorted(moving, key=frame.start.__getitem__):
+        event_id, start, end = frame.ids[index], frame.start[index], frame.end[index]
+
+        if frame.all_day[index]:
+            plan.unplaced.append(event_id)
+            continue
+
+        if (
+            start >= cursor
+            and end <= latest
+            and busy.is_free(start - buffer, end + buffer)
+        ):
+            plan.kept.append(event_id)
+            cursor = end + buffer
+            continue
+
+        slot = _first_slot(busy, max(start, cursor), end - start, latest, buffer, step)
+
+        if slot is None:
+            plan.unplaced.append(event_id)
+            continue
+
+        new_start = int(slot)
+        plan.moves.append(
+            EventMove(
+                calendar_id=calendar_id,
+                event_id=event_id,
+                start=int(start),
+                end=int(end),
+                new_start=new_start,
+                new_end=new_start + int(end - start),
+            )
+        )
+        cursor = new_start + end - start + buffer
+
+    return plan
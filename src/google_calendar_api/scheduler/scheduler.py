@@ -0,0 +1,423 @@
+from collections.abc import Awaitable, Callable
+from enum import IntEnum
+from threading import Condition, Lock
+from time import monotonic
+from typing import Any, TypeVar
+
+from googleapiclient.http import HttpRequest
+
+from ..log import LOGGER
+
+__all__ = [
+    "Priority",
+    "TokenBucket",
+    "RequestScheduler",
+    "get_default_scheduler",
+    "set_default_scheduler",
+]
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+RETRY_BUDGET_CAPACITY = 10.0
+ASYNC_POLL_INTERVAL = 0.01
+"""`aacquire` 等待更優先的請求時重新檢查的間隔秒數"""
+
+
+class Priority(IntEnum):
+    """請求的優先順序，數字越小越優先取得配額"""
+
+    INTERACTIVE = 0  # 單一事件的讀取與寫入
+    BULK = 1  # batch request 與掃描整個日曆的讀取
+
+
+class TokenBucket:
+    """
+    TokenBucket 每秒補充 `rate` 個 token，最多累積 `capacity` 個
+
+    Args:
+        rate (float): 每秒補充的 token 數
+        capacity (float | None, optional): 最多累積的 token 數，預設與 `rate` 相同. Defaults to None.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = monotonic()
+        self._lock = Lock()
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def delay(self, tokens: float = 1) -> float:
+        """delay 距離可取得 `tokens` 個 token 還需等待的秒數"""
+        with self._lock:
+            self._refill()
+
+            return max(0.0, (min(tokens, self.capacity) - self._tokens) / self.rate)
+
+    def consume(self, tokens: float = 1) -> None:
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+
+
+class RequestScheduler:
+    """
+    RequestScheduler 所有 `Calendar` 請求的排程器
+
+    - 每個使用者與整個 project 各有一個 `TokenBucket`，兩者都有 token 時才送出請求
+    - 等待配額時，`Priority.INTERACTIVE` 的請求優先於 `Priority.BULK`
+    - 429、5xx 與 403 rateLimitExceeded 以 jittered exponential backoff 重試，
+      並遵守 `Retry-After` header
+    - 每個請求最多重試 `max_retries` 次，且所有重試次數不超過請求數的 `retry_budget_ratio`，
+      避免服務異常時以重試放大流量
+
+    Args:
+        user_rate (float, optional): 每個使用者每秒的請求數. Defaults to 10.
+        project_rate (float, optional): 整個 project 每秒的請求數. Defaults to 160.
+        max_retries (int, optional): 單一請求的最大重試次數. Defaults to 5.
+        base_delay (float, optional): 第一次重試前的最大等待秒數. Defaults to 0.5.
+        max_delay (float, optional): 重試前的最大等待秒數. Defaults to 32.
+        retry_budget_ratio (float, optional): 重試次數相對於請求數的上限. Defaults to 0.2.
+    """
+
+    def __init__(
+        self,
+        user_rate: float = 10,
+        project_rate: float = 160,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 32,
+        retry_budget_ratio: float = 0.2,
+    ) -> None:
+        self.user_rate = user_rate
+        self.project_bucket = TokenBucket(project_rate)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_budget_ratio = retry_budget_ratio
+        self._user_buckets: dict[str, TokenBucket] = {}
+        self._condition = Condition()
+        self._waiting = dict.fromkeys(Priority, 0)
+        self._retry_budget_lock = Lock()
+        self._retry_tokens = RETRY_BUDGET_CAPACITY
+
+    def _user_bucket(self, user: str) -> TokenBucket:
+        if (bucket := self._user_buckets.get(user)) is None:
+            bucket = self._user_buckets[user] = TokenBucket(self.user_rate)
+
+        return bucket
+
+    def _try_consume(
+        self, user_bucket: TokenBucket, priority: Priority, tokens: float
+    ) -> float | None:
+        """
+        _try_consume 有配額時扣除 `tokens` 並回傳 0，否則回傳還需等待的秒數；
+        有更優先的請求在等待時回傳 None。呼叫時需持有 `_condition`
+        """
+        if any(self._waiting[other] for other in Priority if other < priority):
+            return None
+
+        delay = max(user_bucket.delay(tokens), self.project_bucket.delay(tokens))
+
+        if delay <= 0:
+            user_bucket.consume(tokens)
+            self.project_bucket.consume(tokens)
+
+            return 0
+
+        return delay
+
+    def _refill_retry_budget(self, tokens: float) -> None:
+        with self._retry_budget_lock:
+            self._retry_tokens = min(
+                self._retry_tokens + tokens * self.retry_budget_ratio,
+                RETRY_BUDGET_CAPACITY,
+            )
+
+    def acquire(
+        self,
+        user: str = "default",
+        priority: Priority = Priority.INTERACTIVE,
+        tokens: float = 1,
+    ) -> None:
+        """
+        acquire 等待直到使用者與 project 都有足夠的配額，並扣除 `tokens`
+
+        Args:
+            user (str, optional): 使用者. Defaults to "default".
+            priority (Priority, optional): 優先順序. Defaults to Priority.INTERACTIVE.
+            tokens (float, optional): 請求數，batch request 為其中的請求數. Defaults to 1.
+        """
+        with self._condition:
+            user_bucket = self._user_bucket(user)
+            self._waiting[priority] += 1
+
+            try:
+                while (delay := self._try_consume(user_bucket, priority, tokens)) != 0:
+                    self._condition.wait(delay)
+            finally:
+                self._waiting[priority] -= 1
+                self._condition.notify_all()
+
+        self._refill_retry_budget(tokens)
+
+    async def aacquire(
+        self,
+        user: str = "default",
+        priority: Priority = Priority.INTERACTIVE,
+        tokens: float = 1,
+    ) -> None:
+        """
+        aacquire `acquire` 的 asyncio 版本，以 `asyncio.sleep` 等待配額，
+        取消時不會扣除配額也不佔用 worker thread
+
+        Args:
+            user (str, optional): 使用者. Defaults to "default".
+            priority (Priority, optional): 優先順序. Defaults to Priority.INTERACTIVE.
+            tokens (float, optional): 請求數，batch request 為其中的請求數. Defaults to 1.
+        """
+        import asyncio
+
+        with self._condition:
+            user_bucket = self._user_bucket(user)
+            self._waiting[priority] += 1
+
+        try:
+            while True:
+                with self._condition:
+                    delay = self._try_consume(user_bucket, priority, tokens)
+
+                if delay == 0:
+                    break
+
+                # 更優先的請求可能在其他 thread 等待，無法被通知，因此定期重新檢查
+                await asyncio.sleep(ASYNC_POLL_INTERVAL if delay is None else delay)
+        finally:
+            with self._condition:
+                self._waiting[priority] -= 1
+                self._condition.notify_all()
+
+        self._refill_retry_budget(tokens)
+
+    def _take_retry_budget(self) -> bool:
+        with self._retry_budget_lock:
+            if self._retry_tokens < 1:
+                return False
+
+            self._retry_tokens -= 1
+
+            return True
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        """
+        is_retryable 429、5xx、403 rateLimitExceeded 與連線錯誤 (含 httpx 的連線錯誤) 可以重試
+
+        Args:
+            error (Exception): 請求時發生的錯誤
+
+        Returns:
+            bool: 是否可以重試
+        """
+        from googleapiclient.errors import HttpError
+
+        if isinstance(error, (ConnectionError, TimeoutError)):
+            return True
+
+        try:
+            from httpx import TransportError
+        except ImportError:
+            pass
+        else:
+            # AsyncCalendar 的連線錯誤
+            if isinstance(error, TransportError):
+                return True
+
+        if not isinstance(error, HttpError):
+            return False
+
+        if error.resp.status in RETRYABLE_STATUS:
+            return True
+
+        if error.resp.status == 403 and isinstance(error.error_details, list):
+            return any(
+                isinstance(detail, dict) and detail.get("reason") in RATE_LIMIT_REASONS
+                for detail in error.error_details
+            )
+
+        return False
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        from random import uniform
+
+        retry_after = getattr(getattr(error, "resp", None), "get", lambda _: None)(
+            "retry-after"
+        )
+
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.max_delay)
+            except ValueError:
+                pass
+
+        return uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def _retry_delay(self, retry: bool, attempt: int, error: Exception) -> float | None:
+        """_retry_delay 可以重試時回傳重試前的等待秒數並扣除重試預算，否則回傳 None"""
+        if not (
+            retry
+            and attempt < self.max_retries
+            and self.is_retryable(error)
+            and self._take_retry_budget()
+        ):
+            return None
+
+        delay = self._backoff(attempt, error)
+        LOGGER.warning(
+            "Request failed (%s), retry %d/%d in %.2fs",
+            error,
+            attempt + 1,
+            self.max_retries,
+            delay,
+        )
+
+        return delay
+
+    def call(
+        self,
+        func: Callable[[], T],
+        user: str = "default",
+        priority: Priority = Priority.INTERACTIVE,
+        tokens: float = 1,
+        retry: bool = True,
+    ) -> T:
+        """
+        call 取得配額後執行 `func`，可重試的錯誤會以 backoff 重試
+
+        Args:
+            func (Callable[[], T]): 送出請求的函式
+            user (str, optional): 使用者. Defaults to "default".
+            priority (Priority, optional): 優先順序. Defaults to Priority.INTERACTIVE.
+            tokens (float, optional): 請求數. Defaults to 1.
+            retry (bool, optional): 是否重試，非冪等的請求應設為 False. Defaults to True.
+
+        Returns:
+            T: `func` 的回傳值
+        """
+        from time import sleep
+
+        attempt = 0
+
+        while True:
+            self.acquire(user, priority, tokens)
+
+            try:
+                return func()
+            except Exception as error:
+                if (delay := self._retry_delay(retry, attempt, error)) is None:
+                    raise
+
+            attempt += 1
+            sleep(delay)
+
+    async def acall(
+        self,
+        func: Callable[[], Awaitable[T]],
+        user: str = "default",
+        priority: Priority = Priority.INTERACTIVE,
+        tokens: float = 1,
+        retry: bool = True,
+    ) -> T:
+        """
+        acall `call` 的 asyncio 版本，與同步的請求共用配額與重試預算
+
+        以 `aacquire` 等待配額，不會阻塞 event loop
+
+        Args:
+            func (Callable[[], Awaitable[T]]): 送出請求的 coroutine function
+            user (str, optional): 使用者. Defaults to "default".
+            priority (Priority, optional): 優先順序. Defaults to Priority.INTERACTIVE.
+            tokens (float, optional): 請求數. Defaults to 1.
+            retry (bool, optional): 是否重試，非冪等的請求應設為 False. Defaults to True.
+
+        Returns:
+            T: `func` 的回傳值
+        """
+        import asyncio
+
+        attempt = 0
+
+        while True:
+            await self.aacquire(user, priority, tokens)
+
+            try:
+                return await func()
+            except Exception as error:
+                if (delay := self._retry_delay(retry, attempt, error)) is None:
+                    raise
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def execute(
+        self,
+        request: HttpRequest,
+        priority: Priority = Priority.INTERACTIVE,
+        http: Any = None,
+    ) -> Any:
+        """
+        execute 以排程執行 `HttpRequest`，使用者以請求的憑證區分
+
+        Args:
+            request (HttpRequest): 尚未執行的請求
+            priority (Priority, optional): 優先順序. Defaults to Priority.INTERACTIVE.
+            http (Any, optional): 執行請求使用的 http 對象. Defaults to None.
+
+        Returns:
+            Any: 解析後的回應
+        """
+        return self.call(
+            lambda: request.execute(http=http),
+            user=self.user_key(request),
+            priority=priority,
+        )
+
+    @staticmethod
+    def user_key(request: HttpRequest) -> str:
+        credentials = getattr(request.http, "credentials", None)
+
+        return str(id(credentials)) if credentials is not None else "default"
+
+
+_default_scheduler: RequestScheduler | None = None
+_default_scheduler_lock = Lock()
+
+
+def get_default_scheduler() -> RequestScheduler:
+    """get_default_scheduler 取得 process 內共用的 `RequestScheduler`"""
+    global _default_scheduler
+
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = RequestScheduler()
+
+        return _default_scheduler
+
+
+def set_default_scheduler(scheduler: RequestScheduler) -> None:
+    """set_default_scheduler 設定 process 內共用的 `RequestScheduler`"""
+    global _default_scheduler
+
+    with _default_scheduler_lock:
+        _default_scheduler = scheduler
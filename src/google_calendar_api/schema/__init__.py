@@ -1 +1,5 @@
 from .calendar import *  # noqa: F403
+from .channel import *  # noqa: F403
+from .freebusy import *  # noqa: F403
+from .parse import *  # noqa: F403
+from .stream import *  # noqa: F403
@@ -2,7 +2,17 @@ from typing import Literal
 
 from pydantic import BaseModel
 
-__all__ = ["Event", "Attendee", "Reminders", "QueryEvent"]
+__all__ = [
+    "Event",
+    "EventSlot",
+    "Attendee",
+    "Reminders",
+    "ExtendedProperties",
+    "QueryEvent",
+    "CancelledEvent",
+    "SeriesEvent",
+    "SyncEvent",
+]
 
 
 class Creator(BaseModel):
@@ -37,13 +47,18 @@ class Reminders(BaseModel):
 
 class EventTime(BaseModel):
     dateTime: str
-    timeZone: str
+    timeZone: str | None = None  # 未指定時以 dateTime 的時差為準
 
 
 class EventDate(BaseModel):
     date: str  # date format : yyyy-mm-dd
 
 
+class ExtendedProperties(BaseModel):
+    private: dict[str, str] = {}  # 只有此日曆可見的屬性
+    shared: dict[str, str] = {}  # 所有參加者可見的屬性
+
+
 class Event(BaseModel):
     kind: str
     etag: str
@@ -74,6 +89,8 @@ class Event(BaseModel):
     end: EventTime | EventDate
     recurringEventId: str | None = None
     originalStartTime: EventTime | EventDate | None = None
+    recurrence: list[str] | None = None  # 重複事件主體的 RRULE/EXDATE/RDATE
+    extendedProperties: ExtendedProperties | None = None
     iCalUID: str
     sequence: int
     attendees: list[Attendee] = []
@@ -81,6 +98,15 @@ class Event(BaseModel):
     eventType: str
 
 
+class EventSlot(BaseModel):
+    """只包含 id、摘要與起訖時間的輕量事件，用於 `fields` 部分回應"""
+
+    id: str
+    summary: str | None = None
+    start: EventTime | EventDate
+    end: EventTime | EventDate
+
+
 class QueryEvent(BaseModel):
     kind: str
     etag: str
@@ -91,4 +117,25 @@ class QueryEvent(BaseModel):
     accessRole: str
     defaultReminders: list[ReminderOverride]
     nextPageToken: str | None = None
+    nextSyncToken: str | None = None
     items: list[Event] = []
+
+
+class CancelledEvent(BaseModel):
+    """已取消的事件或重複事件中被刪除的單次事件，API 只回傳少數欄位"""
+
+    id: str
+    recurringEventId: str | None = None
+    originalStartTime: EventTime | EventDate | None = None
+
+
+class SeriesEvent(BaseModel):
+    events: list[Event] = []  # 單次事件、重複事件主體與被修改的單次事件
+    cancelled: list[CancelledEvent] = []  # 被刪除的單次事件
+
+
+class SyncEvent(BaseModel):
+    events: list[Event] = []  # 新增或修改的事件
+    deleted: list[str] = []  # 已刪除(cancelled)的事件id
+    sync_token: str | None = None  # 下次同步使用的 nextSyncToken
+    full_sync: bool = False  # 是否為完整同步，若是，呼叫端應以結果取代本地資料
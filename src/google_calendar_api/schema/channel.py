@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+
+__all__ = ["Channel", "Notification"]
+
+
+class Channel(BaseModel):
+    kind: str = "api#channel"
+    id: str
+    resourceId: str  # 被監看資源的id，停止 channel 時需要
+    resourceUri: str | None = None
+    token: str | None = None  # 每次通知都會帶回的 X-Goog-Channel-Token
+    expiration: str | None = None  # 過期時間，epoch 毫秒
+
+    @property
+    def expires_at(self) -> float | None:
+        """過期時間 (epoch 秒)，沒有過期時間時為 None"""
+        return int(self.expiration) / 1000 if self.expiration else None
+
+
+class Notification(BaseModel):
+    """
+    Notification 推播通知的 `X-Goog-*` headers，通知本身沒有內容
+    doc : https://developers.google.com/calendar/api/guides/push#understanding-the-notification-message-format
+    """
+
+    channel_id: str
+    resource_id: str
+    resource_state: str  # sync (建立 channel)、exists 或 not_exists
+    message_number: int = 0
+    channel_token: str | None = None
+    channel_expiration: str | None = None
+    resource_uri: str | None = None
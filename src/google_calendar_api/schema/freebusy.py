@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+
+__all__ = ["TimePeriod", "FreeBusyCalendar", "FreeBusy"]
+
+
+class TimePeriod(BaseModel):
+    start: str
+    end: str
+
+
+class FreeBusyError(BaseModel):
+    domain: str
+    reason: str  # 例如 notFound、internalError
+
+
+class FreeBusyCalendar(BaseModel):
+    busy: list[TimePeriod] = []
+    errors: list[FreeBusyError] = []
+
+
+class FreeBusy(BaseModel):
+    kind: str
+    timeMin: str
+    timeMax: str
+    calendars: dict[str, FreeBusyCalendar] = {}
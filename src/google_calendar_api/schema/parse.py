@@ -0,0 +1,166 @@
+from typing import Any, Literal
+
+from .calendar import Attendee, Event, EventDate, EventTime, QueryEvent
+
+__all__ = ["ParseMode", "EventView", "parse_event", "parse_query_event"]
+
+ParseMode = Literal["strict", "trusted"]
+"""
+API 回應轉換為事件的方式
+
+- `strict`: 以 pydantic 驗證所有欄位並建立 `Event` (預設)，格式不符時立即拋出 `ValidationError`
+- `trusted`: 信任 API 回應，事件以 `EventView` 包裝原始資料，欄位在存取時才解析；
+  大量讀取只使用少數欄位時 CPU 與記憶體成本明顯較低，但格式不符的錯誤會延後到存取該欄位時才發生
+"""
+
+
+class EventView:
+    """
+    EventView 包裝 events 資源原始資料的唯讀事件，欄位於存取時才解析
+
+    常用的純量欄位直接讀取原始資料；`start`/`end`/`attendees` 第一次存取時才建立 model 並快取；
+    其他 `Event` 的屬性與方法 (例如 `model_copy`、`model_dump`) 會先以 `to_event` 建立完整的 `Event`。
+
+    Args:
+        data (dict[str, Any]): events 資源
+    """
+
+    __slots__ = ("_data", "_start", "_end", "_attendees", "_event")
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+        self._start: EventTime | EventDate | None = None
+        self._end: EventTime | EventDate | None = None
+        self._attendees: list[Attendee] | None = None
+        self._event: Event | None = None
+
+    def __repr__(self) -> str:
+        return f"EventView(id={self.id!r}, summary={self.summary!r})"
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        return getattr(self.to_event(), name)
+
+    @staticmethod
+    def _parse_time(data: dict[str, Any]) -> EventTime | EventDate:
+        if "dateTime" in data:
+            return EventTime.model_validate(data)
+
+        return EventDate.model_validate(data)
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """原始的 events 資源"""
+        return self._data
+
+    @property
+    def id(self) -> str:
+        return self._data["id"]
+
+    @property
+    def etag(self) -> str:
+        return self._data["etag"]
+
+    @property
+    def status(self) -> str:
+        return self._data["status"]
+
+    @property
+    def summary(self) -> str:
+        return self._data["summary"]
+
+    @property
+    def updated(self) -> str:
+        return self._data["updated"]
+
+    @property
+    def recurringEventId(self) -> str | None:  # noqa: N802
+        return self._data.get("recurringEventId")
+
+    @property
+    def recurrence(self) -> list[str] | None:
+        return self._data.get("recurrence")
+
+    @property
+    def originalStartTime(self) -> EventTime | EventDate | None:  # noqa: N802
+        original = self._data.get("originalStartTime")
+
+        return self._parse_time(original) if original is not None else None
+
+    @property
+    def start(self) -> EventTime | EventDate:
+        if self._start is None:
+            self._start = self._parse_time(self._data["start"])
+
+        return self._start
+
+    @property
+    def end(self) -> EventTime | EventDate:
+        if self._end is None:
+            self._end = self._parse_time(self._data["end"])
+
+        return self._end
+
+    @property
+    def attendees(self) -> list[Attendee]:
+        if self._attendees is None:
+            self._attendees = [
+                Attendee.model_validate(attendee)
+                for attendee in self._data.get("attendees", [])
+            ]
+
+        return self._attendees
+
+    def to_event(self) -> Event:
+        """
+        to_event 驗證原始資料並建立完整的 `Event`，結果會被快取
+
+        Returns:
+            Event: calendar event
+        """
+        if self._event is None:
+            self._event = Event.model_validate(self._data)
+
+        return self._event
+
+
+def parse_event(data: dict[str, Any], mode: ParseMode = "strict") -> Event | EventView:
+    """
+    parse_event 將 events 資源轉換為事件
+
+    Args:
+        data (dict[str, Any]): events 資源
+        mode (ParseMode, optional): 轉換方式，`trusted` 時回傳具有相同唯讀介面的 `EventView`. Defaults to "strict".
+
+    Returns:
+        Event | EventView: calendar event
+    """
+    if mode == "trusted":
+        return EventView(data)
+
+    return Event.model_validate(data)
+
+
+def parse_query_event(data: dict[str, Any], mode: ParseMode = "strict") -> QueryEvent:
+    """
+    parse_query_event 將 events.list 回應轉換為 `QueryEvent`
+
+    `trusted` 時仍會驗證分頁本身的欄位，只有 `items` 以 `EventView` 包裝 (指定時不會再經過驗證)
+
+    Args:
+        data (dict[str, Any]): events.list 回應
+        mode (ParseMode, optional): 轉換方式. Defaults to "strict".
+
+    Returns:
+        QueryEvent: 包含事件列表的回應
+    """
+    if mode != "trusted":
+        return QueryEvent.model_validate(data)
+
+    items = data.get("items", [])
+    query_event = QueryEvent.model_validate({**data, "items": []})
+    query_event.items = [parse_event(item, mode) for item in items]
+
+    return query_event
@@ -0,0 +1,150 @@
+from collections.abc import Iterable, Iterator
+from json import JSONDecodeError, JSONDecoder
+from json.decoder import WHITESPACE  # type: ignore
+from typing import Any
+
+__all__ = ["STREAM_CHUNK_SIZE", "decode_chunks", "iter_json_items"]
+
+STREAM_CHUNK_SIZE = 64 * 1024
+"""串流讀取回應時每次讀取的 bytes 數"""
+
+_DECODER = JSONDecoder()
+
+
+def decode_chunks(
+    chunks: Iterable[bytes | memoryview], encoding: str = "UTF-8"
+) -> Iterator[str]:
+    """
+    decode_chunks 逐段解碼 bytes，多位元組字元被切開時會等待下一段
+
+    Args:
+        chunks (Iterable[bytes | memoryview]): 回應內容的片段
+        encoding (str, optional): 編碼. Defaults to "UTF-8".
+
+    Yields:
+        str: 解碼後的片段
+    """
+    from codecs import getincrementaldecoder
+
+    decoder = getincrementaldecoder(encoding)()
+
+    for chunk in chunks:
+        if text := decoder.decode(chunk):
+            yield text
+
+    if text := decoder.decode(b"", final=True):
+        yield text
+
+
+class _JsonReader:
+    """_JsonReader 在逐段讀入的緩衝區上以 `JSONDecoder.raw_decode` 解碼，已解碼的部分會被捨棄"""
+
+    def __init__(self, chunks: Iterator[str]) -> None:
+        self._chunks = chunks
+        self._buffer = ""
+        self._index = 0
+
+    def _fill(self) -> bool:
+        if (chunk := next(self._chunks, None)) is None:
+            return False
+
+        self._buffer = self._buffer[self._index :] + chunk
+        self._index = 0
+
+        return True
+
+    def _error(self, message: str) -> JSONDecodeError:
+        return JSONDecodeError(message, self._buffer, self._index)
+
+    def peek(self) -> str:
+        """peek 略過空白並回傳下一個字元，資料結束時為空字串"""
+        while True:
+            self._index = WHITESPACE.match(self._buffer, self._index).end()
+
+            if self._index < len(self._buffer):
+                return self._buffer[self._index]
+
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+
+        if not char or char not in chars:
+            raise self._error(f"Expecting one of {chars!r}")
+
+        self._index += 1
+
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._index)
+            except JSONDecodeError:
+                if self._fill():
+                    continue
+
+                raise
+
+            # 數字等值在緩衝區結尾時可能尚未完整，讀入下一段後重新解碼
+            if end == len(self._buffer) and self._fill():
+                continue
+
+            self._index = end
+
+            return value
+
+
+def iter_json_items(
+    chunks: Iterable[str], metadata: dict[str, Any], key: str = "items"
+) -> Iterator[Any]:
+    """
+    iter_json_items 逐一解碼 JSON 物件中 `key` 陣列的元素，記憶體中只保留目前的元素與尚未解碼的片段
+
+    其他欄位 (例如 `nextPageToken`) 於讀到時寫入 `metadata`；events.list 回應的 `nextPageToken`
+    位於 `items` 之前，陣列之後的欄位要在所有元素都取出後才會寫入。
+
+    Args:
+        chunks (Iterable[str]): JSON 物件的文字片段，例如 `decode_chunks` 的結果
+        metadata (dict[str, Any]): 寫入 `key` 以外欄位的 dict
+        key (str, optional): 陣列欄位的名稱. Defaults to "items".
+
+    Raises:
+        JSONDecodeError: 內容不是 JSON 物件
+
+    Yields:
+        Any: 陣列的元素
+    """
+    reader = _JsonReader(iter(chunks))
+    reader.expect("{")
+
+    if reader.peek() == "}":
+        return
+
+    while True:
+        name = reader.value()
+
+        if not isinstance(name, str):
+            raise reader._error("Expecting property name")
+
+        reader.expect(":")
+
+        if name == key and reader.peek() == "[":
+            reader.expect("[")
+
+            if reader.peek() == "]":
+                reader.expect("]")
+            else:
+                while True:
+                    yield reader.value()
+
+                    if reader.expect(",]") == "]":
+                        break
+        else:
+            metadata[name] = reader.value()
+
+        if reader.expect(",}") == "}":
+            return
@@ -1 +1,5 @@
+from .aio import *  # noqa: F403
+from .batch import *  # noqa: F403
+from .multi import *  # noqa: F403
 from .service import *  # noqa: F403
+from .sync import *  # noqa: F403
@@ -0,0 +1,234 @@
+import asyncio
+from typing import TYPE_CHECKING, Literal
+
+from googleapiclient.discovery import Resource
+from typing_extensions import Self, Unpack
+
+from ...log import LOGGER
+from ...schema.calendar import Event, QueryEvent
+from ...schema.parse import ParseMode
+from ...types.calendar import EventListFilter, EventParam
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+
+__all__ = ["AsyncCalendarService"]
+
+
+class AsyncCalendarService:
+    """
+    AsyncCalendarService `CalendarService` 的 asyncio 版本
+    """
+
+    def __init__(
+        self,
+        service: Resource,
+        calendar_id: str = "primary",
+        max_concurrency: int = 10,
+        client: "AsyncClient | None" = None,
+        parse_mode: ParseMode = "strict",
+    ) -> None:
+        from ...calendar import AsyncCalendar
+        from ...store.keys import EventKeyIndex
+
+        self.calendar = AsyncCalendar(
+            service=service,
+            max_concurrency=max_concurrency,
+            client=client,
+            parse_mode=parse_mode,
+        )
+        self.calendar_id = calendar_id
+        self.key_index = EventKeyIndex(calendar_id)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.calendar.aclose()
+
+    async def add_calendar_event(self, **event_param: Unpack[EventParam]) -> Event:
+        if "summary" not in event_param:
+            raise KeyError('"summary" key must be exists in event_param')
+
+        LOGGER.info("Inserting event into calendar %s", self.calendar_id)
+
+        event = await self.calendar.insert_event(self.calendar_id, **event_param)
+
+        LOGGER.info(
+            "Event inserted: %s, summary is %s", event.id, event_param["summary"]
+        )
+
+        return event
+
+    async def add_calendar_events(
+        self, event_params: list[EventParam]
+    ) -> list[Event | BaseException]:
+        """
+        add_calendar_events 同時新增多個事件，單一事件失敗不影響其他事件
+
+        Args:
+            event_params (list[EventParam]): 預計新增的事件
+
+        Returns:
+            list[Event | BaseException]: 依 `event_params` 順序回傳已新增的事件或錯誤
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.add_calendar_event(**event_param)
+                    for event_param in event_params
+                ),
+                return_exceptions=True,
+            )
+        )
+
+    async def upsert_calendar_event(
+        self, key: str, **event_param: Unpack[EventParam]
+    ) -> Event:
+        """
+        upsert_calendar_event 以 `key` 產生的固定事件id 新增或修改事件，只支援 `CalendarService` 的 `id` 模式
+
+        Args:
+            key (str): 呼叫端的唯一識別
+
+        Returns:
+            Event: 已新增或修改的事件
+        """
+        from ...store.keys import UPSERT_PROPERTY, upsert_event_id
+
+        event_param["private_properties"] = {
+            **(event_param.get("private_properties") or {}),
+            UPSERT_PROPERTY: key,
+        }
+        exists = self.key_index.get(key) is not None
+
+        LOGGER.info("Upserting %s into calendar %s", key, self.calendar_id)
+
+        event = await self.calendar.upsert_event(
+            self.calendar_id,
+            upsert_event_id(self.calendar_id, key),
+            exists=exists,
+            **event_param,
+        )
+
+        self.key_index.put({key: event.id})
+
+        return event
+
+    async def get_calendar_event(self, event_id: str) -> Event:
+        LOGGER.info("Get %s into calendar", event_id)
+
+        return await self.calendar.get_event(self.calendar_id, event_id)
+
+    async def get_calendar_event_many(self, event_ids: list[str]) -> list[Event]:
+        LOGGER.info("Get %d events into calendar %s", len(event_ids), self.calendar_id)
+
+        return await self.calendar.get_events(self.calendar_id, event_ids)
+
+    async def get_calendar_events(
+        self,
+        page_token: str | None = None,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        max_results: int | None = None,
+        order_by: Literal["startTime", "updated"] = "startTime",
+        q: str | None = None,
+        single_events: bool = True,
+        time_zone: str | None = None,
+        show_deleted: bool = False,
+        **filters: Unpack[EventListFilter],
+    ) -> QueryEvent:
+        from ...calendar import MAX_LIST_RESULTS
+
+        LOGGER.info("Get all event into %s", self.calendar_id)
+
+        return await self.calendar.list_events(
+            calendar_id=self.calendar_id,
+            page_token=page_token,
+            time_min=time_min,
+            time_max=time_max,
+            max_results=max_results or MAX_LIST_RESULTS,
+            order_by=order_by,
+            q=q,
+            single_events=single_events,
+            time_zone=time_zone,
+            show_deleted=show_deleted,
+            **filters,
+        )
+
+    async def update_calendar_event(
+        self, event_id: str, **event_param: Unpack[EventParam]
+    ) -> Event:
+        LOGGER.info("Updating event %s in calendar %s", event_id, self.calendar_id)
+
+        event = await self.calendar.update_event(
+            calendar_id=self.calendar_id, event_id=event_id, **event_param
+        )
+
+        LOGGER.info("Event updated: %s", event.id)
+
+        return event
+
+    async def replace_calendar_event(
+        self, event: Event, **event_param: Unpack[EventParam]
+    ) -> Event:
+        LOGGER.info("Replacing event %s in calendar %s", event.id, self.calendar_id)
+
+        updated_event = await self.calendar.conditional_update_event(
+            self.calendar_id, event, **event_param
+        )
+
+        LOGGER.info("Event replaced: %s", updated_event.id)
+
+        return updated_event
+
+    async def patch_calendar_event(
+        self, event_id: str, **event_param: Unpack[EventParam]
+    ) -> Event:
+        LOGGER.info("Patching event %s in calendar %s", event_id, self.calendar_id)
+
+        event = await self.calendar.patch_event(
+            self.calendar_id, event_id, **event_param
+        )
+
+        LOGGER.info("Event patched: %s", event.id)
+
+        return event
+
+    async def delete_event(self, calendar_id: str, event_id: str) -> bool:
+        from googleapiclient.errors import HttpError
+
+        try:
+            await self.calendar.delete_event(calendar_id, event_id)
+            LOGGER.info(
+                "Event %s in calendar %s deleted successfully.", event_id, calendar_id
+            )
+            return True
+        except HttpError as error:
+            if error.resp.status not in (404, 410):
+                raise
+
+            LOGGER.error(
+                "Failed to delete event %s in calendar %s: %s",
+                event_id,
+                calendar_id,
+                error,
+            )
+            return False
+
+    async def move_calendar_event(
+        self,
+        event_id: str,
+        new_start_time: str,
+        new_end_time: str,
+        time_zone: str | None = None,
+    ) -> Event:
+        return await self.patch_calendar_event(
+            event_id=event_id,
+            start_time=new_start_time,
+            end_time=new_end_time,
+            time_zone=time_zone,
+        )
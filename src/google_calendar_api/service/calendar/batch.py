@@ -0,0 +1,115 @@
+from typing import TYPE_CHECKING
+
+from typing_extensions import Self, Unpack
+
+from ...calendar import BatchResult, CalendarBatch
+from ...log import LOGGER
+from ...schema.calendar import Event
+from ...types.calendar import EventParam
+
+if TYPE_CHECKING:
+    from ...store import EventStore
+
+__all__ = ["CalendarServiceBatch"]
+
+
+class CalendarServiceBatch:
+    """
+    CalendarServiceBatch 綁定 `calendar_id` 的批次寫入，方法對應 `CalendarService` 的寫入操作
+
+    提供 `store` 時，送出後成功的寫入與刪除會套用到 `EventStore`
+    """
+
+    def __init__(
+        self,
+        batch: CalendarBatch,
+        calendar_id: str,
+        time_zone: str | None = None,
+        store: "EventStore | None" = None,
+    ) -> None:
+        self.batch = batch
+        self.calendar_id = calendar_id
+        self.time_zone = time_zone
+        self.store = store
+        self._deletes: dict[int, str] = {}  # 刪除在結果中的位置與事件id
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:
+        if exc_type is None:
+            self.execute()
+
+    def __len__(self) -> int:
+        return len(self.batch)
+
+    @property
+    def results(self) -> list[BatchResult]:
+        return self.batch.results
+
+    def add_calendar_event(self, **event_param: Unpack[EventParam]) -> int:
+        if "summary" not in event_param:
+            raise KeyError('"summary" key must be exists in event_param')
+
+        if self.time_zone is not None:
+            event_param.setdefault("time_zone", self.time_zone)
+
+        return self.batch.insert_event(self.calendar_id, **event_param)
+
+    def patch_calendar_event(
+        self, event_id: str, **event_param: Unpack[EventParam]
+    ) -> int:
+        return self.batch.patch_event(self.calendar_id, event_id, **event_param)
+
+    def update_calendar_event(
+        self, event: Event, **event_param: Unpack[EventParam]
+    ) -> int:
+        return self.batch.update_event(self.calendar_id, event, **event_param)
+
+    def delete_event(self, event_id: str) -> int:
+        index = self.batch.delete_event(self.calendar_id, event_id)
+        self._deletes[index] = event_id
+
+        return index
+
+    def _apply_to_store(self, results: list[BatchResult]) -> None:
+        from googleapiclient.errors import HttpError
+
+        if self.store is None:
+            return
+
+        self.store.put(
+            self.calendar_id,
+            [result for result in results if isinstance(result, Event)],
+        )
+        # 已不存在 (404/410) 的事件同樣從快取移除
+        self.store.delete(
+            self.calendar_id,
+            [
+                event_id
+                for index, event_id in self._deletes.items()
+                if results[index] is None
+                or (
+                    isinstance(results[index], HttpError)
+                    and results[index].resp.status in (404, 410)  # type: ignore
+                )
+            ],
+        )
+
+    def execute(self) -> list[BatchResult]:
+        LOGGER.info(
+            "Executing %d batched requests in calendar %s",
+            len(self.batch),
+            self.calendar_id,
+        )
+
+        results = self.batch.execute()
+        self._apply_to_store(results)
+        self._deletes = {}
+
+        LOGGER.info(
+            "Batch finished: %d failed",
+            sum(isinstance(result, Exception) for result in results),
+        )
+
+        return results
@@ -0,0 +1,102 @@
+from collections.abc import Generator
+from concurrent.futures import Executor
+from heapq import merge
+from typing import TYPE_CHECKING
+
+from ...log import LOGGER
+from ...schema.calendar import Event
+from ...utils._datetime import to_timestamp
+from .service import CalendarService
+
+if TYPE_CHECKING:
+    from ...calendar import Calendar, EventPager
+
+__all__ = ["MERGE_PAGE_SIZE", "merge_calendars_events"]
+
+MERGE_PAGE_SIZE = 250
+"""
+`merge_calendars_events` 預設的每頁事件數；所有日曆的分頁同時保留在記憶體，
+使用 `MAX_LIST_RESULTS` 時日曆數多的 fan-out 會佔用大量記憶體
+"""
+
+
+def _start_timestamp(item: tuple[str, Event]) -> float:
+    return to_timestamp(CalendarService.get_event_date_string(item[1], "start"))
+
+
+def _tag_calendar_id(
+    calendar_id: str, pager: "EventPager"
+) -> Generator[tuple[str, Event], None, None]:
+    for event in pager:
+        yield calendar_id, event
+
+
+def merge_calendars_events(
+    calendar: "Calendar",
+    calendar_ids: list[str],
+    executor: Executor,
+    *,
+    time_min: str | None = None,
+    time_max: str | None = None,
+    max_results: int | None = None,
+    q: str | None = None,
+    time_zone: str | None = None,
+    read_ahead: int = 1,
+) -> Generator[tuple[str, Event], None, None]:
+    """
+    merge_calendars_events 同時讀取多個日曆的事件，並以起始時間 k-way merge 為單一 generator
+
+    每個日曆各自分頁讀取並預先取得 `read_ahead` 頁，記憶體用量只與日曆數及分頁大小有關，
+    因此預設的分頁大小為較小的 `MERGE_PAGE_SIZE`，不超過 `MAX_LIST_RESULTS`。
+
+    Args:
+        calendar (Calendar): 日曆
+        calendar_ids (list[str]): 要讀取的`calendarID`
+        executor (Executor): 執行分頁請求的 executor，決定同時進行中的請求數
+        time_min (str | None, optional): 時間區間起始時間. Defaults to None.
+        time_max (str | None, optional): 時間區間結束時間. Defaults to None.
+        max_results (int | None, optional): 每頁最大的回傳數，預設為 `MERGE_PAGE_SIZE`. Defaults to None.
+        q (str | None, optional): 搜尋關鍵字. Defaults to None.
+        time_zone (str | None, optional): 時區. Defaults to None.
+        read_ahead (int, optional): 每個日曆預先取得的最大頁數. Defaults to 1.
+
+    Yields:
+        tuple[str, Event]: (`calendarID`, 事件)，依起始時間排序
+    """
+    from functools import partial
+
+    from ...calendar import MAX_LIST_RESULTS, EventPager
+
+    page_size = min(max_results or MERGE_PAGE_SIZE, MAX_LIST_RESULTS)
+
+    def fetch_page(calendar_id: str, page_token: str | None):
+        return calendar.list_events(
+            calendar_id=calendar_id,
+            page_token=page_token,
+            time_min=time_min,
+            time_max=time_max,
+            max_results=page_size,
+            order_by="startTime",
+            q=q,
+            time_zone=time_zone,
+            http=calendar.thread_http(),
+        )
+
+    LOGGER.info("Get events of %d calendars", len(calendar_ids))
+
+    pagers = [
+        EventPager(partial(fetch_page, calendar_id), executor, read_ahead)
+        for calendar_id in calendar_ids
+    ]
+
+    try:
+        yield from merge(
+            *(
+                _tag_calendar_id(calendar_id, pager)
+                for calendar_id, pager in zip(calendar_ids, pagers, strict=True)
+            ),
+            key=_start_timestamp,
+        )
+    finally:
+        for pager in pagers:
+            pager.close()
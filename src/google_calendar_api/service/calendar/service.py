@@ -1,32 +1,105 @@
-from typing import Literal
+from collections.abc import Generator, Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
 from googleapiclient.discovery import Resource
+from pydantic import BaseModel
 from typing_extensions import Unpack
 
 from ...log import LOGGER
-from ...schema.calendar import Event, QueryEvent
-from ...types.calendar import EventParam
+from ...schema.calendar import Event, EventSlot, QueryEvent, SyncEvent
+from ...schema.parse import ParseMode
+from ...types.calendar import EventListFilter, EventParam
+from .batch import CalendarServiceBatch
 
-__all__ = ["CalendarService"]
+if TYPE_CHECKING:
+    from ...analytics import EventFrame
+    from ...calendar import BatchResult
+    from ...schedule import EventMove
+    from ...scheduler import RequestScheduler
+    from ...schema.channel import Channel
+    from ...store import EventStore
+
+__all__ = ["CalendarService", "UpsertMode"]
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+UpsertMode = Literal["id", "property"]
 
 
 class CalendarService:
-    def __init__(self, service: Resource, calendar_id: str = "primary") -> None:
+    def __init__(
+        self,
+        service: Resource,
+        calendar_id: str = "primary",
+        store: "EventStore | None" = None,
+        refresh_interval: float = 60.0,
+        scheduler: "RequestScheduler | None" = None,
+        parse_mode: ParseMode = "strict",
+    ) -> None:
+        """
+        Args:
+            service (Resource): Google API 服務對象
+            calendar_id (str, optional): 分享時的`calendarID`. Defaults to "primary".
+            store (EventStore | None, optional): 本地事件快取，提供時讀取優先使用本地資料. Defaults to None.
+            refresh_interval (float, optional): 本地事件快取增量更新的間隔秒數. Defaults to 60.0.
+            scheduler (RequestScheduler | None, optional): 請求排程器，預設為 process 內共用的排程器. Defaults to None.
+            parse_mode (ParseMode, optional): 讀取事件列表時的轉換方式，大量讀取時可使用 `trusted`. Defaults to "strict".
+        """
         from ...calendar import Calendar
+        from ...store.keys import EventKeyIndex
+        from .sync import CalendarSync
 
-        self.calendar = Calendar(service=service)
+        self.calendar = Calendar(
+            service=service, scheduler=scheduler, parse_mode=parse_mode
+        )
         self.calendar_id = calendar_id
+        self.store = store
+        self.refresh_interval = refresh_interval
+        self._store_sync = (
+            CalendarSync(self, store=store) if store is not None else None
+        )
+        self.key_index = EventKeyIndex(calendar_id, store=store)
+
+    def batch(
+        self,
+        batch_size: int | None = None,
+        batch_uri: str | None = None,
+        time_zone: str | None = None,
+    ) -> CalendarServiceBatch:
+        """
+        batch 建立批次寫入，於離開 `with` 區塊時以 multipart batch request 送出
 
-    def get_event_date_string(self, event: Event, attr: Literal["start", "end"]) -> str:
+        Args:
+            batch_size (int | None, optional): 每個 batch request 的最大請求數，預設為 API 上限. Defaults to None.
+            batch_uri (str | None, optional): batch endpoint. Defaults to None.
+            time_zone (str | None, optional): 新增事件時預設的時區. Defaults to None.
+
+        Returns:
+            CalendarServiceBatch: 綁定 `calendar_id` 的批次寫入
+        """
+        from ...calendar import MAX_BATCH_SIZE
+
+        return CalendarServiceBatch(
+            batch=self.calendar.batch(
+                batch_size=batch_size or MAX_BATCH_SIZE, batch_uri=batch_uri
+            ),
+            calendar_id=self.calendar_id,
+            time_zone=time_zone,
+            store=self.store,
+        )
+
+    @staticmethod
+    def get_event_date_string(event: Event, attr: Literal["start", "end"]) -> str:
         attr_value = getattr(event, attr)
 
-        return getattr(attr_value, "datetime", attr_value.date)
+        return getattr(attr_value, "dateTime", None) or attr_value.date
 
-    def process_event_to_event_param(self, event: Event) -> EventParam:
+    @staticmethod
+    def process_event_to_event_param(event: Event) -> EventParam:
         return EventParam(
             summary=event.summary,
-            start_time=self.get_event_date_string(event, "start"),
-            end_time=self.get_event_date_string(event=event, attr="end"),
+            start_time=CalendarService.get_event_date_string(event, "start"),
+            end_time=CalendarService.get_event_date_string(event=event, attr="end"),
             location=event.location,
             description=event.description,
             attendees=event.attendees,
@@ -38,71 +111,786 @@ class CalendarService:
         if "summary" not in event_param:
             raise KeyError('"summary" key must be exists in event_param')
 
-        LOGGER.info(msg=f"Inserting event into calendar {self.calendar_id}")
+        LOGGER.info("Inserting event into calendar %s", self.calendar_id)
 
         event = self.calendar.insert_event(calendar_id=self.calendar_id, **event_param)
 
         LOGGER.info(
-            msg=f"Event inserted: {event.id}, summary is {event_param['summary']}"
+            "Event inserted: %s, summary is %s", event.id, event_param["summary"]
+        )
+
+        self._store_put(event)
+
+        return event
+
+    def _upsert_param(
+        self, key: str, mode: UpsertMode, event_param: EventParam
+    ) -> tuple[str | None, EventParam]:
+        """_upsert_param 回傳 upsert 使用的事件id，並在私有屬性記錄 `key`"""
+        from ...store.keys import UPSERT_PROPERTY, upsert_event_id
+
+        if mode not in ("id", "property"):
+            raise ValueError(f"unknown upsert mode: {mode}")
+
+        event_param = EventParam(**event_param)  # type: ignore
+        event_param["private_properties"] = {
+            **(event_param.get("private_properties") or {}),
+            UPSERT_PROPERTY: key,
+        }
+
+        if mode == "id":
+            return upsert_event_id(self.calendar_id, key), event_param
+
+        return self.key_index.get(key), event_param
+
+    def load_key_index(self) -> int:
+        """
+        load_key_index 以一次分頁讀取 (只有 id 與私有屬性) 取得日曆上所有 upsert 的 key，取代本地索引
+
+        Returns:
+            int: 索引中的 key 數
+        """
+        from ...store.keys import UPSERT_PROPERTY
+
+        LOGGER.info("Loading upsert keys of calendar %s", self.calendar_id)
+
+        self.key_index.load(
+            self.calendar.find_event_ids_by_property(self.calendar_id, UPSERT_PROPERTY)
+        )
+
+        return len(self.key_index)
+
+    def upsert_calendar_event(
+        self, key: str, mode: UpsertMode = "id", **event_param: Unpack[EventParam]
+    ) -> Event:
+        """
+        upsert_calendar_event 以呼叫端的 `key` 新增或修改事件，同一個 `key` 永遠只對應一個事件
+
+        - `id`: 事件id 由 `key` 決定 (`upsert_event_id`)，本地索引只用於決定先 patch 或 insert，
+          不需讀取日曆，每次只需一次寫入
+        - `property`: 事件id 由 API 產生，`key` 記錄在 `extendedProperties.private`；
+          本地索引沒有 `key` 且尚未讀取時，先以 `load_key_index` 讀取日曆上所有 key 一次
+          (只有 id 與私有屬性的分頁讀取)，之後的 upsert 只查詢本地索引。
+          讀取後由其他用戶端新增的 key 不會被發現，需要時再呼叫 `load_key_index`
+
+        Args:
+            key (str): 呼叫端的唯一識別，例如外部系統的 id
+            mode (UpsertMode, optional): 事件與 `key` 的對應方式. Defaults to "id".
+            **event_param (EventParam): 事件內容
+
+        Returns:
+            Event: 已新增或修改的事件
+        """
+        event_id, event_param = self._upsert_param(key, mode, event_param)
+
+        if mode == "property" and event_id is None and not self.key_index.loaded:
+            self.load_key_index()
+            event_id = self.key_index.get(key)
+
+        exists = self.key_index.get(key) is not None
+
+        LOGGER.info(
+            "Upserting %s into calendar %s (%s)",
+            key,
+            self.calendar_id,
+            "patch" if exists else "insert",
         )
 
+        event = self.calendar.upsert_event(
+            self.calendar_id, event_id, exists=exists, **event_param
+        )
+
+        self.key_index.put({key: event.id})
+        self._store_put(event)
+
         return event
 
+    def upsert_calendar_events(
+        self,
+        items: Sequence[tuple[str, EventParam]],
+        mode: UpsertMode = "id",
+        batch_size: int | None = None,
+        time_zone: str | None = None,
+    ) -> list["BatchResult"]:
+        """
+        upsert_calendar_events 以 batch request 新增或修改多個事件，每個事件一次寫入，不會搜尋事件
+
+        索引記錄已存在的事件送出 patch，其他送出 insert；patch 回傳 404 的改為 insert，
+        insert 回傳 409 (事件id 已存在) 的改為 patch，只有這些事件需要第二次寫入。
+        `property` 模式且索引尚未讀取時，會先 `load_key_index` 一次。
+
+        Args:
+            items (Sequence[tuple[str, EventParam]]): `key` 與事件內容
+            mode (UpsertMode, optional): 事件與 `key` 的對應方式. Defaults to "id".
+            batch_size (int | None, optional): 每個 batch request 的最大請求數. Defaults to None.
+            time_zone (str | None, optional): 事件沒有時區時使用的時區. Defaults to None.
+
+        Returns:
+            list[BatchResult]: 依 `items` 順序排列的結果
+        """
+        from googleapiclient.errors import HttpError
+
+        if mode == "property" and not self.key_index.loaded:
+            self.load_key_index()
+
+        prepared = [
+            (key, *self._upsert_param(key, mode, event_param))
+            for key, event_param in items
+        ]
+
+        for _, _, event_param in prepared:
+            if time_zone is not None:
+                event_param.setdefault("time_zone", time_zone)
+
+        results: list[BatchResult] = [None] * len(prepared)
+        # (items 的位置, 是否送出 patch)
+        pending = [
+            (index, self.key_index.get(key) is not None)
+            for index, (key, _, _) in enumerate(prepared)
+        ]
+
+        for attempt in range(2):
+            batch = self.batch(batch_size=batch_size)
+
+            for index, patch in pending:
+                _, event_id, event_param = prepared[index]
+
+                if patch:
+                    batch.batch.upsert_patch_event(
+                        self.calendar_id,
+                        event_id,
+                        **event_param,  # type: ignore
+                    )
+                else:
+                    batch.batch.insert_event(
+                        self.calendar_id,
+                        **{
+                            **event_param,
+                            "event_id": event_id if mode == "id" else None,
+                        },
+                    )
+
+            retry: list[tuple[int, bool]] = []
+
+            for (index, patch), result in zip(pending, batch.execute(), strict=True):
+                results[index] = result
+
+                if (
+                    not attempt
+                    and isinstance(result, HttpError)
+                    and result.resp.status == (404 if patch else 409)
+                ):
+                    retry.append((index, not patch))
+
+            if not retry:
+                break
+
+            LOGGER.info("Retrying %d upserts with the other write", len(retry))
+            pending = retry
+
+        self.key_index.put(
+            {
+                key: result.id
+                for (key, _, _), result in zip(prepared, results, strict=True)
+                if isinstance(result, Event)
+            }
+        )
+
+        return results
+
     def get_calendar_event(self, event_id: str) -> Event:
-        LOGGER.info(msg=f"Get {event_id} into calendar")
+        """
+        get_calendar_event 取得事件
+
+        本地事件快取已同步過時，先依 `refresh_interval` 增量更新快取再從快取讀取；
+        從未同步的快取不保證資料是最新的，直接向 API 取得
+
+        Args:
+            event_id (str): 事件的id
+
+        Returns:
+            Event: calendar event
+        """
+        if self.store is not None and self.store.synced_at(self.calendar_id):
+            self.refresh_store()
+
+            if event := self.store.get(self.calendar_id, event_id):
+                return event
+
+        LOGGER.info("Get %s into calendar", event_id)
+
+        event = self.calendar.get_event(calendar_id=self.calendar_id, event_id=event_id)
 
-        return self.calendar.get_event(calendar_id=self.calendar_id, event_id=event_id)
+        self._store_put(event)
+
+        return event
+
+    def refresh_store(self, force: bool = False) -> SyncEvent | None:
+        """
+        refresh_store 以增量同步更新本地事件快取，距離上次同步未超過 `refresh_interval` 時略過
+
+        Args:
+            force (bool, optional): 忽略 `refresh_interval` 強制同步. Defaults to False.
+
+        Returns:
+            SyncEvent | None: 同步結果，未設定 `store` 或略過時為 None
+        """
+        if self.store is None or self._store_sync is None:
+            return None
+
+        from time import time
+
+        synced_at = self.store.synced_at(self.calendar_id)
+
+        if (
+            not force
+            and synced_at is not None
+            and time() - synced_at < self.refresh_interval
+        ):
+            return None
+
+        return self._store_sync.sync()
+
+    def get_cached_calendar_events(
+        self,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        order_by: Literal["startTime", "updated"] = "startTime",
+        max_results: int | None = None,
+    ) -> list[Event]:
+        """
+        get_cached_calendar_events 從本地事件快取以時間區間讀取事件，必要時先增量更新快取
+
+        Args:
+            time_min (str | None, optional): 時間區間起始時間. Defaults to None.
+            time_max (str | None, optional): 時間區間結束時間. Defaults to None.
+            order_by (Literal["startTime", "updated"], optional): 排序方式. Defaults to "startTime".
+            max_results (int | None, optional): 最大的回傳數. Defaults to None.
+
+        Returns:
+            list[Event]: 符合的事件
+        """
+        if self.store is None:
+            raise ValueError("CalendarService has no event store")
+
+        self.refresh_store()
+
+        return self.store.query(
+            self.calendar_id,
+            time_min=time_min,
+            time_max=time_max,
+            order_by=order_by,
+            limit=max_results,
+        )
+
+    def _store_put(self, event: Event) -> None:
+        if self.store is not None:
+            self.store.put(self.calendar_id, [event])
 
     def get_calendar_events(
         self,
         page_token: str | None = None,
         time_min: str | None = None,
         time_max: str | None = None,
-        max_results: int = 10,
+        max_results: int | None = None,
         order_by: Literal["startTime", "updated"] = "startTime",
         q: str | None = None,
         single_events: bool = True,
         time_zone: str | None = None,
         show_deleted: bool = False,
+        **filters: Unpack[EventListFilter],
     ) -> QueryEvent:
-        LOGGER.info(msg=f"Get all event into {self.calendar_id}")
+        from ...calendar import MAX_LIST_RESULTS
+
+        LOGGER.info("Get all event into %s", self.calendar_id)
 
         return self.calendar.list_events(
             calendar_id=self.calendar_id,
             page_token=page_token,
             time_min=time_min,
             time_max=time_max,
-            max_results=max_results,
+            max_results=max_results or MAX_LIST_RESULTS,
             order_by=order_by,
             q=q,
             single_events=single_events,
             time_zone=time_zone,
             show_deleted=show_deleted,
+            **filters,
         )
 
+    def iter_calendar_events(
+        self,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        max_results: int | None = None,
+        order_by: Literal["startTime", "updated"] = "startTime",
+        q: str | None = None,
+        single_events: bool = True,
+        time_zone: str | None = None,
+        show_deleted: bool = False,
+        **filters: Unpack[EventListFilter],
+    ) -> Generator[Event, None, None]:
+        """
+        iter_calendar_events 逐一回傳事件，每個事件解碼後立即回傳，不會保留整頁的事件
+
+        Args:
+            time_min (str | None, optional): 時間區間起始時間. Defaults to None.
+            time_max (str | None, optional): 時間區間結束時間. Defaults to None.
+            max_results (int | None, optional): 每頁最大的回傳數，預設為 `MAX_LIST_RESULTS`. Defaults to None.
+            order_by (Literal["startTime", "updated"], optional): 排序方式. Defaults to "startTime".
+            q (str | None, optional): 搜尋關鍵字. Defaults to None.
+            single_events (bool, optional): 如果為True，將重複事件展平為單個事件. Defaults to True.
+            time_zone (str | None, optional): 時區. Defaults to None.
+            show_deleted (bool, optional): 如果為True，則包括已刪除的事件. Defaults to False.
+            **filters (EventListFilter): 由伺服器端篩選的條件
+
+        Yields:
+            Event: calendar event
+        """
+        from ...calendar import MAX_LIST_RESULTS
+
+        LOGGER.info("Iterating events of %s", self.calendar_id)
+
+        yield from self.calendar.iter_events(
+            calendar_id=self.calendar_id,
+            time_min=time_min,
+            time_max=time_max,
+            max_results=max_results or MAX_LIST_RESULTS,
+            order_by=order_by,
+            q=q,
+            single_events=single_events,
+            time_zone=time_zone,
+            show_deleted=show_deleted,
+            **filters,
+        )
+
+    def stream_calendar_events(
+        self,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        max_results: int | None = None,
+        order_by: Literal["startTime", "updated"] = "startTime",
+        q: str | None = None,
+        single_events: bool = True,
+        time_zone: str | None = None,
+        show_deleted: bool = False,
+        read_ahead: int = 1,
+        **filters: Unpack[EventListFilter],
+    ) -> Generator[Event, None, None]:
+        """
+        stream_calendar_events 逐一回傳事件，呼叫端處理目前頁面時於背景預先取得之後的頁面
+
+        Args:
+            time_min (str | None, optional): 時間區間起始時間. Defaults to None.
+            time_max (str | None, optional): 時間區間結束時間. Defaults to None.
+            max_results (int | None, optional): 每頁最大的回傳數，預設為 `MAX_LIST_RESULTS`. Defaults to None.
+            order_by (Literal["startTime", "updated"], optional): 排序方式. Defaults to "startTime".
+            q (str | None, optional): 搜尋關鍵字. Defaults to None.
+            single_events (bool, optional): 如果為True，將重複事件展平為單個事件. Defaults to True.
+            time_zone (str | None, optional): 時區. Defaults to None.
+            show_deleted (bool, optional): 如果為True，則包括已刪除的事件. Defaults to False.
+            read_ahead (int, optional): 預先取得的最大頁數. Defaults to 1.
+            **filters (EventListFilter): 由伺服器端篩選的條件
+
+        Yields:
+            Event: calendar event
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        from ...calendar import MAX_LIST_RESULTS, EventPager
+
+        max_results = max_results or MAX_LIST_RESULTS
+
+        if not 0 < max_results <= MAX_LIST_RESULTS:
+            raise ValueError(f"max_results must be between 1 and {MAX_LIST_RESULTS}")
+
+        def fetch_page(page_token: str | None) -> QueryEvent:
+            return self.calendar.list_events(
+                calendar_id=self.calendar_id,
+                page_token=page_token,
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+                order_by=order_by,
+                q=q,
+                single_events=single_events,
+                time_zone=time_zone,
+                show_deleted=show_deleted,
+                http=self.calendar.thread_http(),
+                **filters,
+            )
+
+        LOGGER.info("Stream all event into %s", self.calendar_id)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pager = EventPager(fetch_page, executor, read_ahead)
+
+            try:
+                yield from pager
+            finally:
+                pager.close()
+
+            LOGGER.info(
+                "Streamed %d pages from %s", pager.pages_fetched, self.calendar_id
+            )
+
+    def expand_calendar_events(
+        self,
+        time_min: str,
+        time_max: str,
+        q: str | None = None,
+        time_zone: str | None = None,
+        **filters: Unpack[EventListFilter],
+    ) -> Generator[Event, None, None]:
+        """
+        expand_calendar_events 只取得重複事件的主體與例外，在本地依 RRULE/EXDATE 展開後依起始時間逐一回傳
+
+        結果與 `singleEvents=True` 相同，但每個重複事件只傳輸與解析一次，適合時間區間很寬的查詢
+
+        Args:
+            time_min (str): 時間區間起始時間
+            time_max (str): 時間區間結束時間
+            q (str | None, optional): 搜尋關鍵字. Defaults to None.
+            time_zone (str | None, optional): 時區. Defaults to None.
+            **filters (EventListFilter): 由伺服器端篩選的條件，套用於重複事件的主體
+
+        Yields:
+            Event: 依起始時間排序的單次事件
+        """
+        from ...recurrence import expand_events
+
+        LOGGER.info("Expand all event into %s", self.calendar_id)
+
+        series = self.calendar.list_series(
+            calendar_id=self.calendar_id,
+            time_min=time_min,
+            time_max=time_max,
+            q=q,
+            time_zone=time_zone,
+            **filters,
+        )
+
+        yield from expand_events(series.events, time_min, time_max, series.cancelled)
+
+    def get_calendar_event_as(
+        self, event_id: str, model: type[ModelT] = EventSlot
+    ) -> ModelT:
+        LOGGER.info("Get %s fields into calendar", event_id)
+
+        return self.calendar.get_event_as(model, self.calendar_id, event_id)
+
+    def _iter_event_fields(
+        self,
+        fields: Sequence[str],
+        time_min: str | None = None,
+        time_max: str | None = None,
+        max_results: int | None = None,
+        order_by: Literal["startTime", "updated"] = "startTime",
+        q: str | None = None,
+        time_zone: str | None = None,
+        **filters: Unpack[EventListFilter],
+    ) -> Generator[dict[str, Any], None, None]:
+        from ...calendar import MAX_LIST_RESULTS
+
+        page_token: str | None = None
+
+        while True:
+            items, page_token = self.calendar.list_event_fields(
+                self.calendar_id,
+                fields,
+                page_token,
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results or MAX_LIST_RESULTS,
+                order_by=order_by,
+                q=q,
+                time_zone=time_zone,
+                **filters,
+            )
+
+            yield from items
+
+            if not page_token:
+                break
+
+    def get_calendar_events_as(
+        self,
+        model: type[ModelT] = EventSlot,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        max_results: int | None = None,
+        order_by: Literal["startTime", "updated"] = "startTime",
+        q: str | None = None,
+        time_zone: str | None = None,
+        **filters: Unpack[EventListFilter],
+    ) -> Generator[ModelT, None, None]:
+        """
+        get_calendar_events_as 只取得 `model` 需要的欄位，逐一回傳轉換後的 `model`
+
+        Args:
+            model (type[ModelT], optional): 輕量的事件 model. Defaults to EventSlot.
+            time_min (str | None, optional): 時間區間起始時間. Defaults to None.
+            time_max (str | None, optional): 時間區間結束時間. Defaults to None.
+            max_results (int | None, optional): 每頁最大的回傳數，預設為 `MAX_LIST_RESULTS`. Defaults to None.
+            order_by (Literal["startTime", "updated"], optional): 排序方式. Defaults to "startTime".
+            q (str | None, optional): 搜尋關鍵字. Defaults to None.
+            time_zone (str | None, optional): 時區. Defaults to None.
+            **filters (EventListFilter): 由伺服器端篩選的條件
+
+        Yields:
+            ModelT: 事件
+        """
+        LOGGER.info("Get all event fields into %s", self.calendar_id)
+
+        for item in self._iter_event_fields(
+            tuple(model.model_fields),
+            time_min=time_min,
+            time_max=time_max,
+            max_results=max_results,
+            order_by=order_by,
+            q=q,
+            time_zone=time_zone,
+            **filters,
+        ):
+            yield model(**item)
+
+    def get_calendar_event_rows(
+        self,
+        fields: Sequence[str] = ("id", "start", "end", "summary"),
+        time_min: str | None = None,
+        time_max: str | None = None,
+        max_results: int | None = None,
+        order_by: Literal["startTime", "updated"] = "startTime",
+        q: str | None = None,
+        time_zone: str | None = None,
+        **filters: Unpack[EventListFilter],
+    ) -> Generator[tuple[Any, ...], None, None]:
+        """
+        get_calendar_event_rows 只取得 `fields`，逐一回傳未經 model 驗證的 tuple；
+        `start`/`end` 等時間欄位會展開為 dateTime 或 date 字符串
+
+        Args:
+            fields (Sequence[str], optional): 事件的欄位. Defaults to ("id", "start", "end", "summary").
+            time_min (str | None, optional): 時間區間起始時間. Defaults to None.
+            time_max (str | None, optional): 時間區間結束時間. Defaults to None.
+            max_results (int | None, optional): 每頁最大的回傳數，預設為 `MAX_LIST_RESULTS`. Defaults to None.
+            order_by (Literal["startTime", "updated"], optional): 排序方式. Defaults to "startTime".
+            q (str | None, optional): 搜尋關鍵字. Defaults to None.
+            time_zone (str | None, optional): 時區. Defaults to None.
+            **filters (EventListFilter): 由伺服器端篩選的條件
+
+        Yields:
+            tuple[Any, ...]: 依 `fields` 順序排列的值，缺少的欄位為 None
+        """
+
+        def flatten(value: Any) -> Any:
+            if isinstance(value, dict) and ("dateTime" in value or "date" in value):
+                return value.get("dateTime") or value.get("date")
+
+            return value
+
+        LOGGER.info("Get all event rows into %s", self.calendar_id)
+
+        for item in self._iter_event_fields(
+            fields,
+            time_min=time_min,
+            time_max=time_max,
+            max_results=max_results,
+            order_by=order_by,
+            q=q,
+            time_zone=time_zone,
+            **filters,
+        ):
+            yield tuple(flatten(item.get(field)) for field in fields)
+
+    def get_calendar_event_frame(
+        self,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        max_results: int | None = None,
+        q: str | None = None,
+        time_zone: str | None = None,
+        frame: "EventFrame | None" = None,
+        **filters: Unpack[EventListFilter],
+    ) -> "EventFrame":
+        """
+        get_calendar_event_frame 只取得 `FRAME_FIELDS`，直接轉換為欄位陣列，不會建立 model
+
+        Args:
+            time_min (str | None, optional): 時間區間起始時間. Defaults to None.
+            time_max (str | None, optional): 時間區間結束時間. Defaults to None.
+            max_results (int | None, optional): 每頁最大的回傳數，預設為 `MAX_LIST_RESULTS`. Defaults to None.
+            q (str | None, optional): 搜尋關鍵字. Defaults to None.
+            time_zone (str | None, optional): 時區. Defaults to None.
+            frame (EventFrame | None, optional): 加入到既有的 `EventFrame`，用於合併多個日曆. Defaults to None.
+            **filters (EventListFilter): 由伺服器端篩選的條件
+
+        Returns:
+            EventFrame: 事件的時間區間
+        """
+        from ...analytics import FRAME_FIELDS, EventFrame
+
+        LOGGER.info("Get all event frame into %s", self.calendar_id)
+
+        frame = EventFrame() if frame is None else frame
+        frame.extend(
+            self._iter_event_fields(
+                FRAME_FIELDS,
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+                q=q,
+                time_zone=time_zone,
+                **filters,
+            ),
+            self.calendar_id,
+        )
+
+        return frame
+
+    def sync_calendar_events(
+        self,
+        sync_token: str | None = None,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        single_events: bool = True,
+    ) -> SyncEvent:
+        LOGGER.info(
+            "%s sync of calendar %s",
+            "Incremental" if sync_token else "Full",
+            self.calendar_id,
+        )
+
+        sync_event = self.calendar.sync_events(
+            calendar_id=self.calendar_id,
+            sync_token=sync_token,
+            time_min=time_min,
+            time_max=time_max,
+            single_events=single_events,
+        )
+
+        LOGGER.info(
+            "Synced calendar %s: %d changed, %d deleted",
+            self.calendar_id,
+            len(sync_event.events),
+            len(sync_event.deleted),
+        )
+
+        return sync_event
+
+    def watch_calendar_events(
+        self,
+        address: str,
+        channel_id: str | None = None,
+        token: str | None = None,
+        ttl: int | None = None,
+    ) -> "Channel":
+        """
+        watch_calendar_events 建立 channel，事件變更時 Google 會以 POST 通知 `address`
+
+        Args:
+            address (str): 接收通知的 HTTPS URL
+            channel_id (str | None, optional): channel 的id，預設為隨機的 uuid. Defaults to None.
+            token (str | None, optional): 每次通知都會帶回的驗證 token. Defaults to None.
+            ttl (int | None, optional): channel 的存活秒數. Defaults to None.
+
+        Returns:
+            Channel: 已建立的 channel
+        """
+        from uuid import uuid4
+
+        channel = self.calendar.watch_events(
+            self.calendar_id,
+            channel_id or uuid4().hex,
+            address,
+            token=token,
+            ttl=ttl,
+        )
+
+        LOGGER.info(
+            "Watching calendar %s with channel %s until %s",
+            self.calendar_id,
+            channel.id,
+            channel.expiration,
+        )
+
+        return channel
+
+    def stop_channel(self, channel: "Channel") -> bool:
+        """
+        stop_channel 停止 channel
+
+        Returns:
+            bool: 是否已停止，channel 已過期或不存在時為 False
+        """
+        from googleapiclient.errors import HttpError
+
+        try:
+            self.calendar.stop_channel(channel.id, channel.resourceId)
+        except HttpError as error:
+            if error.resp.status != 404:
+                raise
+
+            LOGGER.warning("Channel %s not found", channel.id)
+            return False
+
+        LOGGER.info("Channel %s of calendar %s stopped", channel.id, self.calendar_id)
+
+        return True
+
     def update_calendar_event(self, event_id: str, **event_param: Unpack[EventParam]):
-        LOGGER.info(f"Updating event {event_id} in calendar {self.calendar_id}")
+        LOGGER.info("Updating event %s in calendar %s", event_id, self.calendar_id)
 
         event = self.calendar.update_event(
             calendar_id=self.calendar_id, event_id=event_id, **event_param
         )
 
-        LOGGER.info(f"Event updated: {event.id}")
+        LOGGER.info("Event updated: %s", event.id)
+
+        self._store_put(event)
 
         return event
 
+    def replace_calendar_event(
+        self, event: Event, **event_param: Unpack[EventParam]
+    ) -> Event:
+        """
+        replace_calendar_event 以呼叫端持有的 `Event` 更新事件，只需一次請求；
+        事件已被修改時才會重新取得
+
+        Args:
+            event (Event): 呼叫端持有的事件，需包含 `etag`
+            **event_param (EventParam): 預修改的內容
+
+        Returns:
+            Event: 回傳已修改的事件
+        """
+        LOGGER.info("Replacing event %s in calendar %s", event.id, self.calendar_id)
+
+        updated_event = self.calendar.conditional_update_event(
+            self.calendar_id, event, **event_param
+        )
+
+        LOGGER.info("Event replaced: %s", updated_event.id)
+
+        self._store_put(updated_event)
+
+        return updated_event
+
     def patch_calendar_event(
         self,
         event_id: str,
         **event_param: Unpack[EventParam],
     ) -> Event:
-        LOGGER.info(f"f'Patching event {event_id} in calendar {self.calendar_id}")
+        LOGGER.info("Patching event %s in calendar %s", event_id, self.calendar_id)
 
-        event = self.calendar.update_event(
+        event = self.calendar.patch_event(
             calendar_id=self.calendar_id, event_id=event_id, **event_param
         )
 
-        LOGGER.info(f"Event patched: {event.id}")
+        LOGGER.info("Event patched: %s", event.id)
+
+        self._store_put(event)
 
         return event
 
@@ -112,12 +900,22 @@ class CalendarService:
         try:
             self.calendar.delete_event(calendar_id, event_id)
             LOGGER.info(
-                f"Event {event_id} in calendar {calendar_id} deleted successfully."
+                "Event %s in calendar %s deleted successfully.", event_id, calendar_id
             )
+
+            if self.store is not None:
+                self.store.delete(calendar_id, [event_id])
+
             return True
         except HttpError as error:
+            if error.resp.status not in (404, 410):
+                raise
+
             LOGGER.error(
-                f"Failed to delete event {event_id} in calendar {calendar_id}: {error}"
+                "Failed to delete event %s in calendar %s: %s",
+                event_id,
+                calendar_id,
+                error,
             )
             return False
 
@@ -129,7 +927,11 @@ class CalendarService:
         time_zone: str | None = None,
     ) -> Event:
         LOGGER.info(
-            f"Moving event {event_id} in calendar {self.calendar_id} to new times: {new_start_time} - {new_end_time}"
+            "Moving event %s in calendar %s to new times: %s - %s",
+            event_id,
+            self.calendar_id,
+            new_start_time,
+            new_end_time,
         )
         event = self.patch_calendar_event(
             event_id=event_id,
@@ -137,6 +939,37 @@ class CalendarService:
             end_time=new_end_time,
             time_zone=time_zone,
         )
-        LOGGER.info(f"Event moved: {event.id}")
+        LOGGER.info("Event moved: %s", event.id)
 
         return event
+
+    def move_calendar_events(
+        self,
+        moves: Iterable["EventMove"],
+        batch_size: int | None = None,
+        time_zone: str | None = None,
+    ) -> list["BatchResult"]:
+        """
+        move_calendar_events 以 batch request 移動多個事件，每個事件只送出一次 patch，不會先讀取事件
+
+        Args:
+            moves (Iterable[EventMove]): `plan_reschedule` 計算的移動
+            batch_size (int | None, optional): 每個 batch request 的最大請求數. Defaults to None.
+            time_zone (str | None, optional): 新時段的時區. Defaults to None.
+
+        Returns:
+            list[BatchResult]: 依 `moves` 順序排列的結果
+        """
+        batch = self.batch(batch_size=batch_size)
+
+        for move in moves:
+            batch.patch_calendar_event(
+                move.event_id,
+                start_time=move.start_time,
+                end_time=move.end_time,
+                time_zone=time_zone,
+            )
+
+        LOGGER.info("Moving %d events in calendar %s", len(batch), self.calendar_id)
+
+        return batch.execute()
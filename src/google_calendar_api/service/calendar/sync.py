@@ -0,0 +1,116 @@
+from typing import TYPE_CHECKING
+
+from ...log import LOGGER
+from ...schema.calendar import SyncEvent
+
+if TYPE_CHECKING:
+    from ...store import EventStore
+    from .service import CalendarService
+
+__all__ = ["CalendarSync"]
+
+
+class CalendarSync:
+    """
+    CalendarSync 保存 `syncToken`，每次呼叫 `sync` 只取得上次同步後變更與刪除的事件
+    doc : https://developers.google.com/calendar/api/guides/sync
+
+    `syncToken` 過期(410 Gone) 時會自動清除 token 並重新完整同步，
+    此時回傳的 `SyncEvent.full_sync` 為 True，呼叫端應以結果取代本地資料。
+
+    Examples:
+        >>> calendar_sync = api.calendar_sync(sync_token_path="sync_token.txt")
+        >>> changes = calendar_sync.sync()
+        >>> changes.events, changes.deleted
+
+    提供 `store` 時，`syncToken` 保存在 `EventStore`，同步結果也會套用到 `EventStore`。
+    """
+
+    def __init__(
+        self,
+        calendar_service: "CalendarService",
+        sync_token_path: str | None = None,
+        *,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        single_events: bool = True,
+        store: "EventStore | None" = None,
+    ) -> None:
+        self.calendar_service = calendar_service
+        self.sync_token_path = sync_token_path
+        self.store = store
+        self.time_min = time_min
+        self.time_max = time_max
+        self.single_events = single_events
+        self.sync_token = self._load_sync_token()
+
+    def _load_sync_token(self) -> str | None:
+        from os.path import exists
+
+        if self.store is not None:
+            return self.store.get_sync_token(self.calendar_service.calendar_id)
+
+        if self.sync_token_path and exists(self.sync_token_path):
+            with open(self.sync_token_path, encoding="UTF-8") as token_file:
+                return token_file.read().strip() or None
+
+        return None
+
+    def _save_sync_token(self) -> None:
+        if not self.sync_token_path:
+            return
+
+        from os import replace
+
+        tmp_path = f"{self.sync_token_path}.tmp"
+
+        with open(tmp_path, mode="w", encoding="UTF-8") as token_file:
+            token_file.write(self.sync_token or "")
+
+        replace(tmp_path, self.sync_token_path)
+
+    def reset(self) -> None:
+        """reset 清除 `syncToken`，下次 `sync` 會重新完整同步"""
+        self.sync_token = None
+        self._save_sync_token()
+
+        if self.store is not None:
+            self.store.clear(self.calendar_service.calendar_id)
+
+    def sync(self) -> SyncEvent:
+        """
+        sync 取得上次同步後變更與刪除的事件，並保存新的 `syncToken`
+
+        Returns:
+            SyncEvent: 變更的事件、已刪除的事件id 與新的 `syncToken`
+        """
+        from googleapiclient.errors import HttpError
+
+        try:
+            sync_event = self._sync()
+        except HttpError as error:
+            if error.resp.status != 410 or self.sync_token is None:
+                raise
+
+            LOGGER.warning(
+                "Sync token of calendar %s expired, performing full sync",
+                self.calendar_service.calendar_id,
+            )
+            self.reset()
+            sync_event = self._sync()
+
+        self.sync_token = sync_event.sync_token
+        self._save_sync_token()
+
+        if self.store is not None:
+            self.store.apply(self.calendar_service.calendar_id, sync_event)
+
+        return sync_event
+
+    def _sync(self) -> SyncEvent:
+        return self.calendar_service.sync_calendar_events(
+            sync_token=self.sync_token,
+            time_min=self.time_min,
+            time_max=self.time_max,
+            single_events=self.single_events,
+        )
@@ -1,19 +1,46 @@
 from googleapiclient.discovery import Resource
 
-from ...credentials import Credentials
-from ...log import LOGGER
+from ...credentials import Credentials, get_token_manager
 
 __all__ = ["CredentialsService"]
 
 
 class CredentialsService:
-    def __init__(self, credentials: Credentials, token_json_path: str | None = None):
+    def __init__(
+        self,
+        credentials: Credentials,
+        token_json_path: str | None = None,
+        discovery_cache_dir: str | None = None,
+        pool_size: int | None = None,
+        auto_refresh: bool = False,
+    ):
+        """
+        Args:
+            credentials (Credentials): 憑證
+            token_json_path (str | None, optional): 憑證刷新後保存的路徑. Defaults to None.
+            discovery_cache_dir (str | None, optional): discovery document 的快取目錄. Defaults to None.
+            pool_size (int | None, optional): 提供時服務對象使用 thread-safe 的連線池，可在多個執行緒間共用. Defaults to None.
+            auto_refresh (bool, optional): 在背景於 token 過期前主動刷新，適合長時間執行的 worker. Defaults to False.
+        """
+        from ...discovery import share_credentials
+
+        # 使用共用 `Resource` 送出請求的憑證對象，TokenManager 才會刷新實際使用的 token
+        credentials.credential = share_credentials(credentials.credential)
         self.credentials = credentials
         self.token_json_path = token_json_path
+        self.discovery_cache_dir = discovery_cache_dir
+        self.pool_size = pool_size
+        self.token_manager = get_token_manager(credentials, token_json_path)
+
+        if auto_refresh:
+            self.token_manager.start()
 
     def get_service(self, service_name: str, version: str) -> Resource:
         """
         get_service 返回指定的 Google API 服務對象，並在需要時刷新憑證。
+        相同憑證與版本的服務對象在 process 內共用，discovery document 優先從快取讀取。
+        設定 `pool_size` 時服務對象使用連線池，否則多執行緒時每個執行緒需使用各自的 http 對象。
+        token 刷新經由 `token_manager` 協調，共用 token.json 的 process 不會重複刷新。
 
         Args:
             service_name (str): Google API 服務的名稱（例如 "calendar"）。
@@ -22,14 +49,14 @@ class CredentialsService:
         Returns:
             CredentialService: 指定的 Google API 服務對象。
         """
-        if self.credentials.need_refresh():
-            self.credentials.refresh_token()
-            LOGGER.info(msg="token refresh")
-
-            if self.token_json_path:
-                self.to_json_file(self.token_json_path)
+        self.token_manager.refresh()
 
-        return self.credentials.build_service(service_name, version)
+        return self.credentials.build_service(
+            service_name,
+            version,
+            cache_dir=self.discovery_cache_dir,
+            pool_size=self.pool_size,
+        )
 
     def to_json_file(self, token_json_path: str) -> None:
         self.credentials.to_json_file(token_json_path=token_json_path)
@@ -42,6 +69,8 @@ class CredentialsService:
         client_id: str,
         client_secret: str,
         scopes: list[str],
+        discovery_cache_dir: str | None = None,
+        pool_size: int | None = None,
     ) -> "CredentialsService":
         """
         from_token_params 從提供的 token 參數生成 CredentialService 實例。
@@ -53,6 +82,8 @@ class CredentialsService:
             client_id (str): 客戶端 ID。
             client_secret (str): 客戶端密鑰。
             scopes (list[str]): 授權範圍。
+            discovery_cache_dir (str | None, optional): discovery document 的快取目錄. Defaults to None.
+            pool_size (int | None, optional): 提供時服務對象使用 thread-safe 的連線池. Defaults to None.
 
         Returns:
             CredentialsService: 生成的 CredentialService 實例。
@@ -66,7 +97,9 @@ class CredentialsService:
             scopes=scopes,
         ).create_credentials()
 
-        return CredentialsService(creds)
+        return CredentialsService(
+            creds, discovery_cache_dir=discovery_cache_dir, pool_size=pool_size
+        )
 
     @staticmethod
     def from_client_secrets_file(
@@ -75,6 +108,8 @@ class CredentialsService:
         port: int = 0,
         *,
         output_token_json: str,
+        discovery_cache_dir: str | None = None,
+        pool_size: int | None = None,
     ) -> "CredentialsService":
         """
         from_client_secrets_file 產生google service 必要的client secrets file
@@ -84,6 +119,8 @@ class CredentialsService:
             scopes (list[str]): 服務網址
             output_token_json (str): 憑證刷新後將新的憑證保存到這個路徑（如果提供）。
             port (int, optional): port號. Defaults to 0.
+            discovery_cache_dir (str | None, optional): discovery document 的快取目錄. Defaults to None.
+            pool_size (int | None, optional): 提供時服務對象使用 thread-safe 的連線池. Defaults to None.
 
         Returns:
             CredentialsService: 生成的 CredentialService 實例。
@@ -92,11 +129,19 @@ class CredentialsService:
             credentials_json_path, scopes, port
         )
 
-        return CredentialsService(creds, token_json_path=output_token_json)
+        return CredentialsService(
+            creds,
+            token_json_path=output_token_json,
+            discovery_cache_dir=discovery_cache_dir,
+            pool_size=pool_size,
+        )
 
     @staticmethod
     def from_authorized_user_file(
-        token_json_path: str, scopes: list[str]
+        token_json_path: str,
+        scopes: list[str],
+        discovery_cache_dir: str | None = None,
+        pool_size: int | None = None,
     ) -> "CredentialsService":
         """
         from_authorized_user_file 產生google service 必要的token path
@@ -104,10 +149,17 @@ class CredentialsService:
         Args:
             token_json_path (str): 憑證刷新後將新的憑證保存到這個路徑（如果提供）。
             scopes (list[str]): 服務網址
+            discovery_cache_dir (str | None, optional): discovery document 的快取目錄. Defaults to None.
+            pool_size (int | None, optional): 提供時服務對象使用 thread-safe 的連線池. Defaults to None.
 
         Returns:
             CredentialsService: 生成的 CredentialService 實例。
         """
         creds = Credentials.from_authorized_user_file(token_json_path, scopes)
 
-        return CredentialsService(creds, token_json_path)
+        return CredentialsService(
+            creds,
+            token_json_path,
+            discovery_cache_dir=discovery_cache_dir,
+            pool_size=pool_size,
+        )
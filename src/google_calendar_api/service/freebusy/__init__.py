@@ -0,0 +1 @@
+from .service import *  # noqa: F403
@@ -0,0 +1,159 @@
+from collections.abc import Iterable
+
+from googleapiclient.discovery import Resource
+
+from ...freebusy import BusyIndex
+from ...log import LOGGER
+from ...schema.calendar import Event
+from ...schema.freebusy import FreeBusy, TimePeriod
+
+__all__ = ["FreeBusyQueryError", "FreeBusyService"]
+
+
+class FreeBusyQueryError(RuntimeError):
+    """
+    FreeBusyQueryError freebusy 無法取得部分日曆的忙碌時段
+
+    Attributes:
+        errors (dict[str, list[str]]): 失敗的`calendarID` 與錯誤原因，例如 notFound
+    """
+
+    def __init__(self, errors: dict[str, list[str]]) -> None:
+        super().__init__(
+            "Freebusy failed for calendars: "
+            + ", ".join(
+                f"{calendar_id} ({', '.join(reasons)})"
+                for calendar_id, reasons in errors.items()
+            )
+        )
+        self.errors = errors
+
+
+class FreeBusyService:
+    def __init__(self, service: Resource) -> None:
+        from ...calendar import Calendar
+
+        self.calendar = Calendar(service=service)
+
+    def get_freebusy(
+        self,
+        calendar_ids: list[str],
+        time_min: str,
+        time_max: str,
+        time_zone: str | None = None,
+    ) -> FreeBusy:
+        """
+        get_freebusy 查詢多個日曆的忙碌時段，超過單次上限時分批查詢後合併
+
+        Args:
+            calendar_ids (list[str]): 要查詢的`calendarID`
+            time_min (str): 時間區間起始時間
+            time_max (str): 時間區間結束時間
+            time_zone (str | None, optional): 回傳時間使用的時區. Defaults to None.
+
+        Returns:
+            FreeBusy: 每個日曆的忙碌時段
+        """
+        from ...calendar import MAX_FREEBUSY_CALENDARS
+
+        LOGGER.info("Query freebusy of %d calendars", len(calendar_ids))
+
+        freebusy: FreeBusy | None = None
+
+        for offset in range(0, len(calendar_ids), MAX_FREEBUSY_CALENDARS):
+            result = self.calendar.query_freebusy(
+                calendar_ids[offset : offset + MAX_FREEBUSY_CALENDARS],
+                time_min=time_min,
+                time_max=time_max,
+                time_zone=time_zone,
+            )
+
+            if freebusy is None:
+                freebusy = result
+            else:
+                freebusy.calendars.update(result.calendars)
+
+        if freebusy is None:
+            raise ValueError("calendar_ids must not be empty")
+
+        for calendar_id, calendar in freebusy.calendars.items():
+            if calendar.errors:
+                LOGGER.warning(
+                    "Freebusy of calendar %s failed: %s",
+                    calendar_id,
+                    ", ".join(error.reason for error in calendar.errors),
+                )
+
+        return freebusy
+
+    def get_busy_index(
+        self,
+        calendar_ids: list[str],
+        time_min: str,
+        time_max: str,
+        events: Iterable[Event] = (),
+    ) -> BusyIndex:
+        """
+        get_busy_index 建立多個日曆忙碌時段的聯集索引
+
+        Args:
+            calendar_ids (list[str]): 以 freebusy 查詢的`calendarID`
+            time_min (str): 時間區間起始時間
+            time_max (str): 時間區間結束時間
+            events (Iterable[Event], optional): 已快取的事件，一併加入忙碌時段. Defaults to ().
+
+        Returns:
+            BusyIndex: 忙碌時段索引
+
+        Raises:
+            FreeBusyQueryError: 任一日曆的 freebusy 查詢失敗
+        """
+        busy_index = BusyIndex()
+        busy_index.add_events(events)
+
+        if calendar_ids:
+            freebusy = self.get_freebusy(calendar_ids, time_min, time_max)
+            errors = {
+                calendar_id: [error.reason for error in calendar.errors]
+                for calendar_id, calendar in freebusy.calendars.items()
+                if calendar.errors
+            }
+
+            # 查詢失敗的日曆沒有忙碌時段，視為空閒會排入衝突的時段
+            if errors:
+                raise FreeBusyQueryError(errors)
+
+            for calendar in freebusy.calendars.values():
+                busy_index.add_periods(calendar.busy)
+
+        return busy_index
+
+    def find_free_slots(
+        self,
+        calendar_ids: list[str],
+        time_min: str,
+        time_max: str,
+        duration: float,
+        count: int = 1,
+        events: Iterable[Event] = (),
+    ) -> list[TimePeriod]:
+        """
+        find_free_slots 找出所有日曆共同的前 `count` 個空閒時段
+
+        Args:
+            calendar_ids (list[str]): 以 freebusy 查詢的`calendarID`
+            time_min (str): 時間區間起始時間
+            time_max (str): 時間區間結束時間
+            duration (float): 空閒時段的長度(秒)
+            count (int, optional): 最多回傳的時段數. Defaults to 1.
+            events (Iterable[Event], optional): 已快取的事件，一併加入忙碌時段. Defaults to ().
+
+        Returns:
+            list[TimePeriod]: 空閒時段
+
+        Raises:
+            FreeBusyQueryError: 任一日曆的 freebusy 查詢失敗
+        """
+        return self.get_busy_index(
+            calendar_ids, time_min, time_max, events
+        ).free_periods(time_min, time_max, duration, count)
@@ -0,0 +1,2 @@
+from .keys import *  # noqa: F403
+from .store import *  # noqa: F403
@@ -0,0 +1,94 @@
+from collections.abc import Iterable, Mapping
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .store import EventStore
+
+__all__ = ["UPSERT_PROPERTY", "EventKeyIndex", "upsert_event_id"]
+
+UPSERT_PROPERTY = "upsertKey"
+"""upsert 時寫入 `extendedProperties.private` 的屬性名稱"""
+
+
+def upsert_event_id(calendar_id: str, key: str) -> str:
+    """
+    upsert_event_id 由日曆與呼叫端的 key 產生固定的事件id，同一個 key 永遠對應同一個事件
+
+    Returns:
+        str: 32 個 base32hex 字元的事件id
+    """
+    from base64 import b32hexencode
+    from hashlib import sha1
+
+    digest = sha1(f"{calendar_id}\0{key}".encode(), usedforsecurity=False).digest()
+
+    return b32hexencode(digest).decode().lower()
+
+
+class EventKeyIndex:
+    """
+    EventKeyIndex 記錄 upsert 的 key 與事件id 的對應，決定 upsert 先送出 patch 或 insert，不需搜尋事件
+
+    提供 `store` 時對應會保存在 `EventStore`，重新啟動後仍可使用
+
+    Args:
+        calendar_id (str): 分享時的`calendarID`
+        store (EventStore | None, optional): 保存對應的本地事件快取. Defaults to None.
+    """
+
+    def __init__(self, calendar_id: str, store: "EventStore | None" = None) -> None:
+        self.calendar_id = calendar_id
+        self.store = store
+        self.loaded = False
+        """是否已從日曆讀取所有 key，為 True 時索引中沒有的 key 即為不存在"""
+        self._event_ids: dict[str, str] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._event_ids)
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            if (event_id := self._event_ids.get(key)) is not None:
+                return event_id
+
+        if self.store is None or self.loaded:
+            return None
+
+        if (event_id := self.store.get_event_id(self.calendar_id, key)) is not None:
+            with self._lock:
+                self._event_ids[key] = event_id
+
+        return event_id
+
+    def put(self, event_ids: Mapping[str, str]) -> None:
+        if not event_ids:
+            return
+
+        with self._lock:
+            self._event_ids.update(event_ids)
+
+        if self.store is not None:
+            self.store.put_event_ids(self.calendar_id, event_ids)
+
+    def discard(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+
+        with self._lock:
+            for key in keys:
+                self._event_ids.pop(key, None)
+
+        if self.store is not None:
+            self.store.delete_event_keys(self.calendar_id, keys)
+
+    def load(self, event_ids: Mapping[str, str]) -> None:
+        """load 以日曆上完整的 key 對應取代索引"""
+        with self._lock:
+            stale = self._event_ids.keys() - event_ids.keys()
+            self._event_ids = dict(event_ids)
+            self.loaded = True
+
+        if self.store is not None:
+            self.store.delete_event_keys(self.calendar_id, stale)
+            self.store.put_event_ids(self.calendar_id, event_ids)
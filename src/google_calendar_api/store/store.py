@@ -0,0 +1,237 @@
+import sqlite3
+from collections.abc import Iterable, Mapping
+from threading import Lock
+from typing import Literal
+
+from typing_extensions import Self
+
+from ..schema.calendar import Event, SyncEvent
+from ..utils._datetime import to_timestamp
+
+__all__ = ["EventStore"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    calendar_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL,
+    updated TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (calendar_id, id)
+);
+CREATE INDEX IF NOT EXISTS events_time_range ON events (calendar_id, start_ts, end_ts);
+CREATE INDEX IF NOT EXISTS events_updated ON events (calendar_id, updated);
+CREATE TABLE IF NOT EXISTS event_keys (
+    calendar_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    PRIMARY KEY (calendar_id, key)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    calendar_id TEXT PRIMARY KEY,
+    sync_token TEXT,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+class EventStore:
+    """
+    EventStore 以 SQLite 保存 `Event`，依 id、起訖時間與 `updated` 建立索引，
+    並保存每個日曆的 `syncToken` 供增量更新使用
+
+    Args:
+        path (str, optional): SQLite 檔案路徑，`:memory:` 則只保存在記憶體. Defaults to ":memory:".
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    @staticmethod
+    def _event_time(event: Event, attr: Literal["start", "end"]) -> float:
+        value = getattr(event, attr)
+
+        return to_timestamp(getattr(value, "dateTime", None) or value.date)
+
+    def get(self, calendar_id: str, event_id: str) -> Event | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM events WHERE calendar_id = ? AND id = ?",
+                (calendar_id, event_id),
+            ).fetchone()
+
+        return Event.model_validate_json(row[0]) if row else None
+
+    def query(
+        self,
+        calendar_id: str,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        order_by: Literal["startTime", "updated"] = "startTime",
+        limit: int | None = None,
+    ) -> list[Event]:
+        """
+        query 以時間區間查詢事件，與 API 相同: 結束時間晚於 `time_min` 且起始時間早於 `time_max`
+
+        Args:
+            calendar_id (str): 分享時的`calendarID`
+            time_min (str | None, optional): 時間區間起始時間. Defaults to None.
+            time_max (str | None, optional): 時間區間結束時間. Defaults to None.
+            order_by (Literal["startTime", "updated"], optional): 排序方式. Defaults to "startTime".
+            limit (int | None, optional): 最大的回傳數. Defaults to None.
+
+        Returns:
+            list[Event]: 符合的事件
+        """
+        sql = "SELECT data FROM events WHERE calendar_id = ?"
+        params: list[str | float | int] = [calendar_id]
+
+        if time_max is not None:
+            sql += " AND start_ts < ?"
+            params.append(to_timestamp(time_max))
+        if time_min is not None:
+            sql += " AND end_ts > ?"
+            params.append(to_timestamp(time_min))
+
+        sql += (
+            " ORDER BY start_ts, id"
+            if order_by == "startTime"
+            else " ORDER BY updated, id"
+        )
+
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+
+        return [Event.model_validate_json(row[0]) for row in rows]
+
+    def put(self, calendar_id: str, events: Iterable[Event]) -> None:
+        with self._lock, self._connection:
+            self._put(calendar_id, events)
+
+    def delete(self, calendar_id: str, event_ids: Iterable[str]) -> None:
+        with self._lock, self._connection:
+            self._delete(calendar_id, event_ids)
+
+    def clear(self, calendar_id: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM events WHERE calendar_id = ?", (calendar_id,)
+            )
+            self._connection.execute(
+                "DELETE FROM sync_state WHERE calendar_id = ?", (calendar_id,)
+            )
+
+    def apply(self, calendar_id: str, sync_event: SyncEvent) -> None:
+        """
+        apply 在同一個 transaction 內套用同步結果並保存新的 `syncToken`；
+        完整同步時會先清除該日曆原有的事件
+
+        Args:
+            calendar_id (str): 分享時的`calendarID`
+            sync_event (SyncEvent): `Calendar.sync_events` 的結果
+        """
+        from time import time
+
+        with self._lock, self._connection:
+            if sync_event.full_sync:
+                self._connection.execute(
+                    "DELETE FROM events WHERE calendar_id = ?", (calendar_id,)
+                )
+
+            self._put(calendar_id, sync_event.events)
+            self._delete(calendar_id, sync_event.deleted)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sync_state (calendar_id, sync_token, synced_at) VALUES (?, ?, ?)",
+                (calendar_id, sync_event.sync_token, time()),
+            )
+
+    def get_sync_token(self, calendar_id: str) -> str | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT sync_token FROM sync_state WHERE calendar_id = ?",
+                (calendar_id,),
+            ).fetchone()
+
+        return row[0] if row else None
+
+    def synced_at(self, calendar_id: str) -> float | None:
+        """
+        synced_at 最後一次套用同步結果的時間
+
+        Args:
+            calendar_id (str): 分享時的`calendarID`
+
+        Returns:
+            float | None: epoch 秒數，從未同步則為 None
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT synced_at FROM sync_state WHERE calendar_id = ?",
+                (calendar_id,),
+            ).fetchone()
+
+        return row[0] if row else None
+
+    def get_event_id(self, calendar_id: str, key: str) -> str | None:
+        """get_event_id 以 upsert 的 key 取得事件id"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT event_id FROM event_keys WHERE calendar_id = ? AND key = ?",
+                (calendar_id, key),
+            ).fetchone()
+
+        return row[0] if row else None
+
+    def put_event_ids(self, calendar_id: str, event_ids: Mapping[str, str]) -> None:
+        """put_event_ids 保存 upsert 的 key 與事件id 的對應"""
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO event_keys (calendar_id, key, event_id) VALUES (?, ?, ?)",
+                ((calendar_id, key, event_id) for key, event_id in event_ids.items()),
+            )
+
+    def delete_event_keys(self, calendar_id: str, keys: Iterable[str]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM event_keys WHERE calendar_id = ? AND key = ?",
+                ((calendar_id, key) for key in keys),
+            )
+
+    def _put(self, calendar_id: str, events: Iterable[Event]) -> None:
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO events (calendar_id, id, start_ts, end_ts, updated, data) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    calendar_id,
+                    event.id,
+                    self._event_time(event, "start"),
+                    self._event_time(event, "end"),
+                    event.updated,
+                    event.model_dump_json(),
+                )
+                for event in events
+            ),
+        )
+
+    def _delete(self, calendar_id: str, event_ids: Iterable[str]) -> None:
+        self._connection.executemany(
+            "DELETE FROM events WHERE calendar_id = ? AND id = ?",
+            ((calendar_id, event_id) for event_id in event_ids),
+        )
@@ -0,0 +1 @@
+from .transport import *  # noqa: F403
@@ -0,0 +1,132 @@
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from google.auth.credentials import Credentials
+    from httplib2 import Response
+
+__all__ = ["DEFAULT_POOL_SIZE", "PooledHttp"]
+
+DEFAULT_POOL_SIZE = 10
+"""每個 host 保留的 keep-alive 連線數"""
+
+
+class PooledHttp:
+    """
+    PooledHttp 以 requests/urllib3 連線池送出請求的 thread-safe transport，提供 httplib2 `Http` 相同的 `request` 介面
+
+    `build_from_document(http=PooledHttp(...))` 建立的 `Resource` 可在多個執行緒間共用，
+    每個執行緒從連線池取得各自的連線；憑證過期時 `AuthorizedSession` 會自動刷新。
+
+    Args:
+        credentials (Credentials): google-auth 憑證
+        pool_size (int, optional): 每個 host 的最大連線數，建議不小於同時送出請求的執行緒數. Defaults to DEFAULT_POOL_SIZE.
+        timeout (float | None, optional): 每個請求的逾時秒數. Defaults to None.
+    """
+
+    thread_safe = True
+
+    def __init__(
+        self,
+        credentials: "Credentials",
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float | None = None,
+    ) -> None:
+        from google.auth.transport.requests import AuthorizedSession
+        from requests.adapters import HTTPAdapter
+
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+
+        self.credentials = credentials
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.session = AuthorizedSession(credentials)
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: str | bytes | None = None,
+        headers: dict[str, str] | None = None,
+        redirections: int = 5,
+        connection_type: Any = None,
+    ) -> tuple["Response", bytes]:
+        """
+        request 送出請求，回傳值與 httplib2 `Http.request` 相同
+
+        Returns:
+            tuple[Response, bytes]: 回應的狀態與 headers、回應內容
+        """
+        from httplib2 import Response
+
+        response = self.session.request(
+            method,
+            uri,
+            data=body,
+            headers=headers,
+            timeout=self.timeout,
+            allow_redirects=redirections > 0,
+        )
+        info = {key.lower(): value for key, value in response.headers.items()}
+        # requests 已解壓縮內容，與 httplib2 相同地移除 content-encoding
+        info.pop("content-encoding", None)
+
+        return Response({**info, "status": response.status_code}), response.content
+
+    def stream(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: str | bytes | None = None,
+        headers: dict[str, str] | None = None,
+        chunk_size: int = 64 * 1024,
+    ) -> tuple[int, Iterator[bytes]]:
+        """
+        stream 送出請求並逐段讀取回應內容，不會一次保留整個回應
+
+        回應狀態碼不為 2xx 時讀取完整內容並拋出 `HttpError`，與 `HttpRequest.execute` 相同
+
+        Raises:
+            HttpError: 回應狀態碼不為 2xx
+
+        Returns:
+            tuple[int, Iterator[bytes]]: 回應狀態碼與已解壓縮的回應片段，讀取結束或關閉時釋放連線
+        """
+        from googleapiclient.errors import HttpError
+        from httplib2 import Response
+
+        response = self.session.request(
+            method, uri, data=body, headers=headers, timeout=self.timeout, stream=True
+        )
+
+        if not 200 <= response.status_code < 300:
+            content = response.content
+            response.close()
+
+            raise HttpError(
+                Response(
+                    {
+                        **{
+                            key.lower(): value
+                            for key, value in response.headers.items()
+                        },
+                        "status": response.status_code,
+                    }
+                ),
+                content,
+                uri=uri,
+            )
+
+        def chunks() -> Iterator[bytes]:
+            with response:
+                yield from response.iter_content(chunk_size)
+
+        return response.status_code, chunks()
+
+    def close(self) -> None:
+        self.session.close()
@@ -1,8 +1,19 @@
+from typing import Literal
+
 from typing_extensions import NotRequired, Required, TypedDict
 
 from ..schema.calendar import Attendee, Reminders
 
-__all__ = ["EventParam", "ApplicationAddEventParam"]
+__all__ = ["EventParam", "ApplicationAddEventParam", "EventType", "EventListFilter"]
+
+EventType = Literal[
+    "default",
+    "birthday",
+    "focusTime",
+    "fromGmail",
+    "outOfOffice",
+    "workingLocation",
+]
 
 
 class EventParam(TypedDict, total=False):
@@ -14,6 +25,9 @@ class EventParam(TypedDict, total=False):
     attendees: list[Attendee] | None
     reminders: Reminders | None
     time_zone: str | None
+    recurrence: list[str] | None  # RRULE/EXDATE/RDATE
+    event_id: str | None  # 新增時指定的事件id，需為 base32hex 字元 (a-v、0-9)
+    private_properties: dict[str, str] | None  # extendedProperties.private
 
 
 class ApplicationAddEventParam(TypedDict, total=False):
@@ -24,3 +38,13 @@ class ApplicationAddEventParam(TypedDict, total=False):
     description: Required[str | None]
     attendees: NotRequired[list[Attendee] | None]
     reminders: NotRequired[Reminders | None]
+
+
+class EventListFilter(TypedDict, total=False):
+    """events.list 由伺服器端篩選的條件，未提供的條件不會送出"""
+
+    updated_min: str | None  # 只回傳此時間 (RFC3339) 之後修改過的事件
+    private_extended_property: list[str] | None  # `name=value`，需全部符合
+    shared_extended_property: list[str] | None  # `name=value`，需全部符合
+    event_types: list[EventType] | None  # 只回傳這些類型的事件
+    i_cal_uid: str | None  # 只回傳此 iCalUID 的事件
@@ -42,3 +42,48 @@ def get_date_string(
         'Monday, July 15, 2024'
     """
     return datetime.strftime(date_format)
+
+
+def to_timestamp(value: str) -> float:
+    """
+    將 API 的 RFC3339 datetime 或 `yyyy-mm-dd` date 字符串轉為 UTC epoch 秒數。
+
+    沒有時區資訊的值(例如全天事件的 date)視為 UTC。
+
+    Args:
+        value (str): 例如 `2024-07-15T09:00:00-07:00`、`2024-07-15T16:00:00Z` 或 `2024-07-15`
+
+    Returns:
+        float: UTC epoch 秒數
+
+    Examples:
+        >>> to_timestamp("2024-07-15T16:00:00Z")
+        1721059200.0
+    """
+    from datetime import timezone
+
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+
+    return parsed.timestamp()
+
+
+def from_timestamp(timestamp: float) -> str:
+    """
+    將 UTC epoch 秒數轉為 RFC3339 datetime 字符串。
+
+    Args:
+        timestamp (float): UTC epoch 秒數
+
+    Returns:
+        str: 例如 `2024-07-15T16:00:00+00:00`
+
+    Examples:
+        >>> from_timestamp(1721059200.0)
+        '2024-07-15T16:00:00+00:00'
+    """
+    from datetime import timezone
+
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
@@ -0,0 +1,2 @@
+from .receiver import *  # noqa: F403
+from .watcher import *  # noqa: F403
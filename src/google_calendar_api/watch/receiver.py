@@ -0,0 +1,233 @@
+from collections.abc import Callable, Hashable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from threading import Condition, Thread
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from typing_extensions import Self
+
+from ..log import LOGGER
+from ..schema.channel import Notification
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+__all__ = [
+    "DEFAULT_COALESCE_DELAY",
+    "ChangeCoalescer",
+    "WebhookReceiver",
+    "parse_notification",
+]
+
+DEFAULT_COALESCE_DELAY = 1.0
+"""收到第一個通知後等待的秒數，期間同一日曆的通知合併為一次讀取"""
+
+
+def parse_notification(headers: Mapping[str, str]) -> Notification | None:
+    """
+    parse_notification 由通知的 headers 建立 `Notification`
+
+    Args:
+        headers (Mapping[str, str]): HTTP headers，名稱不分大小寫
+
+    Returns:
+        Notification | None: 缺少 channel 或資源的 headers 時為 None
+    """
+    headers = {key.lower(): value for key, value in headers.items()}
+
+    if not all(
+        key in headers
+        for key in ("x-goog-channel-id", "x-goog-resource-id", "x-goog-resource-state")
+    ):
+        return None
+
+    return Notification(
+        channel_id=headers["x-goog-channel-id"],
+        resource_id=headers["x-goog-resource-id"],
+        resource_state=headers["x-goog-resource-state"],
+        message_number=int(headers.get("x-goog-message-number") or 0),
+        channel_token=headers.get("x-goog-channel-token"),
+        channel_expiration=headers.get("x-goog-channel-expiration"),
+        resource_uri=headers.get("x-goog-resource-uri"),
+    )
+
+
+class ChangeCoalescer:
+    """
+    ChangeCoalescer 合併短時間內同一個 key 的多次通知，每個 key 在 `delay` 秒後只呼叫一次 `callback`
+
+    `callback` 執行期間收到的通知不會遺失，結束後會再於 `delay` 秒後呼叫一次；
+    同一個 key 不會同時執行，不同 key 在 `max_workers` 個執行緒中並行。
+
+    Args:
+        callback (Callable[[Hashable], Any]): 以 key 呼叫的函式，例如增量讀取日曆
+        delay (float, optional): 合併通知的等待秒數. Defaults to DEFAULT_COALESCE_DELAY.
+        max_workers (int, optional): 同時執行 `callback` 的最大數量. Defaults to 4.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[Hashable], Any],
+        delay: float = DEFAULT_COALESCE_DELAY,
+        max_workers: int = 4,
+    ) -> None:
+        self.callback = callback
+        self.delay = delay
+        self._condition = Condition()
+        self._due: dict[Hashable, float] = {}
+        self._running: set[Hashable] = set()
+        self._pending: set[Hashable] = set()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="coalesce")
+        self._thread = Thread(target=self._run, name="change-coalescer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:
+        self.close()
+
+    def notify(self, key: Hashable) -> None:
+        """notify 記錄 `key` 有變更，已排定或執行中時只會合併"""
+        with self._condition:
+            if key in self._running:
+                self._pending.add(key)
+            elif key not in self._due:
+                self._due[key] = monotonic() + self.delay
+                self._condition.notify()
+
+    def _run(self) -> None:
+        with self._condition:
+            while not self._closed:
+                now = monotonic()
+                ready = [key for key, due in self._due.items() if due <= now]
+
+                for key in ready:
+                    del self._due[key]
+                    self._running.add(key)
+                    self._executor.submit(self._call, key)
+
+                timeout = min(self._due.values(), default=now + 3600) - now
+                self._condition.wait(max(timeout, 0))
+
+    def _call(self, key: Hashable) -> None:
+        try:
+            self.callback(key)
+        except Exception:
+            LOGGER.exception("Change callback of %s failed", key)
+        finally:
+            with self._condition:
+                self._running.discard(key)
+
+                if key in self._pending:
+                    self._pending.discard(key)
+                    self._due[key] = monotonic() + self.delay
+                    self._condition.notify()
+
+    def close(self) -> None:
+        """close 停止排程並等待執行中的 `callback` 結束，尚未到期的通知會被捨棄"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+
+
+class WebhookReceiver:
+    """
+    WebhookReceiver 接收推播通知的 HTTP server，每個通知以 `on_notification` 處理後立即回應 200
+
+    Google 只接受 HTTPS 的 address，對外通常由反向代理終止 TLS 後轉送到此 server；
+    `on_notification` 應盡快返回，實際讀取應交給 `ChangeCoalescer`
+
+    Args:
+        on_notification (Callable[[Notification], Any]): 處理通知的函式
+        host (str, optional): 監聽的位址. Defaults to "127.0.0.1".
+        port (int, optional): 監聽的 port，0 時自動選擇. Defaults to 0.
+        path (str, optional): 接收通知的路徑，其他路徑回應 404. Defaults to "/".
+    """
+
+    def __init__(
+        self,
+        on_notification: Callable[[Notification], Any],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str = "/",
+    ) -> None:
+        self.on_notification = on_notification
+        self.host = host
+        self.port = port
+        self.path = path
+        self._server: ThreadingHTTPServer | None = None
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """url 本機的接收網址"""
+        if self._server is None:
+            raise RuntimeError("receiver is not started")
+
+        host, port = self._server.server_address[:2]
+
+        return f"http://{host}:{port}{self.path}"
+
+    def start(self) -> Self:
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _respond(self, status: int) -> None:
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_POST(self) -> None:  # noqa: N802
+                length = int(self.headers.get("Content-Length") or 0)
+
+                if length:
+                    self.rfile.read(length)
+
+                if self.path.split("?", 1)[0] != receiver.path:
+                    return self._respond(404)
+
+                notification = parse_notification(self.headers)
+
+                if notification is None:
+                    return self._respond(400)
+
+                try:
+                    receiver.on_notification(notification)
+                except Exception:
+                    LOGGER.exception("Notification handler failed")
+                    return self._respond(500)
+
+                self._respond(200)
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        Thread(
+            target=self._server.serve_forever, name="webhook-receiver", daemon=True
+        ).start()
+
+        LOGGER.info("Webhook receiver listening on %s", self.url)
+
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
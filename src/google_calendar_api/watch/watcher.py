@@ -0,0 +1,225 @@
+from collections.abc import Callable, Hashable, Sequence
+from threading import Event, Lock, Thread
+from typing import TYPE_CHECKING, Any
+
+from typing_extensions import Self
+
+from ..log import LOGGER
+from ..schema.calendar import SyncEvent
+from ..schema.channel import Channel, Notification
+from .receiver import DEFAULT_COALESCE_DELAY, ChangeCoalescer, WebhookReceiver
+
+if TYPE_CHECKING:
+    from ..service.calendar import CalendarService
+
+__all__ = ["DEFAULT_RENEW_MARGIN", "CalendarWatcher"]
+
+DEFAULT_RENEW_MARGIN = 3600.0
+"""channel 過期前多少秒建立新的 channel"""
+
+RETRY_DELAY = 60.0
+
+
+class CalendarWatcher:
+    """
+    CalendarWatcher 以推播通知取代定時輪詢：每個日曆建立 channel，收到通知後以 `syncToken` 增量讀取
+
+    - 通知由 `WebhookReceiver` 接收，驗證 channel、token 與 resource id 後交給 `ChangeCoalescer`，
+      同一日曆在 `delay` 秒內的多次通知只會增量讀取一次
+    - channel 於過期前 `renew_margin` 秒建立新的 channel 後才停止舊的，期間的變更不會遺失
+    - 沒有變更時不會送出任何請求，只有更新 channel 時才會呼叫 API
+
+    Args:
+        calendar_services (Sequence[CalendarService]): 要監看的日曆
+        on_change (Callable[[str, SyncEvent], Any]): 有變更時以 (`calendarID`, 變更) 呼叫
+        address (str | None, optional): Google 通知的 HTTPS URL，None 時使用 receiver 的本機網址 (只適用於本地測試). Defaults to None.
+        host (str, optional): receiver 監聽的位址. Defaults to "127.0.0.1".
+        port (int, optional): receiver 監聽的 port. Defaults to 0.
+        path (str, optional): receiver 接收通知的路徑. Defaults to "/".
+        ttl (int | None, optional): channel 的存活秒數，None 時由 API 決定. Defaults to None.
+        renew_margin (float, optional): channel 過期前更新的秒數. Defaults to DEFAULT_RENEW_MARGIN.
+        delay (float, optional): 合併通知的等待秒數. Defaults to DEFAULT_COALESCE_DELAY.
+
+    Examples:
+        >>> with api.calendar_watcher("https://example.com/notify", on_change, port=8080):
+        ...     serve_forever()
+    """
+
+    def __init__(
+        self,
+        calendar_services: Sequence["CalendarService"],
+        on_change: Callable[[str, SyncEvent], Any],
+        address: str | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str = "/",
+        ttl: int | None = None,
+        renew_margin: float = DEFAULT_RENEW_MARGIN,
+        delay: float = DEFAULT_COALESCE_DELAY,
+    ) -> None:
+        from ..service.calendar import CalendarSync
+
+        self.calendar_services = {
+            service.calendar_id: service for service in calendar_services
+        }
+        self.syncs: dict[str, CalendarSync] = {
+            calendar_id: CalendarSync(service, store=service.store)
+            for calendar_id, service in self.calendar_services.items()
+        }
+        self.on_change = on_change
+        self.address = address
+        self.ttl = ttl
+        self.renew_margin = renew_margin
+        self.delay = delay
+        self.receiver = WebhookReceiver(
+            self._on_notification, host=host, port=port, path=path
+        )
+        self.channels: dict[str, tuple[str, Channel]] = {}
+        self._lock = Lock()
+        self._stop = Event()
+        self._coalescer: ChangeCoalescer | None = None
+        self._thread: Thread | None = None
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:
+        self.stop()
+
+    def _sync(self, calendar_id: Hashable) -> None:
+        sync_event = self.syncs[str(calendar_id)].sync()
+
+        if sync_event.events or sync_event.deleted:
+            self.on_change(str(calendar_id), sync_event)
+
+    def _watch(self, calendar_id: str) -> Channel:
+        from secrets import token_urlsafe
+
+        channel = self.calendar_services[calendar_id].watch_calendar_events(
+            self.address or self.receiver.url, token=token_urlsafe(32), ttl=self.ttl
+        )
+
+        with self._lock:
+            self.channels[channel.id] = (calendar_id, channel)
+
+        return channel
+
+    def _on_notification(self, notification: Notification) -> None:
+        from hmac import compare_digest
+
+        with self._lock:
+            entry = self.channels.get(notification.channel_id)
+
+        if entry is None:
+            LOGGER.debug("Notification for unknown channel %s", notification.channel_id)
+            return
+
+        calendar_id, channel = entry
+
+        if not compare_digest(notification.channel_token or "", channel.token or ""):
+            LOGGER.warning("Invalid token for channel %s", notification.channel_id)
+            return
+
+        if notification.resource_id != channel.resourceId:
+            LOGGER.warning(
+                "Unexpected resource %s for channel %s",
+                notification.resource_id,
+                notification.channel_id,
+            )
+            return
+
+        if notification.resource_state == "sync" or self._coalescer is None:
+            return
+
+        self._coalescer.notify(calendar_id)
+
+    def start(self) -> Self:
+        """start 啟動 receiver，完整同步每個日曆以取得 `syncToken` 後建立 channel"""
+        self._stop.clear()
+        self.receiver.start()
+        self._coalescer = ChangeCoalescer(self._sync, delay=self.delay)
+
+        for calendar_id in self.calendar_services:
+            self._sync(calendar_id)
+            self._watch(calendar_id)
+
+        self._thread = Thread(target=self._run, name="channel-renew", daemon=True)
+        self._thread.start()
+
+        return self
+
+    def _next_renewal(self) -> float:
+        from time import time
+
+        with self._lock:
+            expirations = [
+                expires_at
+                for _, channel in self.channels.values()
+                if (expires_at := channel.expires_at) is not None
+            ]
+
+        if not expirations:
+            return RETRY_DELAY * 60
+
+        return max(min(expirations) - self.renew_margin - time(), 0.0)
+
+    def renew(self) -> int:
+        """
+        renew 為即將過期的 channel 建立新的 channel，再停止舊的 channel
+
+        Returns:
+            int: 更新的 channel 數
+        """
+        from time import time
+
+        with self._lock:
+            expiring = [
+                (calendar_id, channel)
+                for calendar_id, channel in self.channels.values()
+                if channel.expires_at is not None
+                and channel.expires_at - time() <= self.renew_margin
+            ]
+
+        for calendar_id, channel in expiring:
+            self._watch(calendar_id)
+
+            with self._lock:
+                self.channels.pop(channel.id, None)
+
+            self.calendar_services[calendar_id].stop_channel(channel)
+
+        return len(expiring)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._next_renewal()):
+            try:
+                self.renew()
+            except Exception:
+                LOGGER.exception("Channel renewal failed, retry in %.0fs", RETRY_DELAY)
+
+                if self._stop.wait(RETRY_DELAY):
+                    break
+
+    def stop(self) -> None:
+        """stop 停止所有 channel、receiver 與尚未執行的增量讀取"""
+        self._stop.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        with self._lock:
+            channels, self.channels = list(self.channels.values()), {}
+
+        for calendar_id, channel in channels:
+            try:
+                self.calendar_services[calendar_id].stop_channel(channel)
+            except Exception:
+                LOGGER.exception("Failed to stop channel %s", channel.id)
+
+        self.receiver.stop()
+
+        if self._coalescer is not None:
+            self._coalescer.close()
+            self._coalescer = None
@@ -0,0 +1,94 @@
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from googleapiclient.discovery import Resource
+
+from benchmarks.server import FakeCalendarServer
+from google_calendar_api import GoogleCalendarAPI
+from google_calendar_api.calendar import Calendar
+from google_calendar_api.scheduler import (
+    RequestScheduler,
+    get_default_scheduler,
+    set_default_scheduler,
+)
+from google_calendar_api.service.calendar import CalendarService
+
+
+@pytest.fixture(autouse=True)
+def scheduler() -> Iterator[RequestScheduler]:
+    """不受速率限制且重試不等待的排程器"""
+    previous = get_default_scheduler()
+    scheduler = RequestScheduler(user_rate=1e9, project_rate=1e9, base_delay=0)
+    set_default_scheduler(scheduler)
+
+    yield scheduler
+
+    set_default_scheduler(previous)
+
+
+@pytest.fixture
+def server() -> Iterator[FakeCalendarServer]:
+    with FakeCalendarServer() as server:
+        yield server
+
+
+@pytest.fixture
+def resource(server: FakeCalendarServer) -> Resource:
+    """指向 `server` 的 Calendar v3 `Resource`"""
+    from google.oauth2.credentials import Credentials
+    from googleapiclient.discovery import build_from_document
+
+    from google_calendar_api.discovery import get_discovery_document
+
+    return build_from_document(
+        server.discovery_document(get_discovery_document("calendar", "v3")),
+        credentials=Credentials(token="test-token"),
+    )
+
+
+@pytest.fixture
+def calendar(resource: Resource) -> Calendar:
+    return Calendar(service=resource)
+
+
+@pytest.fixture
+def calendar_service(resource: Resource) -> CalendarService:
+    return CalendarService(service=resource)
+
+
+@pytest.fixture
+def api_factory(server: FakeCalendarServer, tmp_path: Path):
+    """建立指向 `server` 的 `GoogleCalendarAPI`，discovery document 由 `tmp_path` 的快取提供"""
+    from google_calendar_api.discovery import get_discovery_document
+    from google_calendar_api.discovery.discovery import _cache_file_path, _write_file
+
+    _write_file(
+        _cache_file_path(str(tmp_path), "calendar", "v3"),
+        server.discovery_document(get_discovery_document("calendar", "v3")),
+    )
+    calendar_config_path = tmp_path / "calendar.json"
+    calendar_config_path.write_text(
+        json.dumps({"calendar_id": "primary", "time_zone": "UTC"}), encoding="UTF-8"
+    )
+
+    def factory(**kwargs) -> GoogleCalendarAPI:
+        return GoogleCalendarAPI(
+            token="test-token",
+            refresh_token="test-refresh-token",
+            token_uri=f"{server.url}/token",
+            client_id="test-client",
+            client_secret="test-secret",
+            scopes=["https://www.googleapis.com/auth/calendar"],
+            calendar_config_path=str(calendar_config_path),
+            discovery_cache_dir=str(tmp_path),
+            **kwargs,
+        )
+
+    return factory
+
+
+@pytest.fixture
+def api(api_factory) -> GoogleCalendarAPI:
+    return api_factory()
@@ -0,0 +1,228 @@
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from benchmarks.server import FakeCalendarServer
+from google_calendar_api import GoogleCalendarAPI
+from google_calendar_api.analytics import (
+    STATUSES,
+    EventAggregate,
+    EventFrame,
+    Shard,
+    aggregate_columns,
+    fetch_columns,
+    plan_shards,
+)
+from google_calendar_api.calendar import Calendar
+from google_calendar_api.utils._datetime import to_timestamp
+
+CALENDAR_IDS = ["primary", "team"]
+TIME_MIN = "2024-01-01T00:00:00Z"
+TIME_MAX = "2024-01-03T00:00:00Z"
+
+
+@pytest.fixture
+def seeded(server: FakeCalendarServer) -> FakeCalendarServer:
+    # 45 分鐘的事件每 30 分鐘一個，部分事件跨越 shard 的邊界
+    server.seed("primary", 80, duration=timedelta(minutes=45))
+    server.seed(
+        "team",
+        30,
+        start=datetime(2023, 12, 31, 23, tzinfo=timezone.utc),
+        step=timedelta(hours=1, minutes=10),
+        duration=timedelta(hours=3),
+    )
+
+    return server
+
+
+def single_process(calendar: Calendar) -> EventAggregate:
+    result = EventAggregate()
+
+    for calendar_id in CALENDAR_IDS:
+        result.merge(
+            aggregate_columns(
+                fetch_columns(calendar, Shard(calendar_id, TIME_MIN, TIME_MAX))
+            )
+        )
+
+    return result
+
+
+def test_plan_shards_covers_range():
+    shards = plan_shards(["primary"], TIME_MIN, TIME_MAX, shard_days=0.75)
+
+    assert [(shard.time_min, shard.time_max, shard.first) for shard in shards] == [
+        (TIME_MIN, "2024-01-01T18:00:00Z", True),
+        ("2024-01-01T18:00:00Z", "2024-01-02T12:00:00Z", False),
+        ("2024-01-02T12:00:00Z", TIME_MAX, False),
+    ]
+
+    with pytest.raises(ValueError):
+        plan_shards(["primary"], TIME_MIN, TIME_MAX, shard_days=0)
+
+
+def test_sharded_reduction_matches_single_shard(seeded, calendar: Calendar):
+    sharded = EventAggregate()
+
+    for shard in plan_shards(CALENDAR_IDS, TIME_MIN, TIME_MAX, shard_days=0.25):
+        sharded.merge(aggregate_columns(fetch_columns(calendar, shard, max_results=7)))
+
+    expected = single_process(calendar)
+
+    assert expected.total.count == 80 + 30
+    assert sharded == expected
+
+
+def test_sharded_reduction_with_all_day_events(
+    seeded: FakeCalendarServer, calendar: Calendar
+):
+    seeded.time_zones["team"] = "Asia/Taipei"
+
+    for day in ("2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"):
+        calendar.insert_event(
+            "team",
+            summary=f"all day {day}",
+            start_time=day,
+            end_time=(datetime.fromisoformat(day) + timedelta(days=1))
+            .date()
+            .isoformat(),
+        )
+
+    sharded = EventAggregate()
+
+    for shard in plan_shards(CALENDAR_IDS, TIME_MIN, TIME_MAX, shard_days=0.25):
+        sharded.merge(aggregate_columns(fetch_columns(calendar, shard, max_results=7)))
+
+    expected = single_process(calendar)
+    columns = fetch_columns(calendar, Shard("team", TIME_MIN, TIME_MAX))
+
+    # 全天事件以日曆的時區計算，2024-01-04 在台北時間開始於 2024-01-03T16:00Z，不在區間內
+    assert expected.by_calendar["team"].count == 30 + 3
+    assert to_timestamp("2024-01-02T16:00:00Z") in columns.start
+    assert sharded == expected
+
+
+def test_analyze_calendars_matches_single_process(
+    seeded, api: GoogleCalendarAPI, calendar: Calendar
+):
+    result = api.analyze_calendars(
+        CALENDAR_IDS,
+        time_min=TIME_MIN,
+        time_max=TIME_MAX,
+        shard_days=0.5,
+        max_workers=2,
+        user_rate=1e6,
+        project_rate=1e6,
+    )
+
+    assert result == single_process(calendar)
+
+
+def frame_item(
+    event_id: str, start: dict, end: dict, status: str | None = None
+) -> dict:
+    item = {"id": event_id, "start": start, "end": end}
+
+    return {**item, "status": status} if status else item
+
+
+def test_event_frame_codes_and_all_day():
+    frame = EventFrame.from_calendar_events(
+        [
+            (
+                "primary",
+                frame_item(
+                    "a",
+                    {"dateTime": "2024-01-01T09:00:00+08:00"},
+                    {"dateTime": "2024-01-01T10:00:00+08:00"},
+                ),
+            ),
+            (
+                "team",
+                frame_item(
+                    "b", {"date": "2024-01-02"}, {"date": "2024-01-03"}, "tentative"
+                ),
+            ),
+            (
+                "primary",
+                frame_item(
+                    "c",
+                    {"dateTime": "2024-01-01T02:00:00Z"},
+                    {"dateTime": "2024-01-01T03:00:00Z"},
+                    "cancelled",
+                ),
+            ),
+        ]
+    )
+
+    assert frame.ids == ["a", "b", "c"]
+    assert frame.calendars == ["primary", "team"]
+    assert list(frame.calendar_codes) == [0, 1, 0]
+    assert [STATUSES[code] for code in frame.status_codes] == [
+        "confirmed",
+        "tentative",
+        "cancelled",
+    ]
+    assert list(frame.all_day) == [0, 1, 0]
+    assert list(frame.start) == [
+        to_timestamp("2024-01-01T01:00:00Z"),
+        to_timestamp("2024-01-02T00:00:00Z"),
+        to_timestamp("2024-01-01T02:00:00Z"),
+    ]
+
+    restored = pickle.loads(pickle.dumps(frame))
+    restored.append(
+        frame_item("d", {"date": "2024-01-04"}, {"date": "2024-01-05"}), "team"
+    )
+
+    assert restored.calendars == ["primary", "team"]
+    assert list(restored.calendar_codes) == [0, 1, 0, 1]
+
+
+def test_event_frame_to_numpy_shares_memory():
+    np = pytest.importorskip("numpy")
+    frame = EventFrame.from_events(
+        [
+            frame_item(
+                "a",
+                {"dateTime": "2024-01-01T09:00:00Z"},
+                {"dateTime": "2024-01-01T10:30:00Z"},
+            ),
+            frame_item(
+                "b", {"date": "2024-01-02"}, {"date": "2024-01-03"}, "cancelled"
+            ),
+        ]
+    )
+
+    columns = frame.to_numpy()
+
+    assert np.shares_memory(columns["start"], np.frombuffer(frame.start))
+    assert (columns["end"] - columns["start"]).tolist() == [5400.0, 86400.0]
+    assert columns["all_day"].tolist() == [False, True]
+    assert columns["statuses"][columns["status"]].tolist() == ["confirmed", "cancelled"]
+    assert columns["calendars"][columns["calendar"]].tolist() == ["primary"] * 2
+
+    # NumPy 陣列存在期間無法加入事件，且欄位長度不會不一致
+    with pytest.raises(BufferError):
+        frame.append(
+            frame_item(
+                "c",
+                {"dateTime": "2024-01-03T09:00:00Z"},
+                {"dateTime": "2024-01-03T10:00:00Z"},
+            )
+        )
+
+    assert len(frame.ids) == len(frame.status_codes) == len(frame) == 2
+
+    del columns
+    frame.append(
+        frame_item(
+            "c",
+            {"dateTime": "2024-01-03T09:00:00Z"},
+            {"dateTime": "2024-01-03T10:00:00Z"},
+        )
+    )
+
+    assert len(frame) == 3
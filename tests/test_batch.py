@@ -0,0 +1,150 @@
+from googleapiclient.errors import HttpError
+
+from benchmarks.server import FakeCalendarServer
+from google_calendar_api.calendar import MAX_BATCH_SIZE, Calendar
+from google_calendar_api.schema.calendar import Event
+from google_calendar_api.service.calendar import CalendarService
+
+START = "2024-01-01T09:00:00Z"
+END = "2024-01-01T10:00:00Z"
+
+
+def test_batch_splits_into_chunks(server: FakeCalendarServer, calendar: Calendar):
+    with calendar.batch() as batch:
+        for index in range(MAX_BATCH_SIZE + 10):
+            batch.insert_event(
+                "primary", summary=f"event {index}", start_time=START, end_time=END
+            )
+
+    assert server.requests["batch"] == 2
+    assert server.requests["batched.events.insert"] == MAX_BATCH_SIZE + 10
+    assert len(batch.results) == MAX_BATCH_SIZE + 10
+
+
+def test_batch_size_limits_chunk(server: FakeCalendarServer, calendar: Calendar):
+    batch = calendar.batch(batch_size=3)
+
+    for index in range(7):
+        batch.insert_event(
+            "primary", summary=f"event {index}", start_time=START, end_time=END
+        )
+
+    batch.execute()
+
+    assert server.requests["batch"] == 3
+
+
+def test_batch_results_follow_queue_order(calendar: Calendar):
+    batch = calendar.batch(batch_size=4)
+    summaries = [f"event {index}" for index in range(10)]
+
+    for summary in summaries:
+        batch.insert_event("primary", summary=summary, start_time=START, end_time=END)
+
+    results = batch.execute()
+
+    assert all(isinstance(result, Event) for result in results)
+    assert [result.summary for result in results] == summaries  # type: ignore
+
+
+def test_batch_surfaces_item_errors(calendar: Calendar):
+    created = calendar.insert_event(
+        "primary", summary="kept", start_time=START, end_time=END
+    )
+
+    with calendar.batch() as batch:
+        batch.patch_event("primary", created.id, summary="patched")
+        batch.delete_event("primary", "missing")
+        batch.delete_event("primary", created.id)
+
+    patched, missing, deleted = batch.results
+
+    assert isinstance(patched, Event) and patched.summary == "patched"
+    assert isinstance(missing, HttpError) and missing.resp.status == 404
+    assert deleted is None
+
+
+def test_service_batch_binds_calendar(
+    server: FakeCalendarServer, calendar_service: CalendarService
+):
+    with calendar_service.batch(time_zone="UTC") as batch:
+        batch.add_calendar_event(summary="a", start_time=START, end_time=END)
+        batch.add_calendar_event(summary="b", start_time=START, end_time=END)
+
+    assert [result.start.timeZone for result in batch.results] == ["UTC", "UTC"]  # type: ignore
+    assert server.requests["batch"] == 1
+
+
+def test_batch_keeps_results_when_chunk_fails(
+    server: FakeCalendarServer, calendar: Calendar, monkeypatch
+):
+    from googleapiclient.http import BatchHttpRequest
+
+    execute = BatchHttpRequest.execute
+    calls: list[int] = []
+
+    def flaky(self, *args, **kwargs):
+        calls.append(len(calls))
+
+        if len(calls) == 2:
+            raise ConnectionError("connection reset")
+
+        return execute(self, *args, **kwargs)
+
+    monkeypatch.setattr(BatchHttpRequest, "execute", flaky)
+    batch = calendar.batch(batch_size=2)
+
+    for index in range(6):
+        batch.insert_event(
+            "primary", summary=f"event {index}", start_time=START, end_time=END
+        )
+
+    results = batch.execute()
+
+    assert len(calls) == 3
+    assert [type(result) for result in results] == [
+        Event,
+        Event,
+        ConnectionError,
+        ConnectionError,
+        Event,
+        Event,
+    ]
+    assert results[2] is results[3]
+    assert server.requests["batched.events.insert"] == 4
+
+
+def test_import_retries_failed_chunk(
+    server: FakeCalendarServer, calendar_service: CalendarService, monkeypatch
+):
+    from googleapiclient.http import BatchHttpRequest
+
+    from google_calendar_api.bulk import EventImporter
+
+    execute = BatchHttpRequest.execute
+    calls: list[int] = []
+
+    def flaky(self, *args, **kwargs):
+        calls.append(len(calls))
+
+        if len(calls) == 1:
+            raise ConnectionError("connection reset")
+
+        return execute(self, *args, **kwargs)
+
+    monkeypatch.setattr(BatchHttpRequest, "execute", flaky)
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    result = EventImporter(calendar_service).run(
+        (
+            {
+                "summary": f"imported {index}",
+                "start": {"dateTime": START},
+                "end": {"dateTime": END},
+            }
+            for index in range(3)
+        ),
+        source="test",
+    )
+
+    assert (result.inserted, result.existing, result.failed) == (3, 0, 0)
+    assert len(calls) == 2
@@ -0,0 +1,115 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.server import FakeCalendarServer
+from google_calendar_api import GoogleCalendarAPI
+from google_calendar_api.bulk import read_records, to_event_param, write_events
+from google_calendar_api.calendar import Calendar
+
+TIME_MIN = "2024-01-01T00:00:00Z"
+TIME_MAX = "2024-01-02T00:00:00Z"
+
+
+def snapshot(api: GoogleCalendarAPI) -> list[tuple]:
+    return [
+        (
+            event.summary,
+            event.description,
+            event.start.model_dump(exclude_none=True),
+            event.end.model_dump(exclude_none=True),
+            [attendee.email for attendee in event.attendees],
+        )
+        for event in api.get_calendar_events(time_min=TIME_MIN, time_max=TIME_MAX)
+    ]
+
+
+def clear(api: GoogleCalendarAPI, calendar: Calendar) -> None:
+    for event in api.get_calendar_events(time_min=TIME_MIN, time_max=TIME_MAX):
+        calendar.delete_event("primary", event.id)
+
+
+@pytest.mark.parametrize("suffix", ["jsonl", "ics"])
+def test_export_import_round_trip(
+    server: FakeCalendarServer,
+    api: GoogleCalendarAPI,
+    calendar: Calendar,
+    tmp_path: Path,
+    suffix: str,
+):
+    server.seed("primary", 5)
+    path = str(tmp_path / f"events.{suffix}")
+    exported = snapshot(api)
+
+    assert api.export_calendar_events(path, time_min=TIME_MIN, time_max=TIME_MAX) == 5
+
+    clear(api, calendar)
+    result = api.import_calendar_events(path)
+
+    assert (result.position, result.inserted, result.existing, result.failed) == (
+        5,
+        5,
+        0,
+        0,
+    )
+    assert snapshot(api) == exported
+
+    # 重新匯入同一個檔案時，固定的事件id 以 409 回應，不會重複新增
+    again = api.import_calendar_events(path)
+
+    assert (again.inserted, again.existing) == (0, 5)
+    assert snapshot(api) == exported
+
+
+def test_import_resumes_from_checkpoint(
+    server: FakeCalendarServer, api: GoogleCalendarAPI, tmp_path: Path
+):
+    path = tmp_path / "events.jsonl"
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+    path.write_text(
+        "".join(
+            json.dumps(
+                {
+                    "summary": f"imported {index}",
+                    "start": {"dateTime": f"2024-01-01T0{index}:00:00Z"},
+                    "end": {"dateTime": f"2024-01-01T0{index}:30:00Z"},
+                }
+            )
+            + "\n"
+            for index in range(4)
+        ),
+        encoding="UTF-8",
+    )
+
+    first = api.import_calendar_events(
+        str(path), checkpoint_path=checkpoint_path, chunk_size=2
+    )
+    server.reset_requests()
+    second = api.import_calendar_events(
+        str(path), checkpoint_path=checkpoint_path, chunk_size=2
+    )
+
+    assert (first.position, first.inserted) == (4, 4)
+    assert (second.position, second.inserted) == (4, 4)
+    assert server.requests["batch"] == 0
+
+
+def test_all_day_records_round_trip(calendar: Calendar, tmp_path: Path):
+    event = calendar.insert_event(
+        "primary",
+        summary="line\nbreak, comma; semicolon",
+        start_time="2024-01-01",
+        end_time="2024-01-02",
+        description="all day",
+    )
+
+    for suffix in ("jsonl", "ics"):
+        path = str(tmp_path / f"event.{suffix}")
+        write_events([event], path)
+        [record] = read_records(path)
+        param = to_event_param(record)
+
+        assert param["summary"] == event.summary
+        assert param["description"] == "all day"
+        assert (param["start_time"], param["end_time"]) == ("2024-01-01", "2024-01-02")
@@ -0,0 +1,144 @@
+from googleapiclient.discovery import Resource
+
+from benchmarks.server import FakeCalendarServer
+from google_calendar_api.calendar import Calendar
+from google_calendar_api.schema.parse import EventView
+from google_calendar_api.service.calendar import CalendarService
+
+START = "2024-01-01T09:00:00+08:00"
+END = "2024-01-01T10:00:00+08:00"
+TIME_ZONE = "Asia/Taipei"
+
+
+def test_update_keeps_time_zone(calendar: Calendar):
+    event = calendar.insert_event(
+        "primary", summary="a", start_time=START, end_time=END, time_zone=TIME_ZONE
+    )
+
+    updated = calendar.update_event(
+        "primary", event.id, start_time="2024-01-01T11:00:00+08:00"
+    )
+
+    assert updated.start.dateTime == "2024-01-01T11:00:00+08:00"  # type: ignore
+    assert updated.start.timeZone == TIME_ZONE  # type: ignore
+    assert updated.end.timeZone == TIME_ZONE  # type: ignore
+
+
+def test_update_switches_to_all_day(calendar: Calendar):
+    event = calendar.insert_event(
+        "primary", summary="a", start_time=START, end_time=END, time_zone=TIME_ZONE
+    )
+
+    updated = calendar.update_event(
+        "primary", event.id, start_time="2024-01-02", end_time="2024-01-03"
+    )
+
+    assert updated.start.model_dump() == {"date": "2024-01-02"}
+
+
+def test_replace_keeps_time_zone_after_conflict(
+    server: FakeCalendarServer, calendar: Calendar, calendar_service: CalendarService
+):
+    event = calendar.insert_event(
+        "primary", summary="a", start_time=START, end_time=END, time_zone=TIME_ZONE
+    )
+    calendar.patch_event("primary", event.id, summary="changed elsewhere")
+    server.reset_requests()
+
+    replaced = calendar_service.replace_calendar_event(
+        event, end_time="2024-01-01T12:00:00+08:00"
+    )
+
+    assert server.requests["events.get"] == 1
+    assert replaced.summary == "changed elsewhere"
+    assert replaced.end.dateTime == "2024-01-01T12:00:00+08:00"  # type: ignore
+    assert replaced.end.timeZone == TIME_ZONE  # type: ignore
+
+
+def test_sync_events_in_trusted_mode(server: FakeCalendarServer, resource: Resource):
+    server.seed("primary", 3)
+    calendar = Calendar(service=resource, parse_mode="trusted")
+
+    full = calendar.sync_events("primary")
+
+    assert full.full_sync
+    assert all(isinstance(event, EventView) for event in full.events)
+    assert [event.summary for event in full.events] == ["event 0", "event 1", "event 2"]
+
+    calendar.patch_event("primary", full.events[0].id, summary="changed")
+    calendar.delete_event("primary", full.events[1].id)
+
+    changes = calendar.sync_events("primary", sync_token=full.sync_token)
+
+    assert [event.summary for event in changes.events] == ["changed"]
+    assert changes.deleted == [full.events[1].id]
+
+
+def test_expand_recurring_series_in_trusted_mode(
+    calendar: Calendar, resource: Resource
+):
+    calendar.upsert_event(
+        "primary",
+        summary="daily",
+        start_time="2024-01-01T09:00:00Z",
+        end_time="2024-01-01T10:00:00Z",
+        time_zone="UTC",
+        recurrence=["RRULE:FREQ=DAILY;COUNT=5"],
+    )
+    window = {"time_min": "2024-01-01T00:00:00Z", "time_max": "2024-01-04T00:00:00Z"}
+
+    strict = list(CalendarService(service=resource).expand_calendar_events(**window))
+    trusted = list(
+        CalendarService(service=resource, parse_mode="trusted").expand_calendar_events(
+            **window
+        )
+    )
+
+    assert len(trusted) == 3
+    assert all(isinstance(event, EventView) for event in trusted)
+    assert [(event.id, event.start, event.end) for event in trusted] == [
+        (event.id, event.start, event.end) for event in strict
+    ]
+
+
+def test_streamed_pages_are_recorded_when_read(server: FakeCalendarServer):
+    from google.oauth2.credentials import Credentials
+    from googleapiclient.discovery import build_from_document
+
+    from google_calendar_api.discovery import get_discovery_document
+    from google_calendar_api.instrumentation import (
+        RequestRecord,
+        add_request_hook,
+        remove_request_hook,
+    )
+    from google_calendar_api.transport import PooledHttp
+
+    server.seed("primary", 5)
+    calendar = Calendar(
+        service=build_from_document(
+            server.discovery_document(get_discovery_document("calendar", "v3")),
+            http=PooledHttp(Credentials(token="test-token")),
+        )
+    )
+    records: list[RequestRecord] = []
+    hook = records.append
+    add_request_hook(hook)
+
+    try:
+        events = calendar.iter_events("primary", max_results=2)
+        next(events)
+
+        assert records == []
+
+        assert len(list(events)) == 4
+
+        first = calendar.iter_events("primary", max_results=2)
+        next(first)
+        first.close()
+    finally:
+        remove_request_hook(hook)
+
+    assert [record.method for record in records] == ["calendar.events.list"] * 4
+    assert all(record.status == 200 and record.error is None for record in records)
+    assert all(record.response_bytes > 0 for record in records)
+    assert records[0].response_bytes > records[2].response_bytes
@@ -0,0 +1,92 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from google.oauth2.credentials import Credentials
+
+from google_calendar_api.discovery import clear_resources, get_resource
+from google_calendar_api.discovery.discovery import _cache_file_path, _write_file
+
+
+def credentials(refresh_token: str = "refresh-token", **kwargs) -> Credentials:
+    return Credentials(
+        **{
+            "token": "token",
+            "refresh_token": refresh_token,
+            "token_uri": "http://127.0.0.1/token",
+            "client_id": "client",
+            "client_secret": "secret",
+            **kwargs,
+        }
+    )
+
+
+def test_resource_shared_across_credentials_objects():
+    clear_resources()
+
+    first = get_resource("calendar", "v3", credentials())
+    second = get_resource("calendar", "v3", credentials())
+
+    assert first is second
+    assert get_resource("calendar", "v3", credentials("other-user")) is not first
+
+    clear_resources()
+
+    assert get_resource("calendar", "v3", credentials()) is not first
+
+
+def test_resource_keyed_by_pool_size_and_cache_dir(tmp_path: Path):
+    clear_resources()
+
+    shared = get_resource("calendar", "v3", credentials())
+
+    assert get_resource("calendar", "v3", credentials(), pool_size=2) is not shared
+    assert (
+        get_resource("calendar", "v3", credentials(), cache_dir=str(tmp_path))
+        is not shared
+    )
+
+    clear_resources()
+
+
+def test_concurrent_cache_writes(tmp_path: Path):
+    path = _cache_file_path(str(tmp_path), "calendar", "v3")
+    contents = [f'{{"writer": {index}}}' * 1000 for index in range(16)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda content: _write_file(path, content), contents))
+
+    assert Path(path).read_text(encoding="UTF-8") in contents
+    assert [file.name for file in Path(path).parent.iterdir()] == [Path(path).name]
+
+
+def test_clients_share_credential_and_token_manager(api_factory):
+    clear_resources()
+
+    first, second = api_factory(), api_factory()
+    manager = second.credentials_service.token_manager
+
+    assert second.service is first.service
+    assert manager is first.credentials_service.token_manager
+    assert manager.credentials.credential is second.service._http.credentials
+
+    # 第二個用戶端的主動刷新會更新共用 Resource 實際使用的 token
+    second.service._http.credentials.token = None
+
+    assert manager.refresh()
+    assert first.service._http.credentials.token == manager.credentials.credential.token
+    assert first.service._http.credentials.token is not None
+
+    clear_resources()
+
+
+def test_credentials_key_includes_client_secret_and_token_uri():
+    clear_resources()
+
+    shared = get_resource("calendar", "v3", credentials())
+    other_secret = credentials(client_secret="other-secret")
+    other_uri = credentials(token_uri="http://127.0.0.1/other-token")
+
+    assert get_resource("calendar", "v3", other_secret) is not shared
+    assert get_resource("calendar", "v3", other_uri) is not shared
+
+    clear_resources()
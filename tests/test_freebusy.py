@@ -0,0 +1,95 @@
+from datetime import datetime, timezone
+
+import pytest
+from googleapiclient.discovery import Resource
+
+from benchmarks.server import FakeCalendarServer
+from google_calendar_api.freebusy import BusyIndex
+from google_calendar_api.schema.freebusy import FreeBusy
+from google_calendar_api.service.freebusy import FreeBusyQueryError, FreeBusyService
+
+TIME_MIN = "2024-01-01T00:00:00Z"
+TIME_MAX = "2024-01-02T00:00:00Z"
+
+
+def test_touching_intervals_merge():
+    index = BusyIndex([(10, 20), (20, 30)])
+
+    assert len(index) == 1
+    assert not index.is_free(19, 21)
+    assert index.first_free(after=15, duration=1) == 30
+
+
+def test_first_free_exact_gap():
+    index = BusyIndex([(10, 20), (25, 35)])
+
+    assert index.first_free(after=0, duration=10) == 0
+    assert index.first_free(after=12, duration=5) == 20
+    assert index.first_free(after=12, duration=6) == 35
+    assert index.first_free(after=21, duration=4) == 21
+    assert index.is_free(20, 25)
+    assert index.is_free(35, 40)
+
+
+def test_first_free_before_cutoff():
+    index = BusyIndex([(10, 20)])
+
+    assert index.first_free(after=20, duration=10, before=30) == 20
+    assert index.first_free(after=20, duration=10, before=29) is None
+    assert index.first_free(after=5, duration=10, before=25) is None
+
+
+def test_free_slots_at_boundaries():
+    index = BusyIndex([(10, 30)])
+
+    assert index.free_slots(0, 50, 10, count=5) == [(0, 10), (30, 40), (40, 50)]
+    assert index.free_slots(0, 49, 10, count=5) == [(0, 10), (30, 40)]
+    assert index.free_slots(10, 30, 1, count=5) == []
+
+
+def test_add_after_query_rebuilds():
+    index = BusyIndex([(10, 20)])
+
+    assert index.first_free(after=20, duration=5) == 20
+
+    index.add(18, 26)
+
+    assert index.first_free(after=20, duration=5) == 26
+
+
+def test_find_free_slots_skips_busy_periods(
+    server: FakeCalendarServer, resource: Resource
+):
+    server.seed("team", 1, start=datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    [slot] = FreeBusyService(resource).find_free_slots(
+        ["team"], TIME_MIN, TIME_MAX, duration=3600
+    )
+
+    assert slot.start == "2024-01-01T00:20:00+00:00"
+
+
+def test_find_free_slots_raises_on_calendar_errors(resource: Resource, monkeypatch):
+    freebusy_service = FreeBusyService(resource)
+    monkeypatch.setattr(
+        freebusy_service.calendar,
+        "query_freebusy",
+        lambda calendar_ids, **kwargs: FreeBusy.model_validate(
+            {
+                "kind": "calendar#freeBusy",
+                "timeMin": TIME_MIN,
+                "timeMax": TIME_MAX,
+                "calendars": {
+                    "primary": {"busy": []},
+                    "missing": {"errors": [{"domain": "global", "reason": "notFound"}]},
+                },
+            }
+        ),
+    )
+
+    with pytest.raises(FreeBusyQueryError) as info:
+        freebusy_service.find_free_slots(
+            ["primary", "missing"], TIME_MIN, TIME_MAX, duration=3600
+        )
+
+    assert info.value.errors == {"missing": ["notFound"]}
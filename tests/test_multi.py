@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.server import FakeCalendarServer
+from google_calendar_api.calendar import Calendar
+from google_calendar_api.service.calendar import merge_calendars_events
+from google_calendar_api.utils._datetime import to_timestamp
+
+TIME_MIN = "2024-01-01T00:00:00Z"
+TIME_MAX = "2024-01-02T00:00:00Z"
+
+
+def start_of(item) -> float:
+    return to_timestamp(item[1].start.dateTime)
+
+
+def test_merge_is_ordered_across_calendars(
+    server: FakeCalendarServer, calendar: Calendar
+):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    server.seed("primary", 12, start=start, step=timedelta(minutes=30))
+    server.seed("team", 5, start=start + timedelta(minutes=10), step=timedelta(hours=1))
+    server.seed("room", 3, start=start + timedelta(minutes=45), step=timedelta(hours=2))
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        merged = list(
+            merge_calendars_events(
+                calendar,
+                ["primary", "team", "room"],
+                executor,
+                time_min=TIME_MIN,
+                time_max=TIME_MAX,
+                max_results=2,
+            )
+        )
+
+    assert len(merged) == 12 + 5 + 3
+    assert [start_of(item) for item in merged] == sorted(
+        start_of(item) for item in merged
+    )
+    assert [
+        event.summary for calendar_id, event in merged if calendar_id == "team"
+    ] == [f"event {index}" for index in range(5)]
+    assert server.requests["events.list"] == 6 + 3 + 2
+
+
+def test_multi_calendar_events_from_api(server: FakeCalendarServer, api):
+    server.seed("primary", 3)
+    server.seed("team", 3, start=datetime(2024, 1, 1, 0, 15, tzinfo=timezone.utc))
+
+    merged = list(
+        api.get_multi_calendar_events(
+            ["primary", "team"], time_min=TIME_MIN, time_max=TIME_MAX
+        )
+    )
+
+    assert [calendar_id for calendar_id, _ in merged] == ["primary", "team"] * 3
+
+
+def test_multi_calendar_events_default_page_size(server: FakeCalendarServer, api):
+    from google_calendar_api.service.calendar import MERGE_PAGE_SIZE
+
+    step = timedelta(minutes=2)
+    server.seed("primary", 300, step=step)
+    server.seed("team", 300, step=step)
+
+    merged = list(
+        api.get_multi_calendar_events(
+            ["primary", "team"], time_min=TIME_MIN, time_max=TIME_MAX
+        )
+    )
+
+    # 每頁預設為 MERGE_PAGE_SIZE，同時保留的事件數不會隨 MAX_LIST_RESULTS 增加
+    assert MERGE_PAGE_SIZE == 250
+    assert len(merged) == 600
+    assert server.requests["events.list"] == 4
@@ -0,0 +1,261 @@
+from datetime import date, timedelta
+
+import pytest
+
+from google_calendar_api.recurrence import (
+    RecurrenceRule,
+    RecurrenceSet,
+    expand_event,
+    expand_events,
+)
+from google_calendar_api.schema.calendar import CancelledEvent, Event
+
+ORGANIZER = {"email": "owner@example.com", "self": True}
+
+
+def event(
+    start: str,
+    end: str,
+    recurrence: list[str] | None = None,
+    time_zone: str | None = None,
+    **kwargs,
+) -> Event:
+    def time(value: str) -> dict:
+        if "T" not in value:
+            return {"date": value}
+
+        return (
+            {"dateTime": value, "timeZone": time_zone}
+            if time_zone
+            else {"dateTime": value}
+        )
+
+    return Event.model_validate(
+        {
+            "kind": "calendar#event",
+            "etag": '"etag"',
+            "id": "series",
+            "status": "confirmed",
+            "htmlLink": "https://calendar.google.com/event",
+            "iCalUID": "series@google.com",
+            "sequence": 0,
+            "reminders": {"useDefault": True},
+            "eventType": "default",
+            "created": "2024-01-01T00:00:00Z",
+            "updated": "2024-01-01T00:00:00Z",
+            "summary": "series",
+            "creator": ORGANIZER,
+            "organizer": ORGANIZER,
+            "start": time(start),
+            "end": time(end),
+            "recurrence": recurrence,
+            **kwargs,
+        }
+    )
+
+
+def starts(master: Event, time_min: str, time_max: str) -> list[str]:
+    return [
+        getattr(item.start, "dateTime", None) or item.start.date  # type: ignore
+        for item in expand_event(master, time_min, time_max)
+    ]
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "FREQ=DAILY;INTERVAL=3",
+        "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE,FR",
+        "FREQ=WEEKLY;INTERVAL=3;BYDAY=SU,TU;WKST=SU",
+        "FREQ=MONTHLY;INTERVAL=2;BYDAY=-1FR",
+        "FREQ=MONTHLY;BYMONTHDAY=31",
+        "FREQ=YEARLY;BYMONTH=2,8;BYDAY=2TU",
+    ],
+)
+def test_first_index_skips_whole_periods(line: str):
+    rule = RecurrenceRule.parse(line)
+    dtstart, start, stop = date(2023, 5, 17), date(2025, 3, 10), date(2026, 6, 1)
+
+    skipped = [day for day in rule.iter_dates(dtstart, stop, start) if day >= start]
+    full = [day for day in rule.iter_dates(dtstart, stop) if day >= start]
+
+    assert skipped == full
+    assert full
+
+
+def test_weekly_by_day_with_interval():
+    master = event(
+        "2024-01-01T09:00:00Z",
+        "2024-01-01T10:00:00Z",
+        ["RRULE:FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE,FR"],
+    )
+
+    assert starts(master, "2024-01-01T00:00:00Z", "2024-01-08T00:00:00Z") == [
+        "2024-01-01T09:00:00+00:00",
+        "2024-01-03T09:00:00+00:00",
+        "2024-01-05T09:00:00+00:00",
+    ]
+    # 2024-01-08 的那一週不在間隔內，跳過之前的週期後仍從正確的週開始
+    assert starts(master, "2024-03-01T00:00:00Z", "2024-03-15T00:00:00Z") == [
+        "2024-03-01T09:00:00+00:00",
+        "2024-03-11T09:00:00+00:00",
+        "2024-03-13T09:00:00+00:00",
+    ]
+
+
+def test_monthly_last_friday():
+    master = event(
+        "2024-01-26",
+        "2024-01-27",
+        ["RRULE:FREQ=MONTHLY;BYDAY=-1FR;COUNT=4"],
+    )
+
+    assert starts(master, "2024-01-01T00:00:00Z", "2025-01-01T00:00:00Z") == [
+        "2024-01-26",
+        "2024-02-23",
+        "2024-03-29",
+        "2024-04-26",
+    ]
+
+
+def test_monthly_by_set_pos_last_weekday():
+    master = event(
+        "2024-01-31T17:00:00Z",
+        "2024-01-31T18:00:00Z",
+        ["RRULE:FREQ=MONTHLY;BYDAY=MO,TU,WE,TH,FR;BYSETPOS=-1;COUNT=3"],
+    )
+
+    assert starts(master, "2024-01-01T00:00:00Z", "2025-01-01T00:00:00Z") == [
+        "2024-01-31T17:00:00+00:00",
+        "2024-02-29T17:00:00+00:00",
+        "2024-03-29T17:00:00+00:00",
+    ]
+
+
+def test_until_is_inclusive():
+    timed = event(
+        "2024-01-01T09:00:00Z",
+        "2024-01-01T10:00:00Z",
+        ["RRULE:FREQ=DAILY;UNTIL=20240105T090000Z"],
+    )
+    all_day = event("2024-01-01", "2024-01-02", ["RRULE:FREQ=DAILY;UNTIL=20240103"])
+
+    assert len(starts(timed, "2024-01-01T00:00:00Z", "2024-02-01T00:00:00Z")) == 5
+    assert starts(all_day, "2024-01-01T00:00:00Z", "2024-02-01T00:00:00Z") == [
+        "2024-01-01",
+        "2024-01-02",
+        "2024-01-03",
+    ]
+
+
+def test_exdate_with_tzid_and_utc():
+    master = event(
+        "2024-01-01T09:00:00-05:00",
+        "2024-01-01T10:00:00-05:00",
+        [
+            "RRULE:FREQ=DAILY;COUNT=4",
+            "EXDATE;TZID=America/New_York:20240102T090000",
+            "EXDATE:20240103T140000Z",
+        ],
+        time_zone="America/New_York",
+    )
+
+    # 被排除的日期仍計入 COUNT
+    assert starts(master, "2024-01-01T00:00:00Z", "2024-02-01T00:00:00Z") == [
+        "2024-01-01T09:00:00-05:00",
+        "2024-01-04T09:00:00-05:00",
+    ]
+
+
+def test_keeps_local_time_across_dst():
+    master = event(
+        "2024-03-04T09:00:00-05:00",
+        "2024-03-04T10:00:00-05:00",
+        ["RRULE:FREQ=WEEKLY;COUNT=3"],
+        time_zone="America/New_York",
+    )
+
+    instances = list(
+        expand_event(master, "2024-03-01T00:00:00Z", "2024-04-01T00:00:00Z")
+    )
+
+    assert [item.start.dateTime for item in instances] == [  # type: ignore
+        "2024-03-04T09:00:00-05:00",
+        "2024-03-11T09:00:00-04:00",
+        "2024-03-18T09:00:00-04:00",
+    ]
+    assert [item.end.dateTime for item in instances] == [  # type: ignore
+        "2024-03-04T10:00:00-05:00",
+        "2024-03-11T10:00:00-04:00",
+        "2024-03-18T10:00:00-04:00",
+    ]
+    assert instances[1].id == "series_20240311T130000Z"
+
+
+def test_all_day_yearly_on_leap_day():
+    master = event("2024-02-29", "2024-03-01", ["RRULE:FREQ=YEARLY;COUNT=3"])
+
+    instances = list(
+        expand_event(master, "2024-01-01T00:00:00Z", "2040-01-01T00:00:00Z")
+    )
+
+    assert [item.id for item in instances] == [
+        "series_20240229",
+        "series_20280229",
+        "series_20320229",
+    ]
+    assert instances[1].end.date == "2028-03-01"  # type: ignore
+
+
+def test_recurrence_set_window_skips_earlier_periods():
+    master = event(
+        "2020-01-06T09:00:00Z", "2020-01-06T10:00:00Z", ["RRULE:FREQ=WEEKLY;BYDAY=MO"]
+    )
+    start = date(2024, 1, 1)
+    recurrence = RecurrenceSet(master)
+
+    first = next(
+        day
+        for day in recurrence.occurrences(start, start + timedelta(days=30))
+        if day.date() >= start  # type: ignore
+    )
+
+    assert first.isoformat() == "2024-01-01T09:00:00+00:00"
+
+
+def test_expand_events_replaces_exceptions():
+    master = event(
+        "2024-01-01T09:00:00Z",
+        "2024-01-01T10:00:00Z",
+        ["RRULE:FREQ=DAILY;COUNT=4"],
+    )
+    moved = event(
+        "2024-01-02T15:00:00Z",
+        "2024-01-02T16:00:00Z",
+        id="series_20240102T090000Z",
+        summary="moved",
+        recurringEventId="series",
+        originalStartTime={"dateTime": "2024-01-02T09:00:00Z"},
+    )
+    single = event(
+        "2024-01-02T12:00:00Z", "2024-01-02T13:00:00Z", id="single", summary="single"
+    )
+    cancelled = CancelledEvent(
+        id="series_20240103T090000Z",
+        recurringEventId="series",
+        originalStartTime={"dateTime": "2024-01-03T09:00:00Z"},  # type: ignore
+    )
+
+    expanded = expand_events(
+        [master, moved, single],
+        "2024-01-01T00:00:00Z",
+        "2024-02-01T00:00:00Z",
+        [cancelled],
+    )
+
+    assert [(item.id, item.summary) for item in expanded] == [
+        ("series_20240101T090000Z", "series"),
+        ("single", "single"),
+        ("series_20240102T090000Z", "moved"),
+        ("series_20240104T090000Z", "series"),
+    ]
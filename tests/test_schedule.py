@@ -0,0 +1,194 @@
+from benchmarks.server import FakeCalendarServer
+from google_calendar_api import GoogleCalendarAPI
+from google_calendar_api.analytics import EventFrame
+from google_calendar_api.calendar import Calendar
+from google_calendar_api.schedule import EventMove, find_conflicts, plan_reschedule
+from google_calendar_api.schema.calendar import Event
+from google_calendar_api.schema.freebusy import TimePeriod
+from google_calendar_api.utils._datetime import to_timestamp
+
+TIME_MIN = "2024-01-01T09:00:00Z"
+TIME_MAX = "2024-01-01T17:00:00Z"
+
+
+def at(clock: str) -> str:
+    return f"2024-01-01T{clock}:00Z"
+
+
+def ts(clock: str) -> int:
+    return int(to_timestamp(at(clock)))
+
+
+def item(event_id: str, start: str, end: str, status: str | None = None) -> dict:
+    if len(start) == 10:
+        times = {"start": {"date": start}, "end": {"date": end}}
+    else:
+        times = {"start": {"dateTime": at(start)}, "end": {"dateTime": at(end)}}
+
+    return {"id": event_id, "status": status or "confirmed", **times}
+
+
+def frame(*items: tuple[str, dict]) -> EventFrame:
+    return EventFrame.from_calendar_events(items)
+
+
+def plan(events: EventFrame, event_ids: list[str], **kwargs):
+    return plan_reschedule(
+        events,
+        event_ids,
+        calendar_id="primary",
+        time_min=TIME_MIN,
+        time_max=TIME_MAX,
+        **kwargs,
+    )
+
+
+def test_find_conflicts_skips_copies_cancelled_and_all_day():
+    events = frame(
+        ("primary", item("a", "09:00", "10:00")),
+        ("primary", item("b", "09:30", "10:30")),
+        ("primary", item("c", "10:30", "11:00")),
+        ("primary", item("d", "2024-01-01", "2024-01-02")),
+        ("primary", item("e", "09:00", "11:00", "cancelled")),
+        ("primary", item("z", "09:40", "09:40")),
+        ("room", item("a", "09:00", "10:00")),
+        ("room", item("r", "09:45", "10:15")),
+    )
+
+    conflicts = find_conflicts(events)
+
+    assert [conflict.second_id for conflict in conflicts] == ["b", "b", "r", "r", "r"]
+    assert {
+        (
+            conflict.first_calendar_id,
+            conflict.first_id,
+            conflict.second_calendar_id,
+            conflict.second_id,
+            conflict.start,
+            conflict.end,
+        )
+        for conflict in conflicts
+    } == {
+        ("primary", "a", "primary", "b", ts("09:30"), ts("10:00")),
+        ("room", "a", "primary", "b", ts("09:30"), ts("10:00")),
+        ("primary", "a", "room", "r", ts("09:45"), ts("10:00")),
+        ("room", "a", "room", "r", ts("09:45"), ts("10:00")),
+        ("primary", "b", "room", "r", ts("09:45"), ts("10:15")),
+    }
+
+
+def test_plan_keeps_free_events_and_moves_with_buffer():
+    events = frame(
+        ("primary", item("x", "09:00", "10:00")),
+        ("primary", item("a", "09:30", "10:00")),
+        ("primary", item("b", "13:00", "14:00")),
+    )
+
+    result = plan(events, ["a", "b"], buffer=15 * 60)
+
+    assert result.moves == [
+        EventMove("primary", "a", ts("09:30"), ts("10:00"), ts("10:15"), ts("10:45"))
+    ]
+    assert result.kept == ["b"]
+    assert result.unplaced == []
+
+
+def test_plan_keeps_original_order():
+    events = frame(
+        ("primary", item("x", "09:00", "10:00")),
+        ("primary", item("a", "09:00", "10:00")),
+        ("primary", item("b", "09:30", "10:00")),
+    )
+
+    result = plan(events, ["b", "a"])
+
+    assert [(move.event_id, move.start_time) for move in result.moves] == [
+        ("a", "2024-01-01T10:00:00+00:00"),
+        ("b", "2024-01-01T11:00:00+00:00"),
+    ]
+
+
+def test_plan_aligns_to_step():
+    events = frame(
+        ("primary", item("x", "09:00", "10:10")),
+        ("primary", item("a", "09:00", "09:30")),
+    )
+
+    assert plan(events, ["a"], step=30 * 60).moves[0].new_start == ts("10:30")
+
+    # 對齊後的時段被佔用時，從對齊的時間繼續尋找
+    events.append(item("y", "10:40", "11:00"))
+
+    assert plan(events, ["a"], step=30 * 60).moves[0].new_start == ts("11:00")
+
+
+def test_plan_avoids_blocked_periods():
+    events = frame(("primary", item("a", "10:30", "11:00")))
+
+    result = plan(
+        events, ["a"], blocked=[TimePeriod(start=at("10:00"), end=at("12:00"))]
+    )
+
+    assert [(move.new_start, move.new_end) for move in result.moves] == [
+        (ts("12:00"), ts("12:30"))
+    ]
+
+
+def test_plan_ignores_copies_cancelled_and_all_day_events():
+    events = frame(
+        ("primary", item("a", "10:00", "11:00")),
+        ("primary", item("c", "10:00", "11:00", "cancelled")),
+        ("primary", item("d", "2024-01-01", "2024-01-02")),
+        ("room", item("a", "10:00", "11:00")),
+    )
+
+    result = plan(events, ["a"])
+
+    assert (result.moves, result.kept) == ([], ["a"])
+
+    events.append(item("r", "10:30", "11:30"), "room")
+
+    assert plan(events, ["a"]).moves[0].new_start == ts("11:30")
+
+
+def test_plan_reports_unplaced_events():
+    events = frame(
+        ("primary", item("x", "09:00", "17:00")),
+        ("primary", item("d", "2024-01-01", "2024-01-02")),
+        ("primary", item("e", "12:00", "13:00")),
+        ("room", item("copy", "12:00", "13:00")),
+    )
+
+    result = plan(events, ["missing", "copy", "d", "e"])
+
+    assert result.moves == result.kept == []
+    assert result.unplaced == ["missing", "copy", "d", "e"]
+
+
+def test_reschedule_calendar_events_patches_moves(
+    server: FakeCalendarServer, api: GoogleCalendarAPI, calendar: Calendar
+):
+    calendar.insert_event(
+        "primary", summary="x", start_time=at("09:00"), end_time=at("10:00")
+    )
+    moved = calendar.insert_event(
+        "primary", summary="a", start_time=at("09:30"), end_time=at("10:00")
+    )
+    server.reset_requests()
+
+    dry_run = api.reschedule_calendar_events(
+        [moved.id], time_min=TIME_MIN, time_max=TIME_MAX, dry_run=True
+    )
+
+    assert len(dry_run.moves) == 1 and dry_run.results == []
+    assert server.requests["batch"] == 0
+
+    result = api.reschedule_calendar_events(
+        [moved.id], time_min=TIME_MIN, time_max=TIME_MAX
+    )
+    [patched] = result.results
+
+    assert isinstance(patched, Event)
+    assert to_timestamp(patched.start.dateTime) == ts("10:00")  # type: ignore
+    assert to_timestamp(patched.end.dateTime) == ts("10:30")  # type: ignore
+    assert server.requests["batch"] == 1
@@ -0,0 +1,198 @@
+import asyncio
+
+import pytest
+from googleapiclient.discovery import Resource
+from googleapiclient.errors import HttpError
+from httplib2 import Response
+
+from benchmarks.server import FakeCalendarServer
+from google_calendar_api.calendar import AsyncCalendar, Calendar
+from google_calendar_api.scheduler import Priority, RequestScheduler
+from google_calendar_api.service.calendar import AsyncCalendarService
+
+START = "2024-01-01T09:00:00Z"
+END = "2024-01-01T10:00:00Z"
+
+
+class RecordingScheduler(RequestScheduler):
+    """記錄每個請求的優先順序與是否重試"""
+
+    def __init__(self) -> None:
+        super().__init__(user_rate=1e9, project_rate=1e9, base_delay=0)
+        self.calls: list[tuple[Priority, bool]] = []
+
+    def call(
+        self, func, user="default", priority=Priority.INTERACTIVE, tokens=1, retry=True
+    ):
+        self.calls.append((priority, retry))
+
+        return super().call(func, user, priority, tokens, retry)
+
+    async def acall(
+        self, func, user="default", priority=Priority.INTERACTIVE, tokens=1, retry=True
+    ):
+        self.calls.append((priority, retry))
+
+        return await super().acall(func, user, priority, tokens, retry)
+
+
+def http_error(status: int) -> HttpError:
+    return HttpError(Response({"status": status}), b"{}")
+
+
+def flaky(failures: list[Exception], result: str = "ok"):
+    calls = []
+
+    def func() -> str:
+        calls.append(None)
+
+        if failures:
+            raise failures.pop(0)
+
+        return result
+
+    return func, calls
+
+
+def test_call_retries_retryable_errors(scheduler: RequestScheduler):
+    func, calls = flaky([http_error(503), ConnectionError()])
+
+    assert scheduler.call(func) == "ok"
+    assert len(calls) == 3
+
+
+def test_call_without_retry_raises_first_error(scheduler: RequestScheduler):
+    func, calls = flaky([http_error(503)])
+
+    with pytest.raises(HttpError):
+        scheduler.call(func, retry=False)
+
+    assert len(calls) == 1
+
+
+def test_call_does_not_retry_client_errors(scheduler: RequestScheduler):
+    func, calls = flaky([http_error(404)])
+
+    with pytest.raises(HttpError):
+        scheduler.call(func)
+
+    assert len(calls) == 1
+
+
+def test_acall_retries_retryable_errors(scheduler: RequestScheduler):
+    failures: list[Exception] = [http_error(429)]
+    calls = []
+
+    async def func() -> str:
+        calls.append(None)
+
+        if failures:
+            raise failures.pop(0)
+
+        return "ok"
+
+    assert asyncio.run(scheduler.acall(func)) == "ok"
+    assert len(calls) == 2
+
+
+def test_cancelled_acall_does_not_take_tokens():
+    scheduler = RequestScheduler(user_rate=5, project_rate=1e9)
+    bucket = scheduler._user_bucket("default")
+    bucket.consume(5)
+    calls = []
+
+    async def func() -> None:
+        calls.append(None)
+
+    async def run() -> None:
+        task = asyncio.create_task(scheduler.acall(func))
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        await asyncio.sleep(0.3)
+
+    asyncio.run(run())
+
+    assert calls == []
+    assert scheduler._waiting[Priority.INTERACTIVE] == 0
+    assert bucket.delay(1) == 0
+
+
+def test_acall_waits_for_interactive_requests():
+    scheduler = RequestScheduler(user_rate=20, project_rate=1e9)
+    scheduler._user_bucket("default").consume(20)
+    order: list[Priority] = []
+
+    def request(priority: Priority):
+        async def func() -> None:
+            order.append(priority)
+
+        return scheduler.acall(func, priority=priority)
+
+    async def run() -> None:
+        bulk = asyncio.create_task(request(Priority.BULK))
+        await asyncio.sleep(0)
+        await asyncio.gather(request(Priority.INTERACTIVE), bulk)
+
+    asyncio.run(run())
+
+    assert order == [Priority.INTERACTIVE, Priority.BULK]
+
+
+def test_inserts_without_client_id_are_not_retried(resource: Resource):
+    scheduler = RecordingScheduler()
+    calendar = Calendar(service=resource, scheduler=scheduler)
+
+    event = calendar.insert_event(
+        "primary", summary="a", start_time=START, end_time=END
+    )
+    calendar.upsert_event("primary", summary="b", start_time=START, end_time=END)
+    calendar.get_event("primary", event.id)
+    calendar.patch_event("primary", event.id, summary="c")
+
+    assert scheduler.calls == [
+        (Priority.INTERACTIVE, False),
+        (Priority.INTERACTIVE, False),
+        (Priority.INTERACTIVE, True),
+        (Priority.INTERACTIVE, True),
+    ]
+
+
+def test_async_requests_go_through_scheduler(
+    server: FakeCalendarServer, resource: Resource
+):
+    scheduler = RecordingScheduler()
+
+    async def run() -> None:
+        async with AsyncCalendar(service=resource, scheduler=scheduler) as calendar:
+            event = await calendar.insert_event(
+                "primary", summary="a", start_time=START, end_time=END
+            )
+            await calendar.get_event("primary", event.id)
+
+    asyncio.run(run())
+
+    assert scheduler.calls == [
+        (Priority.INTERACTIVE, False),
+        (Priority.INTERACTIVE, True),
+    ]
+    assert server.requests["events.insert"] == 1
+
+
+def test_async_delete_matches_sync_error_semantics(resource: Resource, monkeypatch):
+    async def run() -> None:
+        async with AsyncCalendarService(service=resource) as calendar_service:
+            assert await calendar_service.delete_event("primary", "missing") is False
+
+            async def fail(calendar_id: str, event_id: str) -> None:
+                raise http_error(403)
+
+            monkeypatch.setattr(calendar_service.calendar, "delete_event", fail)
+
+            with pytest.raises(HttpError):
+                await calendar_service.delete_event("primary", "forbidden")
+
+    asyncio.run(run())
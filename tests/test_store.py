@@ -0,0 +1,119 @@
+from googleapiclient.discovery import Resource
+
+from benchmarks.server import FakeCalendarServer
+from google_calendar_api.calendar import Calendar
+from google_calendar_api.service.calendar import CalendarService
+from google_calendar_api.store import EventStore
+
+TIME_MIN = "2024-01-01T00:00:00Z"
+TIME_MAX = "2024-01-02T00:00:00Z"
+
+
+def test_query_by_time_range(server: FakeCalendarServer, calendar: Calendar):
+    server.seed("primary", 4)
+    store = EventStore()
+    store.put("primary", calendar.list_events(time_min=TIME_MIN).items)
+
+    # 00:00, 00:30, 01:00, 01:30 起始的 20 分鐘事件
+    events = store.query(
+        "primary", time_min="2024-01-01T00:25:00Z", time_max="2024-01-01T01:10:00Z"
+    )
+
+    assert [event.summary for event in events] == ["event 1", "event 2"]
+    assert store.get("primary", events[0].id) == events[0]
+    assert store.get("other", events[0].id) is None
+
+
+def test_get_calendar_event_refreshes_synced_store(
+    server: FakeCalendarServer, resource: Resource, calendar: Calendar
+):
+    server.seed("primary", 2)
+    calendar_service = CalendarService(
+        service=resource, store=EventStore(), refresh_interval=0
+    )
+    calendar_service.refresh_store(force=True)
+    event = calendar.list_events(time_min=TIME_MIN).items[0]
+
+    calendar.patch_event("primary", event.id, summary="changed elsewhere")
+
+    assert calendar_service.get_calendar_event(event.id).summary == "changed elsewhere"
+
+
+def test_get_calendar_event_skips_unsynced_store(
+    server: FakeCalendarServer, resource: Resource, calendar: Calendar
+):
+    server.seed("primary", 1)
+    store = EventStore()
+    calendar_service = CalendarService(service=resource, store=store)
+    event = calendar.list_events(time_min=TIME_MIN).items[0]
+    store.put("primary", [event.model_copy(update={"summary": "stale"})])
+
+    assert calendar_service.get_calendar_event(event.id).summary == "event 0"
+    assert store.get("primary", event.id).summary == "event 0"  # type: ignore
+
+
+def test_batch_writes_update_store(resource: Resource):
+    store = EventStore()
+    calendar_service = CalendarService(service=resource, store=store)
+
+    with calendar_service.batch() as batch:
+        batch.add_calendar_event(
+            summary="a",
+            start_time="2024-01-01T09:00:00Z",
+            end_time="2024-01-01T10:00:00Z",
+        )
+        batch.add_calendar_event(
+            summary="b",
+            start_time="2024-01-01T11:00:00Z",
+            end_time="2024-01-01T12:00:00Z",
+        )
+
+    first, second = batch.results
+
+    assert [event.summary for event in store.query("primary")] == ["a", "b"]
+
+    with calendar_service.batch() as batch:
+        batch.delete_event(first.id)  # type: ignore
+        batch.patch_calendar_event(second.id, summary="b2")  # type: ignore
+
+    assert [event.summary for event in store.query("primary")] == ["b2"]
+
+
+def test_cached_path_bypassed_for_streaming_flags(
+    server: FakeCalendarServer, api_factory
+):
+    server.seed("primary", 3)
+    api = api_factory(event_store_path=":memory:")
+
+    list(api.get_calendar_events(time_min=TIME_MIN, time_max=TIME_MAX))
+    server.reset_requests()
+
+    cached = list(api.get_calendar_events(time_min=TIME_MIN, time_max=TIME_MAX))
+
+    assert server.requests["events.list"] == 0
+
+    streamed = list(
+        api.get_calendar_events(time_min=TIME_MIN, time_max=TIME_MAX, incremental=True)
+    )
+    paged = list(
+        api.get_calendar_events(time_min=TIME_MIN, time_max=TIME_MAX, max_results=1)
+    )
+
+    assert server.requests["events.list"] == 1 + 3
+    assert [event.id for event in streamed] == [event.id for event in cached]
+    assert [event.id for event in paged] == [event.id for event in cached]
+
+
+def test_store_refresh_in_trusted_mode(server: FakeCalendarServer, resource: Resource):
+    server.seed("primary", 2)
+    store = EventStore()
+    calendar_service = CalendarService(
+        service=resource, parse_mode="trusted", store=store, refresh_interval=0
+    )
+
+    calendar_service.refresh_store(force=True)
+    event = store.query("primary")[0]
+    calendar_service.calendar.patch_event("primary", event.id, summary="changed")
+
+    assert calendar_service.get_calendar_event(event.id).summary == "changed"
+    assert [event.summary for event in store.query("primary")] == ["changed", "event 1"]
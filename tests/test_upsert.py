@@ -0,0 +1,172 @@
+from benchmarks.server import FakeCalendarServer
+from google_calendar_api import GoogleCalendarAPI
+from google_calendar_api.schema.calendar import Event
+from google_calendar_api.service.calendar import CalendarService
+
+TIME_MIN = "2024-01-01T00:00:00Z"
+TIME_MAX = "2024-01-02T00:00:00Z"
+START = "2024-01-01T09:00:00Z"
+END = "2024-01-01T10:00:00Z"
+
+
+def summaries(api: GoogleCalendarAPI) -> list[str]:
+    return [
+        event.summary
+        for event in api.get_calendar_events(time_min=TIME_MIN, time_max=TIME_MAX)
+    ]
+
+
+def test_replace_matches_existing_event(api: GoogleCalendarAPI):
+    created = api.add_calendar_event(summary="standup", start_time=START, end_time=END)
+
+    replaced = api.add_calendar_event(
+        replace=True,
+        summary="standup",
+        start_time=START,
+        end_time=END,
+        description="moved online",
+    )
+
+    assert replaced is not None and replaced.id == created.id  # type: ignore
+    assert replaced.description == "moved online"
+    assert summaries(api) == ["standup"]
+
+
+def test_replace_without_match_returns_none(api: GoogleCalendarAPI):
+    assert (
+        api.add_calendar_event(
+            replace=True, summary="missing", start_time=START, end_time=END
+        )
+        is None
+    )
+    assert summaries(api) == []
+
+
+def test_upsert_by_key_is_idempotent(
+    server: FakeCalendarServer, api: GoogleCalendarAPI
+):
+    first = api.add_calendar_event(
+        key="external-1", summary="a", start_time=START, end_time=END
+    )
+    second = api.add_calendar_event(
+        key="external-1", summary="b", start_time=START, end_time=END
+    )
+
+    assert first.id == second.id  # type: ignore
+    assert summaries(api) == ["b"]
+    assert server.requests["events.insert"] == 1
+
+
+def test_property_upsert_loads_key_index_once(
+    server: FakeCalendarServer, calendar_service: CalendarService
+):
+    existing = calendar_service.upsert_calendar_event(
+        "external-1", "property", summary="a", start_time=START, end_time=END
+    )
+    other_client = CalendarService(service=calendar_service.calendar.service)
+    server.reset_requests()
+
+    updated = other_client.upsert_calendar_event(
+        "external-1", "property", summary="b", start_time=START, end_time=END
+    )
+    for index in range(3):
+        other_client.upsert_calendar_event(
+            f"new-{index}", "property", summary="c", start_time=START, end_time=END
+        )
+
+    assert updated.id == existing.id
+    assert server.requests["events.list"] == 1
+    assert server.requests["events.insert"] == 3
+
+
+def test_upsert_calendar_events_keeps_order(
+    server: FakeCalendarServer, api: GoogleCalendarAPI
+):
+    api.upsert_calendar_event("b", summary="old", start_time=START, end_time=END)
+    server.reset_requests()
+
+    results = api.upsert_calendar_events(
+        [
+            (key, {"summary": key, "start_time": START, "end_time": END})
+            for key in ("a", "b", "c")
+        ]
+    )
+
+    assert all(isinstance(result, Event) for result in results)
+    assert [result.summary for result in results] == ["a", "b", "c"]  # type: ignore
+    assert server.requests["events.list"] == 0
+    assert sorted(summaries(api)) == ["a", "b", "c"]
+
+
+def test_async_replace_closes_lookup(
+    server: FakeCalendarServer, api_factory, tmp_path, monkeypatch
+):
+    import asyncio
+
+    from google_calendar_api.aio import AsyncGoogleCalendarAPI
+
+    api = api_factory()
+    created = api.add_calendar_event(summary="standup", start_time=START, end_time=END)
+    api.add_calendar_event(summary="standup", start_time=START, end_time=END)
+    closed: list[dict] = []
+
+    async def run() -> Event | None:
+        async with AsyncGoogleCalendarAPI(
+            token="test-token",
+            refresh_token="test-refresh-token",
+            token_uri=f"{server.url}/token",
+            client_id="test-client",
+            client_secret="test-secret",
+            scopes=["https://www.googleapis.com/auth/calendar"],
+            calendar_config_path=str(tmp_path / "calendar.json"),
+            discovery_cache_dir=str(tmp_path),
+        ) as async_api:
+            lookup = async_api.get_calendar_events
+
+            async def get_calendar_events(**kwargs):
+                try:
+                    async for event in lookup(**kwargs):
+                        yield event
+                finally:
+                    closed.append(kwargs)
+
+            monkeypatch.setattr(async_api, "get_calendar_events", get_calendar_events)
+
+            return await async_api.add_calendar_event(
+                replace=True,
+                summary="standup",
+                start_time=START,
+                end_time=END,
+                description="moved online",
+            )
+
+    replaced = asyncio.run(run())
+
+    assert replaced is not None and replaced.id == created.id  # type: ignore
+    assert replaced.description == "moved online"
+    assert [kwargs["max_results"] for kwargs in closed] == [1]
+
+
+def test_replace_lookup_reads_one_event(
+    server: FakeCalendarServer, api: GoogleCalendarAPI, monkeypatch
+):
+    for _ in range(3):
+        api.add_calendar_event(summary="standup", start_time=START, end_time=END)
+
+    calls: list[dict] = []
+    list_events = api.calendar_service.calendar.list_events
+
+    def recording(*args, **kwargs):
+        calls.append(kwargs)
+
+        return list_events(*args, **kwargs)
+
+    monkeypatch.setattr(api.calendar_service.calendar, "list_events", recording)
+    server.reset_requests()
+
+    api.add_calendar_event(
+        replace=True, summary="standup", start_time=START, end_time=END
+    )
+
+    assert [call["max_results"] for call in calls] == [1]
+    assert server.requests["events.list"] == 1
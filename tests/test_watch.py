@@ -0,0 +1,175 @@
+import threading
+import time
+from collections.abc import Hashable
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from benchmarks.server import FakeCalendarServer
+from google_calendar_api.calendar import Calendar
+from google_calendar_api.schema.calendar import SyncEvent
+from google_calendar_api.schema.channel import Notification
+from google_calendar_api.service.calendar import CalendarService
+from google_calendar_api.watch import (
+    CalendarWatcher,
+    ChangeCoalescer,
+    WebhookReceiver,
+    parse_notification,
+)
+
+START = "2024-01-01T09:00:00Z"
+END = "2024-01-01T10:00:00Z"
+HEADERS = {
+    "X-Goog-Channel-ID": "channel",
+    "X-Goog-Resource-ID": "resource",
+    "X-Goog-Resource-State": "exists",
+}
+
+
+def post(url: str, headers: dict[str, str]) -> int:
+    try:
+        with urlopen(
+            Request(url, data=b"", method="POST", headers=headers)
+        ) as response:
+            return response.status
+    except HTTPError as error:
+        return error.code
+
+
+def wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+
+        time.sleep(0.01)
+
+    return predicate()
+
+
+def test_parse_notification():
+    notification = parse_notification(
+        {
+            **{key.lower(): value for key, value in HEADERS.items()},
+            "X-Goog-Message-Number": "3",
+        }
+    )
+
+    assert notification is not None
+    assert (notification.channel_id, notification.message_number) == ("channel", 3)
+    assert parse_notification({"X-Goog-Channel-ID": "channel"}) is None
+
+
+def test_receiver_routes_and_validates_headers():
+    received: list[Notification] = []
+
+    with WebhookReceiver(received.append, path="/notify") as receiver:
+        assert post(receiver.url, HEADERS) == 200
+        assert post(receiver.url.replace("/notify", "/other"), HEADERS) == 404
+        assert post(receiver.url, {"X-Goog-Channel-ID": "channel"}) == 400
+
+    assert [notification.resource_id for notification in received] == ["resource"]
+
+
+def test_coalescer_merges_notifications():
+    calls: list[Hashable] = []
+    release = threading.Event()
+
+    def callback(key: Hashable) -> None:
+        calls.append(key)
+        release.wait(5)
+
+    with ChangeCoalescer(callback, delay=0.05) as coalescer:
+        for _ in range(10):
+            coalescer.notify("primary")
+        coalescer.notify("other")
+
+        assert wait_until(lambda: len(calls) == 2)
+
+        # 執行中收到的通知在結束後合併為一次
+        for _ in range(5):
+            coalescer.notify("primary")
+
+        release.set()
+
+        assert wait_until(lambda: len(calls) == 3)
+        time.sleep(0.2)
+
+    assert sorted(calls) == ["other", "primary", "primary"]
+
+
+@pytest.fixture
+def changes() -> list[SyncEvent]:
+    return []
+
+
+@pytest.fixture
+def watcher(calendar_service: CalendarService, changes: list[SyncEvent]):
+    watcher = CalendarWatcher(
+        [calendar_service],
+        lambda calendar_id, sync_event: changes.append(sync_event),
+        ttl=3600,
+        renew_margin=60,
+        delay=0.05,
+    )
+
+    with watcher:
+        yield watcher
+
+
+def test_watcher_syncs_on_change(
+    calendar: Calendar, watcher: CalendarWatcher, changes: list[SyncEvent]
+):
+    for index in range(3):
+        calendar.insert_event(
+            "primary", summary=f"new {index}", start_time=START, end_time=END
+        )
+
+    assert wait_until(lambda: sum(len(change.events) for change in changes) == 3)
+    # 3 個通知在 delay 內合併，通常只需要一次增量讀取
+    assert len(changes) <= 3
+
+
+def test_watcher_rejects_forged_notifications(watcher: CalendarWatcher, monkeypatch):
+    notified: list[Hashable] = []
+    monkeypatch.setattr(watcher._coalescer, "notify", notified.append)
+    [(_, channel)] = watcher.channels.values()
+    headers = {
+        "X-Goog-Channel-ID": channel.id,
+        "X-Goog-Resource-ID": channel.resourceId,
+        "X-Goog-Resource-State": "exists",
+        "X-Goog-Channel-Token": channel.token or "",
+    }
+
+    assert (
+        post(watcher.receiver.url, {**headers, "X-Goog-Channel-Token": "forged"}) == 200
+    )
+    assert post(watcher.receiver.url, {**headers, "X-Goog-Resource-ID": "other"}) == 200
+    assert (
+        post(watcher.receiver.url, {**headers, "X-Goog-Channel-ID": "unknown"}) == 200
+    )
+    assert notified == []
+
+    assert post(watcher.receiver.url, headers) == 200
+    assert notified == ["primary"]
+
+
+def test_watcher_renews_expiring_channels(
+    server: FakeCalendarServer, watcher: CalendarWatcher
+):
+    [(_, old)] = watcher.channels.values()
+    server.reset_requests()
+
+    assert watcher.renew() == 0
+
+    watcher.renew_margin = 7200
+
+    assert watcher.renew() == 1
+
+    [(calendar_id, new)] = watcher.channels.values()
+
+    assert calendar_id == "primary" and new.id != old.id
+    assert server.requests["events.watch"] == 1
+    assert server.requests["channels.stop"] == 1